@@ -3,8 +3,9 @@ from flask_restful import Api
 from flask_jwt_extended import JWTManager
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from flask_caching import Cache
 from flask_cors import CORS
+import atexit
+import functools
 import threading
 import time
 import logging
@@ -20,6 +21,19 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Headers added to every API response (also applied by asgi.py).
+SECURITY_HEADERS = {
+    'X-Content-Type-Options': 'nosniff',
+    'X-Frame-Options': 'DENY',
+    'X-XSS-Protection': '1; mode=block',
+    'Referrer-Policy': 'strict-origin-when-cross-origin',
+    'Content-Security-Policy': "default-src 'self'; frame-ancestors 'none'",
+}
+HSTS_HEADER = 'max-age=31536000; includeSubDomains'
+
+# Per-address limits on every route without its own (also applied by asgi.py).
+DEFAULT_RATE_LIMITS = ["200 per day", "50 per hour"]
+
 # ---------------------------------------------------------------------------
 # Scheduler state — module-level so the watchdog and health endpoint can
 # reference the thread regardless of how many times create_app() is called.
@@ -27,6 +41,22 @@ logger = logging.getLogger(__name__)
 _scheduler_thread = None
 _scheduler_last_heartbeat = None
 _scheduler_lock = threading.Lock()
+_scheduler_lease = None
+
+
+def _run_if_leader(job):
+    """Wrap a scheduled *job* so it only runs on the scheduler leader.
+
+    Followers still let ``schedule`` advance the job's next run time, so a
+    worker that later takes over does not replay jobs the old leader ran.
+    """
+    @functools.wraps(job)
+    def run():
+        if _scheduler_lease is not None and not _scheduler_lease.is_leader:
+            logger.info(f"Skipping {job.__name__}: not the scheduler leader")
+            return None
+        return job()
+    return run
 
 
 def run_scheduled_tasks():
@@ -34,19 +64,32 @@ def run_scheduled_tasks():
 
     Registers the daily/weekly jobs and launches a daemon thread.  Idempotent:
     if a live thread already exists this function returns it unchanged.
+
+    Every worker process runs a scheduler thread, but only the holder of the
+    scheduler lease (see :mod:`utils.leader_lock`) runs jobs.  The lease is
+    renewed on each heartbeat.
     """
-    global _scheduler_thread
+    global _scheduler_thread, _scheduler_lease
 
     # Avoid spawning duplicate threads (e.g. if create_app is called twice).
     if _scheduler_thread is not None and _scheduler_thread.is_alive():
         return _scheduler_thread
 
     from services.scheduler import update_property_data, update_market_data
+    from services.materialization import update_property_metrics
+    from utils.leader_lock import LeaderLease
+
+    if _scheduler_lease is None:
+        _scheduler_lease = LeaderLease('scheduler')
+        # Hand over straight away on a clean shutdown instead of waiting
+        # for the lease to expire.
+        atexit.register(_scheduler_lease.release)
 
     def run_schedule():
         global _scheduler_last_heartbeat
         while True:
             try:
+                _scheduler_lease.acquire()
                 schedule.run_pending()
                 with _scheduler_lock:
                     _scheduler_last_heartbeat = time.time()
@@ -55,8 +98,10 @@ def run_scheduled_tasks():
                 logger.error(f"Error in scheduler: {e}")
                 time.sleep(300)
 
-    schedule.every().day.at("01:00").do(update_property_data)
-    schedule.every().week.do(update_market_data)
+    schedule.every().day.at("01:00").do(_run_if_leader(update_property_data))
+    schedule.every().week.do(_run_if_leader(update_market_data))
+    # Runs after the nightly scrape so new and re-priced listings get metrics.
+    schedule.every().day.at("02:00").do(_run_if_leader(update_property_metrics))
 
     _scheduler_thread = threading.Thread(target=run_schedule, name="scheduler")
     _scheduler_thread.daemon = True
@@ -145,21 +190,22 @@ def create_app(config=None):
         if not redis_url:
             logger.info("Cache using SimpleCache (no REDIS_URL configured)")
 
-    Cache(application, config=_cache_cfg)
+    from utils.response_cache import cache
+    cache.init_app(application, config=_cache_cfg)
 
     if redis_url and not application.config.get('TESTING'):
         _limiter = Limiter(
             get_remote_address,
             app=application,
             storage_uri=redis_url,
-            default_limits=["200 per day", "50 per hour"],
+            default_limits=DEFAULT_RATE_LIMITS,
         )
         logger.info("Rate limiter using Redis storage")
     else:
         _limiter = Limiter(
             get_remote_address,
             app=application,
-            default_limits=["200 per day", "50 per hour"],
+            default_limits=DEFAULT_RATE_LIMITS,
         )
 
     # Store limiter on app so routes/users.py can import it from the app module.
@@ -171,26 +217,40 @@ def create_app(config=None):
     init_db(application)
 
     # ----------------------------------------------------------- Route setup
-    from routes.properties import PropertyResource, PropertyListResource
+    from routes.properties import PropertyResource, PropertyListResource, PropertyExportResource
     from routes.analysis import (
         PropertyAnalysisResource,
+        PropertySimulationResource,
+        PropertySensitivityResource,
+        PropertyGoalSeekResource,
+        BatchAnalysisResource,
+        BatchGoalSeekResource,
         MarketAnalysisResource,
         TopMarketsResource,
         OpportunityScoringResource,
     )
     from routes.users import UserRegistration, UserLogin, UserLogout
+    from routes.jobs import JobListResource, JobResource
 
     # Each resource is available at both the versioned (/api/v1/*) and legacy
     # (/api/*) paths to maintain full backward compatibility.
     api.add_resource(PropertyListResource, '/api/v1/properties', '/api/properties')
+    api.add_resource(PropertyExportResource, '/api/v1/properties/export', '/api/properties/export')
     api.add_resource(PropertyResource, '/api/v1/properties/<property_id>', '/api/properties/<property_id>')
     api.add_resource(PropertyAnalysisResource, '/api/v1/analysis/property/<property_id>', '/api/analysis/property/<property_id>')
+    api.add_resource(PropertySimulationResource, '/api/v1/analysis/property/<property_id>/simulate', '/api/analysis/property/<property_id>/simulate')
+    api.add_resource(PropertySensitivityResource, '/api/v1/analysis/property/<property_id>/sensitivity', '/api/analysis/property/<property_id>/sensitivity')
+    api.add_resource(PropertyGoalSeekResource, '/api/v1/analysis/property/<property_id>/goal-seek', '/api/analysis/property/<property_id>/goal-seek')
+    api.add_resource(BatchAnalysisResource, '/api/v1/analysis/batch', '/api/analysis/batch')
+    api.add_resource(BatchGoalSeekResource, '/api/v1/analysis/goal-seek', '/api/analysis/goal-seek')
     api.add_resource(MarketAnalysisResource, '/api/v1/analysis/market/<market_id>', '/api/analysis/market/<market_id>')
     api.add_resource(TopMarketsResource, '/api/v1/markets/top', '/api/markets/top')
     api.add_resource(OpportunityScoringResource, '/api/v1/analysis/score/<property_id>', '/api/analysis/score/<property_id>')
     api.add_resource(UserRegistration, '/api/v1/auth/register', '/api/auth/register')
     api.add_resource(UserLogin, '/api/v1/auth/login', '/api/auth/login')
     api.add_resource(UserLogout, '/api/v1/auth/logout', '/api/auth/logout')
+    api.add_resource(JobListResource, '/api/v1/jobs', '/api/jobs')
+    api.add_resource(JobResource, '/api/v1/jobs/<job_id>', '/api/jobs/<job_id>')
 
     # ----------------------------------------------- Request logging middleware
     @application.before_request
@@ -209,13 +269,9 @@ def create_app(config=None):
             response.status_code,
             latency,
         )
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-        response.headers['Content-Security-Policy'] = "default-src 'self'; frame-ancestors 'none'"
+        response.headers.update(SECURITY_HEADERS)
         if not application.debug:
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
+            response.headers['Strict-Transport-Security'] = HSTS_HEADER
         return response
 
     # ----------------------------------------------------------- Route handlers
@@ -239,14 +295,14 @@ def create_app(config=None):
         checks = {}
         overall_healthy = True
 
-        # MongoDB check
+        # MongoDB check — reports the state tracked by pymongo's server
+        # monitor rather than issuing a ping per probe.
         try:
-            from utils.database import get_db
-            db = get_db()
-            db.command('ping')
-            checks['mongodb'] = {'status': 'ok'}
+            from utils.database import get_connection_health
+            checks['mongodb'] = get_connection_health()
         except Exception as e:
             checks['mongodb'] = {'status': 'error', 'detail': str(e)}
+        if checks['mongodb'].get('status') != 'ok':
             overall_healthy = False
 
         # Scheduler check
@@ -264,6 +320,18 @@ def create_app(config=None):
             else:
                 checks['scheduler'] = {'status': 'error', 'detail': 'Scheduler thread died'}
                 overall_healthy = False
+            if _scheduler_lease is not None:
+                checks['scheduler']['worker'] = _scheduler_lease.owner
+                checks['scheduler']['is_leader'] = _scheduler_lease.is_leader
+                try:
+                    checks['scheduler']['leader'] = _scheduler_lease.current_leader()
+                except Exception as e:
+                    checks['scheduler']['leader'] = None
+                    logger.warning(f"Could not read scheduler leader: {e}")
+
+        # Response cache hit/miss counters for this worker (informational)
+        from utils.response_cache import response_cache_stats
+        checks['response_cache'] = {'status': 'ok', **response_cache_stats()}
 
         _ensure_scheduler_running()
 
@@ -280,17 +348,18 @@ def create_app(config=None):
         return jsonify({'status': 'alive', 'pid': os.getpid()}), 200
 
     # ---------------------------------------------------------------- Teardown
+    # The client is shared by every request and its monitor threads feed
+    # /health/ready, so it is closed once at process exit rather than after
+    # each request.
     from utils.database import close_db
-
-    @application.teardown_appcontext
-    def shutdown_db(exception=None):
-        close_db()
+    atexit.register(close_db)
 
     # ------------------------------------------- Conditional scheduler startup
     # Skip when TESTING=True so the test suite does not spin up background
-    # threads.  The module-level call below handles the production/gunicorn
-    # case.
-    if not application.config.get('TESTING'):
+    # threads, and when EMBEDDED_SCHEDULER is off because worker processes
+    # (python -m worker) own the schedule.  The module-level call below
+    # handles the production/gunicorn case.
+    if not application.config.get('TESTING') and application.config.get('EMBEDDED_SCHEDULER', True):
         run_scheduled_tasks()
 
     return application, _limiter
@@ -301,9 +370,14 @@ def create_app(config=None):
 #   1. ``gunicorn app:app`` works without change.
 #   2. ``from app import app`` and ``from app import limiter`` still work.
 #   3. Existing test fixtures that do ``import app; app.app`` still work.
+#
+# Under ``python app.py`` the Zillow parse pool's spawned workers re-run this
+# script as ``__mp_main__``.  They only parse HTML, so they skip building an
+# app (database connection, scheduler thread).
 # ---------------------------------------------------------------------------
 
-app, limiter = create_app()
+if __name__ != '__mp_main__':
+    app, limiter = create_app()
 
 if __name__ == '__main__':
     debug = os.getenv('FLASK_DEBUG', 'false').lower() == 'true'
@@ -0,0 +1,148 @@
+"""Optional ASGI entry point: async handlers in front of the Flask app.
+
+    pip install -r requirements-asgi.txt
+    uvicorn asgi:app --host 0.0.0.0 --port 5000
+
+The read-heavy endpoints routed in :func:`_routes` (property list and
+detail, property/market analysis, batch analysis, scoring, top markets) run
+as coroutines from ``routes.async_api`` on an async Mongo client.  While one
+request waits on MongoDB, the process serves others, so a single worker
+handles as many concurrent requests as its connection pool
+(``ASYNC_MONGODB_MAX_POOL_SIZE``) allows.
+
+Every other request, including auth, property writes, the export stream and
+the health checks, falls through to the unchanged Flask app.  That app runs
+in a thread pool behind ``a2wsgi``.  The async endpoints do not go through
+Flask's extensions.  :func:`_endpoint` applies ``DEFAULT_RATE_LIMITS`` per
+client address itself, using the Flask limiter's strategy and storage (its
+counters are kept apart from the Flask routes').  There is no response cache
+or ETag on these routes.  They are public reads on the Flask side too, so no
+JWT check is lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from a2wsgi import WSGIMiddleware
+from limits import parse_many
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+
+from app import DEFAULT_RATE_LIMITS, HSTS_HEADER, SECURITY_HEADERS
+from app import app as flask_app
+from app import limiter
+from routes import async_api
+from utils.async_database import close_async_db, get_async_db, init_async_db
+from utils.errors import error_response
+
+logger = logging.getLogger(__name__)
+
+API_PREFIXES = ('/api/v1', '/api')
+
+_flask = WSGIMiddleware(flask_app)
+
+_RATE_LIMITS = [item for spec in DEFAULT_RATE_LIMITS for item in parse_many(spec)]
+
+
+def _json_response(request: Request, body, status):
+    headers = dict(SECURITY_HEADERS)
+    if not flask_app.debug:
+        headers['Strict-Transport-Security'] = HSTS_HEADER
+    # Preflight requests fall through to Flask-CORS; the async responses
+    # only need the matching allow-origin headers.
+    origin = request.headers.get('origin')
+    if origin and origin in flask_app.config.get('CORS_ORIGINS', ['http://localhost:3000']):
+        headers.update({
+            'Access-Control-Allow-Origin': origin,
+            'Access-Control-Allow-Credentials': 'true',
+            'Vary': 'Origin',
+        })
+    return JSONResponse(body, status_code=status, headers=headers)
+
+
+async def _rate_limited(request: Request, scope: str) -> bool:
+    """Count the request against ``DEFAULT_RATE_LIMITS``; True once over."""
+    if not flask_app.config.get('RATELIMIT_ENABLED', True):
+        return False
+    address = request.client.host if request.client else '127.0.0.1'
+    # The limiter's storage may be Redis, so hit it off the event loop.
+    allowed = await asyncio.to_thread(
+        lambda: all(limiter.limiter.hit(item, address, scope) for item in _RATE_LIMITS)
+    )
+    return not allowed
+
+
+async def _json_body(request: Request):
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+def _endpoint(handler, *path_params, query=False, body=False, **extra):
+    """Adapt an ``async_api`` handler to a Starlette endpoint."""
+    async def endpoint(request: Request):
+        if await _rate_limited(request, f'asgi:{request.method}:{handler.__name__}'):
+            return _json_response(
+                request, *error_response('Rate limit exceeded', 'RATE_LIMITED', 429)
+            )
+        db = get_async_db()
+        if db is None:
+            return _json_response(
+                request, *error_response('Database unavailable', 'DB_UNAVAILABLE', 503)
+            )
+        args = [request.path_params[name] for name in path_params]
+        if query:
+            args.append(request.query_params)
+        if body:
+            args.append(await _json_body(request))
+        return _json_response(request, *await handler(db, *args, **extra))
+    endpoint.__name__ = handler.__name__
+    return endpoint
+
+
+def _routes():
+    count_strategy = flask_app.config.get('PROPERTY_COUNT_STRATEGY', 'exact')
+    routes = []
+    for prefix in API_PREFIXES:
+        routes += [
+            Route(f'{prefix}/properties', _endpoint(
+                async_api.list_properties, query=True, default_count_strategy=count_strategy,
+            ), methods=['GET']),
+            # Streamed by Flask; listed so it is not taken as a property id.
+            Route(f'{prefix}/properties/export', _flask),
+            Route(f'{prefix}/properties/{{property_id}}',
+                  _endpoint(async_api.get_property, 'property_id'), methods=['GET']),
+            Route(f'{prefix}/analysis/property/{{property_id}}',
+                  _endpoint(async_api.analyze_property, 'property_id'), methods=['GET']),
+            Route(f'{prefix}/analysis/property/{{property_id}}',
+                  _endpoint(async_api.custom_analysis, 'property_id', body=True), methods=['POST']),
+            Route(f'{prefix}/analysis/batch',
+                  _endpoint(async_api.batch_analysis, body=True), methods=['POST']),
+            Route(f'{prefix}/analysis/market/{{market_id}}',
+                  _endpoint(async_api.market_analysis, 'market_id'), methods=['GET', 'POST']),
+            Route(f'{prefix}/analysis/score/{{property_id}}',
+                  _endpoint(async_api.score_property, 'property_id'), methods=['GET']),
+            Route(f'{prefix}/markets/top',
+                  _endpoint(async_api.top_markets, query=True), methods=['GET']),
+        ]
+    # Anything unmatched, or matched with another method, goes to Flask.
+    routes.append(Mount('/', app=_flask))
+    return routes
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    init_async_db(flask_app.config)
+    try:
+        yield
+    finally:
+        await close_async_db()
+
+
+app = Starlette(routes=_routes(), lifespan=lifespan)
@@ -50,6 +50,16 @@ class BaseConfig:
 
     # ----------------------------------------------------------------- MongoDB
     MONGODB_URI: str | None = os.getenv("DATABASE_URL")
+    # Interval of pymongo's background server monitoring; /health/ready
+    # reports the state tracked from these heartbeats.
+    MONGODB_HEARTBEAT_FREQUENCY_MS: int = int(
+        os.getenv("MONGODB_HEARTBEAT_FREQUENCY_MS", 10000)
+    )
+    # Create the indexes declared in utils/indexes.py after connecting.  Turn
+    # off when indexes are built out of band (python -m utils.indexes).
+    MONGODB_ENSURE_INDEXES: bool = os.getenv("MONGODB_ENSURE_INDEXES", "true").lower() == "true"
+    # Connection pool of the async client used by asgi.py (per process).
+    ASYNC_MONGODB_MAX_POOL_SIZE: int = int(os.getenv("ASYNC_MONGODB_MAX_POOL_SIZE", 100))
 
     # ----------------------------------------------------------------- Caching
     @classmethod
@@ -59,6 +69,18 @@ class BaseConfig:
             return {"CACHE_TYPE": "RedisCache", "CACHE_REDIS_URL": redis_url}
         return {"CACHE_TYPE": "SimpleCache"}
 
+    # Response cache entry lifetimes (seconds); see utils/response_cache.py.
+    RESPONSE_CACHE_TIMEOUT: int = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 300))
+    LISTING_CACHE_TIMEOUT: int = int(os.getenv("LISTING_CACHE_TIMEOUT", 60))
+    # Default total-count strategy for offset property listings: exact | cached | estimated.
+    # exact keeps total/pages precise; the others are opt-in.
+    PROPERTY_COUNT_STRATEGY: str = os.getenv("PROPERTY_COUNT_STRATEGY", "exact")
+
+    # -------------------------------------------------------------- Scheduler
+    # Run the recurring jobs in a thread of each API process (one leader runs
+    # them).  Turn off when ``python -m worker`` processes own the schedule.
+    EMBEDDED_SCHEDULER: bool = os.getenv("EMBEDDED_SCHEDULER", "true").lower() == "true"
+
     # -------------------------------------------------------------- Rate limit
     RATELIMIT_ENABLED: bool = True
 
@@ -80,7 +102,7 @@ class TestingConfig(BaseConfig):
     - TESTING=True  ⟹ Flask test client behaves correctly
     - Random JWT secret so tests never depend on a real env var
     - Rate limiting disabled so tests are not throttled
-    - SimpleCache so no Redis dependency
+    - SimpleCache so no Redis dependency; response caching off
     - No MongoDB URI so init_db() is a no-op (tests mock it anyway)
     """
 
@@ -91,6 +113,7 @@ class TestingConfig(BaseConfig):
     MONGODB_URI: str | None = None
     RATELIMIT_ENABLED: bool = False
     CACHE_TYPE: str = "SimpleCache"
+    RESPONSE_CACHE_ENABLED: bool = False
 
 
 class ProductionConfig(BaseConfig):
@@ -5,6 +5,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Default market data used when no market is found in the database
+DEFAULT_MARKET_DATA = {
+    'property_tax_rate': 0.01,
+    'price_to_rent_ratio': 15,
+    'vacancy_rate': 0.08,
+    'appreciation_rate': 0.03,
+    'avg_hoa_fee': 0,
+    'tax_benefits': {},
+    'financing_programs': [],
+}
+
 
 class Market:
     collection_name = 'markets'
@@ -39,6 +50,8 @@ class Market:
         self.walk_score = None
         self.transit_score = None
         self.avg_hoa_fee = None
+        # Yearly median home prices, oldest first (volatility for risk and simulation)
+        self.price_history = []
 
         # Tax benefits specific to this location
         self.tax_benefits = {}
@@ -75,6 +88,39 @@ class Market:
             return cls.from_dict(market_data)
         return None
 
+    @staticmethod
+    def location_clauses(zip_code=None, city=None, state=None):
+        """Return the ``(field, value)`` fallback levels for a location.
+
+        Levels are in priority order (zip -> city -> state).  The city level
+        is only included when a state is known.
+        """
+        clauses = []
+        if zip_code:
+            clauses.append(('zip_code', zip_code))
+        if city and state:
+            clauses.append(('city', city))
+        if state:
+            clauses.append(('state', state))
+        return clauses
+
+    @classmethod
+    def find_for_location(cls, zip_code=None, city=None, state=None):
+        """Resolve the best market for a location (zip -> city -> state).
+
+        Each level is one ``find_one``, tried in priority order until one
+        matches, so a lookup reads at most one document per level.  A single
+        ``$or`` over all levels would read every market in the state to keep
+        one.  Within a level the first document returned wins.
+        """
+        collection = get_db()[cls.collection_name]
+        for field, value in cls.location_clauses(zip_code, city, state):
+            doc = collection.find_one({field: value})
+            market = cls.from_dict(doc) if doc else None
+            if market is not None:
+                return market
+        return None
+
     @classmethod
     def find_all(cls, filters=None, limit=100, skip=0):
         db = get_db()
@@ -108,6 +154,7 @@ class Market:
             'walk_score': self.walk_score,
             'transit_score': self.transit_score,
             'avg_hoa_fee': self.avg_hoa_fee,
+            'price_history': self.price_history,
             'tax_benefits': self.tax_benefits,
             'financing_programs': self.financing_programs
         }
@@ -149,6 +196,7 @@ class Market:
             instance.walk_score = data.get('walk_score')
             instance.transit_score = data.get('transit_score')
             instance.avg_hoa_fee = data.get('avg_hoa_fee')
+            instance.price_history = data.get('price_history') or []
 
             instance.tax_benefits = data.get('tax_benefits', {})
             instance.financing_programs = data.get('financing_programs', [])
@@ -2,6 +2,8 @@ from datetime import datetime, timezone
 from utils.database import get_db
 import logging
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +11,18 @@ logger = logging.getLogger(__name__)
 class Property:
     collection_name = 'properties'
 
+    # Fields written only when bulk_upsert inserts a new document, so that a
+    # re-scrape does not reset ownership or materialized metrics/score.
+    _insert_only_fields = ('created_at', 'user_id', 'metrics', 'score')
+
+    # Document fields a projected read (``find_all(fields=...)``) may select.
+    projectable_fields = (
+        'address', 'city', 'state', 'zip_code', 'price', 'bedrooms', 'bathrooms',
+        'sqft', 'year_built', 'property_type', 'lot_size', 'listing_url', 'source',
+        'latitude', 'longitude', 'images', 'description', 'user_id', 'created_at',
+        'updated_at', 'metrics', 'score',
+    )
+
     def __init__(self, address, price, bedrooms, bathrooms, sqft, year_built,
                  property_type, lot_size, listing_url, source, latitude=None,
                  longitude=None, images=None, description=None, city='',
@@ -62,6 +76,86 @@ class Property:
             logger.error(f"Error saving property {self.listing_url}: {e}")
             raise
 
+    @classmethod
+    def bulk_upsert(cls, properties, batch_size=500):
+        """Insert or update many properties keyed on their unique ``listing_url``.
+
+        Sends unordered ``bulk_write`` batches of ``UpdateOne(..., upsert=True)``
+        instead of the ``find_one`` + ``insert_one``/``update_one`` round-trips
+        made by :meth:`save`.  When the same ``listing_url`` appears more than
+        once, the last occurrence wins.  Properties without a ``listing_url``
+        are counted as failed.  Newly inserted properties get their ``_id`` set.
+
+        Returns a dict with total ``inserted``, ``modified``, ``matched`` and
+        ``failed`` counts plus a ``batches`` list holding the same counts for
+        each batch sent.
+        """
+        batch_size = max(1, int(batch_size))
+        totals = {'inserted': 0, 'modified': 0, 'matched': 0, 'failed': 0, 'batches': []}
+
+        by_url = {}
+        for prop in properties:
+            if not prop.listing_url:
+                logger.warning(f"Skipping property without listing_url: {prop.address}")
+                totals['failed'] += 1
+                continue
+            by_url[prop.listing_url] = prop
+        unique = list(by_url.values())
+        if not unique:
+            return totals
+
+        collection = get_db()[cls.collection_name]
+        for start in range(0, len(unique), batch_size):
+            chunk = unique[start:start + batch_size]
+            now = datetime.now(timezone.utc)
+            operations = []
+            for prop in chunk:
+                prop.updated_at = now
+                doc = prop.to_dict()
+                insert_only = {field: doc.pop(field) for field in cls._insert_only_fields}
+                operations.append(UpdateOne(
+                    {'listing_url': prop.listing_url},
+                    {'$set': doc, '$setOnInsert': insert_only},
+                    upsert=True,
+                ))
+
+            batch = {'inserted': 0, 'modified': 0, 'matched': 0, 'failed': 0}
+            try:
+                result = collection.bulk_write(operations, ordered=False)
+                upserted_ids = result.upserted_ids or {}
+                batch.update(
+                    inserted=result.upserted_count,
+                    modified=result.modified_count,
+                    matched=result.matched_count,
+                )
+            except BulkWriteError as e:
+                details = e.details or {}
+                write_errors = details.get('writeErrors', [])
+                upserted_ids = {u['index']: u['_id'] for u in details.get('upserted', [])}
+                batch.update(
+                    inserted=details.get('nUpserted', 0),
+                    modified=details.get('nModified', 0),
+                    matched=details.get('nMatched', 0),
+                    failed=len(write_errors),
+                )
+                for error in write_errors[:5]:
+                    failed_url = chunk[error['index']].listing_url
+                    logger.error(f"Error upserting property {failed_url}: {error.get('errmsg')}")
+
+            for index, inserted_id in upserted_ids.items():
+                chunk[index]._id = inserted_id
+
+            logger.info(
+                "Bulk upsert batch %d: inserted=%d modified=%d matched=%d failed=%d",
+                len(totals['batches']) + 1, batch['inserted'], batch['modified'],
+                batch['matched'], batch['failed'],
+            )
+            totals['batches'].append(batch)
+            for key in ('inserted', 'modified', 'matched', 'failed'):
+                totals[key] += batch[key]
+
+        return totals
+
     @classmethod
     def find_by_id(cls, property_id):
         db = get_db()
@@ -72,6 +166,23 @@ class Property:
             return cls.from_dict(property_data)
         return None
 
+    @classmethod
+    def find_by_ids(cls, property_ids):
+        """Fetch many properties with one ``$in`` query.
+
+        Returns a dict mapping each found id (as a string) to its Property;
+        ids with no matching document are absent.
+        """
+        db = get_db()
+        object_ids = [ObjectId(pid) if isinstance(pid, str) else pid for pid in property_ids]
+        cursor = db[cls.collection_name].find({'_id': {'$in': object_ids}})
+        found = {}
+        for doc in cursor:
+            instance = cls.from_dict(doc)
+            if instance is not None:
+                found[str(doc['_id'])] = instance
+        return found
+
     def to_dict(self):
         return {
             'address': self.address,
@@ -133,7 +244,7 @@ class Property:
 
     @classmethod
     def find_all(cls, filters=None, limit=100, skip=0, sort_by='price', sort_order=1,
-                 cursor=None):
+                 cursor=None, fields=None):
         """Fetch properties from MongoDB.
 
         When *cursor* (an ObjectId) is provided the method switches to
@@ -143,10 +254,17 @@ class Property:
         consistent with subsequent cursor advances.
 
         When *cursor* is None the method uses traditional offset/limit
-        pagination controlled by *skip*, *sort_by*, and *sort_order*.
+        pagination controlled by *skip*, *sort_by*, and *sort_order*, with
+        ``_id`` as a tie-breaker so pages are stable.
+
+        When *fields* is given, only those fields (plus ``_id``) are read and
+        the raw documents are returned as dicts instead of ``Property``
+        objects.  Fields missing from a document are absent rather than
+        defaulted as ``from_dict`` would.
         """
         db = get_db()
         query = dict(filters or {})
+        projection = {field: 1 for field in fields} if fields else None
 
         if cursor is not None:
             # Merge the _id lower-bound into the existing query filters.
@@ -161,17 +279,19 @@ class Property:
             # Cursor pagination requires a stable sort on _id.
             mongo_cursor = (
                 db[cls.collection_name]
-                .find(query)
+                .find(query, projection)
                 .sort('_id', 1)
                 .limit(limit)
             )
         else:
             mongo_cursor = (
                 db[cls.collection_name]
-                .find(query)
-                .sort(sort_by, sort_order)
+                .find(query, projection)
+                .sort([(sort_by, sort_order), ('_id', sort_order)])
                 .skip(skip)
                 .limit(limit)
             )
 
+        if projection is not None:
+            return list(mongo_cursor)
         return [p for p in (cls.from_dict(doc) for doc in mongo_cursor) if p is not None]
@@ -1,148 +1,558 @@
 from flask import request
 from flask_restful import Resource
+import numpy as np
 from models.property import Property
 from models.market import Market
 from services.analysis.financial_metrics import FinancialMetrics
-from services.analysis.tax_benefits import TaxBenefits
+from services.analysis.tax_benefits import TaxBenefits, MAX_PROJECTION_YEARS
 from services.analysis.financing_options import FinancingOptions
 from services.analysis.opportunity_scoring import OpportunityScoring
+from services.analysis.monte_carlo import (
+    MonteCarloSimulation,
+    DEFAULT_SIMULATION_PATHS,
+    MIN_SIMULATION_PATHS,
+    MAX_SIMULATION_PATHS,
+    SIMULATION_TIME_BUDGET_MS,
+)
+from services.analysis.sensitivity import (
+    sensitivity_grid,
+    SENSITIVITY_PARAMETERS,
+    DEFAULT_SENSITIVITY_METRICS,
+    MAX_AXIS_VALUES,
+)
+from services.analysis.goal_seek import (
+    GoalSeek,
+    GOAL_SEEK_METRICS,
+    GOAL_SEEK_VARIABLES,
+    INDEPENDENT_TARGETS,
+)
 from services.geographic.market_aggregator import MarketAggregator
+from services.geographic.market_cache import resolve_market_data
 from utils.database import get_db
 from utils.errors import error_response
+from utils.validation import is_valid_objectid
 from utils.request_validators import require_json_body, require_entity
+from utils.response_cache import cached_response, entity_key, query_key
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on property ids accepted by BatchAnalysisResource.
+MAX_BATCH_PROPERTIES = 50
 
-# Default market data used when no market is found in the database
-DEFAULT_MARKET_DATA = {
-    'property_tax_rate': 0.01,
-    'price_to_rent_ratio': 15,
-    'vacancy_rate': 0.08,
-    'appreciation_rate': 0.03,
-    'avg_hoa_fee': 0,
-    'tax_benefits': {},
-    'financing_programs': [],
-}
+# Values generated for a sensitivity axis given as {"min", "max"} without "steps".
+DEFAULT_AXIS_STEPS = 11
 
 
 def _get_market_dict(property_obj):
     """Look up market data for a property, returning a dict suitable for analysis services."""
-    market = None
-
-    if property_obj.zip_code:
-        market = Market.find_by_location('zip_code', property_obj.zip_code)
-
-    if not market and property_obj.city and property_obj.state:
-        market = Market.find_by_location('city', property_obj.city)
+    return resolve_market_data(property_obj.zip_code, property_obj.city, property_obj.state)
+
+
+# Parameter -> (default, lower bound, upper bound, type) for custom analysis.
+_PARAMETER_BOUNDS = {
+    'down_payment_percentage': (0.20, 0.01, 0.99, float),
+    'interest_rate': (0.045, 0.001, 0.30, float),
+    'term_years': (30, 1, 40, int),
+    'holding_period': (5, 1, 30, int),
+    'appreciation_rate': (0.03, -0.10, 0.20, float),
+    'tax_bracket': (0.22, 0.0, 0.50, float),
+    'projection_years': (MAX_PROJECTION_YEARS, 1, MAX_PROJECTION_YEARS, int),
+}
 
-    if not market and property_obj.state:
-        market = Market.find_by_location('state', property_obj.state)
 
-    if market:
-        # Convert Market object to dict so analysis services can use .get()
-        return market.to_dict()
+def _bounded(name, value):
+    """Cast *value* to the parameter's type and clamp it to its bounds."""
+    _, low, high, cast = _PARAMETER_BOUNDS[name]
+    return max(low, min(high, cast(value)))
+
+
+def _parse_custom_parameters(data):
+    """Validate and bound user-supplied analysis parameters.
+
+    Raises ``ValueError``/``TypeError`` when a value is not numeric.
+    """
+    params = {name: _bounded(name, data.get(name, default))
+              for name, (default, _, _, _) in _PARAMETER_BOUNDS.items()}
+    params.update({
+        'credit_score': data.get('credit_score', 720),
+        'veteran': data.get('veteran', False),
+        'first_time_va': data.get('first_time_va', True),
+    })
+    return params
+
+
+def _run_custom_analysis(property_obj, market_data, params):
+    """Run the financial, tax and financing analyses with parsed parameters."""
+    # Custom financial analysis
+    financial_metrics = FinancialMetrics(property_obj, market_data)
+    analysis = financial_metrics.analyze_property(
+        down_payment_percentage=params['down_payment_percentage'],
+        interest_rate=params['interest_rate'],
+        term_years=params['term_years'],
+        holding_period=params['holding_period'],
+        appreciation_rate=params['appreciation_rate']
+    )
+
+    # Custom tax analysis
+    tax_benefits = TaxBenefits(property_obj, market_data)
+    tax_analysis = tax_benefits.analyze_tax_benefits(
+        tax_bracket=params['tax_bracket'],
+        down_payment_percentage=params['down_payment_percentage'],
+        interest_rate=params['interest_rate'],
+        term_years=params['term_years']
+    )
+    tax_projection = tax_benefits.project_tax_benefits(
+        years=params['projection_years'],
+        tax_bracket=params['tax_bracket'],
+        down_payment_percentage=params['down_payment_percentage'],
+        interest_rate=params['interest_rate'],
+        term_years=params['term_years'],
+        property_tax_growth=params['appreciation_rate']
+    )
+
+    # Custom financing analysis
+    financing = FinancingOptions(property_obj, market_data)
+    financing_analysis = financing.analyze_financing_options(
+        credit_score=params['credit_score'],
+        veteran=params['veteran'],
+        first_time_va=params['first_time_va']
+    )
+
+    return {
+        'financial_analysis': analysis,
+        'tax_benefits': tax_analysis,
+        'tax_projection': tax_projection,
+        'financing_options': financing_analysis,
+        'market_data': market_data
+    }
+
+
+def _parse_simulation_parameters(data):
+    """Validate and bound the Monte Carlo simulation parameters.
+
+    Raises ``ValueError``/``TypeError`` when a value is not numeric or the
+    seed is negative.
+    """
+    params = _parse_custom_parameters(data)
+    seed = data.get('seed')
+    if seed is not None:
+        seed = int(seed)
+        if seed < 0:
+            raise ValueError('seed must be non-negative')
+    return {
+        'paths': max(MIN_SIMULATION_PATHS, min(MAX_SIMULATION_PATHS, int(data.get('paths', DEFAULT_SIMULATION_PATHS)))),
+        'holding_period': params['holding_period'],
+        'down_payment_percentage': params['down_payment_percentage'],
+        'interest_rate': params['interest_rate'],
+        'term_years': params['term_years'],
+        # Without an explicit rate the market's appreciation is the mean.
+        'appreciation_rate': params['appreciation_rate'] if 'appreciation_rate' in data else None,
+        'seed': seed,
+        'max_ms': max(1, min(SIMULATION_TIME_BUDGET_MS, int(data.get('max_ms', SIMULATION_TIME_BUDGET_MS)))),
+    }
+
+
+def _parse_sensitivity_axis(name, spec):
+    """Expand one sensitivity axis into sorted, bounded, distinct values.
+
+    *spec* is ``{"min", "max", "steps"}`` (evenly spaced, endpoints
+    included), an explicit list of values, or a single value that holds the
+    parameter fixed.  Raises ``ValueError``/``TypeError``/``KeyError`` for a
+    malformed spec.
+    """
+    if isinstance(spec, dict):
+        steps = int(spec.get('steps', DEFAULT_AXIS_STEPS))
+        if not 2 <= steps <= MAX_AXIS_VALUES:
+            raise ValueError(f"'{name}' steps must be between 2 and {MAX_AXIS_VALUES}")
+        raw = np.linspace(float(spec['min']), float(spec['max']), steps).tolist()
+    elif isinstance(spec, list):
+        if not 1 <= len(spec) <= MAX_AXIS_VALUES:
+            raise ValueError(f"'{name}' must have between 1 and {MAX_AXIS_VALUES} values")
+        raw = spec
+    else:
+        raw = [spec]
+
+    values = [_bounded(name, value) for value in raw]
+    if _PARAMETER_BOUNDS[name][3] is float:
+        # Keep linspace noise out of the axis labels the client matches on.
+        values = [round(value, 6) for value in values]
+    return sorted(set(values))
+
+
+def _parse_sensitivity_request(data):
+    """Validate a sensitivity body into ``(axes, metrics)``.
+
+    Parameters missing from the body are held at their custom-analysis
+    default.
+    """
+    axes = {
+        name: _parse_sensitivity_axis(name, data.get(name, _PARAMETER_BOUNDS[name][0]))
+        for name in SENSITIVITY_PARAMETERS
+    }
+    metrics = data.get('metrics', list(DEFAULT_SENSITIVITY_METRICS))
+    if not isinstance(metrics, list):
+        raise ValueError("'metrics' must be a list")
+    return axes, metrics
+
+
+def _run_default_analysis(property_obj, market_data):
+    """Run the financial, tax and financing analyses with default parameters."""
+    # Financial analysis
+    financial_metrics = FinancialMetrics(property_obj, market_data)
+    analysis = financial_metrics.analyze_property()
+
+    # Tax benefits analysis
+    tax_benefits = TaxBenefits(property_obj, market_data)
+    tax_analysis = tax_benefits.analyze_tax_benefits()
+
+    # Financing options
+    financing = FinancingOptions(property_obj, market_data)
+    financing_analysis = financing.analyze_financing_options()
+
+    return {
+        'property_id': str(property_obj._id),
+        'financial_analysis': analysis,
+        'tax_benefits': tax_analysis,
+        'financing_options': financing_analysis,
+        'market_data': market_data
+    }
+
+
+def _parse_property_ids(data):
+    """Validate the ``property_ids`` list of a batch body.
+
+    Returns ``(valid_ids, errors)``: the de-duplicated well-formed ids and a
+    per-id error dict for malformed ones.  Raises ``ValueError`` with a
+    client-facing message when the list itself is invalid.
+    """
+    property_ids = data.get('property_ids')
+    if not isinstance(property_ids, list) or not property_ids:
+        raise ValueError("'property_ids' must be a non-empty list")
+    property_ids = list(dict.fromkeys(str(pid) for pid in property_ids))
+    if len(property_ids) > MAX_BATCH_PROPERTIES:
+        raise ValueError(f"At most {MAX_BATCH_PROPERTIES} property ids per batch")
+
+    errors = {}
+    valid_ids = []
+    for pid in property_ids:
+        if is_valid_objectid(pid):
+            valid_ids.append(pid)
+        else:
+            errors[pid] = {'code': 'VALIDATION_ERROR', 'message': 'Invalid property id format'}
+    return valid_ids, errors
+
+
+def _parse_batch_request(data):
+    """Validate a batch analysis body.
+
+    Returns ``(property_ids, params, errors)``: the de-duplicated well-formed
+    ids, the parsed parameters and a per-id error dict for malformed ids.
+    Raises ``ValueError`` with a client-facing message when the body is
+    invalid as a whole.
+    """
+    valid_ids, errors = _parse_property_ids(data)
+    try:
+        params = _parse_custom_parameters(data)
+    except (ValueError, TypeError):
+        raise ValueError('Invalid numeric parameter')
+    return valid_ids, params, errors
+
+
+def _parse_goal_seek_parameters(data):
+    """Validate a goal-seek body into keyword arguments for ``GoalSeek.solve``.
+
+    Raises ``ValueError``/``TypeError`` for an unknown variable or metric or
+    a non-numeric value.
+    """
+    params = _parse_custom_parameters(data)
+    solve_for = data.get('solve_for', 'price')
+    if solve_for not in GOAL_SEEK_VARIABLES:
+        raise ValueError(f"'solve_for' must be one of {sorted(GOAL_SEEK_VARIABLES)}")
+    target_metric = data.get('target_metric', 'monthly_cash_flow')
+    if target_metric not in GOAL_SEEK_METRICS:
+        raise ValueError(f"'target_metric' must be one of {list(GOAL_SEEK_METRICS)}")
+    target_value = float(data.get('target_value', 0.0))
+    if not math.isfinite(target_value):
+        raise ValueError("'target_value' must be finite")
+    return {
+        'solve_for': solve_for,
+        'target_metric': target_metric,
+        'target_value': target_value,
+        'down_payment_percentage': params['down_payment_percentage'],
+        'interest_rate': params['interest_rate'],
+        'term_years': params['term_years'],
+        'holding_period': params['holding_period'],
+        'appreciation_rate': params['appreciation_rate'],
+    }
+
+
+def _parse_monthly_rent(data):
+    """Return the optional known ``monthly_rent`` of a goal-seek body."""
+    monthly_rent = data.get('monthly_rent')
+    if monthly_rent is None:
+        return None
+    monthly_rent = float(monthly_rent)
+    if not monthly_rent > 0 or not math.isfinite(monthly_rent):
+        raise ValueError("'monthly_rent' must be positive")
+    return monthly_rent
+
+
+def _rank_goal_seek_results(results):
+    """Order goal-seek results by ``margin``, best first; unreachable last."""
+    results.sort(key=lambda r: (r['margin'] is None, -(r['margin'] or 0.0)))
+    for rank, result in enumerate(results, start=1):
+        result['rank'] = rank
+    return results
+
+
+def _property_location(property_obj):
+    return (property_obj.zip_code, property_obj.city, property_obj.state)
+
+
+def _run_batch_analysis(data, valid_ids, properties, markets, params, errors):
+    """Analyse each found property and build the batch response body.
+
+    *markets* maps ``(zip_code, city, state)`` to market data; locations
+    missing from it are resolved with ``resolve_market_data`` and added.
+    """
+    results = {}
+    for pid in valid_ids:
+        property_obj = properties.get(pid)
+        if property_obj is None:
+            errors[pid] = {'code': 'NOT_FOUND', 'message': 'Property not found'}
+            continue
+        try:
+            location = _property_location(property_obj)
+            if location not in markets:
+                markets[location] = _get_market_dict(property_obj)
+            results[pid] = {
+                'property_id': pid,
+                **_run_custom_analysis(property_obj, markets[location], params),
+            }
+        except Exception as e:
+            logger.exception("Failed batch analysis for property %s", pid)
+            errors[pid] = {'code': 'INTERNAL_ERROR', 'message': str(e)}
 
-    return dict(DEFAULT_MARKET_DATA)
+    parameters = {k: v for k, v in data.items() if k != 'property_ids'}
+    return {
+        'parameters': parameters,
+        'results': results,
+        'errors': errors,
+        'succeeded': len(results),
+        'failed': len(errors),
+    }
 
 
 class PropertyAnalysisResource(Resource):
     @require_entity(Property, 'property_id', inject_as='property_obj')
+    @cached_response('property_analysis', entity_key('property_id', 'property_obj'))
     def get(self, property_id, property_obj):
         """Get comprehensive analysis for a single property"""
         try:
             market_data = _get_market_dict(property_obj)
+            return _run_default_analysis(property_obj, market_data), 200
 
-            # Financial analysis
-            financial_metrics = FinancialMetrics(property_obj, market_data)
-            analysis = financial_metrics.analyze_property()
+        except Exception as e:
+            logger.exception("Failed to analyze property %s", property_id)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
 
-            # Tax benefits analysis
-            tax_benefits = TaxBenefits(property_obj, market_data)
-            tax_analysis = tax_benefits.analyze_tax_benefits()
+    @require_entity(Property, 'property_id', inject_as='property_obj')
+    @require_json_body
+    def post(self, property_id, property_obj, data):
+        """Run custom analysis with user-defined parameters"""
+        try:
+            market_data = _get_market_dict(property_obj)
 
-            # Financing options
-            financing = FinancingOptions(property_obj, market_data)
-            financing_analysis = financing.analyze_financing_options()
+            try:
+                params = _parse_custom_parameters(data)
+            except (ValueError, TypeError):
+                return error_response('Invalid numeric parameter', 'VALIDATION_ERROR', 400)
 
             result = {
                 'property_id': str(property_obj._id),
-                'financial_analysis': analysis,
-                'tax_benefits': tax_analysis,
-                'financing_options': financing_analysis,
-                'market_data': market_data
+                'parameters': data,
+                **_run_custom_analysis(property_obj, market_data, params),
             }
 
             return result, 200
 
         except Exception as e:
-            logger.exception("Failed to analyze property %s", property_id)
+            logger.exception("Failed custom analysis for property %s", property_id)
             return error_response(str(e), 'INTERNAL_ERROR', 500)
 
+
+class PropertySimulationResource(Resource):
     @require_entity(Property, 'property_id', inject_as='property_obj')
     @require_json_body
     def post(self, property_id, property_obj, data):
-        """Run custom analysis with user-defined parameters"""
+        """Simulate the distribution of IRR, ROI and cash flow over the holding period"""
         try:
-            market_data = _get_market_dict(property_obj)
-
-            # Validate and bound user-supplied parameters
             try:
-                down_pct = max(0.01, min(0.99, float(data.get('down_payment_percentage', 0.20))))
-                interest = max(0.001, min(0.30, float(data.get('interest_rate', 0.045))))
-                term = max(1, min(40, int(data.get('term_years', 30))))
-                holding = max(1, min(30, int(data.get('holding_period', 5))))
-                appreciation = max(-0.10, min(0.20, float(data.get('appreciation_rate', 0.03))))
-                tax_bracket = max(0.0, min(0.50, float(data.get('tax_bracket', 0.22))))
+                params = _parse_simulation_parameters(data)
             except (ValueError, TypeError):
                 return error_response('Invalid numeric parameter', 'VALIDATION_ERROR', 400)
+            if not property_obj.price or property_obj.price <= 0:
+                return error_response('Property has no price to simulate', 'VALIDATION_ERROR', 400)
 
-            # Custom financial analysis
-            financial_metrics = FinancialMetrics(property_obj, market_data)
-            analysis = financial_metrics.analyze_property(
-                down_payment_percentage=down_pct,
-                interest_rate=interest,
-                term_years=term,
-                holding_period=holding,
-                appreciation_rate=appreciation
-            )
-
-            # Custom tax analysis
-            tax_benefits = TaxBenefits(property_obj, market_data)
-            tax_analysis = tax_benefits.analyze_tax_benefits(
-                tax_bracket=tax_bracket,
-                down_payment_percentage=down_pct,
-                interest_rate=interest,
-                term_years=term
-            )
-
-            # Custom financing analysis
-            financing = FinancingOptions(property_obj, market_data)
-            financing_analysis = financing.analyze_financing_options(
-                credit_score=data.get('credit_score', 720),
-                veteran=data.get('veteran', False),
-                first_time_va=data.get('first_time_va', True)
-            )
+            market_data = _get_market_dict(property_obj)
+            simulation = MonteCarloSimulation(property_obj, market_data).run(**params)
 
-            result = {
+            return {
                 'property_id': str(property_obj._id),
                 'parameters': data,
-                'financial_analysis': analysis,
-                'tax_benefits': tax_analysis,
-                'financing_options': financing_analysis,
-                'market_data': market_data
-            }
+                'simulation': simulation,
+            }, 200
 
-            return result, 200
+        except Exception as e:
+            logger.exception("Failed simulation for property %s", property_id)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class PropertySensitivityResource(Resource):
+    @require_entity(Property, 'property_id', inject_as='property_obj')
+    @require_json_body
+    def post(self, property_id, property_obj, data):
+        """Evaluate financial metrics over a grid of analysis parameters"""
+        try:
+            try:
+                axes, metrics = _parse_sensitivity_request(data)
+            except (ValueError, TypeError, KeyError) as e:
+                return error_response(f'Invalid sensitivity parameters: {e}', 'VALIDATION_ERROR', 400)
+            if not property_obj.price or property_obj.price <= 0:
+                return error_response('Property has no price to analyse', 'VALIDATION_ERROR', 400)
+
+            market_data = _get_market_dict(property_obj)
+            try:
+                grid = sensitivity_grid(property_obj, market_data, axes, metrics)
+            except ValueError as e:
+                return error_response(f'Invalid sensitivity parameters: {e}', 'VALIDATION_ERROR', 400)
+
+            return {
+                'property_id': str(property_obj._id),
+                'parameters': data,
+                **grid,
+            }, 200
 
         except Exception as e:
-            logger.exception("Failed custom analysis for property %s", property_id)
+            logger.exception("Failed sensitivity analysis for property %s", property_id)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class BatchAnalysisResource(Resource):
+    @require_json_body
+    def post(self, data):
+        """Run custom analysis for many properties with shared parameters.
+
+        Body: ``{"property_ids": [...], ...}`` where the remaining keys are
+        the parameters accepted by ``PropertyAnalysisResource.post``.  The
+        properties are fetched with one ``$in`` query and each distinct
+        location's market is resolved once.  Results and per-item errors are
+        keyed by property id.
+        """
+        try:
+            try:
+                valid_ids, params, errors = _parse_batch_request(data)
+            except ValueError as e:
+                return error_response(str(e), 'VALIDATION_ERROR', 400)
+
+            properties = Property.find_by_ids(valid_ids) if valid_ids else {}
+            return _run_batch_analysis(data, valid_ids, properties, {}, params, errors), 200
+
+        except Exception as e:
+            logger.exception("Failed batch analysis")
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class PropertyGoalSeekResource(Resource):
+    @require_entity(Property, 'property_id', inject_as='property_obj')
+    @require_json_body
+    def post(self, property_id, property_obj, data):
+        """Solve for the price, rent, down payment or rate that hits a target metric"""
+        try:
+            try:
+                params = _parse_goal_seek_parameters(data)
+                monthly_rent = _parse_monthly_rent(data)
+            except (ValueError, TypeError) as e:
+                return error_response(f'Invalid goal-seek parameters: {e}', 'VALIDATION_ERROR', 400)
+
+            market_data = _get_market_dict(property_obj)
+            try:
+                goal_seek = GoalSeek(property_obj, market_data, monthly_rent=monthly_rent).solve(**params)
+            except ValueError as e:
+                return error_response(str(e), 'VALIDATION_ERROR', 400)
+
+            return {
+                'property_id': str(property_obj._id),
+                'parameters': data,
+                'goal_seek': goal_seek,
+            }, 200
+
+        except Exception as e:
+            logger.exception("Failed goal seek for property %s", property_id)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class BatchGoalSeekResource(Resource):
+    @require_json_body
+    def post(self, data):
+        """Goal-seek many properties with shared parameters and rank them.
+
+        Body: ``{"property_ids": [...], ...}`` where the remaining keys are
+        those of ``PropertyGoalSeekResource.post`` except ``monthly_rent``.
+        Results are ordered by ``margin`` so the best offers come first.
+        """
+        try:
+            try:
+                valid_ids, errors = _parse_property_ids(data)
+                params = _parse_goal_seek_parameters(data)
+                if 'monthly_rent' in data:
+                    raise ValueError("'monthly_rent' is only accepted for a single property")
+                # Reject metric/variable pairs once rather than per property.
+                if (params['target_metric'], params['solve_for']) in INDEPENDENT_TARGETS:
+                    raise ValueError(f"'{params['target_metric']}' does not depend on '{params['solve_for']}'")
+            except (ValueError, TypeError) as e:
+                return error_response(f'Invalid goal-seek parameters: {e}', 'VALIDATION_ERROR', 400)
+
+            properties = Property.find_by_ids(valid_ids) if valid_ids else {}
+            markets = {}
+            results = []
+            for pid in valid_ids:
+                property_obj = properties.get(pid)
+                if property_obj is None:
+                    errors[pid] = {'code': 'NOT_FOUND', 'message': 'Property not found'}
+                    continue
+                try:
+                    location = _property_location(property_obj)
+                    if location not in markets:
+                        markets[location] = _get_market_dict(property_obj)
+                    results.append({
+                        'property_id': pid,
+                        **GoalSeek(property_obj, markets[location]).solve(**params),
+                    })
+                except ValueError as e:
+                    errors[pid] = {'code': 'VALIDATION_ERROR', 'message': str(e)}
+                except Exception as e:
+                    logger.exception("Failed batch goal seek for property %s", pid)
+                    errors[pid] = {'code': 'INTERNAL_ERROR', 'message': str(e)}
+
+            return {
+                'parameters': {k: v for k, v in data.items() if k != 'property_ids'},
+                'results': _rank_goal_seek_results(results),
+                'errors': errors,
+                'succeeded': len(results),
+                'failed': len(errors),
+            }, 200
+
+        except Exception as e:
+            logger.exception("Failed batch goal seek")
             return error_response(str(e), 'INTERNAL_ERROR', 500)
 
 
 class MarketAnalysisResource(Resource):
     @require_entity(Market, 'market_id', inject_as='market_obj')
+    @cached_response('market_analysis', entity_key('market_id', 'market_obj'))
     def get(self, market_id, market_obj):
         """Get market analysis for a specific market area"""
         try:
@@ -205,6 +615,7 @@ class MarketAnalysisResource(Resource):
 
 class OpportunityScoringResource(Resource):
     @require_entity(Property, 'property_id', inject_as='property_obj')
+    @cached_response('opportunity_score', entity_key('property_id', 'property_obj'))
     def get(self, property_id, property_obj):
         """Get investment opportunity score for a property"""
         try:
@@ -220,6 +631,8 @@ class OpportunityScoringResource(Resource):
 
 
 class TopMarketsResource(Resource):
+    @cached_response('top_markets', query_key(('limit', 'metric')),
+                     timeout_config='LISTING_CACHE_TIMEOUT')
     def get(self):
         """Get top performing markets based on investment metrics"""
         try:
@@ -0,0 +1,312 @@
+"""Async handlers for the read-heavy endpoints served by ``asgi.py``.
+
+Each handler mirrors a Flask-RESTful resource method.  It takes the async
+database handle (``utils.async_database``) plus the request's path
+parameters, query arguments or JSON body, and returns ``(body, status)``.
+Parsing, analysis and serialization reuse the Flask routes' helpers, so both
+entry points return the same payloads.
+
+Lookups that do not depend on each other are awaited together: a listing
+page and its total, the zip/city/state market fallback levels, and the
+markets of a batch's distinct locations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from bson import ObjectId
+
+from models.market import Market
+from models.property import Property
+from routes.analysis import (
+    _parse_batch_request,
+    _parse_custom_parameters,
+    _property_location,
+    _run_batch_analysis,
+    _run_custom_analysis,
+    _run_default_analysis,
+)
+from routes.properties import _document_json, parse_list_fields, parse_property_filters
+from services.analysis.opportunity_scoring import OpportunityScoring
+from services.geographic.market_aggregator import MarketAggregator
+from services.geographic.market_cache import resolve_market_data_async
+from services.property_query import (
+    COUNT_STRATEGIES,
+    count_properties_async,
+    find_offset_page_async,
+)
+from utils.async_database import aggregate_to_list
+from utils.errors import error_response
+from utils.validation import is_valid_objectid
+
+logger = logging.getLogger(__name__)
+
+# metric query value -> aggregate field, as accepted by TopMarketsResource.
+TOP_MARKET_METRICS = {'roi': 'avg_roi', 'cap_rate': 'avg_cap_rate'}
+
+
+async def _load_entity(db, model_class, param_name, raw_id):
+    """Async ``require_entity``: returns ``(entity, None)`` or ``(None, error)``."""
+    if not is_valid_objectid(raw_id):
+        label = param_name.replace('_', ' ')
+        return None, error_response(f'Invalid {label} format', 'VALIDATION_ERROR', 400)
+    doc = await db[model_class.collection_name].find_one({'_id': ObjectId(raw_id)})
+    entity = model_class.from_dict(doc) if doc else None
+    if entity is None:
+        return None, error_response(f'{model_class.__name__} not found', 'NOT_FOUND', 404)
+    return entity, None
+
+
+def _property_json(property_obj):
+    result = property_obj.to_dict()
+    raw_id = getattr(property_obj, '_id', None)
+    if raw_id is not None:
+        result['_id'] = str(raw_id)
+    return result
+
+
+async def _market_for(db, property_obj):
+    return await resolve_market_data_async(db, *_property_location(property_obj))
+
+
+# ---------------------------------------------------------------------------
+# Properties
+# ---------------------------------------------------------------------------
+
+async def list_properties(db, args, default_count_strategy='exact'):
+    """``GET /api/v1/properties`` (see ``PropertyListResource.get``)."""
+    try:
+        try:
+            filters = parse_property_filters(args)
+        except (ValueError, TypeError):
+            return error_response('Invalid numeric filter parameter', 'VALIDATION_ERROR', 400)
+
+        try:
+            limit = max(1, min(100, int(args.get('limit', 50))))
+        except (ValueError, TypeError):
+            return error_response('Invalid pagination parameter', 'VALIDATION_ERROR', 400)
+
+        try:
+            fields = parse_list_fields(args.get('fields'))
+        except ValueError as e:
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
+
+        def serialize(rows):
+            if fields:
+                return [_document_json(doc) for doc in rows]
+            return [_property_json(prop) for prop in rows]
+
+        cursor_param = args.get('cursor')
+        if cursor_param is not None:
+            query = dict(filters)
+            if cursor_param != '':
+                if not is_valid_objectid(cursor_param):
+                    return error_response(
+                        'Invalid cursor format: must be a valid ObjectId string',
+                        'VALIDATION_ERROR', 400,
+                    )
+                query['_id'] = {'$gt': ObjectId(cursor_param)}
+            projection = {field: 1 for field in fields} if fields else None
+            docs = await (
+                db[Property.collection_name]
+                .find(query, projection)
+                .sort('_id', 1)
+                .limit(limit)
+                .to_list(length=limit)
+            )
+            if not fields:
+                docs = [p for p in (Property.from_dict(doc) for doc in docs) if p is not None]
+            data = serialize(docs)
+            has_more = len(data) == limit
+            return {
+                'data': data,
+                'next_cursor': data[-1]['_id'] if has_more else None,
+                'has_more': has_more,
+                'limit': limit,
+            }, 200
+
+        try:
+            page = max(1, int(args.get('page', 1)))
+        except (ValueError, TypeError):
+            return error_response('Invalid pagination parameter', 'VALIDATION_ERROR', 400)
+        sort_by = args.get('sortBy', 'price')
+        sort_order = 1 if args.get('sortOrder', 'asc') == 'asc' else -1
+
+        count_strategy = args.get('countStrategy', default_count_strategy)
+        if count_strategy not in COUNT_STRATEGIES:
+            return error_response(
+                f"'countStrategy' must be one of: {', '.join(COUNT_STRATEGIES)}",
+                'VALIDATION_ERROR', 400,
+            )
+
+        rows, counted = await asyncio.gather(
+            find_offset_page_async(
+                db, filters, page=page, limit=limit,
+                sort_by=sort_by, sort_order=sort_order, fields=fields,
+            ),
+            count_properties_async(db, filters, count_strategy),
+        )
+        total = counted['total']
+        return {
+            'data': serialize(rows),
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'pages': -(-total // limit),  # ceiling division
+            'count_strategy': counted['count_strategy'],
+            'total_is_lower_bound': counted['total_is_lower_bound'],
+        }, 200
+
+    except Exception as e:
+        logger.exception("Failed to list properties")
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+async def get_property(db, property_id):
+    """``GET /api/v1/properties/<property_id>``."""
+    try:
+        property_obj, error = await _load_entity(db, Property, 'property_id', property_id)
+        if error:
+            return error
+        return _property_json(property_obj), 200
+    except Exception as e:
+        logger.exception("Failed to get property %s", property_id)
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+async def analyze_property(db, property_id):
+    """``GET /api/v1/analysis/property/<property_id>``."""
+    try:
+        property_obj, error = await _load_entity(db, Property, 'property_id', property_id)
+        if error:
+            return error
+        market_data = await _market_for(db, property_obj)
+        return _run_default_analysis(property_obj, market_data), 200
+    except Exception as e:
+        logger.exception("Failed to analyze property %s", property_id)
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+async def custom_analysis(db, property_id, data):
+    """``POST /api/v1/analysis/property/<property_id>``."""
+    try:
+        property_obj, error = await _load_entity(db, Property, 'property_id', property_id)
+        if error:
+            return error
+        if not data or not isinstance(data, dict):
+            return error_response('Request body must be JSON', 'VALIDATION_ERROR', 400)
+        market_data = await _market_for(db, property_obj)
+
+        try:
+            params = _parse_custom_parameters(data)
+        except (ValueError, TypeError):
+            return error_response('Invalid numeric parameter', 'VALIDATION_ERROR', 400)
+
+        return {
+            'property_id': str(property_obj._id),
+            'parameters': data,
+            **_run_custom_analysis(property_obj, market_data, params),
+        }, 200
+    except Exception as e:
+        logger.exception("Failed custom analysis for property %s", property_id)
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+async def batch_analysis(db, data):
+    """``POST /api/v1/analysis/batch``; markets are resolved concurrently."""
+    try:
+        if not data or not isinstance(data, dict):
+            return error_response('Request body must be JSON', 'VALIDATION_ERROR', 400)
+        try:
+            valid_ids, params, errors = _parse_batch_request(data)
+        except ValueError as e:
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
+
+        properties = {}
+        if valid_ids:
+            docs = await (
+                db[Property.collection_name]
+                .find({'_id': {'$in': [ObjectId(pid) for pid in valid_ids]}})
+                .to_list(length=len(valid_ids))
+            )
+            for doc in docs:
+                property_obj = Property.from_dict(doc)
+                if property_obj is not None:
+                    properties[str(doc['_id'])] = property_obj
+
+        locations = list(dict.fromkeys(_property_location(p) for p in properties.values()))
+        resolved = await asyncio.gather(
+            *(resolve_market_data_async(db, *location) for location in locations)
+        )
+        markets = dict(zip(locations, resolved))
+
+        return _run_batch_analysis(data, valid_ids, properties, markets, params, errors), 200
+    except Exception as e:
+        logger.exception("Failed batch analysis")
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+async def score_property(db, property_id):
+    """``GET /api/v1/analysis/score/<property_id>``."""
+    try:
+        property_obj, error = await _load_entity(db, Property, 'property_id', property_id)
+        if error:
+            return error
+        market_data = await _market_for(db, property_obj)
+        result = OpportunityScoring(property_obj, market_data).calculate_score()
+        result['property_id'] = str(property_obj._id)
+        return result, 200
+    except Exception as e:
+        logger.exception("Failed to score opportunity for property %s", property_id)
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+# ---------------------------------------------------------------------------
+# Markets
+# ---------------------------------------------------------------------------
+
+async def market_analysis(db, market_id):
+    """``GET``/``POST /api/v1/analysis/market/<market_id>``."""
+    try:
+        market_obj, error = await _load_entity(db, Market, 'market_id', market_id)
+        if error:
+            return error
+        pipeline = MarketAggregator.pipeline_for_market(market_obj)
+        if pipeline is None:
+            return error_response('Invalid market type', 'INVALID_MARKET_TYPE', 400)
+        aggregated = await aggregate_to_list(db[Property.collection_name], pipeline)
+
+        return {
+            'market_id': str(market_obj._id),
+            'market_name': market_obj.name,
+            'market_type': market_obj.market_type,
+            'aggregate_data': aggregated[0] if aggregated else None,
+            'market_metrics': market_obj.metrics
+        }, 200
+    except Exception as e:
+        logger.exception("Failed to get market analysis for %s", market_id)
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+async def top_markets(db, args):
+    """``GET /api/v1/markets/top``."""
+    try:
+        try:
+            limit = max(1, min(int(args.get('limit', 10)), 100))
+        except (ValueError, TypeError):
+            return error_response('Invalid limit parameter', 'VALIDATION_ERROR', 400)
+        sort_field = TOP_MARKET_METRICS.get(args.get('metric', 'roi'))
+        if sort_field is None:
+            return error_response('Invalid metric', 'INVALID_METRIC', 400)
+
+        pipeline = MarketAggregator.top_markets_pipeline(limit=limit, sort_field=sort_field)
+        return await aggregate_to_list(db[Property.collection_name], pipeline), 200
+    except Exception as e:
+        logger.exception("Failed to get top markets")
+        return error_response(str(e), 'INTERNAL_ERROR', 500)
@@ -0,0 +1,85 @@
+from flask_restful import Resource
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from services.job_queue import JobQueue, job_to_dict
+from services.jobs import ON_DEMAND_JOBS
+from utils.errors import error_response
+from utils.request_validators import lazy_limit, require_json_body
+from utils.validation import is_valid_objectid
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Bounds for the caller-supplied job priority (higher runs first).
+MIN_JOB_PRIORITY = 0
+MAX_JOB_PRIORITY = 10
+DEFAULT_JOB_PRIORITY = 5
+
+# Enqueues allowed per client address; every job ends up as worker time and
+# a crawl as outbound Zillow traffic.
+JOB_ENQUEUE_RATE_LIMIT = os.getenv('JOB_ENQUEUE_RATE_LIMIT', '10/hour')
+
+# Usernames allowed to enqueue jobs that crawl external sites (comma
+# separated).  Empty means crawls only come from the scheduler.
+CRAWL_JOB_TYPES = frozenset({'crawl_city'})
+JOB_CRAWL_USERS = frozenset(
+    name.strip() for name in os.getenv('JOB_CRAWL_USERS', '').split(',') if name.strip()
+)
+
+
+class JobListResource(Resource):
+    decorators = [lazy_limit(JOB_ENQUEUE_RATE_LIMIT)]
+
+    @jwt_required()
+    @require_json_body
+    def post(self, data):
+        """Enqueue an on-demand background job for the worker processes.
+
+        Body: ``{"type": "crawl_city", "payload": {"city": ..., "state": ...}}``
+        or ``{"type": "rescore_market", "payload": {"market_id": ...}}``, with
+        an optional ``priority`` (0-10, default 5).  An identical job that is
+        still queued or running is returned instead of a new one.  Crawl jobs
+        are limited to the users listed in ``JOB_CRAWL_USERS``.
+        """
+        job_type = data.get('type')
+        if job_type not in ON_DEMAND_JOBS:
+            return error_response(
+                f"type must be one of: {', '.join(sorted(ON_DEMAND_JOBS))}",
+                'VALIDATION_ERROR', 400,
+            )
+        if job_type in CRAWL_JOB_TYPES and get_jwt_identity() not in JOB_CRAWL_USERS:
+            return error_response(
+                f'You are not allowed to enqueue {job_type} jobs', 'FORBIDDEN', 403,
+            )
+        payload = data.get('payload') or {}
+        if not isinstance(payload, dict):
+            return error_response('payload must be an object', 'VALIDATION_ERROR', 400)
+        try:
+            payload, dedupe_key = ON_DEMAND_JOBS[job_type](payload)
+            priority = int(data.get('priority', DEFAULT_JOB_PRIORITY))
+        except (ValueError, TypeError) as e:
+            return error_response(str(e), 'VALIDATION_ERROR', 400)
+        priority = max(MIN_JOB_PRIORITY, min(MAX_JOB_PRIORITY, priority))
+
+        try:
+            job = JobQueue().enqueue(job_type, payload, priority=priority, dedupe_key=dedupe_key)
+            return {'job': job_to_dict(job)}, 202
+        except Exception as e:
+            logger.exception("Failed to enqueue %s job", job_type)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class JobResource(Resource):
+    @jwt_required()
+    def get(self, job_id):
+        """Return a job's status, attempts, result or last error."""
+        if not is_valid_objectid(job_id):
+            return error_response('Invalid job ID format', 'VALIDATION_ERROR', 400)
+        try:
+            job = JobQueue().get(job_id)
+            if job is None:
+                return error_response('Job not found', 'NOT_FOUND', 404)
+            return {'job': job_to_dict(job)}, 200
+        except Exception as e:
+            logger.exception("Failed to get job %s", job_id)
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
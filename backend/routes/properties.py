@@ -1,11 +1,14 @@
 from datetime import datetime
-from flask import request
+from flask import Response, current_app, request, stream_with_context
 from flask_restful import Resource
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from models.property import Property
+from services.property_query import COUNT_STRATEGIES, count_properties, find_offset_page, invalidate_property_counts
+from services.property_export import DEFAULT_BATCH_SIZE, csv_lines, iter_property_rows, ndjson_lines
 from utils.database import get_db
 from utils.errors import error_response
 from utils.request_validators import require_json_body, require_entity
+from utils.response_cache import cached_response, invalidate_listings, invalidate_property, query_key
 from bson import ObjectId
 import logging
 
@@ -13,6 +16,22 @@ logger = logging.getLogger(__name__)
 
 ALLOWED_PROPERTY_TYPES = ['single_family', 'condo', 'townhouse', 'multi_family', 'land', 'commercial']
 
+MIN_EXPORT_BATCH_SIZE = 10
+MAX_EXPORT_BATCH_SIZE = 2000
+
+# format -> (line encoder, mimetype) for PropertyExportResource.
+EXPORT_FORMATS = {
+    'ndjson': (ndjson_lines, 'application/x-ndjson'),
+    'csv': (csv_lines, 'text/csv'),
+}
+
+# Query parameters read by PropertyListResource.get; they form its cache key.
+LISTING_QUERY_PARAMS = (
+    'minPrice', 'maxPrice', 'minBedrooms', 'minBathrooms', 'minScore',
+    'propertyType', 'city', 'state', 'zipCode', 'limit', 'cursor', 'page',
+    'sortBy', 'sortOrder', 'countStrategy', 'fields',
+)
+
 
 def validate_property_data(data, require_all=True):
     """Validate property fields. Returns (is_valid, error_message).
@@ -97,7 +116,81 @@ def validate_property_data(data, require_all=True):
     return True, None
 
 
+def parse_property_filters(args):
+    """Build a MongoDB filter from the property list query parameters.
+
+    Raises ``ValueError``/``TypeError`` when a numeric filter is malformed.
+    """
+    filters = {}
+    price_min = args.get('minPrice')
+    price_max = args.get('maxPrice')
+    if price_min or price_max:
+        filters['price'] = {}
+        if price_min:
+            filters['price']['$gte'] = int(price_min)
+        if price_max:
+            filters['price']['$lte'] = int(price_max)
+
+    bedrooms_min = args.get('minBedrooms')
+    if bedrooms_min:
+        filters['bedrooms'] = {'$gte': float(bedrooms_min)}
+
+    bathrooms_min = args.get('minBathrooms')
+    if bathrooms_min:
+        filters['bathrooms'] = {'$gte': float(bathrooms_min)}
+
+    score_min = args.get('minScore')
+    if score_min:
+        filters['score'] = {'$gte': float(score_min)}
+
+    property_type = args.get('propertyType')
+    if property_type:
+        filters['property_type'] = property_type
+
+    city = args.get('city')
+    if city:
+        filters['city'] = city
+
+    state = args.get('state')
+    if state:
+        filters['state'] = state
+
+    zip_code = args.get('zipCode')
+    if zip_code:
+        filters['zip_code'] = zip_code
+
+    return filters
+
+
+def parse_list_fields(value):
+    """Parse the comma-separated ``fields`` list parameter.
+
+    Returns a tuple of field names, or None when the parameter is absent or
+    blank.  Raises ``ValueError`` naming any field outside
+    ``Property.projectable_fields``.
+    """
+    if not value:
+        return None
+    fields = tuple(dict.fromkeys(f.strip() for f in value.split(',') if f.strip()))
+    unknown = [f for f in fields if f not in Property.projectable_fields]
+    if unknown:
+        raise ValueError(f"Unknown field(s) in 'fields': {', '.join(unknown)}")
+    return fields or None
+
+
+def _document_json(doc):
+    """Make a raw projected property document JSON-serializable."""
+    for key, value in doc.items():
+        if isinstance(value, ObjectId):
+            doc[key] = str(value)
+        elif isinstance(value, datetime):
+            doc[key] = value.isoformat()
+    return doc
+
+
 class PropertyListResource(Resource):
+    @cached_response('property_list', query_key(LISTING_QUERY_PARAMS, listings=True, presence=('cursor',)),
+                     timeout_config='LISTING_CACHE_TIMEOUT')
     def get(self):
         """Get list of properties with filtering options.
 
@@ -113,52 +206,19 @@ class PropertyListResource(Resource):
             by the previous page.  Pass an empty string or omit the
             parameter entirely for the first page.
             Response: {data, next_cursor, has_more, limit}
+
+        Either mode accepts ``fields=price,city,...`` to return only those
+        fields (plus ``_id``) straight from a projected query.
         """
         try:
             # Parse and validate common filter query parameters
-            filters = {}
             try:
-                price_min = request.args.get('minPrice')
-                price_max = request.args.get('maxPrice')
-                if price_min or price_max:
-                    filters['price'] = {}
-                    if price_min:
-                        filters['price']['$gte'] = int(price_min)
-                    if price_max:
-                        filters['price']['$lte'] = int(price_max)
-
-                bedrooms_min = request.args.get('minBedrooms')
-                if bedrooms_min:
-                    filters['bedrooms'] = {'$gte': float(bedrooms_min)}
-
-                bathrooms_min = request.args.get('minBathrooms')
-                if bathrooms_min:
-                    filters['bathrooms'] = {'$gte': float(bathrooms_min)}
-
-                score_min = request.args.get('minScore')
-                if score_min:
-                    filters['score'] = {'$gte': float(score_min)}
+                filters = parse_property_filters(request.args)
             except (ValueError, TypeError):
                 return error_response(
                     'Invalid numeric filter parameter', 'VALIDATION_ERROR', 400
                 )
 
-            property_type = request.args.get('propertyType')
-            if property_type:
-                filters['property_type'] = property_type
-
-            city = request.args.get('city')
-            if city:
-                filters['city'] = city
-
-            state = request.args.get('state')
-            if state:
-                filters['state'] = state
-
-            zip_code = request.args.get('zipCode')
-            if zip_code:
-                filters['zip_code'] = zip_code
-
             # Validate and clamp the limit parameter (shared by both modes).
             try:
                 limit = max(1, min(100, int(request.args.get('limit', 50))))
@@ -167,6 +227,11 @@ class PropertyListResource(Resource):
                     'Invalid pagination parameter', 'VALIDATION_ERROR', 400
                 )
 
+            try:
+                fields = parse_list_fields(request.args.get('fields'))
+            except ValueError as e:
+                return error_response(str(e), 'VALIDATION_ERROR', 400)
+
             # ------------------------------------------------------------------
             # Cursor-based pagination branch
             # ------------------------------------------------------------------
@@ -188,23 +253,29 @@ class PropertyListResource(Resource):
                     filters=filters,
                     limit=limit,
                     cursor=cursor_oid,
+                    fields=fields,
                 )
 
                 # Serialize and capture the _id of each result for next_cursor.
                 properties_json = []
                 last_id = None
-                for prop in properties:
-                    prop_dict = prop.to_dict()
-                    raw_id = getattr(prop, '_id', None)
-                    if raw_id is not None:
-                        str_id = str(raw_id)
-                        prop_dict['_id'] = str_id
-                        last_id = str_id
-                    elif '_id' in prop_dict and isinstance(prop_dict['_id'], ObjectId):
-                        str_id = str(prop_dict['_id'])
-                        prop_dict['_id'] = str_id
-                        last_id = str_id
-                    properties_json.append(prop_dict)
+                if fields:
+                    properties_json = [_document_json(doc) for doc in properties]
+                    if properties_json:
+                        last_id = properties_json[-1]['_id']
+                else:
+                    for prop in properties:
+                        prop_dict = prop.to_dict()
+                        raw_id = getattr(prop, '_id', None)
+                        if raw_id is not None:
+                            str_id = str(raw_id)
+                            prop_dict['_id'] = str_id
+                            last_id = str_id
+                        elif '_id' in prop_dict and isinstance(prop_dict['_id'], ObjectId):
+                            str_id = str(prop_dict['_id'])
+                            prop_dict['_id'] = str_id
+                            last_id = str_id
+                        properties_json.append(prop_dict)
 
                 has_more = len(properties_json) == limit
                 return {
@@ -223,37 +294,53 @@ class PropertyListResource(Resource):
                 return error_response(
                     'Invalid pagination parameter', 'VALIDATION_ERROR', 400
                 )
-            skip = (page - 1) * limit
 
             # Sorting
             sort_by = request.args.get('sortBy', 'price')
             sort_order = 1 if request.args.get('sortOrder', 'asc') == 'asc' else -1
 
-            # Get properties
-            properties = Property.find_all(
-                filters=filters,
+            count_strategy = request.args.get(
+                'countStrategy', current_app.config.get('PROPERTY_COUNT_STRATEGY', 'exact')
+            )
+            if count_strategy not in COUNT_STRATEGIES:
+                return error_response(
+                    f"'countStrategy' must be one of: {', '.join(COUNT_STRATEGIES)}",
+                    'VALIDATION_ERROR', 400,
+                )
+
+            # Get properties (deep pages seek on the sort key instead of skipping)
+            db = get_db()
+            properties = find_offset_page(
+                db,
+                filters,
+                page=page,
                 limit=limit,
-                skip=skip,
                 sort_by=sort_by,
-                sort_order=sort_order
+                sort_order=sort_order,
+                fields=fields,
             )
 
             # Convert to JSON
-            properties_json = [p.to_dict() for p in properties]
-            for p in properties_json:
-                if '_id' in p and isinstance(p['_id'], ObjectId):
-                    p['_id'] = str(p['_id'])
-
-            # Count total matching documents for pagination metadata
-            db = get_db()
-            total = db[Property.collection_name].count_documents(filters)
+            if fields:
+                properties_json = [_document_json(doc) for doc in properties]
+            else:
+                properties_json = [p.to_dict() for p in properties]
+                for p in properties_json:
+                    if '_id' in p and isinstance(p['_id'], ObjectId):
+                        p['_id'] = str(p['_id'])
+
+            # Count matching documents for pagination metadata
+            counted = count_properties(db, filters, count_strategy)
+            total = counted['total']
 
             return {
                 'data': properties_json,
                 'total': total,
                 'page': page,
                 'limit': limit,
-                'pages': -(-total // limit)  # ceiling division
+                'pages': -(-total // limit),  # ceiling division
+                'count_strategy': counted['count_strategy'],
+                'total_is_lower_bound': counted['total_is_lower_bound'],
             }, 200
 
         except Exception as e:
@@ -302,6 +389,8 @@ class PropertyListResource(Resource):
 
             # Save to database
             property.save()
+            invalidate_listings()
+            invalidate_property_counts()
 
             # Return created property
             result = property.to_dict()
@@ -348,6 +437,9 @@ class PropertyResource(Resource):
             if not is_valid:
                 return error_response(error_msg, 'VALIDATION_ERROR', 400)
 
+            # Cached responses are keyed on the pre-update version
+            stale_version = getattr(property_obj, 'updated_at', None)
+
             # Update only whitelisted fields
             UPDATABLE_FIELDS = {
                 'address', 'city', 'state', 'zip_code', 'price', 'bedrooms',
@@ -361,6 +453,8 @@ class PropertyResource(Resource):
 
             # Save changes
             property_obj.save()
+            invalidate_property(property_id, stale_version)
+            invalidate_property_counts()
 
             # Return updated property
             result = property_obj.to_dict()
@@ -387,9 +481,70 @@ class PropertyResource(Resource):
             # Delete from database
             db = get_db()
             db[Property.collection_name].delete_one({'_id': ObjectId(property_id)})
+            invalidate_property(property_id, getattr(property_obj, 'updated_at', None))
+            invalidate_property_counts()
 
             return {'message': 'Property deleted successfully'}, 200
 
         except Exception as e:
             logger.exception("Failed to delete property %s", property_id)
             return error_response(str(e), 'INTERNAL_ERROR', 500)
+
+
+class PropertyExportResource(Resource):
+    def get(self):
+        """Stream every property matching the list filters.
+
+        Query parameters are the list endpoint's filters plus ``format``
+        (``ndjson``, the default, or ``csv``), ``includeMetrics`` (``true``
+        adds default-parameter financial metrics) and ``batchSize``.
+        """
+        try:
+            try:
+                filters = parse_property_filters(request.args)
+                batch_size = max(
+                    MIN_EXPORT_BATCH_SIZE,
+                    min(MAX_EXPORT_BATCH_SIZE, int(request.args.get('batchSize', DEFAULT_BATCH_SIZE))),
+                )
+            except (ValueError, TypeError):
+                return error_response(
+                    'Invalid numeric filter parameter', 'VALIDATION_ERROR', 400
+                )
+
+            export_format = request.args.get('format', 'ndjson').lower()
+            if export_format not in EXPORT_FORMATS:
+                return error_response(
+                    f"'format' must be one of: {', '.join(EXPORT_FORMATS)}",
+                    'VALIDATION_ERROR', 400,
+                )
+            include_metrics = request.args.get('includeMetrics', '').lower() in ('1', 'true', 'yes')
+
+            db = get_db()
+            rows = iter_property_rows(db, filters, batch_size=batch_size,
+                                      include_metrics=include_metrics)
+            encode, mimetype = EXPORT_FORMATS[export_format]
+
+            def generate():
+                try:
+                    yield from encode(rows)
+                except Exception as e:
+                    # Headers are already sent.  Re-raising makes the server
+                    # drop the connection without the terminating chunk, so
+                    # the client sees an incomplete transfer rather than a
+                    # complete-looking 200.  NDJSON readers also get a last
+                    # line saying why.
+                    logger.exception("Property export failed mid-stream")
+                    if export_format == 'ndjson':
+                        yield from ndjson_lines([error_response(str(e), 'EXPORT_FAILED')[0]])
+                    raise
+            return Response(
+                stream_with_context(generate()),
+                mimetype=mimetype,
+                headers={
+                    'Content-Disposition': f'attachment; filename=properties.{export_format}',
+                },
+            )
+
+        except Exception as e:
+            logger.exception("Failed to export properties")
+            return error_response(str(e), 'INTERNAL_ERROR', 500)
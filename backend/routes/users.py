@@ -1,11 +1,11 @@
 import re
-from functools import wraps
 
 from flask_restful import Resource, reqparse
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt
 from werkzeug.security import generate_password_hash, check_password_hash
 from utils.database import get_db
 from utils.auth import add_token_to_blocklist
+from utils.request_validators import lazy_limit
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,26 +36,8 @@ def _validate_password(password):
     return None
 
 
-def _lazy_limit(limit_string):
-    """Lazy rate-limit decorator that imports limiter at call time to avoid circular imports.
-
-    Respects RATELIMIT_ENABLED=False in app config (used to disable rate
-    limiting during tests).
-    """
-    def decorator(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            from flask import current_app
-            from app import limiter
-            if not current_app.config.get('RATELIMIT_ENABLED', True):
-                return f(*args, **kwargs)
-            return limiter.limit(limit_string)(f)(*args, **kwargs)
-        return wrapper
-    return decorator
-
-
 class UserRegistration(Resource):
-    decorators = [_lazy_limit("3/hour")]
+    decorators = [lazy_limit("3/hour")]
 
     def post(self):
         """Register a new user.
@@ -99,7 +81,7 @@ class UserRegistration(Resource):
 
 
 class UserLogin(Resource):
-    decorators = [_lazy_limit("5/minute")]
+    decorators = [lazy_limit("5/minute")]
 
     def post(self):
         """Authenticate a user and return a JWT access token.
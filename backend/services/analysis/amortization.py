@@ -0,0 +1,210 @@
+"""Loan amortization schedules shared by the analysis services.
+
+:class:`FinancialMetrics`, :class:`TaxBenefits`, :class:`FinancingOptions`
+and :class:`OpportunityScoring` all need the same loan arithmetic: the
+level monthly payment, the interest paid in a given year, and the balance
+remaining.  :func:`amortize` computes the full month-by-month schedule once
+as NumPy arrays and memoizes it, so one custom analysis (financial metrics
+plus tax benefits on the same loan) builds each schedule a single time.
+
+Closed forms
+------------
+With principal ``P``, monthly rate ``r``, ``n`` payments and growth factor
+``g(k) = (1 + r) ** k``:
+
+- payment ``A = P * (r * g(n)) / (g(n) - 1)``, evaluated in exactly this
+  order so it matches :class:`FinancialMetricsBatch` bit-for-bit;
+- balance after ``k`` payments ``B(k) = P * g(k) - A * (g(k) - 1) / r``;
+- cumulative interest over the first ``k`` payments ``A * k - (P - B(k))``.
+
+Point queries (:meth:`AmortizationSchedule.cumulative_interest`,
+:meth:`~AmortizationSchedule.interest_in_year`) use the closed forms on
+Python floats rather than summing the arrays.
+
+Mortgage insurance
+------------------
+PMI/MIP is charged monthly as ``insurance_rate`` of the original principal
+per year.  It stops once the scheduled balance at the start of a month is at
+or below ``insurance_cancel_balance`` (conventional PMI cancels at 78 % of
+the purchase price), or after ``insurance_months`` payments (FHA MIP with
+10 %+ down lasts 11 years).  With neither, it runs for the life of the loan.
+
+Usage example::
+
+    schedule = amortize(320_000, 0.065, 30)
+    schedule.payment                 # unrounded principal and interest
+    schedule.interest_in_year(1)     # first-year mortgage interest
+    schedule.balance[-1]             # 0.0
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+# Distinct loans kept by the memo; one schedule is a few KB of arrays.
+_SCHEDULE_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, eq=False)
+class AmortizationSchedule:
+    """Month-by-month schedule of a fixed-rate, level-payment loan.
+
+    The arrays have one entry per payment and are read-only, since
+    schedules are shared through the memo in :func:`amortize`.
+
+    Attributes
+    ----------
+    principal, annual_rate, term_years:
+        The loan terms.
+    payment:
+        Unrounded monthly principal and interest payment.
+    interest, principal_paid:
+        Interest and principal portions of each payment.
+    balance:
+        Balance remaining after each payment; the last entry is 0.
+    insurance:
+        PMI/MIP charged with each payment (0 once it has dropped off).
+    """
+
+    principal: float
+    annual_rate: float
+    term_years: int
+    payment: float
+    interest: np.ndarray
+    principal_paid: np.ndarray
+    balance: np.ndarray
+    insurance: np.ndarray
+
+    @property
+    def monthly_rate(self) -> float:
+        return self.annual_rate / 12
+
+    @property
+    def num_payments(self) -> int:
+        return self.term_years * 12
+
+    @property
+    def total_interest(self) -> float:
+        """Interest paid over the whole term."""
+        return self.payment * self.num_payments - self.principal
+
+    @property
+    def total_insurance(self) -> float:
+        """PMI/MIP paid over the whole term."""
+        return float(self.insurance.sum())
+
+    @property
+    def insurance_months(self) -> int:
+        """Number of payments that carry PMI/MIP."""
+        return int(np.count_nonzero(self.insurance))
+
+    def balance_after(self, months: int) -> float:
+        """Balance remaining after *months* payments (closed form)."""
+        months = max(0, min(int(months), self.num_payments))
+        if months == self.num_payments:
+            return 0.0
+        r = self.monthly_rate
+        if r == 0:
+            return self.principal - self.payment * months
+        growth = (1 + r) ** months
+        return self.principal * growth - self.payment * (growth - 1) / r
+
+    def cumulative_interest(self, months: int) -> float:
+        """Interest paid over the first *months* payments (closed form)."""
+        months = max(0, min(int(months), self.num_payments))
+        if self.monthly_rate == 0:
+            return 0.0
+        return self.payment * months - (self.principal - self.balance_after(months))
+
+    def interest_in_year(self, year: int) -> float:
+        """Interest paid in loan year *year* (1-based); 0 after the term."""
+        return self.cumulative_interest(12 * year) - self.cumulative_interest(12 * (year - 1))
+
+    def annual_interest(self, years: int | None = None) -> np.ndarray:
+        """Interest paid in each of the first *years* loan years (default: the
+        term), with zeros for years after the loan is paid off."""
+        years = self.term_years if years is None else years
+        months = np.minimum(np.arange(years + 1) * 12, self.num_payments)
+        r = self.monthly_rate
+        if r == 0:
+            return np.zeros(years)
+        growth = (1 + r) ** months.astype(np.float64)
+        balance = self.principal * growth - self.payment * (growth - 1) / r
+        balance[months == self.num_payments] = 0.0
+        cumulative = self.payment * months - (self.principal - balance)
+        return np.diff(cumulative)
+
+
+def monthly_payment(principal: float, annual_rate: float, term_years: int) -> float:
+    """Unrounded level monthly payment for a fixed-rate loan."""
+    monthly_rate = annual_rate / 12
+    num_payments = term_years * 12
+    if monthly_rate == 0:
+        return principal / num_payments
+    growth = (1 + monthly_rate) ** num_payments
+    return principal * (monthly_rate * growth) / (growth - 1)
+
+
+def amortize(principal: float, annual_rate: float, term_years: int,
+             insurance_rate: float = 0.0, insurance_cancel_balance: float | None = None,
+             insurance_months: int | None = None) -> AmortizationSchedule:
+    """Return the (memoized) amortization schedule for a loan.
+
+    Parameters
+    ----------
+    principal:
+        Amount borrowed.
+    annual_rate:
+        Nominal annual interest rate as a decimal (0.065 for 6.5 %).
+    term_years:
+        Loan term in years.
+    insurance_rate:
+        Annual PMI/MIP rate on the original principal; 0 for none.
+    insurance_cancel_balance:
+        PMI/MIP stops once the balance reaches this amount.
+    insurance_months:
+        PMI/MIP stops after this many payments.
+    """
+    return _schedule(
+        float(principal), float(annual_rate), int(term_years), float(insurance_rate),
+        None if insurance_cancel_balance is None else float(insurance_cancel_balance),
+        None if insurance_months is None else int(insurance_months),
+    )
+
+
+@functools.lru_cache(maxsize=_SCHEDULE_CACHE_SIZE)
+def _schedule(principal: float, annual_rate: float, term_years: int, insurance_rate: float,
+              insurance_cancel_balance: float | None,
+              insurance_months: int | None) -> AmortizationSchedule:
+    r = annual_rate / 12
+    n = term_years * 12
+    payment = monthly_payment(principal, annual_rate, term_years)
+    months = np.arange(n + 1, dtype=np.float64)
+
+    # balance[k] is the balance after k payments, balance[0] the principal.
+    if r == 0:
+        balance = principal - payment * months
+    else:
+        growth = np.power(1 + r, months)
+        balance = principal * growth - payment * (growth - 1) / r
+    balance[-1] = 0.0
+    opening = balance[:-1]
+    interest = opening * r
+    principal_paid = opening - balance[1:]
+
+    insurance = np.zeros(n)
+    if insurance_rate > 0:
+        charged = np.ones(n, dtype=bool)
+        if insurance_cancel_balance is not None:
+            charged &= opening > insurance_cancel_balance
+        if insurance_months is not None:
+            charged[insurance_months:] = False
+        insurance[charged] = principal * insurance_rate / 12
+
+    arrays = (interest, principal_paid, balance[1:], insurance)
+    for arr in arrays:
+        arr.setflags(write=False)
+    return AmortizationSchedule(principal, annual_rate, term_years, payment, *arrays)
@@ -1,3 +1,6 @@
+from services.analysis.amortization import amortize
+
+
 class FinancialMetrics:
     def __init__(self, property_data, market_data):
         self.property = property_data
@@ -56,14 +59,12 @@ class FinancialMetrics:
     def calculate_mortgage_payment(self, down_payment_percentage=0.20, interest_rate=0.045, term_years=30):
         """Calculate monthly mortgage payment"""
         loan_amount = self.property.price * (1 - down_payment_percentage)
-        monthly_rate = interest_rate / 12
-        num_payments = term_years * 12
+        schedule = amortize(loan_amount, interest_rate, term_years)
 
-        if monthly_rate == 0:
-            return loan_amount / num_payments
+        if schedule.monthly_rate == 0:
+            return schedule.payment
 
-        monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / ((1 + monthly_rate) ** num_payments - 1)
-        return round(monthly_payment, 2)
+        return round(schedule.payment, 2)
 
     def calculate_cash_flow(self, monthly_rent, monthly_expenses, mortgage_payment):
         """Calculate monthly cash flow"""
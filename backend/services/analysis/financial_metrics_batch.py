@@ -0,0 +1,402 @@
+"""Vectorized counterpart to :class:`FinancialMetrics` for portfolio-scale runs.
+
+:meth:`FinancialMetrics.analyze_property` works on one property at a time and
+rounds every intermediate value with ``round()``.  That is fine for a single
+API request but dominated by interpreter overhead when re-analysing hundreds of
+thousands of listings.  :class:`FinancialMetricsBatch` takes columnar inputs
+and evaluates the same formulas with NumPy in a single pass.
+
+Exactness
+---------
+Results are required to match the scalar path bit-for-bit, which needs care in
+two places:
+
+- ``round(x, 2)`` rounds the exact binary value of *x*, whereas
+  ``np.rint(x * 100)`` rounds the already-rounded product.  The two only
+  disagree when ``x * 100`` rounds onto an exact ``.5``; :meth:`_round2`
+  recovers the rounding error of the product (Dekker's two-product) and uses
+  its sign to break those ties the way ``round()`` does.
+- ``np.power`` may be backed by a SIMD implementation that differs from the C
+  library ``pow`` used by Python's ``**`` in the last ulp.  Powers whose
+  inputs repeat across rows (the mortgage and appreciation growth factors) are
+  computed once per distinct input with ``**``.  The annualised ROI root is
+  genuinely per-row, so rows where it lands within a hair of a rounding tie
+  are recomputed through the scalar :class:`FinancialMetrics` path at the end.
+
+Usage example::
+
+    batch = FinancialMetricsBatch.from_records(properties, market_dicts)
+    columns = batch.analyze(interest_rate=0.05)
+    rows = batch.to_records(columns)   # same dicts analyze_property returns
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+
+from services.analysis.financial_metrics import FinancialMetrics
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Defaults mirrored from FinancialMetrics (keep in sync)
+# ---------------------------------------------------------------------------
+_DEFAULT_PRICE_TO_RENT_RATIO: float = 15
+_DEFAULT_PROPERTY_TAX_RATE: float = 0.01
+_DEFAULT_VACANCY_RATE: float = 0.08
+_DEFAULT_HOA_FEE: float = 0
+_DEFAULT_MARKET_APPRECIATION: float = 0.03
+
+_INSURANCE_RATE: float = 0.0035
+_MAINTENANCE_RATE: float = 0.01
+_MANAGEMENT_RATE: float = 0.1
+_CLOSING_COST_RATE: float = 0.03
+_BREAK_EVEN_DOWN_PAYMENT: float = 0.20
+
+# Rows whose pow()-derived values fall within this distance of a rounding tie
+# are recomputed through the scalar path.
+_TIE_ABS_TOLERANCE: float = 1e-9
+_TIE_REL_TOLERANCE: float = 1e-13
+
+# Veltkamp splitting constant (2**27 + 1) used by the exact rounding helper.
+_SPLITTER: float = 134217729.0
+
+
+def _column(values: Any, size: int, name: str) -> np.ndarray:
+    """Return *values* as a float64 array of length *size* (scalars broadcast)."""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.ndim == 0:
+        return np.full(size, float(arr))
+    if arr.shape != (size,):
+        raise ValueError(
+            f"'{name}' must be a scalar or have shape ({size},); got {arr.shape}"
+        )
+    return arr
+
+
+def _market_value(market: dict[str, Any], key: str, default: float) -> float:
+    """Read a market field, treating an explicit ``None`` as missing."""
+    value = market.get(key, default)
+    return default if value is None else value
+
+
+class FinancialMetricsBatch:
+    """Evaluate :meth:`FinancialMetrics.analyze_property` over many rows at once.
+
+    Parameters
+    ----------
+    prices:
+        Purchase prices, one per property.
+    price_to_rent_ratio, property_tax_rate, vacancy_rate, avg_hoa_fee, appreciation_rate:
+        Market inputs, either one value per property or a scalar shared by
+        every row.  ``appreciation_rate`` here is the *market* rate used by the
+        break-even calculation, not the holding-period assumption passed to
+        :meth:`analyze`.
+    """
+
+    def __init__(
+        self,
+        prices: Sequence[float] | np.ndarray,
+        price_to_rent_ratio: Any = _DEFAULT_PRICE_TO_RENT_RATIO,
+        property_tax_rate: Any = _DEFAULT_PROPERTY_TAX_RATE,
+        vacancy_rate: Any = _DEFAULT_VACANCY_RATE,
+        avg_hoa_fee: Any = _DEFAULT_HOA_FEE,
+        appreciation_rate: Any = _DEFAULT_MARKET_APPRECIATION,
+    ) -> None:
+        self.prices = np.asarray(prices, dtype=np.float64).reshape(-1)
+        size = self.prices.shape[0]
+        self.price_to_rent_ratio = _column(price_to_rent_ratio, size, "price_to_rent_ratio")
+        self.property_tax_rate = _column(property_tax_rate, size, "property_tax_rate")
+        self.vacancy_rate = _column(vacancy_rate, size, "vacancy_rate")
+        self.avg_hoa_fee = _column(avg_hoa_fee, size, "avg_hoa_fee")
+        self.appreciation_rate = _column(appreciation_rate, size, "appreciation_rate")
+
+    def __len__(self) -> int:
+        return self.prices.shape[0]
+
+    @classmethod
+    def from_records(
+        cls,
+        properties: Iterable[Any],
+        market_data: dict[str, Any] | Iterable[dict[str, Any]],
+    ) -> "FinancialMetricsBatch":
+        """Build a batch from property objects and market dicts.
+
+        Parameters
+        ----------
+        properties:
+            Objects exposing a ``price`` attribute (e.g. :class:`Property`).
+        market_data:
+            Either a single market dict shared by every property or an
+            iterable of market dicts aligned with *properties*.  Missing keys
+            and explicit ``None`` values fall back to the scalar defaults.
+        """
+        props = list(properties)
+        if isinstance(market_data, dict):
+            markets = [market_data] * len(props)
+        else:
+            markets = list(market_data)
+            if len(markets) != len(props):
+                raise ValueError("market_data must align with properties")
+
+        return cls(
+            prices=[p.price for p in props],
+            price_to_rent_ratio=[_market_value(m, "price_to_rent_ratio", _DEFAULT_PRICE_TO_RENT_RATIO) for m in markets],
+            property_tax_rate=[_market_value(m, "property_tax_rate", _DEFAULT_PROPERTY_TAX_RATE) for m in markets],
+            vacancy_rate=[_market_value(m, "vacancy_rate", _DEFAULT_VACANCY_RATE) for m in markets],
+            avg_hoa_fee=[_market_value(m, "avg_hoa_fee", _DEFAULT_HOA_FEE) for m in markets],
+            appreciation_rate=[_market_value(m, "appreciation_rate", _DEFAULT_MARKET_APPRECIATION) for m in markets],
+        )
+
+    # ------------------------------------------------------------------
+    # Rounding helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _round2(values: np.ndarray, ambiguous: np.ndarray | None = None) -> np.ndarray:
+        """Round to 2 dp exactly like ``round(x, 2)``.
+
+        When *ambiguous* is given, rows within tolerance of a tie are flagged
+        for the scalar fallback (used for values carrying ``np.power`` error).
+        """
+        scaled = values * 100.0
+        # Exact rounding error of the product: values * 100 == scaled + error.
+        t = values * _SPLITTER
+        hi = t - (t - values)
+        lo = values - hi
+        error = (hi * 100.0 - scaled) + lo * 100.0
+
+        rounded = np.rint(scaled)
+        tie = np.abs(scaled - np.trunc(scaled)) == 0.5
+        rounded = np.where(tie & (error > 0), np.ceil(scaled), rounded)
+        rounded = np.where(tie & (error < 0), np.floor(scaled), rounded)
+
+        if ambiguous is not None:
+            frac = np.abs(scaled - np.trunc(scaled))
+            tolerance = _TIE_ABS_TOLERANCE + _TIE_REL_TOLERANCE * np.abs(scaled)
+            ambiguous |= np.abs(frac - 0.5) <= tolerance
+        return rounded / 100.0
+
+    @staticmethod
+    def _pow(base: np.ndarray, exponent: np.ndarray) -> np.ndarray:
+        """Elementwise ``base ** exponent`` using Python's ``**`` per distinct pair."""
+        if base.size == 0:
+            return np.empty(0)
+        if base.min() == base.max() and exponent.min() == exponent.max():
+            return np.full(base.shape, float(base[0]) ** float(exponent[0]))
+        # Pack each (base, exponent) pair into one complex value so a 1-D
+        # unique can be used; np.unique(axis=0) is an order of magnitude slower.
+        unique, inverse = np.unique(base + 1j * exponent, return_inverse=True)
+        powers = np.array([v.real ** v.imag for v in unique.tolist()], dtype=np.float64)
+        return powers[inverse]
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def analyze(
+        self,
+        down_payment_percentage: Any = 0.20,
+        interest_rate: Any = 0.045,
+        term_years: Any = 30,
+        holding_period: Any = 5,
+        appreciation_rate: Any = 0.03,
+    ) -> dict[str, Any]:
+        """Vectorized :meth:`FinancialMetrics.analyze_property`.
+
+        Every parameter may be a scalar or a per-row array.
+
+        Returns
+        -------
+        dict
+            The same keys as ``analyze_property`` with a NumPy array in place
+            of each scalar (``monthly_expenses`` and ``roi`` are dicts of
+            arrays).  Use :meth:`to_records` to get per-row dicts.
+        """
+        size = len(self)
+        price = self.prices
+        down_pct = _column(down_payment_percentage, size, "down_payment_percentage")
+        rate = _column(interest_rate, size, "interest_rate")
+        term = _column(term_years, size, "term_years")
+        holding = _column(holding_period, size, "holding_period")
+        appreciation = _column(appreciation_rate, size, "appreciation_rate")
+
+        ambiguous = np.zeros(size, dtype=bool)
+        r2 = self._round2
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # -- Rent -------------------------------------------------------
+            ptr = np.where(self.price_to_rent_ratio > 0, self.price_to_rent_ratio,
+                           _DEFAULT_PRICE_TO_RENT_RATIO)
+            ptr = np.where(np.isnan(ptr), _DEFAULT_PRICE_TO_RENT_RATIO, ptr)
+            monthly_rent = r2(price / ptr / 12)
+            annual_rental_income = monthly_rent * 12
+
+            # -- Expenses ---------------------------------------------------
+            monthly_property_tax = price * self.property_tax_rate / 12
+            monthly_insurance = price * _INSURANCE_RATE / 12
+            monthly_maintenance = price * _MAINTENANCE_RATE / 12
+            monthly_vacancy_cost = monthly_rent * self.vacancy_rate
+            monthly_management = monthly_rent * _MANAGEMENT_RATE
+            monthly_hoa = self.avg_hoa_fee
+            expenses_total = r2(
+                monthly_property_tax + monthly_insurance + monthly_maintenance
+                + monthly_vacancy_cost + monthly_management + monthly_hoa
+            )
+            monthly_expenses = {
+                "total": expenses_total,
+                "property_tax": r2(monthly_property_tax),
+                "insurance": r2(monthly_insurance),
+                "maintenance": r2(monthly_maintenance),
+                "vacancy": r2(monthly_vacancy_cost),
+                "management": r2(monthly_management),
+                "hoa": r2(monthly_hoa),
+            }
+            annual_expenses = expenses_total * 12
+
+            # -- Mortgage ---------------------------------------------------
+            loan_amount = price * (1 - down_pct)
+            monthly_rate = rate / 12
+            num_payments = term * 12
+            growth = self._pow(1 + monthly_rate, num_payments)
+            amortized = r2(loan_amount * (monthly_rate * growth) / (growth - 1))
+            # The zero-rate branch of the scalar path is deliberately unrounded.
+            mortgage_payment = np.where(monthly_rate == 0, loan_amount / num_payments, amortized)
+
+            # -- Cash flow --------------------------------------------------
+            down_payment = price * down_pct
+            closing_costs = price * _CLOSING_COST_RATE
+            monthly_cash_flow = r2(monthly_rent - expenses_total - mortgage_payment)
+            annual_cash_flow = monthly_cash_flow * 12
+
+            # -- Cap rate / CoC ---------------------------------------------
+            cap_rate = np.where(
+                price <= 0, 0.0,
+                r2((annual_rental_income - annual_expenses) / price * 100),
+            )
+            total_investment = down_payment + closing_costs
+            cash_on_cash = np.where(
+                total_investment <= 0, 0.0,
+                r2(annual_cash_flow / total_investment * 100),
+            )
+
+            # -- ROI --------------------------------------------------------
+            future_value = price * self._pow(1 + appreciation, holding)
+            total_cash_flow = annual_cash_flow * holding
+            appreciation_profit = future_value - price
+            roi_raw = (total_cash_flow + appreciation_profit) / total_investment * 100
+            base = 1 + roi_raw / 100
+            annualized_raw = np.where(base > 0, (base ** (1 / holding) - 1) * 100, -100.0)
+            has_investment = total_investment > 0
+            roi = {
+                "total_roi": np.where(has_investment, r2(roi_raw), 0.0),
+                "annualized_roi": np.where(has_investment, r2(annualized_raw, ambiguous), 0.0),
+                "future_value": r2(future_value),
+                "total_cash_flow": r2(total_cash_flow),
+                "appreciation_profit": r2(appreciation_profit),
+            }
+
+            # -- Break-even -------------------------------------------------
+            unrounded_cash_flow = monthly_rent - expenses_total - mortgage_payment
+            break_even_investment = (
+                price * _BREAK_EVEN_DOWN_PAYMENT + price * _CLOSING_COST_RATE
+            )
+            monthly_appreciation = price * self.appreciation_rate / 12
+            total_monthly_benefit = unrounded_cash_flow + monthly_appreciation
+            years_to_break_even = r2(break_even_investment / total_monthly_benefit / 12)
+            break_even = np.where(
+                unrounded_cash_flow >= 0, 0.0,
+                np.where(total_monthly_benefit <= 0, 99.0, years_to_break_even),
+            )
+
+            # -- Ratios -----------------------------------------------------
+            price_to_rent_ratio = np.where(
+                annual_rental_income > 0, r2(price / annual_rental_income), 0.0
+            )
+            gross_yield = np.where(
+                price > 0, r2(annual_rental_income / price * 100), 0.0
+            )
+
+        result = {
+            "monthly_rent": monthly_rent,
+            "monthly_expenses": monthly_expenses,
+            "mortgage_payment": mortgage_payment,
+            "monthly_cash_flow": monthly_cash_flow,
+            "annual_cash_flow": annual_cash_flow,
+            "cap_rate": cap_rate,
+            "cash_on_cash_return": cash_on_cash,
+            "roi": roi,
+            "break_even_point": break_even,
+            "price_to_rent_ratio": price_to_rent_ratio,
+            "gross_yield": gross_yield,
+            "total_investment": r2(total_investment),
+        }
+
+        # Flags raised inside np.where branches that were not selected are
+        # harmless: the scalar recompute below returns the same answer.
+        ambiguous_rows = np.flatnonzero(ambiguous)
+        if ambiguous_rows.size:
+            logger.debug(
+                "FinancialMetricsBatch: recomputing %d/%d near-tie rows via scalar path",
+                ambiguous_rows.size,
+                size,
+            )
+            params = (down_pct, rate, term, holding, appreciation)
+            for row in ambiguous_rows:
+                self._patch_row(result, row, self._scalar_row(row, params))
+
+        return result
+
+    def to_records(self, columns: dict[str, Any]) -> list[dict[str, Any]]:
+        """Convert the column dict from :meth:`analyze` into per-row dicts."""
+        expense_keys = list(columns["monthly_expenses"])
+        roi_keys = list(columns["roi"])
+        flat_keys = [k for k in columns if k not in ("monthly_expenses", "roi")]
+
+        flat = {k: columns[k].tolist() for k in flat_keys}
+        expenses = {k: columns["monthly_expenses"][k].tolist() for k in expense_keys}
+        roi = {k: columns["roi"][k].tolist() for k in roi_keys}
+
+        records = []
+        for i in range(len(self)):
+            row = {k: flat[k][i] for k in flat_keys}
+            row["monthly_expenses"] = {k: expenses[k][i] for k in expense_keys}
+            row["roi"] = {k: roi[k][i] for k in roi_keys}
+            records.append(row)
+        return records
+
+    # ------------------------------------------------------------------
+    # Scalar fallback
+    # ------------------------------------------------------------------
+
+    def _scalar_row(self, row: int, params: tuple[np.ndarray, ...]) -> dict[str, Any]:
+        """Run the scalar :class:`FinancialMetrics` path for one row."""
+        down_pct, rate, term, holding, appreciation = (float(p[row]) for p in params)
+        market = {
+            "price_to_rent_ratio": float(self.price_to_rent_ratio[row]),
+            "property_tax_rate": float(self.property_tax_rate[row]),
+            "vacancy_rate": float(self.vacancy_rate[row]),
+            "avg_hoa_fee": float(self.avg_hoa_fee[row]),
+            "appreciation_rate": float(self.appreciation_rate[row]),
+        }
+        prop = SimpleNamespace(price=float(self.prices[row]))
+        return FinancialMetrics(prop, market).analyze_property(
+            down_payment_percentage=down_pct,
+            interest_rate=rate,
+            term_years=int(term),
+            holding_period=int(holding),
+            appreciation_rate=appreciation,
+        )
+
+    @staticmethod
+    def _patch_row(columns: dict[str, Any], row: int, values: dict[str, Any]) -> None:
+        for key, value in values.items():
+            if isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    columns[key][sub_key][row] = sub_value
+            else:
+                columns[key][row] = value
@@ -1,3 +1,11 @@
+from services.analysis.amortization import amortize
+
+# Conventional PMI is cancelled once the balance reaches 78% of the
+# purchase price; FHA MIP lasts 11 years with 10%+ down, else the full term.
+PMI_CANCEL_LTV = 0.78
+FHA_MIP_MONTHS_WITH_10_PCT_DOWN = 11 * 12
+
+
 class FinancingOptions:
     def __init__(self, property_data, market_data):
         self.property = property_data
@@ -13,26 +21,22 @@ class FinancingOptions:
             adjusted_rate += 0.0025  # Higher rate for lower down payment
             
         loan_amount = self.property.price * (1 - down_payment_percentage)
-        monthly_rate = adjusted_rate / 12
-        num_payments = term_years * 12
 
-        # Calculate monthly payment
-        if monthly_rate == 0:
-            monthly_payment = loan_amount / num_payments
-        else:
-            monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / ((1 + monthly_rate) ** num_payments - 1)
+        # PMI if down payment less than 20%, until the balance reaches 78% LTV
+        pmi_rate = 0.005 if down_payment_percentage < 0.20 else 0.0  # 0.5% annual PMI rate
+        schedule = amortize(
+            loan_amount, adjusted_rate, term_years,
+            insurance_rate=pmi_rate,
+            insurance_cancel_balance=self.property.price * PMI_CANCEL_LTV,
+        )
+        monthly_payment = schedule.payment
+        monthly_pmi = (loan_amount * pmi_rate) / 12
 
-        # Calculate PMI if down payment less than 20%
-        monthly_pmi = 0
-        if down_payment_percentage < 0.20:
-            pmi_rate = 0.005  # 0.5% annual PMI rate
-            monthly_pmi = (loan_amount * pmi_rate) / 12
-            
         # Calculate total monthly payment
         total_monthly_payment = monthly_payment + monthly_pmi
-        
+
         # Calculate total cost over loan term
-        total_cost = total_monthly_payment * num_payments
+        total_cost = monthly_payment * schedule.num_payments + schedule.total_insurance
         total_interest = total_cost - loan_amount
         
         return {
@@ -44,6 +48,7 @@ class FinancingOptions:
             'term_years': term_years,
             'monthly_payment': round(monthly_payment, 2),
             'monthly_pmi': round(monthly_pmi, 2),
+            'pmi_months': schedule.insurance_months,
             'total_monthly_payment': round(total_monthly_payment, 2),
             'total_cost': round(total_cost, 2),
             'total_interest': round(total_interest, 2)
@@ -58,24 +63,23 @@ class FinancingOptions:
             down_payment_percentage = 0.035  # FHA minimum
             
         loan_amount = self.property.price * (1 - down_payment_percentage)
-        monthly_rate = interest_rate / 12
-        num_payments = term_years * 12
-
-        # Calculate monthly payment
-        if monthly_rate == 0:
-            monthly_payment = loan_amount / num_payments
-        else:
-            monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / ((1 + monthly_rate) ** num_payments - 1)
 
         # FHA requires both upfront and monthly mortgage insurance
+        mip_rate = 0.0055  # 0.55% annual MIP rate
+        schedule = amortize(
+            loan_amount, interest_rate, term_years,
+            insurance_rate=mip_rate,
+            insurance_months=FHA_MIP_MONTHS_WITH_10_PCT_DOWN if down_payment_percentage >= 0.10 else None,
+        )
+        monthly_payment = schedule.payment
         upfront_mip = loan_amount * 0.0175  # 1.75% upfront MIP
-        monthly_mip = (loan_amount * 0.0055) / 12  # 0.55% annual MIP rate
-        
+        monthly_mip = (loan_amount * mip_rate) / 12
+
         # Calculate total monthly payment
         total_monthly_payment = monthly_payment + monthly_mip
-        
+
         # Calculate total cost over loan term
-        total_cost = (total_monthly_payment * num_payments) + upfront_mip
+        total_cost = monthly_payment * schedule.num_payments + schedule.total_insurance + upfront_mip
         total_interest = total_cost - loan_amount
         
         return {
@@ -88,6 +92,7 @@ class FinancingOptions:
             'monthly_payment': round(monthly_payment, 2),
             'upfront_mip': round(upfront_mip, 2),
             'monthly_mip': round(monthly_mip, 2),
+            'mip_months': schedule.insurance_months,
             'total_monthly_payment': round(total_monthly_payment, 2),
             'total_cost': round(total_cost, 2),
             'total_interest': round(total_interest, 2)
@@ -105,18 +110,12 @@ class FinancingOptions:
         loan_amount = self.property.price * (1 - down_payment_percentage)
         funding_fee = loan_amount * funding_fee_percentage
         financed_amount = loan_amount + funding_fee
-        
-        monthly_rate = interest_rate / 12
-        num_payments = term_years * 12
 
-        # Calculate monthly payment
-        if monthly_rate == 0:
-            monthly_payment = financed_amount / num_payments
-        else:
-            monthly_payment = financed_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / ((1 + monthly_rate) ** num_payments - 1)
-        
+        schedule = amortize(financed_amount, interest_rate, term_years)
+        monthly_payment = schedule.payment
+
         # Calculate total cost over loan term
-        total_cost = monthly_payment * num_payments
+        total_cost = monthly_payment * schedule.num_payments
         total_interest = total_cost - loan_amount
         
         return {
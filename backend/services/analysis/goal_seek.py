@@ -0,0 +1,346 @@
+"""Goal seek: solve the financial model for the input that hits a target.
+
+Investors ask questions like "what is the most I can offer and still break
+even?" or "what rent does this need for a 6 % cap rate?".  Answering them
+with :meth:`FinancialMetrics.analyze_property` means guessing repeatedly.
+:class:`GoalSeek` inverts the same model instead.  It solves for one of
+``GOAL_SEEK_VARIABLES`` so that a metric in ``GOAL_SEEK_METRICS`` reaches a
+target value.
+
+The model
+---------
+The formulas are those of :class:`FinancialMetrics` without the
+intermediate rounding.  The monthly rent is an input.  It defaults to
+:meth:`FinancialMetrics.estimate_rental_income` at the listing price and is
+held fixed when solving for price: the rent a property commands does not
+change with the offer.
+
+With price ``P``, rent ``R``, down payment ``d``, and annuity factor ``A``
+(the monthly payment per dollar borrowed)::
+
+    cash flow  CF  = R * (1 - vacancy - management) - hoa
+                     - P * (tax + insurance + maintenance) / 12
+                     - P * (1 - d) * A
+    cap rate       = 1200 * (CF + P * (1 - d) * A) / P
+    cash-on-cash   = 1200 * CF / (P * (d + closing))
+    total ROI      = 100 * (12 * holding * CF + P * ((1 + g) ** holding - 1))
+                     / (P * (d + closing))
+
+Solvers
+-------
+In price, rent and down payment, each metric is a ratio of two affine
+functions ``(n0 + n1 x) / (d0 + d1 x)``.  Setting it to ``t`` gives the
+closed form ``x = (n0 - t d0) / (t d1 - n1)``.  The interest rate enters
+through the annuity factor, which is not affine, so it is solved with
+Brent's method on ``[0, MAX_GOAL_SEEK_RATE]``.  Both paths take
+microseconds per property.
+
+Usage example::
+
+    seek = GoalSeek(property_obj, market_data)
+    result = seek.solve('price', 'monthly_cash_flow', 0.0, interest_rate=0.065)
+    result['value'], result['margin']
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import sys
+from typing import Any, Callable
+
+from services.analysis.amortization import monthly_payment
+from services.analysis.financial_metrics import FinancialMetrics
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Defaults mirrored from FinancialMetrics (keep in sync)
+# ---------------------------------------------------------------------------
+_DEFAULT_PROPERTY_TAX_RATE = 0.01
+_DEFAULT_VACANCY_RATE = 0.08
+_DEFAULT_HOA_FEE = 0
+_INSURANCE_RATE = 0.0035
+_MAINTENANCE_RATE = 0.01
+_MANAGEMENT_RATE = 0.1
+_CLOSING_COST_RATE = 0.03
+
+# ---------------------------------------------------------------------------
+# Solver settings
+# ---------------------------------------------------------------------------
+# Upper end of the interest-rate bracket; matches the custom-analysis bound.
+MAX_GOAL_SEEK_RATE = 0.30
+_BRENT_XTOL = 1e-12
+_BRENT_RTOL = 4 * sys.float_info.epsilon
+_BRENT_MAX_ITER = 100
+
+GOAL_SEEK_METRICS = ('monthly_cash_flow', 'cap_rate', 'cash_on_cash_return', 'total_roi')
+
+# Variable -> (lower, upper) bounds of a meaningful solution.
+GOAL_SEEK_VARIABLES = {
+    'price': (0.0, math.inf),
+    'monthly_rent': (0.0, math.inf),
+    'down_payment_percentage': (0.0, 1.0),
+    'interest_rate': (0.0, MAX_GOAL_SEEK_RATE),
+}
+
+# Cap rate is computed before debt service, so financing cannot move it.
+INDEPENDENT_TARGETS = frozenset({
+    ('cap_rate', 'down_payment_percentage'),
+    ('cap_rate', 'interest_rate'),
+})
+
+
+def _brent(f: Callable[[float], float], a: float, b: float) -> tuple[float, int]:
+    """Root of *f* in ``[a, b]`` by Brent's method.
+
+    ``f(a)`` and ``f(b)`` must differ in sign.  Returns ``(root,
+    iterations)``.  This is the same algorithm as SciPy's ``brentq``:
+    inverse quadratic interpolation or secant steps, falling back to
+    bisection whenever a step would not shrink the bracket fast enough.
+    """
+    xpre, xcur = a, b
+    fpre, fcur = f(xpre), f(xcur)
+    if fpre == 0:
+        return xpre, 0
+    if fcur == 0:
+        return xcur, 0
+    if (fpre > 0) == (fcur > 0):
+        raise ValueError('f(a) and f(b) must have opposite signs')
+
+    xblk = fblk = spre = scur = 0.0
+    for iteration in range(1, _BRENT_MAX_ITER + 1):
+        if fpre != 0 and fcur != 0 and (fpre > 0) != (fcur > 0):
+            xblk, fblk = xpre, fpre
+            spre = scur = xcur - xpre
+        if abs(fblk) < abs(fcur):
+            xpre, xcur, xblk = xcur, xblk, xcur
+            fpre, fcur, fblk = fcur, fblk, fcur
+
+        delta = (_BRENT_XTOL + _BRENT_RTOL * abs(xcur)) / 2
+        sbis = (xblk - xcur) / 2
+        if fcur == 0 or abs(sbis) < delta:
+            return xcur, iteration
+
+        if abs(spre) > delta and abs(fcur) < abs(fpre):
+            if xpre == xblk:
+                # Secant step.
+                stry = -fcur * (xcur - xpre) / (fcur - fpre)
+            else:
+                # Inverse quadratic interpolation.
+                dpre = (fpre - fcur) / (xpre - xcur)
+                dblk = (fblk - fcur) / (xblk - xcur)
+                stry = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            if 2 * abs(stry) < min(abs(spre), 3 * abs(sbis) - delta):
+                spre, scur = scur, stry
+            else:
+                spre = scur = sbis
+        else:
+            spre = scur = sbis
+
+        xpre, fpre = xcur, fcur
+        xcur += scur if abs(scur) > delta else (delta if sbis > 0 else -delta)
+        fcur = f(xcur)
+
+    logger.warning(f"Brent solver did not converge in {_BRENT_MAX_ITER} iterations")
+    return xcur, _BRENT_MAX_ITER
+
+
+def _market_value(market: dict[str, Any], key: str, default: float) -> float:
+    value = market.get(key)
+    return default if value is None else float(value)
+
+
+class GoalSeek:
+    """Invert the :class:`FinancialMetrics` model for one property.
+
+    Parameters
+    ----------
+    property_data:
+        Object exposing ``price`` (e.g. :class:`Property`); the listing price.
+    market_data:
+        Market dict as passed to :class:`FinancialMetrics`.
+    monthly_rent:
+        Known monthly rent.  Defaults to the market estimate at the listing
+        price.
+    """
+
+    def __init__(self, property_data: Any, market_data: dict[str, Any],
+                 monthly_rent: float | None = None) -> None:
+        self.price = float(property_data.price or 0)
+        if self.price <= 0:
+            raise ValueError('Property has no price to solve against')
+        self.market = market_data
+        if monthly_rent is None:
+            monthly_rent = FinancialMetrics(property_data, market_data).estimate_rental_income()
+        self.monthly_rent = float(monthly_rent)
+
+        vacancy = _market_value(market_data, 'vacancy_rate', _DEFAULT_VACANCY_RATE)
+        self._rent_kept = 1 - vacancy - _MANAGEMENT_RATE
+        self._hoa = _market_value(market_data, 'avg_hoa_fee', _DEFAULT_HOA_FEE)
+        tax_rate = _market_value(market_data, 'property_tax_rate', _DEFAULT_PROPERTY_TAX_RATE)
+        self._price_expense_rate = (tax_rate + _INSURANCE_RATE + _MAINTENANCE_RATE) / 12
+
+    # ------------------------------------------------------------------
+    # Forward model
+    # ------------------------------------------------------------------
+
+    def _parts(self, metric: str, price: float, monthly_rent: float, down_payment_percentage: float,
+               interest_rate: float, term_years: int, holding_period: int,
+               appreciation_rate: float) -> tuple[float, float]:
+        """Numerator and denominator of *metric* at the given inputs."""
+        debt_service = price * (1 - down_payment_percentage) * monthly_payment(1.0, interest_rate, term_years)
+        operating = monthly_rent * self._rent_kept - self._hoa - price * self._price_expense_rate
+        cash_flow = operating - debt_service
+        investment = price * (down_payment_percentage + _CLOSING_COST_RATE)
+
+        if metric == 'monthly_cash_flow':
+            return cash_flow, 1.0
+        if metric == 'cap_rate':
+            return 1200 * operating, price
+        if metric == 'cash_on_cash_return':
+            return 1200 * cash_flow, investment
+        growth = (1 + appreciation_rate) ** holding_period - 1
+        return 100 * (12 * holding_period * cash_flow + price * growth), investment
+
+    def metrics(self, price: float | None = None, monthly_rent: float | None = None,
+                down_payment_percentage: float = 0.20, interest_rate: float = 0.045,
+                term_years: int = 30, holding_period: int = 5,
+                appreciation_rate: float = 0.03) -> dict[str, float]:
+        """Unrounded ``GOAL_SEEK_METRICS`` at the given inputs.
+
+        *price* and *monthly_rent* default to the listing price and the
+        rent this instance was built with.
+        """
+        inputs = self._inputs(price, monthly_rent, down_payment_percentage, interest_rate,
+                              term_years, holding_period, appreciation_rate)
+        result = {}
+        for metric in GOAL_SEEK_METRICS:
+            numerator, denominator = self._parts(metric, **inputs)
+            result[metric] = numerator / denominator if denominator else 0.0
+        return result
+
+    def _inputs(self, price, monthly_rent, down_payment_percentage, interest_rate,
+                term_years, holding_period, appreciation_rate) -> dict[str, Any]:
+        return {
+            'price': self.price if price is None else float(price),
+            'monthly_rent': self.monthly_rent if monthly_rent is None else float(monthly_rent),
+            'down_payment_percentage': float(down_payment_percentage),
+            'interest_rate': float(interest_rate),
+            'term_years': int(term_years),
+            'holding_period': int(holding_period),
+            'appreciation_rate': float(appreciation_rate),
+        }
+
+    # ------------------------------------------------------------------
+    # Solver
+    # ------------------------------------------------------------------
+
+    def solve(self, solve_for: str = 'price', target_metric: str = 'monthly_cash_flow',
+              target_value: float = 0.0, down_payment_percentage: float = 0.20,
+              interest_rate: float = 0.045, term_years: int = 30, holding_period: int = 5,
+              appreciation_rate: float = 0.03) -> dict[str, Any]:
+        """Find the value of *solve_for* at which *target_metric* equals
+        *target_value*, holding every other input fixed.
+
+        Returns
+        -------
+        dict
+            ``solve_for``, ``target_metric``, ``target_value``, ``method``
+            (``closed_form`` or ``brent``), ``iterations`` (Brent steps,
+            0 for closed forms), ``value`` (``None`` when
+            unreachable), ``reachable``, ``reason`` (why not, else ``None``),
+            ``current`` (the input's value today), ``margin`` (``|value -
+            current| / current``, positive when the metric meets the target
+            at ``current`` and negative when it falls short) and ``inputs``
+            (the other inputs used).
+
+        Raises
+        ------
+        ValueError
+            For an unknown variable or metric, or a metric that does not
+            depend on the variable.
+        """
+        if solve_for not in GOAL_SEEK_VARIABLES:
+            raise ValueError(f"Cannot solve for '{solve_for}'")
+        if target_metric not in GOAL_SEEK_METRICS:
+            raise ValueError(f"Unknown target metric '{target_metric}'")
+        if (target_metric, solve_for) in INDEPENDENT_TARGETS:
+            raise ValueError(f"'{target_metric}' does not depend on '{solve_for}'")
+
+        target = float(target_value)
+        inputs = self._inputs(None, None, down_payment_percentage, interest_rate,
+                              term_years, holding_period, appreciation_rate)
+        current = inputs[solve_for]
+
+        def residual(x: float) -> float:
+            numerator, denominator = self._parts(target_metric, **{**inputs, solve_for: x})
+            return numerator - target * denominator
+
+        if solve_for == 'interest_rate':
+            method = 'brent'
+            value, reason, iterations = self._solve_rate(residual)
+        else:
+            method = 'closed_form'
+            value, reason = self._solve_affine(target_metric, solve_for, target, inputs, current)
+            iterations = 0
+
+        del inputs[solve_for]
+        return {
+            'solve_for': solve_for,
+            'target_metric': target_metric,
+            'target_value': target,
+            'method': method,
+            'iterations': iterations,
+            'value': value,
+            'reachable': value is not None,
+            'reason': reason,
+            'current': current,
+            'margin': None if value is None else self._margin(value, current, residual(current)),
+            'inputs': inputs,
+        }
+
+    def _solve_affine(self, metric: str, variable: str, target: float,
+                      inputs: dict[str, Any], current: float) -> tuple[float | None, str | None]:
+        """Closed-form solve for a variable the metric is affine-fractional in."""
+        # Sample at 0 and at the current value; the scale of the latter
+        # keeps the slopes well conditioned.
+        scale = current if current > 0 else 1.0
+        n0, d0 = self._parts(metric, **{**inputs, variable: 0.0})
+        n_s, d_s = self._parts(metric, **{**inputs, variable: scale})
+        n1, d1 = (n_s - n0) / scale, (d_s - d0) / scale
+
+        slope = target * d1 - n1
+        if slope == 0:
+            return None, f"'{metric}' does not change with '{variable}'"
+        value = (n0 - target * d0) / slope
+
+        low, high = GOAL_SEEK_VARIABLES[variable]
+        if not low < value <= high or d0 + d1 * value <= 0:
+            return None, f"No {variable} in range reaches the target"
+        return value, None
+
+    def _solve_rate(self, residual: Callable[[float], float]) -> tuple[float | None, str | None, int]:
+        """Brent solve for the interest rate on ``[0, MAX_GOAL_SEEK_RATE]``."""
+        low, high = GOAL_SEEK_VARIABLES['interest_rate']
+        f_low, f_high = residual(low), residual(high)
+        if f_low < 0 and f_high < 0:
+            return None, 'Target is not reached even at a 0% interest rate', 0
+        if f_low > 0 and f_high > 0:
+            return None, f'Target is exceeded at every rate up to {high:.0%}', 0
+        value, iterations = _brent(residual, low, high)
+        return value, None, iterations
+
+    @staticmethod
+    def _margin(value: float, current: float, current_residual: float) -> float | None:
+        """Relative distance of *current* from the solved *value*, signed by
+        whether the metric already meets the target at *current*.
+
+        The sign comes from the model rather than the variable: a higher
+        down payment raises cash flow but, under positive leverage, lowers
+        cash-on-cash return, and ROI can rise or fall with price.
+        """
+        if current == 0:
+            return None
+        distance = abs(value - current) / current
+        return distance if current_residual >= 0 else -distance
@@ -0,0 +1,335 @@
+"""Monte Carlo simulation of holding-period returns for one property.
+
+:meth:`FinancialMetrics.analyze_property` answers "what is the ROI if the
+market appreciates at exactly 3 % a year?".  :class:`MonteCarloSimulation`
+instead draws many paths for the uncertain inputs and reports the
+distribution of outcomes:
+
+- **appreciation**: normal per year.  The mean is the market
+  ``appreciation_rate``.  The standard deviation is that of the annual log
+  returns in the market ``price_history`` (yearly values, oldest first),
+  or ``DEFAULT_APPRECIATION_STDEV`` with fewer than three points;
+- **rent growth**: normal per year around the market ``rent_growth_rate``,
+  correlated with that year's appreciation;
+- **vacancy**: beta per year with the market ``vacancy_rate`` as its mean;
+- **interest rate**: normal once per path around the requested rate (the
+  rate locked at purchase), clipped to the API's accepted range.
+
+Each path is a year-by-year cash flow built with the same expense model as
+:class:`FinancialMetrics` (tax, insurance and maintenance scale with the
+property value; vacancy and management with rent).  All paths of a chunk
+are evaluated together as ``(paths, years)`` NumPy arrays.
+
+Outputs per path:
+
+- ``total_roi``: cash flow plus appreciation over the initial investment,
+  as in :meth:`FinancialMetrics.calculate_roi`;
+- ``irr``: internal rate of return of ``-investment``, the yearly cash
+  flows and the sale equity (value minus remaining loan balance) in the
+  final year, solved by vectorized bisection;
+- ``annual_cash_flow``: mean yearly cash flow.
+
+Paths are simulated in chunks of ``SIMULATION_CHUNK_PATHS``.  When a run
+exceeds its time budget after a chunk, it stops early and reports the
+completed paths with ``truncated: true``.  With a ``seed``, a run that
+completes the same number of paths is reproducible.
+
+Usage example::
+
+    sim = MonteCarloSimulation(property_obj, market_data)
+    result = sim.run(paths=20_000, holding_period=7, seed=42)
+    result['irr']['p50'], result['probability_negative_cash_flow']
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import secrets
+import time
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Run limits
+# ---------------------------------------------------------------------------
+DEFAULT_SIMULATION_PATHS = 20_000
+MIN_SIMULATION_PATHS = 100
+MAX_SIMULATION_PATHS = 200_000
+SIMULATION_CHUNK_PATHS = 10_000
+SIMULATION_TIME_BUDGET_MS = int(os.getenv("SIMULATION_TIME_BUDGET_MS", 2000))
+
+# ---------------------------------------------------------------------------
+# Distribution defaults
+# ---------------------------------------------------------------------------
+DEFAULT_APPRECIATION_STDEV: float = 0.05
+MIN_APPRECIATION_STDEV: float = 0.005
+MAX_APPRECIATION_STDEV: float = 0.30
+DEFAULT_RENT_GROWTH: float = 0.03
+RENT_GROWTH_STDEV: float = 0.02
+RENT_APPRECIATION_CORRELATION: float = 0.5
+# Beta concentration (alpha + beta) of the yearly vacancy draw.
+VACANCY_CONCENTRATION: float = 40.0
+INTEREST_RATE_STDEV: float = 0.0075
+MIN_INTEREST_RATE: float = 0.001
+MAX_INTEREST_RATE: float = 0.30
+
+# ---------------------------------------------------------------------------
+# Expense model mirrored from FinancialMetrics (keep in sync)
+# ---------------------------------------------------------------------------
+_DEFAULT_PRICE_TO_RENT_RATIO: float = 15
+_DEFAULT_PROPERTY_TAX_RATE: float = 0.01
+_DEFAULT_VACANCY_RATE: float = 0.08
+_DEFAULT_APPRECIATION: float = 0.03
+_INSURANCE_RATE: float = 0.0035
+_MAINTENANCE_RATE: float = 0.01
+_MANAGEMENT_RATE: float = 0.1
+_CLOSING_COST_RATE: float = 0.03
+
+_PERCENTILES = (5, 25, 50, 75, 95)
+
+# IRR search bracket (as rates) and bisection steps (~1e-13 resolution).
+_IRR_LOW: float = -0.99
+_IRR_HIGH: float = 10.0
+_IRR_ITERATIONS: int = 48
+
+
+def _irr(flows: np.ndarray) -> np.ndarray:
+    """Row-wise IRR of ``flows`` (shape ``(paths, years + 1)``), NaN where the
+    NPV does not change sign over the search bracket."""
+
+    def npv(rate: np.ndarray) -> np.ndarray:
+        # Horner's rule in the discount factor 1 / (1 + rate).
+        x = 1.0 / (1.0 + rate)
+        total = flows[:, -1].copy()
+        for t in range(flows.shape[1] - 2, -1, -1):
+            total *= x
+            total += flows[:, t]
+        return total
+
+    n = flows.shape[0]
+    low = np.full(n, _IRR_LOW)
+    high = np.full(n, _IRR_HIGH)
+    npv_low = npv(low)
+    valid = np.sign(npv_low) != np.sign(npv(high))
+    for _ in range(_IRR_ITERATIONS):
+        mid = (low + high) / 2
+        same = np.sign(npv(mid)) == np.sign(npv_low)
+        low = np.where(same, mid, low)
+        high = np.where(same, high, mid)
+    return np.where(valid, (low + high) / 2, np.nan)
+
+
+def _summary(values: np.ndarray) -> dict[str, float | None]:
+    """Mean and percentiles of *values*, ignoring NaN; None when all NaN."""
+    finite = values[~np.isnan(values)]
+    if finite.size == 0:
+        return {'mean': None, **{f'p{p}': None for p in _PERCENTILES}}
+    pct = np.percentile(finite, _PERCENTILES)
+    return {
+        'mean': round(float(finite.mean()), 2),
+        **{f'p{p}': round(float(v), 2) for p, v in zip(_PERCENTILES, pct)},
+    }
+
+
+class MonteCarloSimulation:
+    """Simulate holding-period outcomes for one property.
+
+    Parameters
+    ----------
+    property_data:
+        Property object with ``price``.
+    market_data:
+        Market dict as returned by ``resolve_market_data``.
+    """
+
+    def __init__(self, property_data, market_data: dict[str, Any]) -> None:
+        self.property = property_data
+        self.market = market_data
+
+    def _market_float(self, key: str, default: float) -> float:
+        value = self.market.get(key)
+        return default if value is None else float(value)
+
+    def assumptions(self, interest_rate: float = 0.045,
+                    appreciation_rate: float | None = None) -> dict[str, Any]:
+        """The distributions a run draws from, derived from the market."""
+        history = [float(p) for p in (self.market.get('price_history') or []) if p and float(p) > 0]
+        log_returns = np.diff(np.log(history)) if len(history) >= 2 else np.empty(0)
+
+        if appreciation_rate is None:
+            appreciation_rate = self.market.get('appreciation_rate')
+        if appreciation_rate is None:
+            appreciation_rate = (
+                float(np.expm1(log_returns.mean())) if log_returns.size else _DEFAULT_APPRECIATION
+            )
+        if log_returns.size >= 2:
+            stdev = float(np.std(log_returns, ddof=1))
+            stdev = min(MAX_APPRECIATION_STDEV, max(MIN_APPRECIATION_STDEV, stdev))
+            source = 'price_history'
+        else:
+            stdev, source = DEFAULT_APPRECIATION_STDEV, 'default'
+
+        vacancy = min(0.5, max(0.005, self._market_float('vacancy_rate', _DEFAULT_VACANCY_RATE)))
+        return {
+            'appreciation': {'mean': float(appreciation_rate), 'stdev': stdev, 'source': source},
+            'rent_growth': {
+                'mean': self._market_float('rent_growth_rate', DEFAULT_RENT_GROWTH),
+                'stdev': RENT_GROWTH_STDEV,
+                'correlation_with_appreciation': RENT_APPRECIATION_CORRELATION,
+            },
+            'vacancy': {'mean': vacancy, 'concentration': VACANCY_CONCENTRATION},
+            'interest_rate': {'mean': interest_rate, 'stdev': INTEREST_RATE_STDEV},
+        }
+
+    def run(self, paths: int = DEFAULT_SIMULATION_PATHS, holding_period: int = 5,
+            down_payment_percentage: float = 0.20, interest_rate: float = 0.045,
+            term_years: int = 30, appreciation_rate: float | None = None,
+            seed: int | None = None, max_ms: float | None = None) -> dict[str, Any]:
+        """Simulate *paths* holding periods and summarize the outcomes.
+
+        Parameters
+        ----------
+        paths:
+            Number of paths, clamped to
+            [``MIN_SIMULATION_PATHS``, ``MAX_SIMULATION_PATHS``].
+        holding_period:
+            Years held before the sale.
+        down_payment_percentage, interest_rate, term_years:
+            Loan terms; *interest_rate* is the mean of the drawn rate.
+        appreciation_rate:
+            Mean appreciation override; defaults to the market's.
+        seed:
+            Random seed.  A random one is chosen (and returned) if omitted.
+        max_ms:
+            Time budget in milliseconds.  Defaults to
+            ``SIMULATION_TIME_BUDGET_MS``.
+
+        Raises
+        ------
+        ValueError
+            If the property has no positive price.
+        """
+        started = time.perf_counter()
+        price = float(getattr(self.property, 'price', 0) or 0)
+        if price <= 0:
+            raise ValueError("Property price must be positive to simulate returns")
+        paths = max(MIN_SIMULATION_PATHS, min(MAX_SIMULATION_PATHS, int(paths)))
+        years = max(1, int(holding_period))
+        budget = (SIMULATION_TIME_BUDGET_MS if max_ms is None else max_ms) / 1000
+        if seed is None:
+            seed = secrets.randbelow(2 ** 32)
+        rng = np.random.default_rng(seed)
+        assumptions = self.assumptions(interest_rate, appreciation_rate)
+
+        totals = {'irr': [], 'total_roi': [], 'annual_cash_flow': [], 'first_year_cash_flow': []}
+        done, truncated = 0, False
+        while done < paths:
+            if done and time.perf_counter() - started >= budget:
+                truncated = True
+                break
+            size = min(SIMULATION_CHUNK_PATHS, paths - done)
+            for key, values in self._simulate_chunk(
+                rng, size, years, price, down_payment_percentage, term_years, assumptions,
+            ).items():
+                totals[key].append(values)
+            done += size
+
+        results = {key: np.concatenate(chunks) for key, chunks in totals.items()}
+        irr = results['irr']
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if truncated:
+            logger.info(f"Simulation stopped at {done}/{paths} paths after {elapsed_ms:.0f} ms")
+        return {
+            'paths': done,
+            'requested_paths': paths,
+            'truncated': truncated,
+            'seed': seed,
+            'holding_period': years,
+            'elapsed_ms': round(elapsed_ms, 1),
+            'assumptions': assumptions,
+            'irr': {**_summary(irr * 100), 'undefined_paths': int(np.isnan(irr).sum())},
+            'total_roi': _summary(results['total_roi']),
+            'annual_cash_flow': _summary(results['annual_cash_flow']),
+            'probability_negative_cash_flow': round(float((results['annual_cash_flow'] < 0).mean()), 4),
+            'probability_negative_first_year': round(float((results['first_year_cash_flow'] < 0).mean()), 4),
+            'probability_loss': round(float((results['total_roi'] < 0).mean()), 4),
+        }
+
+    def _simulate_chunk(self, rng: np.random.Generator, size: int, years: int, price: float,
+                        down_payment_percentage: float, term_years: int,
+                        assumptions: dict[str, Any]) -> dict[str, np.ndarray]:
+        appreciation = assumptions['appreciation']
+        rent_growth = assumptions['rent_growth']
+        vacancy = assumptions['vacancy']
+        rate = assumptions['interest_rate']
+
+        # -- Draws -----------------------------------------------------------
+        z_value, z_rent = rng.standard_normal((2, size, years))
+        rho = rent_growth['correlation_with_appreciation']
+        value_growth = appreciation['mean'] + appreciation['stdev'] * z_value
+        rent_change = rent_growth['mean'] + rent_growth['stdev'] * (
+            rho * z_value + math.sqrt(1 - rho * rho) * z_rent
+        )
+        k = vacancy['concentration']
+        vacancy_rate = rng.beta(vacancy['mean'] * k, (1 - vacancy['mean']) * k, (size, years))
+        loan_rate = np.clip(
+            rate['mean'] + rate['stdev'] * rng.standard_normal(size), MIN_INTEREST_RATE, MAX_INTEREST_RATE,
+        )
+
+        # -- Property value and rent paths -----------------------------------
+        value_index = np.cumprod(1 + value_growth, axis=1)
+        start_value = price * np.hstack([np.ones((size, 1)), value_index[:, :-1]])
+        sale_value = price * value_index[:, -1]
+        rent_index = np.hstack([np.ones((size, 1)), np.cumprod(1 + rent_change[:, :-1], axis=1)])
+
+        ratio = self._market_float('price_to_rent_ratio', _DEFAULT_PRICE_TO_RENT_RATIO)
+        if ratio <= 0:
+            ratio = _DEFAULT_PRICE_TO_RENT_RATIO
+        gross_rent = (price / ratio) * rent_index
+        tax_rate = self._market_float('property_tax_rate', _DEFAULT_PROPERTY_TAX_RATE)
+        hoa = self._market_float('avg_hoa_fee', 0.0) * 12
+        noi = (
+            gross_rent * (1 - vacancy_rate - _MANAGEMENT_RATE)
+            - start_value * (tax_rate + _INSURANCE_RATE + _MAINTENANCE_RATE)
+            - hoa
+        )
+
+        # -- Financing -------------------------------------------------------
+        loan = price * (1 - down_payment_percentage)
+        monthly_rate = loan_rate / 12
+        num_payments = term_years * 12
+        growth = (1 + monthly_rate) ** num_payments
+        payment = loan * (monthly_rate * growth) / (growth - 1)
+        paid = min(years * 12, num_payments)
+        growth_paid = (1 + monthly_rate) ** paid
+        balance = loan * growth_paid - payment * (growth_paid - 1) / monthly_rate
+        if paid == num_payments:
+            balance = np.zeros(size)
+        annual_debt_service = np.where(
+            np.arange(years) * 12 < num_payments,
+            np.minimum(12, num_payments - np.arange(years) * 12),
+            0,
+        ) * payment[:, None]
+        cash_flow = noi - annual_debt_service
+
+        # -- Outcomes --------------------------------------------------------
+        investment = price * down_payment_percentage + price * _CLOSING_COST_RATE
+        total_cash_flow = cash_flow.sum(axis=1)
+        total_roi = (total_cash_flow + sale_value - price) / investment * 100
+
+        flows = np.empty((size, years + 1))
+        flows[:, 0] = -investment
+        flows[:, 1:] = cash_flow
+        flows[:, -1] += sale_value - balance
+
+        return {
+            'irr': _irr(flows),
+            'total_roi': total_roi,
+            'annual_cash_flow': total_cash_flow / years,
+            'first_year_cash_flow': cash_flow[:, 0],
+        }
@@ -9,6 +9,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from services.analysis.amortization import amortize
 from services.analysis.financial_metrics import FinancialMetrics
 
 logger = logging.getLogger(__name__)
@@ -448,25 +449,10 @@ class OpportunityScoring:
         building_value: float = price * 0.80
         annual_depreciation: float = building_value / 27.5
 
-        # First-year mortgage interest (rough approximation)
-        monthly_rate: float = _DEFAULT_INTEREST_RATE / 12
-        num_payments: int = _DEFAULT_TERM_YEARS * 12
-        if monthly_rate > 0:
-            monthly_payment: float = (
-                loan_amount
-                * (monthly_rate * (1 + monthly_rate) ** num_payments)
-                / ((1 + monthly_rate) ** num_payments - 1)
-            )
-            # First payment is almost entirely interest; use first-year sum
-            first_year_interest: float = 0.0
-            balance: float = loan_amount
-            for _ in range(12):
-                interest_pmt: float = balance * monthly_rate
-                principal_pmt: float = monthly_payment - interest_pmt
-                balance -= principal_pmt
-                first_year_interest += interest_pmt
-        else:
-            first_year_interest = 0.0
+        # First-year mortgage interest (shares the memoized schedule)
+        first_year_interest: float = amortize(
+            loan_amount, _DEFAULT_INTEREST_RATE, _DEFAULT_TERM_YEARS
+        ).interest_in_year(1)
 
         property_tax_rate: float = self.market.get("property_tax_rate", 0.01)
         annual_property_tax: float = price * property_tax_rate
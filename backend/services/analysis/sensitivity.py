@@ -0,0 +1,149 @@
+"""Sensitivity grids: financial metrics over a sweep of analysis parameters.
+
+Checking how cash flow moves across down payments and interest rates used
+to take one :meth:`FinancialMetrics.analyze_property` call per combination.
+:func:`sensitivity_grid` instead expands the requested parameter values into
+their full Cartesian grid and evaluates every point in one pass through
+:class:`FinancialMetricsBatch`, so each cell matches the scalar analysis
+bit-for-bit.
+
+Axes are taken in the canonical order of ``SENSITIVITY_PARAMETERS``.  An
+axis with a single value is reported under ``fixed`` rather than as a
+dimension.  Each metric is returned as a nested list over only the swept
+axes it depends on; mortgage payment and cash flow do not change with the
+holding period or appreciation, so a rate x down payment x holding-period
+sweep still yields a 2-D cash-flow table.  The frontend interpolates
+between cells while a slider moves instead of calling the server.
+
+Usage example::
+
+    grid = sensitivity_grid(property_obj, market_data, {
+        'down_payment_percentage': [0.1, 0.2, 0.3],
+        'interest_rate': [0.05, 0.06, 0.07],
+    })
+    grid['metrics']['monthly_cash_flow']['values'][1][2]   # 20 % down at 7 %
+"""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+import numpy as np
+
+from services.analysis.financial_metrics_batch import FinancialMetricsBatch
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Grid limits
+# ---------------------------------------------------------------------------
+MAX_AXIS_VALUES = 50
+MAX_SENSITIVITY_POINTS = 10_000
+
+# Parameters that can be swept, in the order axes are laid out.
+SENSITIVITY_PARAMETERS = (
+    'down_payment_percentage',
+    'interest_rate',
+    'term_years',
+    'holding_period',
+    'appreciation_rate',
+)
+
+_FINANCING = ('down_payment_percentage', 'interest_rate', 'term_years')
+
+# Metric name -> (path into FinancialMetricsBatch.analyze output, parameters
+# the metric depends on).
+SENSITIVITY_METRICS = {
+    'mortgage_payment': (('mortgage_payment',), _FINANCING),
+    'monthly_cash_flow': (('monthly_cash_flow',), _FINANCING),
+    'annual_cash_flow': (('annual_cash_flow',), _FINANCING),
+    'cash_on_cash_return': (('cash_on_cash_return',), _FINANCING),
+    'break_even_point': (('break_even_point',), _FINANCING),
+    'total_roi': (('roi', 'total_roi'), SENSITIVITY_PARAMETERS),
+    'annualized_roi': (('roi', 'annualized_roi'), SENSITIVITY_PARAMETERS),
+}
+
+DEFAULT_SENSITIVITY_METRICS = ('monthly_cash_flow', 'cash_on_cash_return', 'total_roi')
+
+
+def sensitivity_grid(property_data: Any, market_data: dict[str, Any],
+                     axes: dict[str, list[float]],
+                     metrics: Iterable[str] = DEFAULT_SENSITIVITY_METRICS) -> dict[str, Any]:
+    """Evaluate *metrics* over the Cartesian grid of *axes*.
+
+    Parameters
+    ----------
+    property_data:
+        Object exposing ``price`` (e.g. :class:`Property`).
+    market_data:
+        Market dict as passed to :class:`FinancialMetrics`.
+    axes:
+        Values for each name in ``SENSITIVITY_PARAMETERS``.  Every
+        parameter must be present; a one-element list holds it fixed.
+    metrics:
+        Names from ``SENSITIVITY_METRICS``.
+
+    Returns
+    -------
+    dict
+        ``axes`` (swept parameter -> values), ``fixed`` (held parameter ->
+        value), ``points`` (grid size) and ``metrics``: for each metric its
+        ``dimensions`` (swept axes it varies over, in order) and ``values``
+        (nested lists indexed the same way).
+
+    Raises
+    ------
+    ValueError
+        For an unknown metric, an empty or oversized axis, or a grid larger
+        than ``MAX_SENSITIVITY_POINTS``.
+    """
+    metrics = list(dict.fromkeys(metrics))
+    unknown = [m for m in metrics if m not in SENSITIVITY_METRICS]
+    if unknown or not metrics:
+        raise ValueError(f"Unknown metrics: {unknown}" if unknown else 'At least one metric is required')
+
+    values = []
+    for name in SENSITIVITY_PARAMETERS:
+        axis = list(axes[name])
+        if not 1 <= len(axis) <= MAX_AXIS_VALUES:
+            raise ValueError(f"'{name}' must have between 1 and {MAX_AXIS_VALUES} values")
+        values.append(axis)
+
+    shape = tuple(len(v) for v in values)
+    points = int(np.prod(shape))
+    if points > MAX_SENSITIVITY_POINTS:
+        raise ValueError(f"Grid has {points} points; at most {MAX_SENSITIVITY_POINTS} are allowed")
+
+    mesh = np.meshgrid(*[np.asarray(v, dtype=np.float64) for v in values], indexing='ij')
+    batch = FinancialMetricsBatch.from_records(
+        [SimpleNamespace(price=property_data.price)] * points, market_data
+    )
+    columns = batch.analyze(**{name: grid.ravel() for name, grid in zip(SENSITIVITY_PARAMETERS, mesh)})
+
+    swept = [name for name, axis in zip(SENSITIVITY_PARAMETERS, values) if len(axis) > 1]
+    result_metrics = {}
+    for metric in metrics:
+        path, depends_on = SENSITIVITY_METRICS[metric]
+        column = columns
+        for key in path:
+            column = column[key]
+        grid = column.reshape(shape)
+        # Collapse every axis the metric does not vary over (and the fixed
+        # ones) to its first entry.
+        index = tuple(
+            slice(None) if name in swept and name in depends_on else 0
+            for name in SENSITIVITY_PARAMETERS
+        )
+        result_metrics[metric] = {
+            'dimensions': [name for name in swept if name in depends_on],
+            'values': grid[index].tolist(),
+        }
+
+    return {
+        'axes': {name: axis for name, axis in zip(SENSITIVITY_PARAMETERS, values) if len(axis) > 1},
+        'fixed': {name: axis[0] for name, axis in zip(SENSITIVITY_PARAMETERS, values) if len(axis) == 1},
+        'points': points,
+        'metrics': result_metrics,
+    }
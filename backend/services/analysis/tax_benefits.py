@@ -1,3 +1,11 @@
+import numpy as np
+
+from services.analysis.amortization import amortize
+
+# Longest holding period project_tax_benefits will tabulate.
+MAX_PROJECTION_YEARS = 30
+
+
 class TaxBenefits:
     def __init__(self, property_data, market_data):
         self.property = property_data
@@ -26,27 +34,8 @@ class TaxBenefits:
         
     def calculate_mortgage_interest_deduction(self, loan_amount, interest_rate, term_years=30):
         """Calculate first-year mortgage interest deduction"""
-        # Calculate monthly payment
-        monthly_rate = interest_rate / 12
-        num_payments = term_years * 12
-        
-        if monthly_rate == 0:
-            monthly_payment = loan_amount / num_payments
-            return 0  # No interest if rate is 0
-            
-        monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate) ** num_payments) / ((1 + monthly_rate) ** num_payments - 1)
-        
-        # Calculate first year interest (sum of interest payments for first 12 months)
-        first_year_interest = 0
-        remaining_balance = loan_amount
-        
-        for _ in range(12):
-            interest_payment = remaining_balance * monthly_rate
-            principal_payment = monthly_payment - interest_payment
-            remaining_balance -= principal_payment
-            first_year_interest += interest_payment
-            
-        return round(first_year_interest, 2)
+        schedule = amortize(loan_amount, interest_rate, term_years)
+        return round(schedule.interest_in_year(1), 2)
         
     def calculate_property_tax_deduction(self):
         """Calculate property tax deduction"""
@@ -107,4 +96,62 @@ class TaxBenefits:
             'total_deductions': round(deductions, 2),
             'estimated_tax_savings': round(tax_savings, 2),
             'monthly_tax_savings': round(tax_savings / 12, 2)
-        }
\ No newline at end of file
+        }
+
+    def project_tax_benefits(self, years=MAX_PROJECTION_YEARS, tax_bracket=0.22, down_payment_percentage=0.20,
+                             interest_rate=0.045, term_years=30, property_tax_growth=None):
+        """
+        Project deductions and tax savings for each year of a holding period
+
+        Mortgage interest per year comes from the closed-form cumulative
+        interest of the shared amortization schedule, and every column is
+        computed as a NumPy array, so the cost does not grow with the loan
+        term.  Depreciation is straight-line and stops once the building
+        value is fully depreciated (half a year's worth in year 28).
+        Property tax grows at *property_tax_growth* per year, defaulting to
+        the market appreciation rate.
+        """
+        years = max(1, min(MAX_PROJECTION_YEARS, int(years)))
+        if property_tax_growth is None:
+            property_tax_growth = self.market.get('appreciation_rate', 0.03)
+
+        loan_amount = self.property.price * (1 - down_payment_percentage)
+        interest = amortize(loan_amount, interest_rate, term_years).annual_interest(years)
+
+        # Same basis as calculate_depreciation: building is 80% of the price
+        building_value = self.property.price * 0.8
+        annual_depreciation = building_value / 27.5
+        depreciated = np.minimum(annual_depreciation * np.arange(years + 1), building_value)
+        depreciation = np.diff(depreciated)
+
+        first_year_tax = self.property.price * self.market.get('property_tax_rate', 0.01)
+        property_tax = first_year_tax * (1 + property_tax_growth) ** np.arange(years)
+
+        deductions = depreciation + interest + property_tax
+        savings = deductions * tax_bracket
+        cumulative = np.cumsum(savings)
+
+        columns = [np.round(col, 2).tolist() for col in (
+            depreciation, interest, property_tax, deductions, savings, cumulative,
+        )]
+        schedule = [
+            {
+                'year': year,
+                'depreciation': row[0],
+                'mortgage_interest': row[1],
+                'property_tax': row[2],
+                'total_deductions': row[3],
+                'tax_savings': row[4],
+                'cumulative_tax_savings': row[5],
+            }
+            for year, row in enumerate(zip(*columns), start=1)
+        ]
+
+        return {
+            'years': years,
+            'tax_bracket': tax_bracket,
+            'property_tax_growth': property_tax_growth,
+            'schedule': schedule,
+            'total_deductions': round(float(deductions.sum()), 2),
+            'total_tax_savings': round(float(cumulative[-1]), 2)
+        }
@@ -0,0 +1,156 @@
+"""Multi-city crawl orchestration for the scheduled property refresh.
+
+:func:`crawl_cities` crawls every configured city in one event loop.  All
+cities share one ``aiohttp`` session, whose connection pool is sized to the
+global cap, and one semaphore, so at most ``CRAWL_MAX_CONCURRENCY`` requests
+are in flight across the whole run.  The scraper's per-host token bucket
+still spaces those requests.
+
+Saving is pipelined: as soon as a city's listings are in, they are handed to
+*save* (normally ``Property.bulk_upsert``) on a worker thread while the
+other cities keep crawling.  If a save fails, the city's listing pages are
+dropped from the scraper's page cache so the next run fetches them again.
+Each city gets a report with its counts and timings;
+:func:`format_crawl_report` renders them for the log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from typing import Any, Callable
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+CRAWL_MAX_CONCURRENCY = int(os.getenv("CRAWL_MAX_CONCURRENCY", 16))
+
+
+async def crawl_cities(
+    scraper,
+    cities: list[dict[str, str]],
+    save: Callable[[list], dict[str, int]],
+    max_pages: int = 2,
+    max_concurrency: int | None = None,
+) -> list[dict[str, Any]]:
+    """Crawl *cities* concurrently and save each city's listings as it finishes.
+
+    Parameters
+    ----------
+    scraper:
+        A :class:`~services.data_collection.zillow_scraper.ZillowScraper`.
+    cities:
+        Dicts with ``city`` and ``state`` keys.
+    save:
+        Blocking callable taking a city's properties and returning
+        ``{'inserted', 'modified', 'failed'}`` counts.  Run on a thread.
+    max_pages:
+        Search-result pages to fetch per city.
+    max_concurrency:
+        Requests in flight across all cities.  Defaults to
+        ``CRAWL_MAX_CONCURRENCY``.
+
+    Returns
+    -------
+    list[dict]
+        One report per city, in *cities* order (see :func:`_crawl_city`).
+        A failed city has its ``error`` set; the others are unaffected.
+    """
+    cap = max(1, max_concurrency or CRAWL_MAX_CONCURRENCY)
+    slots = asyncio.Semaphore(cap)
+    connector = aiohttp.TCPConnector(limit=cap)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return list(await asyncio.gather(*(
+            _crawl_city(scraper, city_data, save, max_pages, session, slots)
+            for city_data in cities
+        )))
+
+
+async def _crawl_city(scraper, city_data, save, max_pages, session, slots) -> dict[str, Any]:
+    """Crawl and save one city.
+
+    The report has ``city``, ``state``, ``found``, ``inserted``,
+    ``modified``, ``failed``, ``crawl_seconds``, ``save_seconds`` and
+    ``error`` (None on success).
+    """
+    report: dict[str, Any] = {
+        'city': city_data['city'],
+        'state': city_data['state'],
+        'found': 0,
+        'inserted': 0,
+        'modified': 0,
+        'failed': 0,
+        'crawl_seconds': 0.0,
+        'save_seconds': 0.0,
+        'error': None,
+    }
+    started = time.perf_counter()
+    try:
+        properties = scraper.search_properties(
+            city=city_data['city'],
+            state=city_data['state'],
+            max_pages=max_pages,
+            session=session,
+            slots=slots,
+        )
+        # Test doubles return plain lists rather than coroutines.
+        if inspect.isawaitable(properties):
+            properties = await properties
+        report['crawl_seconds'] = time.perf_counter() - started
+        report['found'] = len(properties)
+
+        if properties:
+            saving = time.perf_counter()
+            try:
+                saved = await asyncio.to_thread(save, properties)
+            except Exception:
+                _forget_pages(scraper, properties)
+                raise
+            report['save_seconds'] = time.perf_counter() - saving
+            report.update(
+                inserted=saved['inserted'],
+                modified=saved['modified'],
+                failed=saved['failed'],
+            )
+            if saved['failed']:
+                _forget_pages(scraper, properties)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        logger.error("Error scanning %s: %s", city_data['city'], exc)
+        report['error'] = str(exc)
+        if not report['crawl_seconds']:
+            report['crawl_seconds'] = time.perf_counter() - started
+    return report
+
+
+def _forget_pages(scraper, properties) -> None:
+    # A listing whose save failed must not be skipped as unchanged next run.
+    scraper.forget_pages([p.listing_url for p in properties])
+
+
+def format_crawl_report(reports: list[dict[str, Any]]) -> list[str]:
+    """Render city reports as aligned log lines, with a totals row."""
+    lines = [
+        f"{'city':<20} {'found':>6} {'inserted':>9} {'modified':>9} {'failed':>7} "
+        f"{'crawl (s)':>10} {'save (s)':>9}"
+    ]
+    for r in reports:
+        line = (
+            f"{r['city'] + ', ' + r['state']:<20} {r['found']:>6} {r['inserted']:>9} "
+            f"{r['modified']:>9} {r['failed']:>7} {r['crawl_seconds']:>10.2f} "
+            f"{r['save_seconds']:>9.2f}"
+        )
+        if r['error']:
+            line += f"  error: {r['error']}"
+        lines.append(line)
+    totals = {key: sum(r[key] for r in reports) for key in ('found', 'inserted', 'modified', 'failed')}
+    lines.append(
+        f"{'total':<20} {totals['found']:>6} {totals['inserted']:>9} "
+        f"{totals['modified']:>9} {totals['failed']:>7}"
+    )
+    return lines
@@ -0,0 +1,172 @@
+"""On-disk cache of HTTP validators for the Zillow scraper.
+
+For every fetched URL the cache keeps the response's ``ETag`` and
+``Last-Modified`` headers, a SHA-256 hash of the body, and an optional JSON
+payload (the listing URLs parsed from a search page).  The scraper sends
+``If-None-Match`` / ``If-Modified-Since`` from the entry.  A ``304`` or a
+body whose hash matches the stored one means the page is unchanged, so it is
+neither parsed nor saved again.
+
+Entries live in one SQLite file (``pages.sqlite3``) under the cache
+directory.  The cache is bounded by *max_bytes*, counted as the approximate
+size of each row.  When a write pushes it over, the least recently used
+entries are evicted.  Every :meth:`PageCache.get` hit counts as a use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_hash TEXT,
+    payload TEXT,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed);
+"""
+
+
+def body_hash(body: str) -> str:
+    """Return the hex SHA-256 of *body*."""
+    return hashlib.sha256(body.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class PageCache:
+    """SQLite-backed LRU store of per-URL validators.
+
+    Parameters
+    ----------
+    directory:
+        Directory holding ``pages.sqlite3``; created if missing.
+    max_bytes:
+        Approximate size bound.  Defaults to 64 MiB.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            os.path.join(directory, "pages.sqlite3"),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        """Return the entry for *url* (marking it used), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, payload FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE pages SET accessed = ? WHERE url = ?", (time.time(), url)
+            )
+        return {
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "body_hash": row["body_hash"],
+            "payload": json.loads(row["payload"]) if row["payload"] is not None else None,
+        }
+
+    @staticmethod
+    def conditional_headers(entry: dict[str, Any] | None) -> dict[str, str]:
+        """Request headers that make a GET conditional on *entry*."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        body_hash: str | None,
+        payload: Any = None,
+    ) -> None:
+        """Store *url*'s validators and optional JSON *payload*, then evict."""
+        payload_json = json.dumps(payload) if payload is not None else None
+        size = sum(len(v) for v in (url, etag, last_modified, body_hash, payload_json) if v)
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, etag, last_modified, body_hash, payload, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body_hash, payload_json, size, time.time()),
+            )
+            self._total += size - (previous["size"] if previous else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def discard(self, urls) -> None:
+        """Forget *urls*, so their next fetch is unconditional."""
+        with self._lock:
+            for url in urls:
+                row = self._conn.execute(
+                    "SELECT size FROM pages WHERE url = ?", (url,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+                    self._total -= row["size"]
+
+    def _evict(self) -> None:
+        # Caller holds the lock.
+        evicted = 0
+        rows = self._conn.execute(
+            "SELECT url, size FROM pages ORDER BY accessed"
+        ).fetchall()
+        for row in rows:
+            if self._total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM pages WHERE url = ?", (row["url"],))
+            self._total -= row["size"]
+            evicted += 1
+        logger.debug("PageCache: evicted %d entries (%d bytes kept)", evicted, self._total)
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes currently stored."""
+        return self._total
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,180 @@
+"""HTML parsing for :class:`~services.data_collection.zillow_scraper.ZillowScraper`.
+
+Parsing is CPU-bound, so the scraper runs these functions in a process pool
+rather than on the event loop.  They are module-level, take and return only
+plain data, and so pickle cleanly.
+
+Backends
+--------
+``html.parser``
+    BeautifulSoup with the standard-library parser (always available).
+``lxml``
+    BeautifulSoup with the lxml tree builder (``pip install lxml``).
+``selectolax``
+    selectolax's Lexbor parser (``pip install selectolax``); the fastest.
+
+Every backend only locates elements and returns their raw text.  Turning that
+text into listing URLs and property fields happens in shared code, so every
+backend gives the same results on well-formed pages.  ``auto`` picks the
+first installed backend in the order selectolax, lxml, html.parser.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+_LISTING_CARD = "article.list-card"
+_LISTING_LINK = "a.list-card-link"
+_ADDRESS = ".ds-address-container"
+_PRICE = '[data-testid="price"]'
+_FACTS = ('[data-testid="bed-bath-beyond"] span:nth-child(1)',
+          '[data-testid="bed-bath-beyond"] span:nth-child(2)',
+          '[data-testid="bed-bath-beyond"] span:nth-child(3)')
+
+
+def available_backends() -> list[str]:
+    """Return the installed backends, in :data:`PARSER_BACKENDS` order."""
+    return [
+        name for name in PARSER_BACKENDS
+        if name == "html.parser" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def resolve_backend(name: str = "auto") -> str:
+    """Map a configured backend name to an installed one.
+
+    Raises
+    ------
+    ValueError
+        For a name that is neither ``auto`` nor in :data:`PARSER_BACKENDS`.
+    """
+    installed = available_backends()
+    if name == "auto":
+        return next(b for b in ("selectolax", "lxml", "html.parser") if b in installed)
+    if name not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown HTML parser {name!r}; expected auto or one of: {', '.join(PARSER_BACKENDS)}"
+        )
+    if name not in installed:
+        logger.warning("HTML parser %r is not installed; using html.parser", name)
+        return "html.parser"
+    return name
+
+
+# ---------------------------------------------------------------------------
+# Public parse functions (run in the scraper's process pool)
+# ---------------------------------------------------------------------------
+
+def extract_listing_urls(html: str | bytes, backend: str = "html.parser") -> list[str]:
+    """Return the absolute listing URLs on a search-results page."""
+    if backend == "selectolax":
+        hrefs = _selectolax_listing_hrefs(html)
+    else:
+        hrefs = listing_hrefs_from_soup(BeautifulSoup(html, backend))
+    return [href for href in hrefs if href.startswith("http")]
+
+
+def parse_detail(html: str | bytes, property_url: str, backend: str = "html.parser") -> dict:
+    """Return the property data dictionary for a detail page.
+
+    Raises
+    ------
+    ValueError, AttributeError
+        When the page does not have the expected structure.
+    """
+    if backend == "selectolax":
+        texts = _selectolax_detail_texts(html)
+    else:
+        texts = detail_texts_from_soup(BeautifulSoup(html, backend))
+    return detail_from_texts(*texts, property_url=property_url)
+
+
+# ---------------------------------------------------------------------------
+# BeautifulSoup backends (html.parser, lxml)
+# ---------------------------------------------------------------------------
+
+def listing_hrefs_from_soup(soup: BeautifulSoup) -> list[str]:
+    """Return each listing card's link ``href`` ("" when it has none)."""
+    hrefs = []
+    for card in soup.select(_LISTING_CARD):
+        url_elem = card.select_one(_LISTING_LINK)
+        if url_elem:
+            hrefs.append(url_elem.get("href", ""))
+    return hrefs
+
+
+def detail_texts_from_soup(soup: BeautifulSoup) -> tuple:
+    """Return the address, price and bed/bath/sqft texts (None when missing)."""
+    def text(selector):
+        elem = soup.select_one(selector)
+        return elem.text if elem else None
+
+    return text(_ADDRESS), text(_PRICE), [text(selector) for selector in _FACTS]
+
+
+# ---------------------------------------------------------------------------
+# selectolax backend
+# ---------------------------------------------------------------------------
+
+def _selectolax_tree(html):
+    from selectolax.lexbor import LexborHTMLParser
+
+    return LexborHTMLParser(html)
+
+
+def _selectolax_listing_hrefs(html) -> list[str]:
+    hrefs = []
+    for card in _selectolax_tree(html).css(_LISTING_CARD):
+        link = card.css_first(_LISTING_LINK)
+        if link is not None:
+            hrefs.append(link.attributes.get("href") or "")
+    return hrefs
+
+
+def _selectolax_detail_texts(html) -> tuple:
+    tree = _selectolax_tree(html)
+
+    def text(selector):
+        node = tree.css_first(selector)
+        return node.text() if node is not None else None
+
+    return text(_ADDRESS), text(_PRICE), [text(selector) for selector in _FACTS]
+
+
+# ---------------------------------------------------------------------------
+# Shared field extraction
+# ---------------------------------------------------------------------------
+
+def _first_token(text: str | None) -> str:
+    parts = text.split() if text else []
+    return parts[0] if parts else ""
+
+
+def detail_from_texts(
+    address: str | None,
+    price: str | None,
+    facts: list[str | None],
+    property_url: str,
+) -> dict:
+    """Build the property data dictionary from a detail page's element texts."""
+    price_str = price.replace("$", "").replace(",", "") if price is not None else "0"
+    beds, baths, sqft = (_first_token(text) for text in facts)
+    return {
+        "address": address.strip() if address is not None else "Unknown Address",
+        "price": int(price_str) if price_str.isdigit() else 0,
+        "bedrooms": int(beds) if beds.isdigit() else 0,
+        "bathrooms": float(baths) if baths.replace(".", "").isdigit() else 0,
+        "sqft": int(sqft.replace(",", "")) if sqft.replace(",", "").isdigit() else 0,
+        "year_built": 0,
+        "property_type": "Residential",
+        "lot_size": 0,
+        "listing_url": property_url,
+        "source": "Zillow",
+    }
@@ -2,25 +2,47 @@
 
 Design notes
 ------------
-- HTTP is performed with the ``requests`` library for all detail-page fetches.
-- Search-page fetching uses ``aiohttp`` for concurrent page retrieval (existing
-  async interface is preserved so that callers and tests that rely on the async
-  API continue to work without modification).
-- The circuit breaker wraps every outbound HTTP call.  After five consecutive
-  failures the circuit opens and new requests are rejected immediately, giving
-  Zillow time to recover.  The circuit automatically transitions to HALF_OPEN
-  after the configured recovery timeout (default 5 minutes) and will close
-  again on the first successful probe request.
-- Rate-limiting delays are applied before each page fetch to avoid triggering
-  Zillow's bot-detection.
+- :meth:`ZillowScraper.search_properties` fetches search pages and then every
+  listing's detail page concurrently on one shared ``aiohttp`` session.  A
+  semaphore caps in-flight requests (``ZILLOW_MAX_CONCURRENCY``) and a
+  per-host token bucket (``ZILLOW_REQUESTS_PER_SECOND`` /
+  ``ZILLOW_BURST``) keeps the crawl within its request budget.
+- :meth:`ZillowScraper._parse_property_details` remains as a synchronous,
+  ``requests``-based single-page fetch for callers outside an event loop.
+- HTML parsing is CPU-bound, so search and detail pages are parsed in a
+  process pool (``ZILLOW_PARSE_WORKERS``; 0 parses inline) while the event
+  loop keeps fetching.  The parser backend (``ZILLOW_HTML_PARSER``:
+  ``auto``, ``html.parser``, ``lxml`` or ``selectolax``) is chosen in
+  :mod:`services.data_collection.zillow_parser`.
+- With a page cache (``ZILLOW_PAGE_CACHE_DIR``, see
+  :mod:`services.data_collection.page_cache`) requests are conditional.  A
+  ``304`` or an unchanged body hash skips parsing; an unchanged search page
+  reuses its cached listing URLs and an unchanged detail page is dropped
+  from the results, so it is not saved again.
+- A circuit breaker wraps every outbound HTTP call, one per endpoint
+  (search pages and detail pages).  After five consecutive network failures
+  on an endpoint its circuit opens and new requests there are rejected
+  immediately, giving Zillow time to recover.  The circuit automatically
+  transitions to HALF_OPEN after the configured recovery timeout (default 5
+  minutes).  Exactly one request then probes the endpoint while concurrent
+  fetches are turned away; the circuit closes again if the probe succeeds.
+- Every request, search or detail, waits for a token from the host's
+  bucket, so concurrency never raises the request rate above the budget.
 - Random user-agent rotation is preserved on every request.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import multiprocessing
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from urllib.parse import urlsplit
 
 import aiohttp
 import backoff
@@ -28,31 +50,105 @@ import requests
 from bs4 import BeautifulSoup
 
 from models.property import Property
-from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.data_collection.page_cache import DEFAULT_MAX_BYTES, PageCache, body_hash
+from services.data_collection.zillow_parser import (
+    extract_listing_urls,
+    listing_hrefs_from_soup,
+    parse_detail,
+    resolve_backend,
+)
+from utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+from utils.circuit_store import get_circuit_store
+from utils.rate_limiter import HostRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Defaults for the crawl budget; each can be overridden per scraper instance.
+ZILLOW_MAX_CONCURRENCY = int(os.getenv("ZILLOW_MAX_CONCURRENCY", 8))
+ZILLOW_REQUESTS_PER_SECOND = float(os.getenv("ZILLOW_REQUESTS_PER_SECOND", 4))
+ZILLOW_BURST = int(os.getenv("ZILLOW_BURST", 2))
+ZILLOW_PARSE_WORKERS = int(os.getenv("ZILLOW_PARSE_WORKERS", 2))
+ZILLOW_HTML_PARSER = os.getenv("ZILLOW_HTML_PARSER", "auto")
+ZILLOW_PAGE_CACHE_DIR = os.getenv("ZILLOW_PAGE_CACHE_DIR")
+ZILLOW_PAGE_CACHE_MAX_BYTES = int(
+    os.getenv("ZILLOW_PAGE_CACHE_MAX_MB", DEFAULT_MAX_BYTES // (1024 * 1024))
+) * 1024 * 1024
+
+
+def _upstream_failed(status: int) -> bool:
+    """True for responses that count as a circuit breaker failure: the
+    endpoint is throttling us (429) or erroring (5xx)."""
+    return status == 429 or status >= 500
+
+
+class _UpstreamStatusError(Exception):
+    """Raised inside the breaker for a :func:`_upstream_failed` response so
+    it is recorded as a failure; :meth:`ZillowScraper._request` turns it back
+    into the response's status."""
+
+    def __init__(self, status: int, headers: Any) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers
+
 
 class ZillowScraper:
     """Scrapes property listings from Zillow.
 
-    The scraper maintains one shared :class:`~utils.circuit_breaker.CircuitBreaker`
-    instance so that repeated failures on either search pages or detail pages
-    are counted against the same threshold.
+    The scraper keeps one :class:`~utils.circuit_breaker.CircuitBreaker` per
+    endpoint (see :meth:`_breaker`), so failing detail pages do not stop
+    search pages, or the other way round.  When Redis is configured (see
+    :mod:`utils.circuit_store`) the breakers' state is shared by every
+    process running a scraper.
 
     Parameters
     ----------
     failure_threshold:
-        Consecutive failures required to open the circuit.  Defaults to 5.
+        Consecutive failures required to open an endpoint's circuit.
+        Defaults to 5.
     recovery_timeout:
         Seconds the circuit stays OPEN before moving to HALF_OPEN.
         Defaults to 300 (5 minutes).
+    max_concurrency:
+        Maximum requests in flight during one search.  Defaults to
+        ``ZILLOW_MAX_CONCURRENCY``.
+    requests_per_second:
+        Sustained request budget per host; 0 disables rate limiting.
+        Defaults to ``ZILLOW_REQUESTS_PER_SECOND``.
+    burst:
+        Requests per host that may start back to back after an idle period.
+        Defaults to ``ZILLOW_BURST``.
+    parse_workers:
+        Size of the HTML parsing process pool, started on first use; 0
+        parses on the calling thread.  Defaults to ``ZILLOW_PARSE_WORKERS``.
+    html_parser:
+        Parser backend name (see :mod:`~services.data_collection.zillow_parser`).
+        Defaults to ``ZILLOW_HTML_PARSER``.
+    page_cache:
+        :class:`~services.data_collection.page_cache.PageCache` for
+        conditional fetches.  By default one is opened in
+        ``ZILLOW_PAGE_CACHE_DIR`` when that is set; otherwise every page is
+        fetched in full.
+
+    Call :meth:`close` when done to stop the parsing processes and close a
+    page cache the scraper opened itself.
     """
 
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: float = 300.0,
+        max_concurrency: int | None = None,
+        requests_per_second: float | None = None,
+        burst: int | None = None,
+        parse_workers: int | None = None,
+        html_parser: str | None = None,
+        page_cache: PageCache | None = None,
     ) -> None:
         self.base_url = "https://www.zillow.com"
         self.user_agents = [
@@ -63,7 +159,7 @@ class ZillowScraper:
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36",
         ]
-        self._circuit_breaker: CircuitBreaker = CircuitBreaker(
+        self._breakers = CircuitBreakerRegistry(
             name="zillow",
             failure_threshold=failure_threshold,
             recovery_timeout=recovery_timeout,
@@ -72,8 +168,66 @@ class ZillowScraper:
                 aiohttp.ClientError,
                 asyncio.TimeoutError,
                 OSError,
+                _UpstreamStatusError,
             ),
+            store=get_circuit_store(),
         )
+        self.max_concurrency = max(1, max_concurrency or ZILLOW_MAX_CONCURRENCY)
+        self._rate_limiter = HostRateLimiter(
+            rate=ZILLOW_REQUESTS_PER_SECOND if requests_per_second is None else requests_per_second,
+            burst=burst or ZILLOW_BURST,
+        )
+        self.parse_workers = max(
+            0, ZILLOW_PARSE_WORKERS if parse_workers is None else parse_workers
+        )
+        self.html_parser = resolve_backend(html_parser or ZILLOW_HTML_PARSER)
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._owns_page_cache = page_cache is None and bool(ZILLOW_PAGE_CACHE_DIR)
+        if self._owns_page_cache:
+            page_cache = PageCache(ZILLOW_PAGE_CACHE_DIR, ZILLOW_PAGE_CACHE_MAX_BYTES)
+        self.page_cache = page_cache
+
+    # ------------------------------------------------------------------
+    # Parse workers
+    # ------------------------------------------------------------------
+
+    async def _parse(self, func, *args):
+        """Run a :mod:`zillow_parser` function in the process pool.
+
+        The pool uses the ``spawn`` start method: forking a process that
+        holds a PyMongo client and the scheduler thread is not safe.  If the
+        pool breaks, it is dropped and parsing continues inline.  Only the
+        pool is dropped: other fetches of the same crawl are still using the
+        page cache, which stays open until :meth:`close`.
+        """
+        if not self.parse_workers:
+            return func(*args)
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool, func, *args
+            )
+        except BrokenProcessPool:
+            logger.error("ZillowScraper: parse pool broke; parsing inline from now on")
+            self._close_parse_pool()
+            self.parse_workers = 0
+            return func(*args)
+
+    def _close_parse_pool(self) -> None:
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+
+    def close(self) -> None:
+        """Shut down the parsing process pool and an owned page cache."""
+        self._close_parse_pool()
+        if self._owns_page_cache and self.page_cache is not None:
+            self.page_cache.close()
+            self.page_cache = None
 
     # ------------------------------------------------------------------
     # Headers
@@ -100,16 +254,106 @@ class ZillowScraper:
             return f"{self.base_url}/homes/{city_state}/for_sale/"
         return f"{self.base_url}/homes/{city_state}/for_sale/{page}_p/"
 
+    def _breaker(self, url: str) -> CircuitBreaker:
+        """The circuit breaker for *url*'s endpoint: its host and first path
+        segment (``homes`` for search pages, ``homedetails`` for details)."""
+        parts = urlsplit(url)
+        segment = parts.path.strip("/").split("/", 1)[0]
+        return self._breakers.get(f"{parts.netloc.lower()}/{segment}")
+
     # ------------------------------------------------------------------
-    # Async page fetch (used by search_properties)
+    # Async fetches (used by search_properties)
     # ------------------------------------------------------------------
 
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        slots: asyncio.Semaphore | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> tuple[int, str | None, Any] | None:
+        """GET *url* on *session* within the concurrency and rate budget.
+
+        Holds one of *slots* (when given) for the whole request and waits for
+        a token from the host's bucket before sending it.  The request runs
+        inside the endpoint's circuit breaker: network errors count as
+        failures and are re-raised, and so do 429 and 5xx responses (they
+        are still returned).  Any other HTTP response counts as a success
+        because the endpoint answered.  A status other than 200 or 304 is
+        logged.
+
+        Returns
+        -------
+        tuple or None
+            ``(status, body, response headers)``, with a body only for a
+            200, or *None* when the circuit breaker rejects the request
+            (OPEN, or HALF_OPEN with another request already probing).
+        """
+        async with slots or contextlib.nullcontext():
+            await self._rate_limiter.acquire(url)
+
+            headers = self._get_headers()
+            headers.update(extra_headers or {})
+            try:
+                # Entered after waiting: the circuit may have opened meanwhile.
+                async with self._breaker(url):
+                    async with session.get(
+                        url,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=10),
+                    ) as response:
+                        if response.status == 304:
+                            return 304, None, response.headers
+                        if _upstream_failed(response.status):
+                            raise _UpstreamStatusError(response.status, response.headers)
+                        if response.status != 200:
+                            logger.warning(
+                                "Non-200 status %d for %s", response.status, url
+                            )
+                            return response.status, None, response.headers
+                        return 200, await response.text(), response.headers
+            except _UpstreamStatusError as exc:
+                logger.warning("Non-200 status %d for %s", exc.status, url)
+                return exc.status, None, exc.headers
+            except CircuitOpenError:
+                logger.warning(
+                    "ZillowScraper: circuit breaker rejected fetch for %s", url
+                )
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+                logger.error("Network error fetching %s: %s", url, exc)
+                raise
+
+    async def _get_text(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        slots: asyncio.Semaphore | None = None,
+    ) -> str | None:
+        """Unconditional :meth:`_request`: the body of a 200, else *None*."""
+        result = await self._request(session, url, slots)
+        return result[1] if result is not None else None
+
+    @backoff.on_exception(
+        backoff.expo,
+        (aiohttp.ClientError, asyncio.TimeoutError),
+        max_tries=3,
+    )
+    async def _request_with_retries(self, session, url, slots=None, extra_headers=None):
+        """:meth:`_request`, retried like :meth:`_fetch_page`."""
+        return await self._request(session, url, slots, extra_headers)
+
     @backoff.on_exception(
         backoff.expo,
         (aiohttp.ClientError, asyncio.TimeoutError),
         max_tries=3,
     )
-    async def _fetch_page(self, session: aiohttp.ClientSession, url: str) -> str | None:
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        slots: asyncio.Semaphore | None = None,
+    ) -> str | None:
         """Fetch a single search-results page, applying rate-limiting and retries.
 
         Parameters
@@ -118,6 +362,8 @@ class ZillowScraper:
             An active :class:`aiohttp.ClientSession`.
         url:
             The URL to fetch.
+        slots:
+            Optional semaphore bounding concurrent requests.
 
         Returns
         -------
@@ -125,79 +371,144 @@ class ZillowScraper:
             The response body as text, or *None* if the response status is not
             200 or the circuit breaker is open.
         """
-        # Rate-limiting delay before every request.
-        await asyncio.sleep(random.uniform(1.5, 3.5))
+        return await self._get_text(session, url, slots)
 
-        headers = self._get_headers()
+    async def _get_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        slots: asyncio.Semaphore | None = None,
+        retry: bool = False,
+    ) -> tuple[str, str | None, dict | None]:
+        """Fetch *url*, conditionally when the page cache has an entry.
 
-        # Wrap the actual I/O in the circuit breaker.  Because aiohttp is
-        # async we cannot call ``self._circuit_breaker.call()`` directly (it
-        # expects a synchronous callable).  Instead we perform the call inside
-        # a try/except that mirrors what the circuit breaker does, then
-        # delegate failure recording to the breaker's internal helpers.
-        if self._circuit_breaker.state.value == "OPEN":
-            logger.warning(
-                "ZillowScraper: circuit is OPEN; skipping fetch for %s", url
-            )
-            return None
+        Returns
+        -------
+        tuple
+            ``("changed", body, validators)`` for new content, whose
+            validators go to :meth:`_remember` once the body is processed;
+            ``("unchanged", None, entry)`` for a 304 or a body matching the
+            cached hash; ``("failed", None, None)`` otherwise.
+        """
+        if self.page_cache is None:
+            fetch = self._fetch_page if retry else self._get_text
+            body = await fetch(session, url, slots)
+            return ("changed", body, None) if body is not None else ("failed", None, None)
+
+        entry = self.page_cache.get(url)
+        request = self._request_with_retries if retry else self._request
+        result = await request(session, url, slots, PageCache.conditional_headers(entry))
+        if result is None:
+            return "failed", None, None
+        status, body, headers = result
+        if status == 304 and entry is not None:
+            logger.debug("ZillowScraper: %s not modified", url)
+            return "unchanged", None, entry
+        if body is None:
+            return "failed", None, None
+
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "body_hash": body_hash(body),
+        }
+        if entry is not None and entry["body_hash"] == validators["body_hash"]:
+            logger.debug("ZillowScraper: %s body unchanged", url)
+            self.page_cache.put(url, payload=entry["payload"], **validators)
+            return "unchanged", None, entry
+        return "changed", body, validators
+
+    def _remember(self, url: str, validators: dict | None, payload: Any = None) -> None:
+        """Store *url*'s validators (and parsed *payload*) once it is processed."""
+        if self.page_cache is not None and validators is not None:
+            self.page_cache.put(url, payload=payload, **validators)
+
+    def forget_pages(self, urls) -> None:
+        """Drop cached entries so *urls* are fetched and saved again next run.
+
+        Called when saving a crawl's listings fails, so that a page cached as
+        processed is not skipped while its data never reached the database.
+        """
+        if self.page_cache is not None:
+            self.page_cache.discard(urls)
+
+    async def _fetch_property_details(
+        self,
+        session: aiohttp.ClientSession,
+        property_url: str,
+        slots: asyncio.Semaphore | None = None,
+    ) -> dict | None:
+        """Fetch and parse a detail page on the shared *session*.
+
+        The async counterpart of :meth:`_parse_property_details`.  Detail
+        pages are not retried; a failed listing is skipped.
 
+        Returns
+        -------
+        dict or None
+            A property data dictionary, or *None* on network or parsing
+            errors, a non-200 status, an open circuit, or a page the cache
+            reports unchanged.
+        """
         try:
-            async with session.get(
-                url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as response:
-                if response.status != 200:
-                    logger.warning(
-                        "Non-200 status %d for %s", response.status, url
-                    )
-                    # A non-200 is not a hard network failure; don't count it
-                    # against the circuit breaker.
-                    return None
-                text = await response.text()
-                # Successful response: reset the failure counter.
-                self._circuit_breaker._on_success()
-                return text
-        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
-            logger.error("Network error fetching %s: %s", url, exc)
-            self._circuit_breaker._on_failure()
-            raise
+            outcome, html, validators = await self._get_page(session, property_url, slots)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+            return None
+        if outcome != "changed":
+            return None
+        try:
+            prop_data = await self._parse(parse_detail, html, property_url, self.html_parser)
+        except (ValueError, AttributeError) as exc:
+            logger.error("Parsing error for %s: %s", property_url, exc)
+            return None
+        self._remember(property_url, validators)
+        return prop_data
 
     # ------------------------------------------------------------------
     # Listing extraction
     # ------------------------------------------------------------------
 
-    def _extract_listings_from_page(self, soup: BeautifulSoup) -> list[dict]:
-        """Extract listing URLs from a parsed search-results page.
+    def _extract_listings_from_page(self, page: BeautifulSoup | str | bytes) -> list[dict]:
+        """Extract listing URLs from a search-results page.
 
         Parameters
         ----------
-        soup:
-            A :class:`bs4.BeautifulSoup` object representing the page DOM.
+        page:
+            A :class:`bs4.BeautifulSoup` object representing the page DOM, or
+            the page's HTML, parsed with the configured backend.
 
         Returns
         -------
         list[dict]
             Each element is a dict with a single ``"url"`` key.
         """
-        listings: list[dict] = []
-        property_cards = soup.select("article.list-card")
-        for card in property_cards:
-            url_elem = card.select_one("a.list-card-link")
-            if url_elem and url_elem.get("href", "").startswith("http"):
-                listings.append({"url": url_elem["href"]})
-        return listings
+        if isinstance(page, BeautifulSoup):
+            urls = [href for href in listing_hrefs_from_soup(page) if href.startswith("http")]
+        else:
+            urls = extract_listing_urls(page, self.html_parser)
+        return [{"url": url} for url in urls]
 
     # ------------------------------------------------------------------
-    # Detail-page parsing (synchronous, uses requests)
+    # Detail-page parsing
     # ------------------------------------------------------------------
 
+    def _parse_detail_html(self, content: str | bytes, property_url: str) -> dict:
+        """Extract a property data dictionary from a detail page's HTML.
+
+        Raises
+        ------
+        ValueError, AttributeError
+            When the page does not have the expected structure.
+        """
+        return parse_detail(content, property_url, self.html_parser)
+
     def _parse_property_details(self, property_url: str) -> dict | None:
-        """Fetch and parse a Zillow property detail page.
+        """Fetch and parse a Zillow property detail page synchronously.
 
-        Uses the synchronous ``requests`` library so it can be called directly
-        from both async and sync contexts without event-loop management.  The
-        call is protected by the shared circuit breaker.
+        Uses the blocking ``requests`` library for callers outside an event
+        loop; :meth:`search_properties` uses :meth:`_fetch_property_details`
+        instead.  The call is protected by the detail endpoint's circuit
+        breaker, which also counts 429 and 5xx responses as failures.
 
         Parameters
         ----------
@@ -210,78 +521,15 @@ class ZillowScraper:
             A property data dictionary on success, or *None* on network or
             parsing errors.
         """
-        # Respect the circuit breaker before making the network call.
-        if self._circuit_breaker.state.value == "OPEN":
-            logger.warning(
-                "ZillowScraper: circuit is OPEN; skipping detail fetch for %s",
-                property_url,
-            )
-            return None
-
         try:
             headers = self._get_headers()
-            response = self._circuit_breaker.call(
-                requests.get,
-                property_url,
-                headers=headers,
-                timeout=10,
-            )
+            with self._breaker(property_url):
+                response = requests.get(property_url, headers=headers, timeout=10)
+                if _upstream_failed(response.status_code):
+                    response.raise_for_status()
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            address_elem = soup.select_one(".ds-address-container")
-            address = address_elem.text.strip() if address_elem else "Unknown Address"
-
-            price_elem = soup.select_one('[data-testid="price"]')
-            price_str = (
-                price_elem.text.replace("$", "").replace(",", "")
-                if price_elem
-                else "0"
-            )
-            price = int(price_str) if price_str.isdigit() else 0
-
-            beds_elem = soup.select_one(
-                '[data-testid="bed-bath-beyond"] span:nth-child(1)'
-            )
-            bedrooms = (
-                int(beds_elem.text.split()[0])
-                if beds_elem and beds_elem.text.split()[0].isdigit()
-                else 0
-            )
-
-            baths_elem = soup.select_one(
-                '[data-testid="bed-bath-beyond"] span:nth-child(2)'
-            )
-            bathrooms = (
-                float(baths_elem.text.split()[0])
-                if baths_elem
-                and baths_elem.text.split()[0].replace(".", "").isdigit()
-                else 0
-            )
-
-            sqft_elem = soup.select_one(
-                '[data-testid="bed-bath-beyond"] span:nth-child(3)'
-            )
-            sqft = (
-                int(sqft_elem.text.split()[0].replace(",", ""))
-                if sqft_elem
-                and sqft_elem.text.split()[0].replace(",", "").isdigit()
-                else 0
-            )
-
-            return {
-                "address": address,
-                "price": price,
-                "bedrooms": bedrooms,
-                "bathrooms": bathrooms,
-                "sqft": sqft,
-                "year_built": 0,
-                "property_type": "Residential",
-                "lot_size": 0,
-                "listing_url": property_url,
-                "source": "Zillow",
-            }
+            return self._parse_detail_html(response.content, property_url)
         except CircuitOpenError:
             logger.warning(
                 "ZillowScraper: circuit breaker rejected detail fetch for %s",
@@ -300,12 +548,19 @@ class ZillowScraper:
     # ------------------------------------------------------------------
 
     async def search_properties(
-        self, city: str, state: str, max_pages: int = 3
+        self,
+        city: str,
+        state: str,
+        max_pages: int = 3,
+        session: aiohttp.ClientSession | None = None,
+        slots: asyncio.Semaphore | None = None,
     ) -> list[Property]:
         """Search for property listings in the given city and state.
 
         Fetches up to *max_pages* search-results pages concurrently, then
-        fetches the detail page for each listing found.
+        the detail page of every listing found, all on one session.  At most
+        ``max_concurrency`` requests are in flight at once and each waits for
+        the host's rate-limit token.  Pages are parsed in the parse pool.
 
         Parameters
         ----------
@@ -315,6 +570,11 @@ class ZillowScraper:
             Two-letter state abbreviation (e.g. ``"WA"``).
         max_pages:
             Maximum number of search-results pages to retrieve.
+        session:
+            Session to reuse (left open); a new one is created by default.
+        slots:
+            Semaphore shared with other searches to cap their combined
+            requests; defaults to one of ``max_concurrency`` slots.
 
         Returns
         -------
@@ -322,8 +582,8 @@ class ZillowScraper:
             A list of :class:`~models.property.Property` instances.  Returns
             an empty list when no listings are found or if the circuit is open.
         """
-        # Short-circuit immediately if the breaker is already open.
-        if self._circuit_breaker.state.value == "OPEN":
+        # Short-circuit immediately if search pages are known to be failing.
+        if self._breaker(self._get_search_url(city, state)).state is CircuitState.OPEN:
             logger.warning(
                 "ZillowScraper: circuit is OPEN; aborting search for %s, %s",
                 city,
@@ -331,22 +591,42 @@ class ZillowScraper:
             )
             return []
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_page(session, self._get_search_url(city, state, page))
-                for page in range(1, max_pages + 1)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_concurrency)
+        if session is None:
+            session_context = aiohttp.ClientSession()
+        else:
+            session_context = contextlib.nullcontext(session)
+        async with session_context as session:
+            search_urls = [
+                self._get_search_url(city, state, page) for page in range(1, max_pages + 1)
+            ]
+            pages = await asyncio.gather(*(
+                self._get_page(session, url, slots, retry=True) for url in search_urls
+            ))
+
+            # Unchanged pages reuse the listing URLs parsed last time.
+            listing_urls: list[str] = []
+            for outcome, _, entry in pages:
+                if outcome == "unchanged":
+                    listing_urls.extend(entry["payload"] or [])
+            changed = [
+                (url, body, validators)
+                for url, (outcome, body, validators) in zip(search_urls, pages)
+                if outcome == "changed"
             ]
-            pages = await asyncio.gather(*tasks, return_exceptions=False)
-
-        properties: list[Property] = []
-        for page_content in pages:
-            if page_content is None:
-                continue
-            soup = BeautifulSoup(page_content, "html.parser")
-            listings = self._extract_listings_from_page(soup)
-            for listing in listings:
-                prop_data = self._parse_property_details(listing["url"])
-                if prop_data:
-                    properties.append(Property(**prop_data))
-
-        return properties
+            parsed_pages = await asyncio.gather(*(
+                self._parse(extract_listing_urls, body, self.html_parser)
+                for _, body, _ in changed
+            ))
+            for (url, _, validators), urls in zip(changed, parsed_pages):
+                listing_urls.extend(urls)
+                self._remember(url, validators, payload=urls)
+
+            # The same listing can appear on several pages; fetch it once.
+            details = await asyncio.gather(*(
+                self._fetch_property_details(session, url, slots)
+                for url in dict.fromkeys(listing_urls)
+            ))
+
+        return [Property(**prop_data) for prop_data in details if prop_data]
@@ -2,9 +2,10 @@ class MarketAggregator:
     def __init__(self, db):
         self.db = db
         
-    def aggregate_by_state(self, state_code):
-        """Aggregate property data at the state level"""
-        pipeline = [
+    @staticmethod
+    def state_pipeline(state_code):
+        """Pipeline run by :meth:`aggregate_by_state`."""
+        return [
             {'$match': {'state': state_code, 'sqft': {'$gt': 0}, 'price': {'$gt': 0}}},
             {'$group': {
                 '_id': '$state',
@@ -32,13 +33,27 @@ class MarketAggregator:
                 '_id': 0
             }}
         ]
-        
-        result = list(self.db.properties.aggregate(pipeline))
+
+    @classmethod
+    def pipeline_for_market(cls, market):
+        """Aggregation pipeline for a Market document's level, or None."""
+        if market.market_type == 'state':
+            return cls.state_pipeline(market.state)
+        if market.market_type == 'city':
+            return cls.city_pipeline(market.state, market.city)
+        if market.market_type == 'zip_code':
+            return cls.zip_code_pipeline(market.zip_code)
+        return None
+
+    def aggregate_by_state(self, state_code):
+        """Aggregate property data at the state level"""
+        result = list(self.db.properties.aggregate(self.state_pipeline(state_code)))
         return result[0] if result else None
         
-    def aggregate_by_city(self, state_code, city):
-        """Aggregate property data at the city level"""
-        pipeline = [
+    @staticmethod
+    def city_pipeline(state_code, city):
+        """Pipeline run by :meth:`aggregate_by_city`."""
+        return [
             {'$match': {'state': state_code, 'city': city, 'sqft': {'$gt': 0}, 'price': {'$gt': 0}}},
             {'$group': {
                 '_id': {'state': '$state', 'city': '$city'},
@@ -67,13 +82,16 @@ class MarketAggregator:
                 '_id': 0
             }}
         ]
-        
-        result = list(self.db.properties.aggregate(pipeline))
+
+    def aggregate_by_city(self, state_code, city):
+        """Aggregate property data at the city level"""
+        result = list(self.db.properties.aggregate(self.city_pipeline(state_code, city)))
         return result[0] if result else None
         
-    def aggregate_by_zip_code(self, zip_code):
-        """Aggregate property data at the zip code level"""
-        pipeline = [
+    @staticmethod
+    def zip_code_pipeline(zip_code):
+        """Pipeline run by :meth:`aggregate_by_zip_code`."""
+        return [
             {'$match': {'zip_code': zip_code, 'sqft': {'$gt': 0}, 'price': {'$gt': 0}}},
             {'$group': {
                 '_id': '$zip_code',
@@ -101,13 +119,16 @@ class MarketAggregator:
                 '_id': 0
             }}
         ]
-        
-        result = list(self.db.properties.aggregate(pipeline))
+
+    def aggregate_by_zip_code(self, zip_code):
+        """Aggregate property data at the zip code level"""
+        result = list(self.db.properties.aggregate(self.zip_code_pipeline(zip_code)))
         return result[0] if result else None
         
-    def top_markets_by_roi(self, limit=10, sort_field='avg_roi'):
-        """Find top markets ranked by a given investment metric field."""
-        pipeline = [
+    @staticmethod
+    def top_markets_pipeline(limit=10, sort_field='avg_roi'):
+        """Pipeline run by :meth:`top_markets_by_roi`."""
+        return [
             {'$match': {'metrics.cap_rate': {'$exists': True}}},
             {'$group': {
                 '_id': {'state': '$state', 'city': '$city'},
@@ -131,8 +152,10 @@ class MarketAggregator:
                 '_id': 0
             }}
         ]
-        
-        return list(self.db.properties.aggregate(pipeline))
+
+    def top_markets_by_roi(self, limit=10, sort_field='avg_roi'):
+        """Find top markets ranked by a given investment metric field."""
+        return list(self.db.properties.aggregate(self.top_markets_pipeline(limit, sort_field)))
         
     def compare_markets(self, markets, metrics=None):
         """Compare multiple markets across key metrics"""
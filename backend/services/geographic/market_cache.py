@@ -0,0 +1,87 @@
+"""Process-level cache of resolved market data.
+
+Every analysis and scoring request resolves its property's market through the
+zip -> city -> state fallback.  Market documents only change when the
+scheduler's ``update_market_data`` job runs, so resolutions are cached per
+``(zip_code, city, state)`` in a size-bounded LRU with a TTL.  Misses are
+resolved by ``Market.find_for_location``, one bounded ``find_one`` per level.
+
+The scheduler calls :func:`invalidate_market_cache` after updating markets.
+Other worker processes do not see that call and pick up changes when their
+entries expire, so the TTL bounds staleness across workers.
+
+:func:`resolve_market_data_async` shares the cache for the ASGI handlers and
+resolves misses by querying every fallback level concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import os
+from typing import Any
+
+from models.market import DEFAULT_MARKET_DATA, Market
+from utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+MARKET_CACHE_TTL_SECONDS = int(os.getenv("MARKET_CACHE_TTL_SECONDS", 3600))
+MARKET_CACHE_MAX_ENTRIES = int(os.getenv("MARKET_CACHE_MAX_ENTRIES", 4096))
+
+_cache = TTLCache(maxsize=MARKET_CACHE_MAX_ENTRIES, ttl=MARKET_CACHE_TTL_SECONDS)
+
+
+def resolve_market_data(zip_code: str | None, city: str | None,
+                        state: str | None) -> dict[str, Any]:
+    """Return market data for a location, or ``DEFAULT_MARKET_DATA``.
+
+    Each call returns a fresh copy, so callers may modify the result.
+    """
+    key = (zip_code or None, city or None, state or None)
+    market_data = _cache.get(key)
+    if market_data is MISSING:
+        market = Market.find_for_location(*key)
+        market_data = market.to_dict() if market else None
+        _cache.set(key, market_data)
+    if market_data is None:
+        return dict(DEFAULT_MARKET_DATA)
+    return copy.deepcopy(market_data)
+
+
+async def resolve_market_data_async(db, zip_code: str | None, city: str | None,
+                                    state: str | None) -> dict[str, Any]:
+    """Async :func:`resolve_market_data` for an async Mongo database handle.
+
+    On a miss the zip, city and state levels are looked up concurrently and
+    the highest-priority match wins, as in ``Market.find_for_location``.
+    """
+    key = (zip_code or None, city or None, state or None)
+    market_data = _cache.get(key)
+    if market_data is MISSING:
+        market_data = None
+        clauses = Market.location_clauses(*key)
+        collection = db[Market.collection_name]
+        docs = await asyncio.gather(
+            *(collection.find_one({field: value}) for field, value in clauses)
+        )
+        for doc in docs:
+            market = Market.from_dict(doc) if doc else None
+            if market is not None:
+                market_data = market.to_dict()
+                break
+        _cache.set(key, market_data)
+    if market_data is None:
+        return dict(DEFAULT_MARKET_DATA)
+    return copy.deepcopy(market_data)
+
+
+def invalidate_market_cache() -> None:
+    """Drop every cached market resolution."""
+    _cache.clear()
+    logger.info("Market cache invalidated")
+
+
+def market_cache_stats() -> dict[str, int]:
+    return _cache.stats()
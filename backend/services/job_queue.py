@@ -0,0 +1,247 @@
+"""Persistent job queue for background work, stored in MongoDB.
+
+The API and the scheduler enqueue jobs; ``python -m worker`` processes run
+them, so scraping and re-scoring never share a process with request handling.
+
+Each job is a document in the ``jobs`` collection::
+
+    {'type': 'crawl_city', 'payload': {...}, 'priority': 5, 'status': 'queued',
+     'attempts': 0, 'max_attempts': 3, 'run_after': ..., 'lease_until': None,
+     'worker': None, 'dedupe_key': 'crawl_city:Seattle:WA', 'live': True, ...}
+
+Status moves ``queued`` -> ``running`` -> ``done`` or ``failed``.
+
+- **Priorities**: :meth:`JobQueue.claim` takes the highest ``priority``
+  first, then the oldest ``run_after``.
+- **Visibility timeout**: a claimed job is leased to one worker until
+  ``lease_until``.  The worker extends the lease while the job runs.  If the
+  worker dies, the job becomes claimable again when the lease lapses.
+- **Retries**: a failed attempt is re-queued with exponential backoff until
+  ``max_attempts`` is reached, then marked ``failed``.  A job whose lease
+  lapsed on its last attempt is failed when it is next claimed.
+- **De-duplication**: an enqueue with a ``dedupe_key`` returns the existing
+  queued or running job with that key instead of adding another.  Queued and
+  running jobs carry ``live: True``, which is unset when they finish; a
+  unique partial index on ``(dedupe_key, live)`` makes the lookup-or-insert
+  atomic, and the enqueue that loses an insert race returns the winner's job.
+
+Finished jobs are removed by a TTL index on ``finished_at`` (see
+:mod:`utils.indexes`).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from utils.database import get_db
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = 'jobs'
+
+JOB_VISIBILITY_TIMEOUT = int(os.getenv('JOB_VISIBILITY_TIMEOUT', 600))
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', 3))
+JOB_RETRY_DELAY = int(os.getenv('JOB_RETRY_DELAY', 60))
+
+# Upsert attempts for a deduplicated enqueue before giving up; a conflicting
+# job can finish between the failed insert and the re-read.
+DEDUPE_ATTEMPTS = 3
+
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+def job_to_dict(job: dict[str, Any]) -> dict[str, Any]:
+    """JSON-safe view of a job document for API responses."""
+    result = {
+        'id': str(job['_id']),
+        'type': job['type'],
+        'payload': job.get('payload', {}),
+        'priority': job.get('priority', 0),
+        'status': job['status'],
+        'attempts': job.get('attempts', 0),
+        'max_attempts': job.get('max_attempts'),
+        'error': job.get('error'),
+        'result': job.get('result'),
+    }
+    for field in ('created_at', 'started_at', 'finished_at'):
+        value = job.get(field)
+        result[field] = value.isoformat() if isinstance(value, datetime) else value
+    return result
+
+
+class JobQueue:
+    """Enqueue, claim and settle jobs in the ``jobs`` collection.
+
+    Parameters
+    ----------
+    db:
+        A pymongo ``Database``.  Defaults to :func:`utils.database.get_db`
+        on each use.
+    visibility_timeout:
+        Seconds a claimed job stays leased to its worker.  Defaults to
+        ``JOB_VISIBILITY_TIMEOUT``.
+    retry_delay:
+        Base delay before a failed attempt is retried; doubled per attempt.
+        Defaults to ``JOB_RETRY_DELAY``.
+    """
+
+    def __init__(self, db=None, visibility_timeout: float | None = None,
+                 retry_delay: float | None = None) -> None:
+        self._db = db
+        self.visibility_timeout = (
+            JOB_VISIBILITY_TIMEOUT if visibility_timeout is None else visibility_timeout
+        )
+        self.retry_delay = JOB_RETRY_DELAY if retry_delay is None else retry_delay
+
+    @property
+    def collection(self):
+        return (self._db if self._db is not None else get_db())[COLLECTION]
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def enqueue(self, job_type: str, payload: dict[str, Any] | None = None,
+                priority: int = 0, max_attempts: int | None = None,
+                dedupe_key: str | None = None) -> dict[str, Any]:
+        """Add a job and return its document.
+
+        With *dedupe_key*, a queued or running job with the same key is
+        returned instead of adding a duplicate.
+        """
+        now = datetime.now(timezone.utc)
+        job = {
+            'type': job_type,
+            'payload': payload or {},
+            'priority': priority,
+            'status': QUEUED,
+            'attempts': 0,
+            'max_attempts': JOB_MAX_ATTEMPTS if max_attempts is None else max_attempts,
+            'run_after': now,
+            'lease_until': None,
+            'worker': None,
+            'dedupe_key': dedupe_key,
+            'live': True,
+            'created_at': now,
+            'updated_at': now,
+        }
+        if dedupe_key is None:
+            job['_id'] = self.collection.insert_one(job).inserted_id
+            return job
+        live = {'dedupe_key': dedupe_key, 'live': True}
+        for _ in range(DEDUPE_ATTEMPTS):
+            try:
+                return self.collection.find_one_and_update(
+                    live,
+                    {'$setOnInsert': {k: v for k, v in job.items() if k not in live}},
+                    upsert=True,
+                    return_document=ReturnDocument.AFTER,
+                )
+            except DuplicateKeyError:
+                # A concurrent enqueue inserted the same key first.
+                existing = self.collection.find_one(live)
+                if existing is not None:
+                    return existing
+        raise RuntimeError(f"Could not enqueue job with dedupe key {dedupe_key!r}")
+
+    def get(self, job_id: str | ObjectId) -> dict[str, Any] | None:
+        """Return the job document, or None."""
+        return self.collection.find_one({'_id': ObjectId(job_id)})
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def claim(self, worker: str) -> dict[str, Any] | None:
+        """Lease the next runnable job to *worker*, or return None.
+
+        Runnable means queued and due, or running with a lapsed lease.
+        """
+        while True:
+            now = datetime.now(timezone.utc)
+            job = self.collection.find_one_and_update(
+                {'$or': [
+                    {'status': QUEUED, 'run_after': {'$lte': now}},
+                    {'status': RUNNING, 'lease_until': {'$lt': now}},
+                ]},
+                {
+                    '$set': {
+                        'status': RUNNING,
+                        'worker': worker,
+                        'lease_until': now + timedelta(seconds=self.visibility_timeout),
+                        'started_at': now,
+                        'updated_at': now,
+                    },
+                    '$inc': {'attempts': 1},
+                },
+                sort=[('priority', DESCENDING), ('run_after', ASCENDING)],
+                return_document=ReturnDocument.AFTER,
+            )
+            if job is None or job['attempts'] <= job['max_attempts']:
+                return job
+            # The previous holder's lease lapsed on the last allowed attempt.
+            self._finish(job, FAILED, error='Visibility timeout expired on final attempt')
+
+    def extend(self, job: dict[str, Any]) -> bool:
+        """Push the job's lease forward; False if the worker lost the job."""
+        now = datetime.now(timezone.utc)
+        result = self.collection.update_one(
+            {'_id': job['_id'], 'worker': job['worker'], 'status': RUNNING},
+            {'$set': {
+                'lease_until': now + timedelta(seconds=self.visibility_timeout),
+                'updated_at': now,
+            }},
+        )
+        return result.modified_count == 1
+
+    def complete(self, job: dict[str, Any], result: Any = None) -> bool:
+        """Mark a claimed job done; False if the worker lost the job."""
+        return self._finish(job, DONE, result=result)
+
+    def fail(self, job: dict[str, Any], error: str, retry: bool = True) -> bool:
+        """Record a failed attempt: re-queue with backoff, or mark failed
+        once attempts are used up or *retry* is False.
+
+        Returns False if the worker lost the job.
+        """
+        if not retry or job['attempts'] >= job['max_attempts']:
+            return self._finish(job, FAILED, error=error)
+        now = datetime.now(timezone.utc)
+        delay = self.retry_delay * 2 ** (job['attempts'] - 1)
+        result = self.collection.update_one(
+            {'_id': job['_id'], 'worker': job['worker'], 'status': RUNNING},
+            {'$set': {
+                'status': QUEUED,
+                'run_after': now + timedelta(seconds=delay),
+                'lease_until': None,
+                'error': error,
+                'updated_at': now,
+            }},
+        )
+        return result.modified_count == 1
+
+    def _finish(self, job: dict[str, Any], status: str, result: Any = None,
+                error: str | None = None) -> bool:
+        now = datetime.now(timezone.utc)
+        update = self.collection.update_one(
+            {'_id': job['_id'], 'worker': job['worker'], 'status': RUNNING},
+            {
+                '$set': {
+                    'status': status,
+                    'result': result,
+                    'error': error,
+                    'lease_until': None,
+                    'finished_at': now,
+                    'updated_at': now,
+                },
+                '$unset': {'live': ''},
+            },
+        )
+        return update.modified_count == 1
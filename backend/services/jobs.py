@@ -0,0 +1,123 @@
+"""Job handlers run by the background worker (``python -m worker``).
+
+``JOB_HANDLERS`` maps a job ``type`` to a callable taking the job payload as
+keyword arguments.  A handler returns a BSON-serializable result, which is
+stored on the job, and raises to fail the attempt.
+
+``ON_DEMAND_JOBS`` are the types the API may enqueue (``POST /api/v1/jobs``).
+Each maps to a validator that checks the payload and returns it normalized,
+plus the job's de-duplication key.  The other types are enqueued by the
+worker's own schedule.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from models.market import Market
+from models.property import Property
+from services.data_collection.crawler import crawl_cities
+from services.data_collection.zillow_scraper import ZillowScraper
+from services.materialization import MetricsMaterializer
+from utils.validation import is_valid_objectid
+
+logger = logging.getLogger(__name__)
+
+MAX_CRAWL_PAGES = 10
+
+
+def crawl_city(city: str, state: str, max_pages: int = 2) -> dict[str, Any]:
+    """Re-crawl one city and bulk upsert its listings; returns the crawl report."""
+    scraper = ZillowScraper()
+    try:
+        report = asyncio.run(crawl_cities(
+            scraper,
+            [{'city': city, 'state': state}],
+            save=Property.bulk_upsert,
+            max_pages=max_pages,
+        ))[0]
+    finally:
+        scraper.close()
+    if report['error']:
+        raise RuntimeError(report['error'])
+    return report
+
+
+def market_query(market: Market) -> dict[str, Any]:
+    """Property filter selecting the listings that belong to *market*."""
+    if market.market_type == 'zip_code' and market.zip_code:
+        return {'zip_code': market.zip_code}
+    if market.market_type == 'city' and market.city:
+        return {'city': market.city, 'state': market.state}
+    if market.state:
+        return {'state': market.state}
+    raise ValueError(f"Market {market.name} has no location to select properties by")
+
+
+def rescore_market(market_id: str) -> dict[str, int]:
+    """Recompute metrics and scores for every property in a market."""
+    market = Market.find_by_id(market_id)
+    if market is None:
+        raise ValueError(f"Market {market_id} not found")
+    return MetricsMaterializer().run(force=True, query=market_query(market))
+
+
+def update_property_metrics() -> dict[str, int]:
+    """Incremental metrics materialization over all properties."""
+    return MetricsMaterializer().run()
+
+
+# The scheduled tasks log their own errors and return False.
+
+def update_property_data() -> None:
+    """The nightly crawl of every configured city."""
+    from services import scheduler
+    if not scheduler.update_property_data():
+        raise RuntimeError("update_property_data failed; see the worker log")
+
+
+def update_market_data() -> None:
+    """The weekly market data refresh."""
+    from services import scheduler
+    if not scheduler.update_market_data():
+        raise RuntimeError("update_market_data failed; see the worker log")
+
+
+JOB_HANDLERS: dict[str, Callable[..., Any]] = {
+    'crawl_city': crawl_city,
+    'rescore_market': rescore_market,
+    'update_property_data': update_property_data,
+    'update_market_data': update_market_data,
+    'update_property_metrics': update_property_metrics,
+}
+
+
+# ---------------------------------------------------------------------------
+# On-demand job validation
+# ---------------------------------------------------------------------------
+
+def _crawl_city_payload(payload: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    city = str(payload.get('city') or '').strip()
+    state = str(payload.get('state') or '').strip().upper()
+    if not city or len(state) != 2 or not state.isalpha():
+        raise ValueError("crawl_city requires 'city' and a two-letter 'state'")
+    max_pages = max(1, min(MAX_CRAWL_PAGES, int(payload.get('max_pages', 2))))
+    return (
+        {'city': city, 'state': state, 'max_pages': max_pages},
+        f"crawl_city:{city.lower()}:{state}",
+    )
+
+
+def _rescore_market_payload(payload: dict[str, Any]) -> tuple[dict[str, Any], str]:
+    market_id = payload.get('market_id')
+    if not isinstance(market_id, str) or not is_valid_objectid(market_id):
+        raise ValueError("rescore_market requires a valid 'market_id'")
+    return {'market_id': market_id}, f"rescore_market:{market_id}"
+
+
+ON_DEMAND_JOBS: dict[str, Callable[[dict[str, Any]], tuple[dict[str, Any], str]]] = {
+    'crawl_city': _crawl_city_payload,
+    'rescore_market': _rescore_market_payload,
+}
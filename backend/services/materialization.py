@@ -0,0 +1,240 @@
+"""Background materialization of ``metrics`` and ``score`` on property documents.
+
+``MarketAggregator.top_markets_by_roi`` groups on ``metrics.cap_rate`` and the
+``minScore`` list filter matches on ``score``, but neither field is populated
+when a listing is scraped or created.  :class:`MetricsMaterializer` walks the
+``properties`` collection, runs :class:`FinancialMetricsBatch` and
+:class:`OpportunityScoring` for each property, and writes the results back in
+unordered ``bulk_write`` batches of ``UpdateOne``.
+
+Incremental runs
+----------------
+Each written document also receives a ``metrics_fingerprint``: a hash of the
+price, the year built and every market input the two analysis services read.
+A property is only reprocessed when its fingerprint no longer matches (its
+price changed, or the market it resolves to changed) or when it has no score
+yet, e.g. because ``Property.save()`` reset ``metrics``/``score`` on re-scrape.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from models.market import DEFAULT_MARKET_DATA, Market
+from models.property import Property
+from services.analysis.financial_metrics_batch import FinancialMetricsBatch
+from services.analysis.opportunity_scoring import OpportunityScoring
+from utils.database import get_db
+
+logger = logging.getLogger(__name__)
+
+# Bump when the analysis formulas change so every document is recomputed.
+FINGERPRINT_VERSION = 1
+
+DEFAULT_BATCH_SIZE = 500
+
+# Market fields read by FinancialMetrics and OpportunityScoring.
+_MARKET_INPUT_FIELDS = (
+    'property_tax_rate', 'price_to_rent_ratio', 'vacancy_rate',
+    'appreciation_rate', 'avg_hoa_fee', 'rent_growth_rate', 'days_on_market',
+    'unemployment_rate', 'walk_score', 'school_rating', 'crime_rating',
+    'current_mortgage_rate', 'tax_benefits',
+)
+
+# Property fields needed to analyse, score and fingerprint a listing.
+_PROPERTY_PROJECTION = {
+    'price': 1, 'year_built': 1, 'zip_code': 1, 'city': 1, 'state': 1,
+    'property_type': 1, 'bedrooms': 1, 'bathrooms': 1, 'sqft': 1,
+    'lot_size': 1, 'score': 1, 'metrics_fingerprint': 1,
+}
+
+
+class MarketIndex:
+    """In-memory zip -> city -> state market lookup for a whole run.
+
+    Mirrors the fallback order of ``Market.find_for_location`` but
+    loads the ``markets`` collection once instead of issuing up to three
+    queries per property.  As with ``find_one``, the first document in natural
+    order wins when several markets share a key.
+    """
+
+    def __init__(self, market_docs: Iterable[dict[str, Any]]) -> None:
+        self._by_field: dict[str, dict[Any, dict[str, Any]]] = {
+            'zip_code': {}, 'city': {}, 'state': {},
+        }
+        for doc in market_docs:
+            market = Market.from_dict(doc)
+            if market is None:
+                continue
+            market_dict = market.to_dict()
+            for field, index in self._by_field.items():
+                value = doc.get(field)
+                if value is not None and value not in index:
+                    index[value] = market_dict
+
+    @classmethod
+    def load(cls, db) -> 'MarketIndex':
+        return cls(db[Market.collection_name].find({}))
+
+    def resolve(self, zip_code: str | None, city: str | None, state: str | None) -> dict[str, Any]:
+        market = None
+        if zip_code:
+            market = self._by_field['zip_code'].get(zip_code)
+        if not market and city and state:
+            market = self._by_field['city'].get(city)
+        if not market and state:
+            market = self._by_field['state'].get(state)
+        return market if market else dict(DEFAULT_MARKET_DATA)
+
+
+def compute_fingerprint(property_doc: dict[str, Any], market_data: dict[str, Any],
+                        year: int | None = None) -> str:
+    """Return a stable hash of every input that affects metrics and score.
+
+    The current year is included because the risk score depends on property
+    age, so scores are refreshed once a year even when nothing else changes.
+    """
+    payload = {
+        'v': FINGERPRINT_VERSION,
+        'year': year if year is not None else datetime.now().year,
+        'price': property_doc.get('price'),
+        'year_built': property_doc.get('year_built'),
+        'market': {k: market_data.get(k) for k in _MARKET_INPUT_FIELDS},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class MetricsMaterializer:
+    """Compute and persist ``metrics``/``score`` for every stale property.
+
+    Parameters
+    ----------
+    db:
+        A pymongo ``Database``.  Defaults to :func:`utils.database.get_db`.
+    batch_size:
+        Number of properties analysed and written per ``bulk_write``.
+    """
+
+    def __init__(self, db=None, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self.db = db if db is not None else get_db()
+        self.batch_size = max(1, int(batch_size))
+
+    def run(self, force: bool = False, query: dict[str, Any] | None = None) -> dict[str, int]:
+        """Materialize metrics for stale properties.
+
+        Parameters
+        ----------
+        force:
+            Reprocess every property regardless of its fingerprint.
+        query:
+            Filter limiting the run to some properties, e.g. one market's
+            (``services.jobs.rescore_market``).  Defaults to all.
+
+        Returns
+        -------
+        dict
+            Counts of ``scanned``, ``skipped``, ``updated`` and ``failed``
+            properties.
+        """
+        markets = MarketIndex.load(self.db)
+        year = datetime.now().year
+        stats = {'scanned': 0, 'skipped': 0, 'updated': 0, 'failed': 0}
+
+        pending: list[tuple[dict[str, Any], dict[str, Any], str]] = []
+        cursor = (
+            self.db[Property.collection_name]
+            .find(query or {}, _PROPERTY_PROJECTION)
+            .batch_size(self.batch_size)
+        )
+        for doc in cursor:
+            stats['scanned'] += 1
+            market_data = markets.resolve(doc.get('zip_code'), doc.get('city'), doc.get('state'))
+            fingerprint = compute_fingerprint(doc, market_data, year=year)
+            if (not force and doc.get('score') is not None
+                    and doc.get('metrics_fingerprint') == fingerprint):
+                stats['skipped'] += 1
+                continue
+
+            pending.append((doc, market_data, fingerprint))
+            if len(pending) >= self.batch_size:
+                self._flush(pending, stats)
+                pending = []
+
+        if pending:
+            self._flush(pending, stats)
+
+        logger.info(
+            "Metrics materialization: scanned=%d updated=%d skipped=%d failed=%d",
+            stats['scanned'], stats['updated'], stats['skipped'], stats['failed'],
+        )
+        return stats
+
+    def _build_updates(self, pending: list[tuple[dict[str, Any], dict[str, Any], str]],
+                       stats: dict[str, int]) -> list[UpdateOne]:
+        properties = [Property.from_dict(doc) for doc, _, _ in pending]
+        batch = FinancialMetricsBatch.from_records(properties, [m for _, m, _ in pending])
+        analyses = batch.to_records(batch.analyze())
+        now = datetime.now(timezone.utc).isoformat()
+
+        updates = []
+        for (doc, market_data, fingerprint), prop, analysis in zip(pending, properties, analyses):
+            try:
+                score = OpportunityScoring(prop, market_data).calculate_score()
+            except Exception as e:
+                logger.error(f"Failed to score property {doc.get('_id')}: {e}")
+                stats['failed'] += 1
+                continue
+            updates.append(UpdateOne(
+                {'_id': doc['_id']},
+                {'$set': {
+                    'metrics': analysis,
+                    'score': score['overall_score'],
+                    'metrics_fingerprint': fingerprint,
+                    'metrics_updated_at': now,
+                }},
+            ))
+        return updates
+
+    def _flush(self, pending: list[tuple[dict[str, Any], dict[str, Any], str]],
+               stats: dict[str, int]) -> None:
+        try:
+            updates = self._build_updates(pending, stats)
+        except Exception as e:
+            logger.error(f"Failed to analyse batch of {len(pending)} properties: {e}")
+            stats['failed'] += len(pending)
+            return
+        if not updates:
+            return
+
+        try:
+            result = self.db[Property.collection_name].bulk_write(updates, ordered=False)
+            stats['updated'] += result.matched_count
+        except BulkWriteError as e:
+            details = e.details or {}
+            write_errors = details.get('writeErrors', [])
+            logger.error(f"Bulk metrics write had {len(write_errors)} errors")
+            stats['updated'] += details.get('nMatched', 0)
+            stats['failed'] += len(write_errors)
+
+
+def update_property_metrics(force: bool = False) -> bool:
+    """
+    Materialize metrics and scores on property documents.
+    This function is called by the scheduler.
+    """
+    try:
+        logger.info(f"Starting scheduled metrics materialization at {datetime.now()}")
+        MetricsMaterializer().run(force=force)
+        logger.info("Metrics materialization completed successfully")
+        return True
+    except Exception as e:
+        logger.error(f"Error in metrics materialization: {str(e)}")
+        return False
@@ -0,0 +1,138 @@
+"""Streaming export of property documents as NDJSON or CSV.
+
+Rows are read from a server-side cursor in ``batch_size`` chunks and encoded
+one line at a time, so memory use depends on the chunk size rather than on
+the number of exported properties.  When metrics are requested, each chunk is
+analysed with :class:`FinancialMetricsBatch` using the market data resolved
+for every property's location.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from types import SimpleNamespace
+from typing import Any, Iterable, Iterator
+
+from models.property import Property
+from services.analysis.financial_metrics_batch import FinancialMetricsBatch
+from services.geographic.market_cache import resolve_market_data
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# Exported property fields, in CSV column order.  ``images`` and
+# ``description`` are left out to keep rows small.
+EXPORT_FIELDS = (
+    '_id', 'address', 'city', 'state', 'zip_code', 'price', 'bedrooms',
+    'bathrooms', 'sqft', 'year_built', 'property_type', 'lot_size',
+    'listing_url', 'source', 'latitude', 'longitude', 'score',
+    'created_at', 'updated_at',
+)
+
+_PROJECTION = {field: 1 for field in EXPORT_FIELDS}
+
+
+def iter_property_rows(db, filters: dict[str, Any], batch_size: int = DEFAULT_BATCH_SIZE,
+                       include_metrics: bool = False) -> Iterator[dict[str, Any]]:
+    """Yield exported property dicts matching *filters* in ``_id`` order.
+
+    Parameters
+    ----------
+    db:
+        A pymongo ``Database``.
+    filters:
+        Query filter, as built for the property list endpoint.
+    batch_size:
+        Cursor batch size and the number of rows analysed together.
+    include_metrics:
+        Add a ``metrics`` dict holding ``FinancialMetrics.analyze_property``
+        results computed with default parameters.
+    """
+    cursor = (
+        db[Property.collection_name]
+        .find(filters, _PROJECTION)
+        .sort('_id', 1)
+        .batch_size(batch_size)
+    )
+    chunk: list[dict[str, Any]] = []
+    for doc in cursor:
+        chunk.append(doc)
+        if len(chunk) >= batch_size:
+            yield from _finish_chunk(chunk, include_metrics)
+            chunk = []
+    if chunk:
+        yield from _finish_chunk(chunk, include_metrics)
+
+
+def _finish_chunk(docs: list[dict[str, Any]], include_metrics: bool) -> Iterator[dict[str, Any]]:
+    rows = [{field: doc.get(field) for field in EXPORT_FIELDS} for doc in docs]
+    for row in rows:
+        row['_id'] = str(row['_id'])
+
+    if include_metrics:
+        markets: dict[tuple, dict[str, Any]] = {}
+        market_data = []
+        for doc in docs:
+            location = (doc.get('zip_code'), doc.get('city'), doc.get('state'))
+            if location not in markets:
+                markets[location] = resolve_market_data(*location)
+            market_data.append(markets[location])
+        batch = FinancialMetricsBatch.from_records(
+            [SimpleNamespace(price=doc.get('price') or 0) for doc in docs], market_data,
+        )
+        for row, metrics in zip(rows, batch.to_records(batch.analyze())):
+            row['metrics'] = metrics
+
+    yield from rows
+
+
+# ---------------------------------------------------------------------------
+# Encoders
+# ---------------------------------------------------------------------------
+
+def ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Encode each row as one JSON document per line."""
+    for row in rows:
+        yield json.dumps(row, default=str) + '\n'
+
+
+def _flatten(value: dict[str, Any], prefix: str) -> dict[str, Any]:
+    flat = {}
+    for key, item in value.items():
+        name = f'{prefix}.{key}'
+        if isinstance(item, dict):
+            flat.update(_flatten(item, name))
+        else:
+            flat[name] = item
+    return flat
+
+
+def _csv_line(values: list[Any]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def csv_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Encode rows as CSV with a header line.
+
+    Nested ``metrics`` values become dotted columns (``metrics.roi.total_roi``).
+    The header is taken from the first row, so an empty export yields only the
+    base property columns.
+    """
+    columns = None
+    for row in rows:
+        metrics = row.get('metrics')
+        flat = {field: row.get(field) for field in EXPORT_FIELDS}
+        if isinstance(metrics, dict):
+            flat.update(_flatten(metrics, 'metrics'))
+        if columns is None:
+            columns = list(flat)
+            yield _csv_line(columns)
+        yield _csv_line([flat.get(column) for column in columns])
+    if columns is None:
+        yield _csv_line(list(EXPORT_FIELDS))
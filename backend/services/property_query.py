@@ -0,0 +1,310 @@
+"""Totals and deep-page reads for offset-paginated property listings.
+
+Count strategies
+----------------
+``exact``
+    ``count_documents(filters)`` on every request.
+``cached``
+    The exact count, memoised per normalized filter in a process-level TTL
+    cache (``PROPERTY_COUNT_CACHE_TTL_SECONDS``, default 60).
+``estimated``
+    ``estimated_document_count()`` (collection metadata, no scan) when there
+    is no filter; otherwise ``count_documents`` with ``limit`` so the scan
+    stops at ``ESTIMATED_COUNT_CAP`` matches.  A capped total is a lower
+    bound and is reported as such.
+
+Deep pages
+----------
+``skip(n)`` still walks ``n`` documents.  Past ``DEEP_PAGE_SKIP_THRESHOLD``
+the page is instead read with a range filter on ``(sort_by, _id)`` that
+starts after the previous page's last row.  That boundary comes from a
+process-level cache filled as pages are served, so walking pages in order
+seeks directly; on a cache miss it is located with a projected
+``skip(n - 1).limit(1)`` that reads only the two sort-key fields.
+
+``count_properties_async`` and ``find_offset_page_async`` do the same with
+an async Mongo database handle for the ASGI app.  Both sides run the same
+query plans (see ``_run``) and share these caches.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Generator, NamedTuple
+
+from models.property import Property
+from utils.ttl_cache import MISSING, TTLCache
+
+logger = logging.getLogger(__name__)
+
+COUNT_STRATEGIES = ('exact', 'cached', 'estimated')
+
+PROPERTY_COUNT_CACHE_TTL_SECONDS = int(os.getenv("PROPERTY_COUNT_CACHE_TTL_SECONDS", 60))
+ESTIMATED_COUNT_CAP = int(os.getenv("ESTIMATED_COUNT_CAP", 10000))
+DEEP_PAGE_SKIP_THRESHOLD = int(os.getenv("DEEP_PAGE_SKIP_THRESHOLD", 1000))
+
+# Sort keys eligible for range seeking.  Seeking compares values with
+# $gt/$lt, which only matches within one BSON type, so it is limited to
+# fields that hold a single type.
+SEEKABLE_SORT_FIELDS = frozenset({
+    'price', 'bedrooms', 'bathrooms', 'sqft', 'year_built', 'lot_size',
+    'score', 'created_at', 'updated_at',
+})
+
+_count_cache = TTLCache(maxsize=1024, ttl=PROPERTY_COUNT_CACHE_TTL_SECONDS)
+_boundary_cache = TTLCache(maxsize=4096, ttl=PROPERTY_COUNT_CACHE_TTL_SECONDS)
+
+
+def _filter_key(filters: dict[str, Any], *extra: Any) -> str:
+    return json.dumps([filters, *extra], sort_keys=True, default=str)
+
+
+# ---------------------------------------------------------------------------
+# Query plans
+#
+# Counting and seeking are written once, as generators that yield the Mongo
+# operations they need and are sent each result back.  ``_run`` executes the
+# operations on a pymongo collection and ``_run_async`` awaits them on an
+# async one, so the sync and async entry points share every decision and
+# cache.
+# ---------------------------------------------------------------------------
+
+class _Count(NamedTuple):
+    filters: dict[str, Any]
+    limit: int | None = None
+
+
+class _EstimatedCount(NamedTuple):
+    pass
+
+
+class _Find(NamedTuple):
+    query: dict[str, Any]
+    projection: dict[str, int] | None
+    sort: list
+    limit: int
+    skip: int | None = None
+
+
+def _cursor(collection, op: _Find):
+    cursor = collection.find(op.query, op.projection).sort(op.sort)
+    if op.skip is not None:
+        cursor = cursor.skip(op.skip)
+    return cursor.limit(op.limit)
+
+
+def _execute(collection, op):
+    if isinstance(op, _Count):
+        if op.limit is None:
+            return collection.count_documents(op.filters)
+        return collection.count_documents(op.filters, limit=op.limit)
+    if isinstance(op, _EstimatedCount):
+        return collection.estimated_document_count()
+    return list(_cursor(collection, op))
+
+
+async def _execute_async(collection, op):
+    if isinstance(op, _Count):
+        if op.limit is None:
+            return await collection.count_documents(op.filters)
+        return await collection.count_documents(op.filters, limit=op.limit)
+    if isinstance(op, _EstimatedCount):
+        return await collection.estimated_document_count()
+    return await _cursor(collection, op).to_list(length=op.limit)
+
+
+def _run(plan: Generator, collection) -> Any:
+    try:
+        op = next(plan)
+        while True:
+            op = plan.send(_execute(collection, op))
+    except StopIteration as done:
+        return done.value
+
+
+async def _run_async(plan: Generator, collection) -> Any:
+    try:
+        op = next(plan)
+        while True:
+            op = plan.send(await _execute_async(collection, op))
+    except StopIteration as done:
+        return done.value
+
+
+# ---------------------------------------------------------------------------
+# Totals
+# ---------------------------------------------------------------------------
+
+def _count_plan(filters, strategy):
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Unknown count strategy: {strategy}")
+    lower_bound = False
+
+    if strategy == 'cached':
+        key = _filter_key(filters)
+        total = _count_cache.get(key)
+        if total is MISSING:
+            total = yield _Count(filters)
+            _count_cache.set(key, total)
+    elif strategy == 'estimated':
+        if not filters:
+            total = yield _EstimatedCount()
+        else:
+            total = yield _Count(filters, ESTIMATED_COUNT_CAP)
+            lower_bound = total >= ESTIMATED_COUNT_CAP
+    else:
+        total = yield _Count(filters)
+
+    return {'total': total, 'count_strategy': strategy, 'total_is_lower_bound': lower_bound}
+
+
+def count_properties(db, filters: dict[str, Any], strategy: str = 'exact') -> dict[str, Any]:
+    """Count properties matching *filters* with the given strategy.
+
+    Parameters
+    ----------
+    db:
+        A pymongo ``Database``.
+    filters:
+        Query filter, as built for the property list endpoint.
+    strategy:
+        One of ``COUNT_STRATEGIES``.
+
+    Returns
+    -------
+    dict
+        ``total``, ``count_strategy`` (the strategy used) and
+        ``total_is_lower_bound`` (True only when an estimated count hit
+        ``ESTIMATED_COUNT_CAP``).
+    """
+    return _run(_count_plan(filters, strategy), db[Property.collection_name])
+
+
+async def count_properties_async(db, filters: dict[str, Any],
+                                 strategy: str = 'exact') -> dict[str, Any]:
+    """Async :func:`count_properties` for an async Mongo database handle."""
+    return await _run_async(_count_plan(filters, strategy), db[Property.collection_name])
+
+
+def invalidate_property_counts() -> None:
+    """Drop cached totals and page boundaries after a property write."""
+    _count_cache.clear()
+    _boundary_cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Offset pages
+# ---------------------------------------------------------------------------
+
+def _sort_spec(sort_by, sort_order):
+    return [(sort_by, sort_order), ('_id', sort_order)]
+
+
+def _is_deep(skip, sort_by):
+    return skip > 0 and skip >= DEEP_PAGE_SKIP_THRESHOLD and sort_by in SEEKABLE_SORT_FIELDS
+
+
+def _seek_filter(sort_by, sort_order, value, last_id):
+    """Match rows that sort strictly after ``(value, last_id)``.
+
+    Missing and null values sort lowest, so they come first in ascending
+    order and last in descending order.
+    """
+    if sort_order == 1:
+        if value is None:
+            return {'$or': [
+                {sort_by: {'$ne': None}},
+                {sort_by: None, '_id': {'$gt': last_id}},
+            ]}
+        return {'$or': [
+            {sort_by: {'$gt': value}},
+            {sort_by: value, '_id': {'$gt': last_id}},
+        ]}
+    if value is None:
+        return {sort_by: None, '_id': {'$lt': last_id}}
+    return {'$or': [
+        {sort_by: {'$lt': value}},
+        {sort_by: value, '_id': {'$lt': last_id}},
+        {sort_by: None},
+    ]}
+
+
+def _page_rows(docs, fields, sort_by=None):
+    """Turn page documents into the rows returned to the route.
+
+    Projected pages stay raw documents; *sort_by* is dropped from them when
+    it was only read for the boundary.
+    """
+    if fields:
+        if sort_by is not None and sort_by not in fields:
+            for doc in docs:
+                doc.pop(sort_by, None)
+        return docs
+    return [p for p in (Property.from_dict(doc) for doc in docs) if p is not None]
+
+
+def _seek_plan(filters, sort_by, sort_order, skip, limit, fields):
+    """Read the page starting at *skip* by seeking past the previous row."""
+    sort = _sort_spec(sort_by, sort_order)
+    boundary = _boundary_cache.get(_filter_key(filters, sort_by, sort_order, skip))
+    if boundary is MISSING:
+        # Only the two sort-key fields of the row just before *skip*.
+        located = yield _Find(filters, {sort_by: 1, '_id': 1}, sort, 1, skip - 1)
+        boundary = (located[0].get(sort_by), located[0]['_id']) if located else None
+    if boundary is None:
+        return []
+
+    after = _seek_filter(sort_by, sort_order, *boundary)
+    query = {'$and': [filters, after]} if filters else after
+    # The sort field is always read so the next boundary can be cached.
+    projection = {field: 1 for field in (*fields, sort_by)} if fields else None
+    docs = yield _Find(query, projection, sort, limit)
+
+    if len(docs) == limit:
+        _boundary_cache.set(
+            _filter_key(filters, sort_by, sort_order, skip + limit),
+            (docs[-1].get(sort_by), docs[-1]['_id']),
+        )
+    return _page_rows(docs, fields, sort_by)
+
+
+def find_offset_page(db, filters: dict[str, Any], page: int, limit: int,
+                     sort_by: str = 'price', sort_order: int = 1,
+                     fields: tuple[str, ...] | None = None) -> list:
+    """Return one offset page, seeking by sort key for deep pages.
+
+    Shallow pages, and sorts on fields outside ``SEEKABLE_SORT_FIELDS``, use
+    ``Property.find_all`` with ``skip``.  Rows are ordered by
+    ``(sort_by, _id)`` on both paths so they return the same page.  With
+    *fields*, rows are projected raw documents as from
+    ``Property.find_all(fields=...)``.
+    """
+    skip = (page - 1) * limit
+    if not _is_deep(skip, sort_by):
+        return Property.find_all(
+            filters=filters, limit=limit, skip=skip,
+            sort_by=sort_by, sort_order=sort_order, fields=fields,
+        )
+    return _run(
+        _seek_plan(filters, sort_by, sort_order, skip, limit, fields),
+        db[Property.collection_name],
+    )
+
+
+async def find_offset_page_async(db, filters: dict[str, Any], page: int, limit: int,
+                                 sort_by: str = 'price', sort_order: int = 1,
+                                 fields: tuple[str, ...] | None = None) -> list:
+    """Async :func:`find_offset_page` for an async Mongo database handle."""
+    collection = db[Property.collection_name]
+    skip = (page - 1) * limit
+    if not _is_deep(skip, sort_by):
+        projection = {field: 1 for field in fields} if fields else None
+        docs = await _execute_async(
+            collection, _Find(filters, projection, _sort_spec(sort_by, sort_order), limit, skip),
+        )
+        return _page_rows(docs, fields)
+    return await _run_async(
+        _seek_plan(filters, sort_by, sort_order, skip, limit, fields), collection,
+    )
@@ -1,28 +1,16 @@
 import asyncio
-import inspect
 import logging
 from datetime import datetime, timezone
+from services.data_collection.crawler import crawl_cities, format_crawl_report
 from services.data_collection.zillow_scraper import ZillowScraper
 from models.market import Market
+from models.property import Property
+from services.geographic.market_cache import invalidate_market_cache
 from utils.database import get_db
 
 logger = logging.getLogger(__name__)
 
 
-def _run_maybe_coroutine(value):
-    """Run *value* to completion if it is a coroutine; otherwise return it as-is.
-
-    This helper exists because ``ZillowScraper.search_properties`` is an async
-    method.  In production it returns an awaitable that must be driven by an
-    event loop.  In tests the scraper is replaced with a ``MagicMock`` whose
-    ``search_properties`` attribute returns a plain list directly.  Checking
-    before calling ``asyncio.run`` ensures both cases work correctly.
-    """
-    if inspect.isawaitable(value):
-        return asyncio.run(value)
-    return value
-
-
 def update_property_data():
     """
     Update property data by scraping new listings and refreshing existing ones.
@@ -42,28 +30,20 @@ def update_property_data():
         # Initialize scraper
         scraper = ZillowScraper()
 
-        # Scan each city
-        for city_data in cities_to_scan:
-            try:
-                logger.info(f"Scanning {city_data['city']}, {city_data['state']}")
-                # search_properties is async; use _run_maybe_coroutine so that
-                # production coroutines are driven to completion while test
-                # mocks (which return plain lists) pass through unchanged.
-                properties = _run_maybe_coroutine(
-                    scraper.search_properties(
-                        city=city_data['city'],
-                        state=city_data['state'],
-                        max_pages=2  # Limit pages to avoid overloading
-                    )
-                )
-
-                # Save properties to database
-                for prop in properties:
-                    prop.save()
-
-                logger.info(f"Found {len(properties)} properties in {city_data['city']}")
-            except Exception as e:
-                logger.error(f"Error scanning {city_data['city']}: {str(e)}")
+        # Crawl all cities in one event loop; each city's listings are bulk
+        # upserted (keyed on listing_url) as soon as that city finishes.
+        try:
+            reports = asyncio.run(crawl_cities(
+                scraper,
+                cities_to_scan,
+                save=Property.bulk_upsert,
+                max_pages=2,  # Limit pages to avoid overloading
+            ))
+        finally:
+            scraper.close()
+
+        for line in format_crawl_report(reports):
+            logger.info(line)
 
         logger.info("Property data update completed successfully")
         return True
@@ -99,6 +79,7 @@ def update_market_data():
             except Exception as e:
                 logger.error(f"Error updating market {market.name}: {str(e)}")
 
+        invalidate_market_cache()
         logger.info("Market data update completed successfully")
         return True
     except Exception as e:
@@ -0,0 +1,116 @@
+"""
+Benchmark: scalar FinancialMetrics vs. vectorized FinancialMetricsBatch.
+
+Generates a synthetic portfolio at each requested size, times both paths and
+checks that the batch output matches the scalar output row-for-row.
+
+Running
+-------
+    cd backend
+    python -m tests.benchmarks.bench_financial_metrics
+    python -m tests.benchmarks.bench_financial_metrics --sizes 1000 100000
+    python -m tests.benchmarks.bench_financial_metrics --scalar-limit 100000
+
+The scalar path at 1M rows takes tens of seconds; ``--scalar-limit`` times the
+scalar path on a prefix of that size and extrapolates linearly beyond it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from services.analysis.financial_metrics import FinancialMetrics  # noqa: E402
+from services.analysis.financial_metrics_batch import FinancialMetricsBatch  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+
+def _make_portfolio(size: int, seed: int) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "prices": rng.integers(50_000, 2_000_000, size).astype(np.float64),
+        "price_to_rent_ratio": rng.uniform(8, 25, size).round(1),
+        "property_tax_rate": rng.uniform(0.004, 0.025, size).round(4),
+        "vacancy_rate": rng.uniform(0.02, 0.15, size).round(3),
+        "avg_hoa_fee": rng.choice([0.0, 0.0, 150.0, 325.0], size),
+        "appreciation_rate": rng.uniform(-0.02, 0.08, size).round(3),
+    }
+
+
+def _run_scalar(columns: dict[str, np.ndarray], rows: int) -> list[dict]:
+    market_keys = [k for k in columns if k != "prices"]
+    market_lists = {k: columns[k][:rows].tolist() for k in market_keys}
+    prices = columns["prices"][:rows].tolist()
+    results = []
+    for i, price in enumerate(prices):
+        market = {k: market_lists[k][i] for k in market_keys}
+        results.append(
+            FinancialMetrics(SimpleNamespace(price=price), market).analyze_property()
+        )
+    return results
+
+
+def _run_batch(columns: dict[str, np.ndarray]) -> tuple[FinancialMetricsBatch, dict]:
+    batch = FinancialMetricsBatch(**columns)
+    return batch, batch.analyze()
+
+
+def bench(size: int, scalar_limit: int | None, seed: int) -> dict[str, float]:
+    columns = _make_portfolio(size, seed)
+    scalar_rows = size if scalar_limit is None else min(size, scalar_limit)
+
+    start = time.perf_counter()
+    scalar = _run_scalar(columns, scalar_rows)
+    scalar_secs = (time.perf_counter() - start) * size / scalar_rows
+
+    start = time.perf_counter()
+    batch, batch_columns = _run_batch(columns)
+    batch_secs = time.perf_counter() - start
+
+    records = batch.to_records(batch_columns)[:scalar_rows]
+    mismatches = sum(1 for got, expected in zip(records, scalar) if got != expected)
+
+    return {
+        "size": size,
+        "scalar_secs": scalar_secs,
+        "scalar_extrapolated": scalar_rows < size,
+        "batch_secs": batch_secs,
+        "speedup": scalar_secs / batch_secs if batch_secs else float("inf"),
+        "checked_rows": scalar_rows,
+        "mismatches": mismatches,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--scalar-limit", type=int, default=None,
+                        help="Time the scalar path on at most this many rows and extrapolate.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    print(f"{'rows':>10} {'scalar (s)':>12} {'batch (s)':>10} {'speedup':>9} {'mismatches':>11}")
+    failed = False
+    for size in args.sizes:
+        r = bench(size, args.scalar_limit, args.seed)
+        marker = "*" if r["scalar_extrapolated"] else " "
+        print(
+            f"{r['size']:>10,} {r['scalar_secs']:>11.3f}{marker} {r['batch_secs']:>10.3f} "
+            f"{r['speedup']:>8.1f}x {r['mismatches']:>5}/{r['checked_rows']:<,}"
+        )
+        failed |= r["mismatches"] > 0
+    if args.scalar_limit is not None:
+        print("* scalar time extrapolated from --scalar-limit rows")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
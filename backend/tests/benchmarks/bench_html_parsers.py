@@ -0,0 +1,121 @@
+"""
+Benchmark: Zillow HTML parser backends over the saved fixture pages.
+
+Times listing extraction on ``tests/fixtures/zillow_search.html`` and detail
+parsing on ``tests/fixtures/zillow_detail.html`` with every installed backend
+(html.parser, lxml, selectolax), and checks that each backend returns exactly
+what html.parser returns.  With ``--workers`` it also times a crawl-sized
+batch of detail pages parsed inline against the same batch in a process pool.
+
+Running
+-------
+    cd backend
+    python -m tests.benchmarks.bench_html_parsers
+    python -m tests.benchmarks.bench_html_parsers --repeat 500
+    python -m tests.benchmarks.bench_html_parsers --workers 4 --pages 120
+
+Install ``lxml`` and/or ``selectolax`` to include them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from services.data_collection.zillow_parser import (  # noqa: E402
+    available_backends,
+    extract_listing_urls,
+    parse_detail,
+)
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+DETAIL_URL = "https://www.zillow.com/homedetails/20480000_zpid/"
+
+
+def _per_call(func, repeat: int) -> tuple[float, object]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def bench_backend(backend: str, search_html: str, detail_html: str, repeat: int) -> dict:
+    search_secs, urls = _per_call(lambda: extract_listing_urls(search_html, backend), repeat)
+    detail_secs, detail = _per_call(
+        lambda: parse_detail(detail_html, DETAIL_URL, backend), repeat
+    )
+    return {
+        "backend": backend,
+        "search_secs": search_secs,
+        "detail_secs": detail_secs,
+        "urls": urls,
+        "detail": detail,
+    }
+
+
+def bench_pool(backend: str, detail_html: str, pages: int, workers: int) -> dict:
+    args = ([detail_html] * pages, [DETAIL_URL] * pages, [backend] * pages)
+
+    start = time.perf_counter()
+    list(map(parse_detail, *args))
+    inline_secs = time.perf_counter() - start
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+        list(pool.map(parse_detail, *args))  # warm up worker processes
+        start = time.perf_counter()
+        list(pool.map(parse_detail, *args))
+        pool_secs = time.perf_counter() - start
+
+    return {"inline_secs": inline_secs, "pool_secs": pool_secs}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Also time --pages detail pages in a pool of this many processes.")
+    parser.add_argument("--pages", type=int, default=120)
+    args = parser.parse_args(argv)
+
+    search_html = (FIXTURES / "zillow_search.html").read_text()
+    detail_html = (FIXTURES / "zillow_detail.html").read_text()
+
+    results = [
+        bench_backend(name, search_html, detail_html, args.repeat)
+        for name in available_backends()
+    ]
+    reference = results[0]
+
+    print(f"{'backend':>12} {'search (ms)':>12} {'detail (ms)':>12} {'speedup':>8} {'matches':>8}")
+    failed = False
+    for r in results:
+        matches = r["urls"] == reference["urls"] and r["detail"] == reference["detail"]
+        speedup = (
+            (reference["search_secs"] + reference["detail_secs"])
+            / (r["search_secs"] + r["detail_secs"])
+        )
+        print(
+            f"{r['backend']:>12} {r['search_secs'] * 1e3:>12.3f} "
+            f"{r['detail_secs'] * 1e3:>12.3f} {speedup:>7.1f}x {'yes' if matches else 'NO':>8}"
+        )
+        failed |= not matches
+
+    if args.workers:
+        backend = results[-1]["backend"]
+        p = bench_pool(backend, detail_html, args.pages, args.workers)
+        print(
+            f"\n{args.pages} detail pages ({backend}): inline {p['inline_secs']:.3f}s, "
+            f"{args.workers} workers {p['pool_secs']:.3f}s"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
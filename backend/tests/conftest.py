@@ -33,6 +33,23 @@ class MockProperty:
         self.score = None
 
 
+@pytest.fixture(autouse=True)
+def _clear_market_cache():
+    """Keep process-level market resolutions and listing counts from leaking
+    between tests.
+
+    Looked up through ``sys.modules`` because several test modules purge and
+    re-import application packages.
+    """
+    yield
+    market_cache = sys.modules.get('services.geographic.market_cache')
+    if market_cache is not None:
+        market_cache.invalidate_market_cache()
+    property_query = sys.modules.get('services.property_query')
+    if property_query is not None:
+        property_query.invalidate_property_counts()
+
+
 @pytest.fixture
 def mock_property():
     return MockProperty()
@@ -0,0 +1,108 @@
+# backend/tests/test_amortization.py
+"""
+Tests for the shared amortization schedule (services/analysis/amortization.py).
+
+Covers the payment formula, the closed-form interest and balance queries
+against the month-by-month arrays, mortgage insurance drop-off, and
+memoization of schedules.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.analysis.amortization import _schedule, amortize, monthly_payment
+
+
+def _loop_schedule(principal, annual_rate, term_years):
+    """Reference month-by-month amortization with a plain loop."""
+    r = annual_rate / 12
+    payment = monthly_payment(principal, annual_rate, term_years)
+    balance = principal
+    interest = []
+    for _ in range(term_years * 12):
+        interest.append(balance * r)
+        balance -= payment - balance * r
+    return interest, balance
+
+
+class TestSchedule:
+
+    def test_payment_matches_annuity_formula(self):
+        r, n = 0.065 / 12, 360
+        expected = 320_000 * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+        assert amortize(320_000, 0.065, 30).payment == expected
+
+    def test_arrays_match_loop(self):
+        schedule = amortize(320_000, 0.065, 30)
+        interest, final_balance = _loop_schedule(320_000, 0.065, 30)
+
+        np.testing.assert_allclose(schedule.interest, interest, rtol=1e-9, atol=1e-6)
+        assert final_balance == pytest.approx(0, abs=1e-4)
+        assert schedule.balance[-1] == 0.0
+        assert schedule.principal_paid.sum() == pytest.approx(320_000)
+
+    def test_closed_forms_match_arrays(self):
+        schedule = amortize(250_000, 0.05, 15)
+
+        assert schedule.cumulative_interest(60) == pytest.approx(schedule.interest[:60].sum())
+        assert schedule.balance_after(60) == pytest.approx(schedule.balance[59])
+        assert schedule.interest_in_year(3) == pytest.approx(schedule.interest[24:36].sum())
+        assert schedule.total_interest == pytest.approx(schedule.interest.sum())
+
+    def test_annual_interest_covers_term_and_pads_with_zeros(self):
+        schedule = amortize(250_000, 0.05, 15)
+
+        yearly = schedule.annual_interest(20)
+
+        assert yearly.shape == (20,)
+        assert yearly[0] == pytest.approx(schedule.interest_in_year(1))
+        assert yearly[:15].sum() == pytest.approx(schedule.total_interest)
+        assert not yearly[15:].any()
+
+    def test_zero_rate(self):
+        schedule = amortize(120_000, 0.0, 10)
+
+        assert schedule.payment == 1_000
+        assert schedule.interest_in_year(1) == 0.0
+        assert schedule.balance_after(12) == 108_000
+        assert not schedule.interest.any()
+
+
+class TestMortgageInsurance:
+
+    def test_insurance_cancels_at_balance(self):
+        schedule = amortize(360_000, 0.06, 30, insurance_rate=0.005, insurance_cancel_balance=312_000)
+
+        months = schedule.insurance_months
+        assert schedule.balance[months - 2] > 312_000 >= schedule.balance[months - 1]
+        assert schedule.insurance[0] == pytest.approx(360_000 * 0.005 / 12)
+        assert not schedule.insurance[months:].any()
+
+    def test_insurance_for_fixed_months(self):
+        schedule = amortize(360_000, 0.06, 30, insurance_rate=0.0055, insurance_months=132)
+        assert schedule.insurance_months == 132
+
+    def test_no_insurance_by_default(self):
+        assert amortize(360_000, 0.06, 30).total_insurance == 0.0
+
+
+class TestMemoization:
+
+    def test_same_loan_reuses_schedule(self):
+        _schedule.cache_clear()
+
+        first = amortize(400_000, 0.07, 30)
+        second = amortize(400_000.0, 0.07, 30.0)
+
+        assert first is second
+        assert _schedule.cache_info().hits == 1
+
+    def test_shared_arrays_are_read_only(self):
+        schedule = amortize(400_000, 0.07, 30)
+        with pytest.raises(ValueError):
+            schedule.interest[0] = 0
@@ -0,0 +1,106 @@
+"""Tests for the optional ASGI entry point (backend/asgi.py).
+
+Skipped unless the ASGI extras (``requirements-asgi.txt``) and httpx, which
+Starlette's TestClient needs, are installed.  The lifespan is not run, so
+no async Mongo client is created; ``get_async_db`` is patched instead.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any, Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+pytest.importorskip("starlette")
+pytest.importorskip("a2wsgi")
+pytest.importorskip("httpx")
+
+from limits import parse_many  # noqa: E402
+from starlette.testclient import TestClient  # noqa: E402
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(scope="module")
+def asgi_module() -> Generator[Any, None, None]:
+    """Import ``asgi`` (and with it ``app``) with database I/O mocked out."""
+    with (
+        patch("utils.database.init_db", return_value=MagicMock()),
+        patch("utils.database.get_db", return_value=MagicMock()),
+        patch("utils.database.close_db", return_value=None),
+    ):
+        import asgi
+
+        asgi.flask_app.config.update({
+            "TESTING": True,
+            "JWT_SECRET_KEY": "test-secret-key-for-jwt",
+            "RATELIMIT_ENABLED": False,
+        })
+        yield asgi
+
+
+@pytest.fixture()
+def client(asgi_module: Any) -> TestClient:
+    return TestClient(asgi_module.app)
+
+
+def _db(doc=None):
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value=doc)
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    return db
+
+
+class TestAsyncRoutes:
+
+    def test_routed_request_runs_async_handler(self, asgi_module: Any, client: TestClient) -> None:
+        with patch.object(asgi_module, "get_async_db", return_value=_db()):
+            response = client.get(f"/api/v1/properties/{ObjectId()}")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "NOT_FOUND"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_missing_async_db_returns_503(self, asgi_module: Any, client: TestClient) -> None:
+        with patch.object(asgi_module, "get_async_db", return_value=None):
+            response = client.get(f"/api/properties/{ObjectId()}")
+
+        assert response.status_code == 503
+        assert response.json()["error"]["code"] == "DB_UNAVAILABLE"
+
+    def test_other_routes_fall_through_to_flask(self, client: TestClient) -> None:
+        # Jobs are not served asynchronously; Flask's JWT check answers.
+        response = client.get(f"/api/v1/jobs/{ObjectId()}")
+
+        assert response.status_code == 401
+
+
+class TestRateLimit:
+
+    def test_async_routes_apply_default_limits(self, asgi_module: Any, client: TestClient) -> None:
+        asgi_module.limiter.reset()
+        with (
+            patch.dict(asgi_module.flask_app.config, {"RATELIMIT_ENABLED": True}),
+            patch.object(asgi_module, "_RATE_LIMITS", parse_many("2 per minute")),
+            patch.object(asgi_module, "get_async_db", return_value=None),
+        ):
+            statuses = [client.get(f"/api/v1/properties/{ObjectId()}").status_code for _ in range(3)]
+            limited = client.get(f"/api/v1/properties/{ObjectId()}")
+
+        assert statuses == [503, 503, 429]
+        assert limited.json()["error"]["code"] == "RATE_LIMITED"
+        asgi_module.limiter.reset()
+
+    def test_limits_are_off_when_disabled(self, asgi_module: Any, client: TestClient) -> None:
+        with (
+            patch.object(asgi_module, "_RATE_LIMITS", parse_many("1 per minute")),
+            patch.object(asgi_module, "get_async_db", return_value=None),
+        ):
+            statuses = {client.get(f"/api/v1/properties/{ObjectId()}").status_code for _ in range(3)}
+
+        assert statuses == {503}
@@ -0,0 +1,352 @@
+"""Tests for the async ASGI handlers (backend/routes/async_api.py) and the
+async database helpers (backend/utils/async_database.py).
+
+Handlers are driven with ``asyncio.run`` against MagicMock collections whose
+awaited methods are AsyncMocks, so neither MongoDB nor an ASGI server is
+needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import routes.async_api as async_api  # noqa: E402
+import utils.async_database as async_database  # noqa: E402
+from models.property import Property  # noqa: E402
+from services.property_query import invalidate_property_counts  # noqa: E402
+from services.geographic.market_cache import invalidate_market_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    # Other test modules re-import ``services``; clear this module's copies.
+    invalidate_property_counts()
+    invalidate_market_cache()
+    yield
+    invalidate_property_counts()
+    invalidate_market_cache()
+
+
+def _property_doc(**overrides):
+    doc = Property(
+        address="1 Main St", price=250000, bedrooms=3, bathrooms=2, sqft=1500,
+        year_built=1999, property_type="single_family", lot_size=4000,
+        listing_url="http://example.com/1", source="Zillow", city="Seattle",
+        state="WA", zip_code="98101",
+    ).to_dict()
+    doc["_id"] = ObjectId()
+    doc.update(overrides)
+    return doc
+
+
+def _cursor(docs):
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+    return cursor
+
+
+class _Db:
+    """Async db double: one MagicMock collection per name."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            coll = MagicMock()
+            coll.find_one = AsyncMock(return_value=None)
+            coll.count_documents = AsyncMock(return_value=0)
+            coll.estimated_document_count = AsyncMock(return_value=0)
+            coll.find.return_value = _cursor([])
+            self.collections[name] = coll
+        return self.collections[name]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Properties
+# ---------------------------------------------------------------------------
+
+class TestGetProperty:
+
+    def test_invalid_id_returns_400(self):
+        body, status = run(async_api.get_property(_Db(), "nope"))
+        assert status == 400
+        assert body["error"]["message"] == "Invalid property id format"
+
+    def test_missing_property_returns_404(self):
+        body, status = run(async_api.get_property(_Db(), str(ObjectId())))
+        assert status == 404
+        assert body["error"]["code"] == "NOT_FOUND"
+
+    def test_returns_property_with_string_id(self):
+        db = _Db()
+        doc = _property_doc()
+        db["properties"].find_one.return_value = doc
+
+        body, status = run(async_api.get_property(db, str(doc["_id"])))
+
+        assert status == 200
+        assert body["_id"] == str(doc["_id"])
+        assert body["price"] == 250000
+
+
+class TestListProperties:
+
+    def test_offset_page_and_total(self):
+        db = _Db()
+        docs = [_property_doc(), _property_doc()]
+        db["properties"].find.return_value = _cursor(docs)
+        db["properties"].count_documents.return_value = 12
+
+        body, status = run(async_api.list_properties(
+            db, {"state": "WA", "limit": "2", "countStrategy": "exact"},
+        ))
+
+        assert status == 200
+        assert [row["_id"] for row in body["data"]] == [str(d["_id"]) for d in docs]
+        assert body["total"] == 12
+        assert body["pages"] == 6
+        assert body["count_strategy"] == "exact"
+        db["properties"].count_documents.assert_awaited_once_with({"state": "WA"})
+
+    def test_page_and_count_run_concurrently(self):
+        db = _Db()
+        counted = asyncio.Event()
+
+        async def count_documents(filters):
+            counted.set()
+            return 1
+
+        async def to_list(length):
+            # Only completes if the count was started alongside the page.
+            await asyncio.wait_for(counted.wait(), timeout=1)
+            return [_property_doc()]
+
+        db["properties"].count_documents = AsyncMock(side_effect=count_documents)
+        db["properties"].find.return_value.to_list = AsyncMock(side_effect=to_list)
+
+        body, status = run(async_api.list_properties(db, {"countStrategy": "exact"}))
+
+        assert status == 200
+        assert body["total"] == 1
+
+    def test_fields_return_projected_documents(self):
+        db = _Db()
+        oid = ObjectId()
+        db["properties"].find.return_value = _cursor([{"_id": oid, "price": 1}])
+
+        body, _ = run(async_api.list_properties(db, {"fields": "price"}))
+
+        assert body["data"] == [{"_id": str(oid), "price": 1}]
+        assert db["properties"].find.call_args.args[1] == {"price": 1}
+
+    def test_cursor_mode(self):
+        db = _Db()
+        cursor_id = ObjectId()
+        doc = _property_doc()
+        db["properties"].find.return_value = _cursor([doc])
+
+        body, status = run(async_api.list_properties(
+            db, {"cursor": str(cursor_id), "limit": "1"},
+        ))
+
+        assert status == 200
+        assert db["properties"].find.call_args.args[0] == {"_id": {"$gt": cursor_id}}
+        assert body["next_cursor"] == str(doc["_id"])
+        assert body["has_more"] is True
+
+    @pytest.mark.parametrize("args", [
+        {"minPrice": "abc"},
+        {"limit": "x"},
+        {"fields": "password"},
+        {"cursor": "bad"},
+        {"countStrategy": "guess"},
+    ])
+    def test_invalid_arguments_return_400(self, args):
+        _, status = run(async_api.list_properties(_Db(), args))
+        assert status == 400
+
+
+# ---------------------------------------------------------------------------
+# Analysis
+# ---------------------------------------------------------------------------
+
+class TestAnalysis:
+
+    def test_analyze_property_uses_resolved_market(self):
+        db = _Db()
+        doc = _property_doc()
+        db["properties"].find_one.return_value = doc
+
+        async def market_find_one(query):
+            if "state" in query:
+                return {"name": "WA", "market_type": "state", "state": "WA",
+                        "property_tax_rate": 0.01, "price_to_rent_ratio": 15,
+                        "vacancy_rate": 0.05, "appreciation_rate": 0.03, "avg_hoa_fee": 0}
+            return None
+
+        db["markets"].find_one = AsyncMock(side_effect=market_find_one)
+
+        body, status = run(async_api.analyze_property(db, str(doc["_id"])))
+
+        assert status == 200
+        assert body["property_id"] == str(doc["_id"])
+        assert body["market_data"]["name"] == "WA"
+        assert {"financial_analysis", "tax_benefits", "financing_options"} <= set(body)
+        assert db["markets"].find_one.await_count == 3
+
+    def test_custom_analysis_requires_json_body(self):
+        db = _Db()
+        doc = _property_doc()
+        db["properties"].find_one.return_value = doc
+
+        body, status = run(async_api.custom_analysis(db, str(doc["_id"]), None))
+
+        assert status == 400
+        assert body["error"]["message"] == "Request body must be JSON"
+
+    def test_custom_analysis_rejects_bad_parameters(self):
+        db = _Db()
+        doc = _property_doc()
+        db["properties"].find_one.return_value = doc
+
+        _, status = run(async_api.custom_analysis(
+            db, str(doc["_id"]), {"interest_rate": "abc"},
+        ))
+
+        assert status == 400
+
+    def test_batch_resolves_each_location_once(self):
+        db = _Db()
+        first, second = _property_doc(), _property_doc()
+        missing = str(ObjectId())
+        db["properties"].find.return_value = _cursor([first, second])
+
+        body, status = run(async_api.batch_analysis(db, {
+            "property_ids": [str(first["_id"]), str(second["_id"]), missing, "bad"],
+        }))
+
+        assert status == 200
+        assert body["succeeded"] == 2
+        assert body["errors"][missing]["code"] == "NOT_FOUND"
+        assert body["errors"]["bad"]["code"] == "VALIDATION_ERROR"
+        # One location -> one concurrent lookup per fallback level.
+        assert db["markets"].find_one.await_count == 3
+
+    def test_batch_validates_body(self):
+        _, status = run(async_api.batch_analysis(_Db(), {"property_ids": []}))
+        assert status == 400
+
+    def test_score_property(self):
+        db = _Db()
+        doc = _property_doc()
+        db["properties"].find_one.return_value = doc
+
+        body, status = run(async_api.score_property(db, str(doc["_id"])))
+
+        assert status == 200
+        assert body["property_id"] == str(doc["_id"])
+
+
+# ---------------------------------------------------------------------------
+# Markets
+# ---------------------------------------------------------------------------
+
+class TestMarkets:
+
+    def _market_db(self, market_type, aggregated):
+        db = _Db()
+        db["markets"].find_one.return_value = {
+            "_id": ObjectId(), "name": "Seattle", "market_type": market_type,
+            "state": "WA", "city": "Seattle",
+        }
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=aggregated)
+        db["properties"].aggregate = MagicMock(return_value=cursor)
+        return db
+
+    def test_market_analysis_runs_level_pipeline(self):
+        db = self._market_db("city", [{"count": 3}])
+
+        body, status = run(async_api.market_analysis(db, str(ObjectId())))
+
+        assert status == 200
+        assert body["aggregate_data"] == {"count": 3}
+        pipeline = db["properties"].aggregate.call_args.args[0]
+        assert pipeline[0]["$match"]["city"] == "Seattle"
+
+    def test_market_analysis_invalid_type(self):
+        db = self._market_db("county", [])
+
+        body, status = run(async_api.market_analysis(db, str(ObjectId())))
+
+        assert status == 400
+        assert body["error"]["code"] == "INVALID_MARKET_TYPE"
+
+    def test_top_markets(self):
+        db = self._market_db("city", [{"city": "Seattle"}])
+
+        body, status = run(async_api.top_markets(db, {"metric": "cap_rate", "limit": "5"}))
+
+        assert status == 200
+        assert body == [{"city": "Seattle"}]
+        pipeline = db["properties"].aggregate.call_args.args[0]
+        assert {"$sort": {"avg_cap_rate": -1}} in pipeline
+        assert {"$limit": 5} in pipeline
+
+    def test_top_markets_invalid_metric(self):
+        body, status = run(async_api.top_markets(_Db(), {"metric": "vibes"}))
+        assert status == 400
+        assert body["error"]["code"] == "INVALID_METRIC"
+
+
+# ---------------------------------------------------------------------------
+# utils.async_database
+# ---------------------------------------------------------------------------
+
+class TestAsyncDatabase:
+
+    def test_aggregate_to_list_accepts_awaitable_cursor(self):
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{"n": 1}])
+        collection = MagicMock()
+        collection.aggregate = AsyncMock(return_value=cursor)
+
+        assert run(async_database.aggregate_to_list(collection, [])) == [{"n": 1}]
+        cursor.to_list.assert_awaited_once_with(length=None)
+
+    def test_init_without_uri_returns_none(self):
+        with patch.object(async_database, "AsyncClient") as client:
+            assert async_database.init_async_db({}) is None
+        client.assert_not_called()
+
+    def test_init_and_close(self):
+        client = MagicMock()
+        client.close = AsyncMock()
+        with patch.object(async_database, "AsyncClient", return_value=client) as factory:
+            db = async_database.init_async_db({
+                "MONGODB_URI": "mongodb://localhost:27017/realestate",
+                "ASYNC_MONGODB_MAX_POOL_SIZE": 250,
+            })
+            assert async_database.get_async_db() is db
+            run(async_database.close_async_db())
+
+        assert factory.call_args.kwargs["maxPoolSize"] == 250
+        client.__getitem__.assert_called_once_with("realestate")
+        client.close.assert_awaited_once()
+        assert async_database.get_async_db() is None
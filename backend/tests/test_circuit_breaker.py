@@ -0,0 +1,196 @@
+"""Tests for the circuit breaker (backend/utils/circuit_breaker.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.circuit_breaker import (  # noqa: E402
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    CircuitState,
+)
+
+
+def _fail():
+    raise ConnectionError("down")
+
+
+def _half_open(**kwargs) -> CircuitBreaker:
+    """A breaker that has tripped and, with no recovery wait, is HALF_OPEN."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0, **kwargs)
+    with pytest.raises(ConnectionError):
+        breaker.call(_fail)
+    assert breaker.state is CircuitState.HALF_OPEN
+    return breaker
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_threshold_and_rejects(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "never")
+
+    def test_unexpected_exception_is_not_counted(self):
+        breaker = CircuitBreaker(failure_threshold=1, expected_exception=ConnectionError)
+
+        with pytest.raises(KeyError):
+            breaker.call(lambda: {}["missing"])
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_admits_one_probe_at_a_time(self):
+        breaker = _half_open()
+
+        with breaker:
+            # A second caller while the probe is in flight is turned away.
+            with pytest.raises(CircuitOpenError):
+                breaker.call(lambda: "second")
+
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.call(lambda: "ok") == "ok"
+
+    def test_failed_probe_reopens(self):
+        breaker = _half_open()
+        breaker.recovery_timeout = 60
+
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_decorator_wraps_sync_functions(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+
+        @breaker
+        def fetch(value):
+            if value is None:
+                raise ConnectionError("down")
+            return value
+
+        assert fetch(3) == 3
+        with pytest.raises(ConnectionError):
+            fetch(None)
+        with pytest.raises(CircuitOpenError):
+            fetch(3)
+
+
+class TestAsyncCircuitBreaker:
+
+    def test_call_async_records_outcomes(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+
+        async def ok():
+            return "ok"
+
+        async def fail():
+            raise ConnectionError("down")
+
+        async def run():
+            assert await breaker.call_async(ok) == "ok"
+            with pytest.raises(ConnectionError):
+                await breaker.call_async(fail)
+            with pytest.raises(CircuitOpenError):
+                await breaker.call_async(ok)
+
+        asyncio.run(run())
+        assert breaker.state is CircuitState.OPEN
+
+    def test_concurrent_coroutines_send_a_single_probe(self):
+        breaker = _half_open()
+        probes = []
+
+        @breaker
+        async def probe(release):
+            probes.append(1)
+            await release.wait()
+            return "ok"
+
+        async def run():
+            release = asyncio.Event()
+            tasks = [asyncio.ensure_future(probe(release)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = asyncio.run(run())
+
+        assert len(probes) == 1
+        assert results.count("ok") == 1
+        assert sum(isinstance(r, CircuitOpenError) for r in results) == 4
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_cancelled_probe_frees_the_slot(self):
+        breaker = _half_open()
+
+        async def run():
+            async def hang():
+                async with breaker:
+                    await asyncio.sleep(10)
+
+            task = asyncio.ensure_future(hang())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            async with breaker:
+                pass
+
+        asyncio.run(run())
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_context_manager_counts_expected_failures(self):
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=60, expected_exception=ConnectionError,
+        )
+
+        async def run():
+            with pytest.raises(ValueError):
+                async with breaker:
+                    raise ValueError("not a network failure")
+            assert breaker.state is CircuitState.CLOSED
+            with pytest.raises(ConnectionError):
+                async with breaker:
+                    raise ConnectionError("down")
+
+        asyncio.run(run())
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestCircuitBreakerRegistry:
+
+    def test_breakers_are_independent_per_key(self):
+        registry = CircuitBreakerRegistry(name="zillow", failure_threshold=1, recovery_timeout=60)
+
+        with pytest.raises(ConnectionError):
+            registry.get("detail").call(_fail)
+
+        assert registry.get("detail") is registry.get("detail")
+        assert registry.get("detail").name == "zillow:detail"
+        assert registry.get("search").call(lambda: "ok") == "ok"
+        assert registry.states() == {
+            "detail": CircuitState.OPEN, "search": CircuitState.CLOSED,
+        }
+
+    def test_reset_closes_every_breaker(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=60)
+        for key in ("a", "b"):
+            with pytest.raises(ConnectionError):
+                registry.get(key).call(_fail)
+
+        registry.reset()
+
+        assert set(registry.states().values()) == {CircuitState.CLOSED}
@@ -0,0 +1,234 @@
+"""Tests for the Redis circuit breaker store (backend/utils/circuit_store.py).
+
+Most tests never contact Redis: the client is a mock whose scripts return
+what the Lua scripts would, so they cover how the breaker uses the store and
+falls back to local state.  ``TestLuaScripts`` runs the scripts themselves
+against the Redis at ``CIRCUIT_STORE_TEST_REDIS_URL`` and is skipped when
+that is not set.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.circuit_breaker import (  # noqa: E402
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from utils.circuit_store import RedisCircuitStore  # noqa: E402
+
+
+def _client():
+    client = MagicMock()
+    scripts = {}
+
+    def register_script(source):
+        name = "failure" if "HINCRBY" in source else "admit"
+        scripts[name] = MagicMock(name=name)
+        return scripts[name]
+
+    client.register_script.side_effect = register_script
+    client.scripts = scripts
+    return client
+
+
+def _breaker(client, **kwargs):
+    store = RedisCircuitStore(client)
+    return CircuitBreaker(name="zillow:search", failure_threshold=2, store=store, **kwargs)
+
+
+def _fail():
+    raise ConnectionError("down")
+
+
+class TestSharedState:
+
+    def test_open_circuit_in_redis_rejects_locally_closed_breaker(self):
+        client = _client()
+        breaker = _breaker(client)
+        client.scripts["admit"].return_value = ["OPEN", "0", "120.5"]
+
+        with pytest.raises(CircuitOpenError, match="Recovery in 120s"):
+            breaker.call(lambda: "never")
+
+        client.scripts["admit"].assert_called_once()
+        assert client.scripts["admit"].call_args.kwargs["keys"] == ["circuit:zillow:search"]
+
+    def test_probe_claimed_elsewhere_rejects(self):
+        client = _client()
+        breaker = _breaker(client)
+        client.scripts["admit"].return_value = ["HALF_OPEN", "0", "0"]
+
+        with pytest.raises(CircuitOpenError, match="probe in flight"):
+            breaker.call(lambda: "never")
+
+    def test_failures_are_counted_in_redis(self):
+        client = _client()
+        breaker = _breaker(client)
+        client.scripts["admit"].return_value = ["CLOSED", "1", "0"]
+        client.scripts["failure"].return_value = ["CLOSED", "OPEN", "2"]
+
+        with pytest.raises(ConnectionError):
+            breaker.call(_fail)
+
+        args = client.scripts["failure"].call_args.kwargs["args"]
+        assert args[1] == 2
+        # The local fields are untouched; Redis owns the state.
+        assert breaker._state is CircuitState.CLOSED and breaker._failure_count == 0
+
+    def test_success_deletes_the_hash(self):
+        client = _client()
+        breaker = _breaker(client)
+        client.scripts["admit"].return_value = ["HALF_OPEN", "1", "0"]
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = ["HALF_OPEN", 1]
+
+        assert breaker.call(lambda: "ok") == "ok"
+
+        pipe.hget.assert_called_once_with("circuit:zillow:search", "state")
+        pipe.delete.assert_called_once_with("circuit:zillow:search")
+
+    def test_async_use_calls_the_store_off_the_event_loop(self):
+        client = _client()
+        breaker = _breaker(client)
+        threads = []
+        client.scripts["admit"].side_effect = (
+            lambda **kwargs: threads.append(threading.get_ident()) or ["CLOSED", "1", "0"]
+        )
+        pipe = client.pipeline.return_value
+        pipe.execute.side_effect = (
+            lambda: threads.append(threading.get_ident()) or [None, 0]
+        )
+
+        async def probe():
+            return threading.get_ident(), await breaker.call_async(asyncio.sleep, 0, "ok")
+
+        loop_thread, result = asyncio.run(probe())
+
+        assert result == "ok"
+        assert len(threads) == 2 and loop_thread not in threads
+
+    def test_state_reports_half_open_after_recovery_timeout(self):
+        client = _client()
+        breaker = _breaker(client, recovery_timeout=60)
+        client.hmget.return_value = ["OPEN", "1000"]
+
+        with patch("utils.circuit_store.time.time", return_value=1030):
+            assert breaker.state is CircuitState.OPEN
+        with patch("utils.circuit_store.time.time", return_value=1060):
+            assert breaker.state is CircuitState.HALF_OPEN
+
+
+class TestFallback:
+
+    def test_unreachable_redis_falls_back_to_local_state(self):
+        client = _client()
+        breaker = _breaker(client, recovery_timeout=60)
+        client.scripts["admit"].side_effect = ConnectionError("redis down")
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError, match="down"):
+                breaker.call(_fail)
+
+        assert breaker._state is CircuitState.OPEN
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "never")
+        # After the first error Redis is skipped for the retry interval.
+        assert client.scripts["admit"].call_count == 1
+
+    def test_redis_is_retried_after_interval(self):
+        client = _client()
+        store = RedisCircuitStore(client, retry_interval=30)
+        breaker = CircuitBreaker(name="x", store=store)
+        client.scripts["admit"].side_effect = [ConnectionError("redis down"), ["CLOSED", "1", "0"]]
+        client.pipeline.return_value.execute.return_value = [None, 0]
+
+        with patch("utils.circuit_store.time.monotonic", return_value=100):
+            breaker.call(lambda: None)
+        with patch("utils.circuit_store.time.monotonic", return_value=131):
+            breaker.call(lambda: None)
+
+        assert client.scripts["admit"].call_count == 2
+
+
+@pytest.mark.skipif(
+    not os.getenv("CIRCUIT_STORE_TEST_REDIS_URL"),
+    reason="CIRCUIT_STORE_TEST_REDIS_URL is not set",
+)
+class TestLuaScripts:
+    """The admission and failure scripts run on a real Redis."""
+
+    def setup_method(self):
+        import redis
+
+        self.client = redis.from_url(os.environ["CIRCUIT_STORE_TEST_REDIS_URL"], decode_responses=True)
+        self.store = RedisCircuitStore(self.client, prefix=f"test-circuit:{uuid.uuid4().hex}:", probe_timeout=30)
+
+    def teardown_method(self):
+        self.store.reset("zillow")
+
+    def test_trip_recover_and_single_probe(self):
+        assert self.store.admit("zillow", 60) == (CircuitState.CLOSED, True, 0.0)
+        assert self.store.record_failure("zillow", 2) == (CircuitState.CLOSED, CircuitState.CLOSED, 1)
+        assert self.store.record_failure("zillow", 2) == (CircuitState.CLOSED, CircuitState.OPEN, 2)
+
+        state, admitted, remaining = self.store.admit("zillow", 60)
+        assert (state, admitted) == (CircuitState.OPEN, False) and 0 < remaining <= 60
+
+        # Recovery timeout of zero: the next admission claims the probe and
+        # every other caller is turned away until it settles.
+        assert self.store.admit("zillow", 0)[:2] == (CircuitState.HALF_OPEN, True)
+        assert self.store.admit("zillow", 0)[:2] == (CircuitState.HALF_OPEN, False)
+        self.store.release_probe("zillow")
+        assert self.store.admit("zillow", 0)[:2] == (CircuitState.HALF_OPEN, True)
+
+        assert self.store.record_success("zillow") is CircuitState.HALF_OPEN
+        assert self.store.state("zillow", 60) is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        for _ in range(2):
+            self.store.record_failure("zillow", 2)
+        assert self.store.admit("zillow", 0)[:2] == (CircuitState.HALF_OPEN, True)
+
+        previous, state, _ = self.store.record_failure("zillow", 2)
+
+        assert (previous, state) == (CircuitState.HALF_OPEN, CircuitState.OPEN)
+        assert self.store.admit("zillow", 60)[:2] == (CircuitState.OPEN, False)
+
+
+class TestGetCircuitStore:
+
+    def test_returns_none_without_url(self):
+        import utils.circuit_store as circuit_store
+
+        with (
+            patch.object(circuit_store, "CIRCUIT_BREAKER_REDIS_URL", ""),
+            patch.object(circuit_store, "_store", None),
+        ):
+            assert circuit_store.get_circuit_store() is None
+
+    def test_builds_store_from_url(self):
+        import utils.circuit_store as circuit_store
+
+        with (
+            patch.object(circuit_store, "CIRCUIT_BREAKER_REDIS_URL", "redis://cache:6379/1"),
+            patch.object(circuit_store, "_store", None),
+            patch("redis.from_url") as from_url,
+        ):
+            store = circuit_store.get_circuit_store()
+            assert circuit_store.get_circuit_store() is store
+
+        assert isinstance(store, RedisCircuitStore)
+        from_url.assert_called_once()
+        assert from_url.call_args.kwargs["decode_responses"] is True
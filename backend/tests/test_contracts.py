@@ -411,7 +411,7 @@ class TestPropertyAnalysisContract:
         "appreciation_profit",
     )
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_analysis_returns_200(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -422,7 +422,7 @@ class TestPropertyAnalysisContract:
         response = client.get(f"/api/v1/analysis/property/{_VALID_PROPERTY_ID}")
         assert response.status_code == 200
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_analysis_has_required_envelope_keys(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -437,7 +437,7 @@ class TestPropertyAnalysisContract:
         for key in self.REQUIRED_ANALYSIS_KEYS:
             assert key in body, f"Analysis envelope missing key: '{key}'"
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_analysis_financial_keys_present(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -453,7 +453,7 @@ class TestPropertyAnalysisContract:
         for key in self.REQUIRED_FINANCIAL_KEYS:
             assert key in financial, f"financial_analysis missing key: '{key}'"
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_analysis_roi_sub_keys_present(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -469,7 +469,7 @@ class TestPropertyAnalysisContract:
         for key in self.REQUIRED_ROI_KEYS:
             assert key in roi, f"roi sub-object missing key: '{key}'"
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_analysis_property_id_is_string(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -500,7 +500,7 @@ class TestPropertyAnalysisContract:
 class TestCustomAnalysisContract:
     """POST /api/v1/analysis/property/<id> must return the same envelope shape."""
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_custom_analysis_returns_200(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -521,7 +521,7 @@ class TestCustomAnalysisContract:
         )
         assert response.status_code == 200
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_custom_analysis_has_same_envelope_as_get(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -543,7 +543,7 @@ class TestCustomAnalysisContract:
         ):
             assert key in body, f"Custom analysis envelope missing key: '{key}'"
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_custom_analysis_includes_parameters_echo(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -558,7 +558,7 @@ class TestCustomAnalysisContract:
 
         assert "parameters" in body, "Custom analysis must echo params under 'parameters'"
 
-    @patch("routes.analysis.Market.find_by_location")
+    @patch("routes.analysis.Market.find_for_location")
     @patch("routes.analysis.Property.find_by_id")
     def test_custom_analysis_financial_has_roi_keys(
         self, mock_find: Any, mock_market: Any, client: Any
@@ -0,0 +1,152 @@
+"""Tests for the multi-city crawl orchestrator (backend/services/data_collection/crawler.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.data_collection.crawler import crawl_cities, format_crawl_report  # noqa: E402
+
+CITIES = [
+    {"city": "Seattle", "state": "WA"},
+    {"city": "Portland", "state": "OR"},
+    {"city": "San Francisco", "state": "CA"},
+]
+
+
+def _saved(properties):
+    return {"inserted": len(properties), "modified": 0, "failed": 0}
+
+
+class _Scraper:
+    """Scraper double whose searches are released per city by the test."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+        self.release = {city: asyncio.Event() for city in results}
+
+    async def search_properties(self, city, state, max_pages, session, slots):
+        self.calls.append((city, max_pages, session, slots))
+        await self.release[city].wait()
+        result = self.results[city]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+async def _until(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+class TestCrawlCities:
+
+    def test_all_cities_share_one_session_and_cap(self):
+        scraper = _Scraper({c["city"]: [] for c in CITIES})
+
+        async def run():
+            task = asyncio.ensure_future(
+                crawl_cities(scraper, CITIES, save=_saved, max_pages=2, max_concurrency=5)
+            )
+            # Every city is in flight before any of them finishes.
+            await _until(lambda: len(scraper.calls) == 3)
+            for event in scraper.release.values():
+                event.set()
+            return await task
+
+        reports = asyncio.run(run())
+
+        assert [r["city"] for r in reports] == ["Seattle", "Portland", "San Francisco"]
+        sessions = {id(call[2]) for call in scraper.calls}
+        slots = {id(call[3]) for call in scraper.calls}
+        assert len(sessions) == 1 and len(slots) == 1
+        assert scraper.calls[0][3]._value == 5
+        assert all(call[1] == 2 for call in scraper.calls)
+
+    def test_city_is_saved_while_others_still_crawl(self):
+        scraper = _Scraper({"Seattle": ["a", "b"], "Portland": ["c"], "San Francisco": []})
+        saved_cities = []
+        seattle_saved = threading.Event()
+
+        def save(properties):
+            saved_cities.append(list(properties))
+            seattle_saved.set()
+            return _saved(properties)
+
+        async def run():
+            task = asyncio.ensure_future(crawl_cities(scraper, CITIES, save=save))
+            await _until(lambda: len(scraper.calls) == 3)
+            scraper.release["Seattle"].set()
+            await asyncio.to_thread(seattle_saved.wait, 1)
+            # Seattle is stored before Portland's crawl has returned.
+            assert saved_cities == [["a", "b"]]
+            scraper.release["Portland"].set()
+            scraper.release["San Francisco"].set()
+            return await task
+
+        reports = asyncio.run(run())
+
+        assert saved_cities == [["a", "b"], ["c"]]
+        assert [(r["found"], r["inserted"]) for r in reports] == [(2, 2), (1, 1), (0, 0)]
+
+    def test_failed_city_is_reported_and_others_saved(self):
+        scraper = _Scraper({
+            "Seattle": RuntimeError("network error"), "Portland": ["p"], "San Francisco": [],
+        })
+        for event in scraper.release.values():
+            event.set()
+        save = MagicMock(side_effect=_saved)
+
+        reports = asyncio.run(crawl_cities(scraper, CITIES, save=save))
+
+        assert reports[0]["error"] == "network error"
+        assert reports[1]["error"] is None and reports[1]["inserted"] == 1
+        save.assert_called_once_with(["p"])
+
+    def test_failed_save_forgets_cached_pages(self):
+        prop = MagicMock(listing_url="https://www.zillow.com/homedetails/1/")
+        scraper = MagicMock()
+        scraper.search_properties.return_value = [prop]
+
+        reports = asyncio.run(crawl_cities(
+            scraper, CITIES[:1],
+            save=lambda properties: {"inserted": 0, "modified": 0, "failed": 1},
+        ))
+
+        assert reports[0]["failed"] == 1
+        scraper.forget_pages.assert_called_once_with([prop.listing_url])
+
+    def test_plain_list_results_are_accepted(self):
+        scraper = MagicMock()
+        scraper.search_properties.return_value = ["x"]
+
+        reports = asyncio.run(crawl_cities(scraper, CITIES[:1], save=_saved))
+
+        assert reports[0]["found"] == 1
+
+
+class TestFormatCrawlReport:
+
+    def test_rows_and_totals(self):
+        reports = [
+            {"city": "Seattle", "state": "WA", "found": 3, "inserted": 2, "modified": 1,
+             "failed": 0, "crawl_seconds": 1.5, "save_seconds": 0.1, "error": None},
+            {"city": "Portland", "state": "OR", "found": 0, "inserted": 0, "modified": 0,
+             "failed": 0, "crawl_seconds": 0.2, "save_seconds": 0.0, "error": "boom"},
+        ]
+
+        lines = format_crawl_report(reports)
+
+        assert lines[1].startswith("Seattle, WA")
+        assert "1.50" in lines[1]
+        assert lines[2].endswith("error: boom")
+        assert lines[-1].split() == ["total", "3", "2", "1", "0"]
@@ -56,6 +56,33 @@ def _minimal_detail_html(
     """
 
 
+def _mock_session(detail):
+    """Return an aiohttp session double whose GETs answer with *detail*.
+
+    *detail* is the response body, an exception to raise on entering the
+    request, or an async callable producing the body.
+    """
+    def get(url, **kwargs):
+        response = MagicMock()
+        response.status = 200
+        if isinstance(detail, Exception):
+            response.__aenter__ = AsyncMock(side_effect=detail)
+        else:
+            response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        if callable(detail):
+            response.text = detail
+        else:
+            response.text = AsyncMock(return_value=detail)
+        return response
+
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    session.get = MagicMock(side_effect=get)
+    return session
+
+
 # ---------------------------------------------------------------------------
 # ZillowScraper tests
 # ---------------------------------------------------------------------------
@@ -166,6 +193,7 @@ class TestZillowScraperParsePropertyDetails:
 
         html = _minimal_detail_html()
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.content = html.encode()
         mock_response.raise_for_status = MagicMock()
 
@@ -180,6 +208,7 @@ class TestZillowScraperParsePropertyDetails:
 
         html = _minimal_detail_html()
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.content = html.encode()
         mock_response.raise_for_status = MagicMock()
 
@@ -195,6 +224,7 @@ class TestZillowScraperParsePropertyDetails:
 
         html = _minimal_detail_html()
         mock_response = MagicMock()
+        mock_response.status_code = 200
         mock_response.content = html.encode()
         mock_response.raise_for_status = MagicMock()
 
@@ -222,6 +252,7 @@ class TestZillowScraperParsePropertyDetails:
         import requests
 
         mock_response = MagicMock()
+        mock_response.status_code = 404
         mock_response.raise_for_status.side_effect = (
             requests.exceptions.HTTPError("404")
         )
@@ -232,6 +263,25 @@ class TestZillowScraperParsePropertyDetails:
             )
 
         assert result is None
+        # The endpoint answered: a 404 is not a breaker failure.
+        assert self.scraper._breaker("https://www.zillow.com/homedetails/missing/")._failure_count == 0
+
+    def test_server_error_counts_as_breaker_failure(self):
+        import requests
+
+        mock_response = MagicMock()
+        mock_response.status_code = 503
+        mock_response.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError("503")
+        )
+
+        with patch("requests.get", return_value=mock_response):
+            result = self.scraper._parse_property_details(
+                "https://www.zillow.com/homedetails/down/"
+            )
+
+        assert result is None
+        assert self.scraper._breaker("https://www.zillow.com/homedetails/down/")._failure_count == 1
 
 
 class TestZillowScraperFetchPage:
@@ -289,13 +339,32 @@ class TestZillowScraperFetchPage:
 
         assert result is None
 
+    @pytest.mark.parametrize("status,failures", [(429, 1), (503, 1), (404, 0)])
+    def test_throttling_and_server_errors_count_as_breaker_failures(self, status, failures):
+        """429 and 5xx responses trip the breaker; other statuses do not."""
+        url = "https://www.zillow.com/homes/seattle-wa/for_sale/"
+        mock_response = AsyncMock()
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+        mock_response.status = status
+
+        mock_session = MagicMock()
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            result = self._run(self.scraper._request(mock_session, url))
+
+        assert result[:2] == (status, None)
+        assert self.scraper._breaker(url)._failure_count == failures
+
 
 class TestZillowScraperSearchProperties:
     """Integration-style unit tests for ZillowScraper.search_properties()."""
 
     def setup_method(self):
         from services.data_collection.zillow_scraper import ZillowScraper
-        self.scraper = ZillowScraper()
+        # Parse inline; the process pool is covered in test_zillow_parser.py.
+        self.scraper = ZillowScraper(parse_workers=0)
 
     def _run(self, coro):
         loop = asyncio.new_event_loop()
@@ -345,33 +414,23 @@ class TestZillowScraperSearchProperties:
         search_html = _minimal_html(num_listings=1)
         detail_html = _minimal_detail_html(price="400000")
 
-
-        mock_req_response = MagicMock()
-        mock_req_response.content = detail_html.encode()
-        mock_req_response.raise_for_status = MagicMock()
-
         with (
             patch.object(
                 self.scraper, "_fetch_page", new_callable=AsyncMock, return_value=search_html
             ),
-            patch("aiohttp.ClientSession") as mock_session_cls,
-            patch("requests.get", return_value=mock_req_response),
+            patch("aiohttp.ClientSession", return_value=_mock_session(detail_html)),
         ):
-            mock_session = AsyncMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock(return_value=False)
-            mock_session_cls.return_value = mock_session
-
             result = self._run(
                 self.scraper.search_properties("Seattle", "WA", max_pages=1)
             )
 
         assert len(result) == 1
         assert isinstance(result[0], Property)
+        assert result[0].price == 400000
 
     def test_skips_listings_with_parse_failure(self):
-        """Listings whose detail page fails to parse should be silently skipped."""
-        import requests
+        """Listings whose detail page fails to fetch should be silently skipped."""
+        import aiohttp
 
         search_html = _minimal_html(num_listings=2)
 
@@ -379,23 +438,105 @@ class TestZillowScraperSearchProperties:
             patch.object(
                 self.scraper, "_fetch_page", new_callable=AsyncMock, return_value=search_html
             ),
-            patch("aiohttp.ClientSession") as mock_session_cls,
             patch(
-                "requests.get",
-                side_effect=requests.exceptions.ConnectionError("down"),
+                "aiohttp.ClientSession",
+                return_value=_mock_session(aiohttp.ClientConnectionError("down")),
             ),
         ):
-            mock_session = AsyncMock()
-            mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-            mock_session.__aexit__ = AsyncMock(return_value=False)
-            mock_session_cls.return_value = mock_session
-
             result = self._run(
                 self.scraper.search_properties("Seattle", "WA", max_pages=1)
             )
 
         assert result == []
 
+    def test_duplicate_listings_fetched_once(self):
+        search_html = _minimal_html(num_listings=2)
+        session = _mock_session(_minimal_detail_html())
+
+        with (
+            patch.object(
+                self.scraper, "_fetch_page", new_callable=AsyncMock, return_value=search_html
+            ),
+            patch("aiohttp.ClientSession", return_value=session),
+        ):
+            result = self._run(
+                self.scraper.search_properties("Seattle", "WA", max_pages=3)
+            )
+
+        assert len(result) == 2
+        assert session.get.call_count == 2
+
+    def test_reuses_caller_session(self):
+        """A session passed in is used for detail pages and left open."""
+        session = _mock_session(_minimal_detail_html())
+
+        with (
+            patch.object(
+                self.scraper, "_fetch_page", new_callable=AsyncMock,
+                return_value=_minimal_html(num_listings=1),
+            ),
+            patch("aiohttp.ClientSession") as session_cls,
+        ):
+            result = self._run(self.scraper.search_properties(
+                "Seattle", "WA", max_pages=1, session=session,
+            ))
+
+        assert len(result) == 1
+        session_cls.assert_not_called()
+        session.__aexit__.assert_not_called()
+
+    def test_detail_fetches_run_concurrently_within_limit(self):
+        """Detail pages overlap on the shared session, capped by max_concurrency."""
+        from services.data_collection.zillow_scraper import ZillowScraper
+
+        scraper = ZillowScraper(max_concurrency=4, requests_per_second=0, parse_workers=0)
+        in_flight = {"now": 0, "peak": 0}
+
+        async def text():
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return _minimal_detail_html()
+
+        with (
+            patch.object(
+                scraper, "_fetch_page", new_callable=AsyncMock,
+                return_value=_minimal_html(num_listings=12),
+            ),
+            patch("aiohttp.ClientSession", return_value=_mock_session(text)),
+        ):
+            result = self._run(scraper.search_properties("Seattle", "WA", max_pages=1))
+
+        assert len(result) == 12
+        assert in_flight["peak"] == 4
+
+    def test_detail_fetches_stop_when_circuit_opens(self):
+        """Once the breaker opens, remaining detail fetches are skipped."""
+        import aiohttp
+        from services.data_collection.zillow_scraper import ZillowScraper
+
+        scraper = ZillowScraper(
+            failure_threshold=2, max_concurrency=1, requests_per_second=0,
+            parse_workers=0,
+        )
+        session = _mock_session(aiohttp.ClientConnectionError("down"))
+
+        with (
+            patch.object(
+                scraper, "_fetch_page", new_callable=AsyncMock,
+                return_value=_minimal_html(num_listings=5),
+            ),
+            patch("aiohttp.ClientSession", return_value=session),
+        ):
+            result = self._run(scraper.search_properties("Seattle", "WA", max_pages=1))
+
+        assert result == []
+        assert session.get.call_count == 2
+        states = {key: state.value for key, state in scraper._breakers.states().items()}
+        # Only the detail endpoint tripped; search pages stay available.
+        assert states == {"www.zillow.com/homes": "CLOSED", "www.zillow.com/homedetails": "OPEN"}
+
 
 # ---------------------------------------------------------------------------
 # DataCollectionService tests
@@ -29,11 +29,16 @@ def reset_db_state():
     orig_client = db_module._db_client
     orig_db = db_module._db
     orig_uri = db_module._mongodb_uri
+    orig_health = db_module._health
+    orig_ensure_indexes = db_module._ensure_indexes
+    orig_indexes_ensured = db_module._indexes_ensured
 
     # Reset to clean state
     db_module._db_client = None
     db_module._db = None
     db_module._mongodb_uri = None
+    db_module._health = None
+    db_module._indexes_ensured = False
 
     yield
 
@@ -41,6 +46,9 @@ def reset_db_state():
     db_module._db_client = orig_client
     db_module._db = orig_db
     db_module._mongodb_uri = orig_uri
+    db_module._health = orig_health
+    db_module._ensure_indexes = orig_ensure_indexes
+    db_module._indexes_ensured = orig_indexes_ensured
 
 
 # ---------------------------------------------------------------------------
@@ -180,6 +188,41 @@ class TestInitDb:
             "Expected create_index to be called on at least one collection"
         )
 
+    def test_skips_indexes_when_disabled(self):
+        """MONGODB_ENSURE_INDEXES=False leaves index creation to the CLI."""
+        from utils.database import init_db
+
+        config = {"MONGODB_URI": "mongodb://localhost:27017/testdb",
+                  "MONGODB_ENSURE_INDEXES": False}
+        app = MagicMock()
+        app.config.get = MagicMock(side_effect=lambda key, default=None: config.get(key, default))
+
+        with (
+            patch("utils.database.MongoClient", return_value=_make_mongo_client_mock()),
+            patch("utils.database.ensure_indexes") as ensure,
+        ):
+            assert init_db(app) is not None
+
+        ensure.assert_not_called()
+
+    def test_indexes_are_ensured_once_per_process(self):
+        """A reconnect after close_db() does not re-run index creation."""
+        from utils.database import close_db, get_db, init_db
+
+        config = {"MONGODB_URI": "mongodb://localhost:27017/testdb"}
+        app = MagicMock()
+        app.config.get = MagicMock(side_effect=lambda key, default=None: config.get(key, default))
+
+        with (
+            patch("utils.database.MongoClient", return_value=_make_mongo_client_mock()),
+            patch("utils.database.ensure_indexes") as ensure,
+        ):
+            init_db(app)
+            close_db()
+            get_db()
+
+        ensure.assert_called_once()
+
     def test_returns_none_when_connection_fails_all_retries(self):
         from utils.database import init_db
 
@@ -221,6 +264,46 @@ class TestInitDb:
         assert call_count["n"] == 2
 
 
+    def test_registers_health_listener_and_heartbeat_interval(self):
+        import utils.database as db_module
+        from utils.database import ConnectionHealth, init_db
+
+        app = MagicMock()
+        app.config = {
+            "MONGODB_URI": "mongodb://localhost:27017/testdb",
+            "MONGODB_HEARTBEAT_FREQUENCY_MS": 2000,
+        }
+
+        with patch("utils.database.MongoClient", return_value=_make_mongo_client_mock()) as client_cls:
+            init_db(app)
+
+        kwargs = client_cls.call_args.kwargs
+        assert kwargs["heartbeatFrequencyMS"] == 2000
+        assert kwargs["retryReads"] is True
+        (listener,) = kwargs["event_listeners"]
+        assert isinstance(listener, ConnectionHealth)
+        assert db_module._health is listener
+
+    @pytest.mark.parametrize("configured, expected", [
+        (100, 500),
+        ("not-a-number", 10000),
+        (None, 10000),
+    ])
+    def test_heartbeat_interval_is_clamped_or_defaulted(self, configured, expected):
+        from utils.database import init_db
+
+        app = MagicMock()
+        app.config = {
+            "MONGODB_URI": "mongodb://localhost:27017/testdb",
+            "MONGODB_HEARTBEAT_FREQUENCY_MS": configured,
+        }
+
+        with patch("utils.database.MongoClient", return_value=_make_mongo_client_mock()) as client_cls:
+            init_db(app)
+
+        assert client_cls.call_args.kwargs["heartbeatFrequencyMS"] == expected
+
+
 # ---------------------------------------------------------------------------
 # get_db tests
 # ---------------------------------------------------------------------------
@@ -234,8 +317,8 @@ class TestGetDb:
         with pytest.raises((ValueError, ConnectionError)):
             get_db()
 
-    def test_returns_existing_db_without_reconnect(self):
-        """If _db is already set and ping succeeds, the same db is returned."""
+    def test_returns_existing_db_without_ping(self):
+        """If _db is already set it is returned without a round trip."""
         import utils.database as db_module
         from utils.database import get_db
 
@@ -246,54 +329,12 @@ class TestGetDb:
         db_module._db = mock_db
         db_module._mongodb_uri = "mongodb://localhost:27017/testdb"
 
-        result = get_db()
-
-        assert result is mock_db
-        # Ping is called once to verify liveness
-        mock_client.admin.command.assert_called_once_with("ping")
-
-    def test_reconnects_when_ping_fails(self):
-        """If the liveness ping raises, get_db should reconnect."""
-        import utils.database as db_module
-        from utils.database import get_db
-        from pymongo.errors import ConnectionFailure
-
-        stale_client = MagicMock()
-        stale_client.admin.command.side_effect = ConnectionFailure("timeout")
-
-        fresh_client = _make_mongo_client_mock()
-
-        db_module._db_client = stale_client
-        db_module._db = MagicMock()
-        db_module._mongodb_uri = "mongodb://localhost:27017/testdb"
-
-        with (
-            patch("utils.database.MongoClient", return_value=fresh_client),
-            patch("time.sleep"),
-        ):
+        with patch("utils.database.MongoClient") as client_cls:
             result = get_db()
 
-        assert result is not None
-
-    def test_raises_connection_error_when_reconnect_fails(self):
-        """If reconnect also fails, a ConnectionError is raised."""
-        import utils.database as db_module
-        from utils.database import get_db
-        from pymongo.errors import ServerSelectionTimeoutError
-
-        stale_client = MagicMock()
-        stale_client.admin.command.side_effect = ServerSelectionTimeoutError("down")
-
-        db_module._db_client = stale_client
-        db_module._db = MagicMock()
-        db_module._mongodb_uri = "mongodb://localhost:27017/testdb"
-
-        with (
-            patch("utils.database.MongoClient", side_effect=Exception("refused")),
-            patch("time.sleep"),
-        ):
-            with pytest.raises((ConnectionError, Exception)):
-                get_db()
+        assert result is mock_db
+        mock_client.admin.command.assert_not_called()
+        client_cls.assert_not_called()
 
     def test_raises_when_uri_none_and_db_none(self):
         """With no URI and no db, a meaningful error is raised."""
@@ -327,6 +368,149 @@ class TestGetDb:
         assert result is not None
 
 
+# ---------------------------------------------------------------------------
+# Connection health tracking
+# ---------------------------------------------------------------------------
+
+ADDRESS = ("localhost", 27017)
+
+
+def _heartbeat_succeeded(duration=0.004, address=ADDRESS):
+    return MagicMock(connection_id=address, duration=duration)
+
+
+def _heartbeat_failed(error="connection refused", address=ADDRESS):
+    return MagicMock(connection_id=address, reply=Exception(error))
+
+
+def _description_changed(known, error=None, address=ADDRESS):
+    new = MagicMock(is_server_type_known=known, error=error)
+    return MagicMock(server_address=address, new_description=new)
+
+
+class TestConnectionHealth:
+    """Tests for utils.database.ConnectionHealth."""
+
+    def test_unknown_before_first_heartbeat(self):
+        from utils.database import ConnectionHealth
+
+        assert ConnectionHealth().snapshot()["status"] == "unknown"
+
+    def test_ok_after_successful_heartbeat(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.succeeded(_heartbeat_succeeded(duration=0.004))
+
+        snapshot = health.snapshot()
+        assert snapshot["status"] == "ok"
+        assert snapshot["latency_ms"] == 4.0
+        assert snapshot["servers"]["localhost:27017"]["consecutive_failures"] == 0
+
+    def test_error_after_failed_heartbeat(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.succeeded(_heartbeat_succeeded())
+        health.failed(_heartbeat_failed("connection refused"))
+        health.failed(_heartbeat_failed("connection refused"))
+
+        snapshot = health.snapshot()
+        assert snapshot["status"] == "error"
+        assert snapshot["detail"] == "connection refused"
+        assert snapshot["servers"]["localhost:27017"]["consecutive_failures"] == 2
+
+    def test_recovers_after_successful_heartbeat(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.failed(_heartbeat_failed())
+        health.succeeded(_heartbeat_succeeded())
+
+        assert health.snapshot()["status"] == "ok"
+
+    def test_operation_failure_marks_server_down(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.succeeded(_heartbeat_succeeded())
+        health.description_changed(_description_changed(False, error=Exception("reset by peer")))
+
+        snapshot = health.snapshot()
+        assert snapshot["status"] == "error"
+        assert snapshot["detail"] == "reset by peer"
+
+    def test_failed_heartbeat_is_not_counted_twice(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.failed(_heartbeat_failed())
+        health.description_changed(_description_changed(False, error=Exception("refused")))
+
+        assert health.snapshot()["servers"]["localhost:27017"]["consecutive_failures"] == 1
+
+    def test_ok_while_any_server_is_healthy(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.failed(_heartbeat_failed(address=("db1", 27017)))
+        health.succeeded(_heartbeat_succeeded(address=("db2", 27017)))
+
+        assert health.snapshot()["status"] == "ok"
+
+    def test_stale_heartbeat_reports_error(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth(heartbeat_frequency_ms=1000)
+        with patch("utils.database.time.time", return_value=1000.0):
+            health.succeeded(_heartbeat_succeeded())
+        with patch("utils.database.time.time", return_value=1004.0):
+            snapshot = health.snapshot()
+
+        assert snapshot["status"] == "error"
+        assert snapshot["servers"]["localhost:27017"]["stale"] is True
+
+    def test_closed_server_is_forgotten(self):
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.succeeded(_heartbeat_succeeded())
+        health.closed(MagicMock(server_address=ADDRESS))
+
+        assert health.snapshot()["status"] == "unknown"
+
+
+class TestGetConnectionHealth:
+    """Tests for utils.database.get_connection_health()."""
+
+    def test_error_when_not_initialized(self):
+        from utils.database import get_connection_health
+
+        assert get_connection_health()["status"] == "error"
+
+    def test_returns_tracked_snapshot(self):
+        import utils.database as db_module
+        from utils.database import ConnectionHealth, get_connection_health
+
+        db_module._db = MagicMock()
+        db_module._health = ConnectionHealth()
+        db_module._health.succeeded(_heartbeat_succeeded())
+
+        assert get_connection_health()["status"] == "ok"
+
+    def test_close_db_clears_health(self):
+        import utils.database as db_module
+        from utils.database import ConnectionHealth, close_db, get_connection_health
+
+        db_module._db_client = MagicMock()
+        db_module._db = MagicMock()
+        db_module._health = ConnectionHealth()
+
+        close_db()
+
+        assert get_connection_health()["status"] == "error"
+
+
 # ---------------------------------------------------------------------------
 # close_db tests
 # ---------------------------------------------------------------------------
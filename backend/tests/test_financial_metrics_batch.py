@@ -0,0 +1,138 @@
+"""Tests for FinancialMetricsBatch, the vectorized FinancialMetrics engine.
+
+The contract under test is exact agreement with the scalar
+FinancialMetrics.analyze_property() path, including the near-tie rows that
+the batch engine recomputes through the scalar fallback.
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.analysis.financial_metrics import FinancialMetrics
+from services.analysis.financial_metrics_batch import FinancialMetricsBatch
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _random_inputs(n, seed=1234):
+    rng = random.Random(seed)
+    props, markets = [], []
+    for _ in range(n):
+        props.append(SimpleNamespace(price=rng.choice([
+            rng.randint(0, 2_000_000),
+            round(rng.uniform(50_000, 900_000), 2),
+            rng.randrange(100_000, 1_000_000, 5_000),
+        ])))
+        markets.append({
+            'price_to_rent_ratio': rng.choice([0, 8, 12.5, 15, 22, rng.uniform(5, 30)]),
+            'property_tax_rate': rng.choice([0.01, 0.0125, rng.uniform(0.002, 0.03)]),
+            'vacancy_rate': rng.choice([0.05, 0.08, rng.uniform(0, 0.2)]),
+            'avg_hoa_fee': rng.choice([0, 150, rng.uniform(0, 600)]),
+            'appreciation_rate': rng.choice([-0.02, 0.0, 0.03, rng.uniform(-0.05, 0.1)]),
+        })
+    return props, markets
+
+
+def _assert_rows_match(batch_rows, scalar_rows):
+    assert len(batch_rows) == len(scalar_rows)
+    for i, (got, expected) in enumerate(zip(batch_rows, scalar_rows)):
+        assert got == expected, f"row {i} differs: {got} != {expected}"
+
+
+# ---------------------------------------------------------------------------
+# Exact agreement with the scalar path
+# ---------------------------------------------------------------------------
+
+class TestScalarParity:
+
+    def test_default_parameters_match_scalar(self, mock_property, default_market_data):
+        batch = FinancialMetricsBatch.from_records([mock_property], default_market_data)
+        rows = batch.to_records(batch.analyze())
+        expected = FinancialMetrics(mock_property, default_market_data).analyze_property()
+        _assert_rows_match(rows, [expected])
+
+    def test_random_portfolio_matches_scalar(self):
+        props, markets = _random_inputs(3000)
+        batch = FinancialMetricsBatch.from_records(props, markets)
+        rows = batch.to_records(batch.analyze())
+        expected = [FinancialMetrics(p, m).analyze_property() for p, m in zip(props, markets)]
+        _assert_rows_match(rows, expected)
+
+    @pytest.mark.parametrize('params', [
+        dict(down_payment_percentage=0.10, interest_rate=0.07, term_years=15,
+             holding_period=10, appreciation_rate=0.05),
+        dict(down_payment_percentage=0.99, interest_rate=0.001, term_years=1,
+             holding_period=1, appreciation_rate=-0.10),
+        dict(down_payment_percentage=0.25, interest_rate=0.0, term_years=30,
+             holding_period=30, appreciation_rate=0.2),
+    ])
+    def test_custom_parameters_match_scalar(self, params):
+        props, markets = _random_inputs(500, seed=99)
+        batch = FinancialMetricsBatch.from_records(props, markets)
+        rows = batch.to_records(batch.analyze(**params))
+        expected = [FinancialMetrics(p, m).analyze_property(**params) for p, m in zip(props, markets)]
+        _assert_rows_match(rows, expected)
+
+    def test_per_row_parameters_match_scalar(self):
+        props, markets = _random_inputs(200, seed=7)
+        rates = np.linspace(0.02, 0.09, len(props))
+        batch = FinancialMetricsBatch.from_records(props, markets)
+        rows = batch.to_records(batch.analyze(interest_rate=rates))
+        expected = [
+            FinancialMetrics(p, m).analyze_property(interest_rate=float(r))
+            for p, m, r in zip(props, markets, rates)
+        ]
+        _assert_rows_match(rows, expected)
+
+    def test_rounding_ties_match_python_round(self):
+        """Prices chosen so intermediate values land on x.xx5 boundaries."""
+        prices = [1_800.9, 180.9, 2_412.3, 1_000_000.02, 123_456.78, 0.3]
+        props = [SimpleNamespace(price=p) for p in prices]
+        market = {'price_to_rent_ratio': 1, 'vacancy_rate': 0.1, 'property_tax_rate': 0.012}
+        batch = FinancialMetricsBatch.from_records(props, market)
+        rows = batch.to_records(batch.analyze())
+        expected = [FinancialMetrics(p, market).analyze_property() for p in props]
+        _assert_rows_match(rows, expected)
+
+
+# ---------------------------------------------------------------------------
+# Input handling
+# ---------------------------------------------------------------------------
+
+class TestInputs:
+
+    def test_zero_price_row_is_safe(self, default_market_data):
+        batch = FinancialMetricsBatch.from_records([SimpleNamespace(price=0)], default_market_data)
+        columns = batch.analyze()
+        assert columns['cap_rate'][0] == 0.0
+        assert columns['cash_on_cash_return'][0] == 0.0
+        assert columns['roi']['total_roi'][0] == 0.0
+        assert columns['gross_yield'][0] == 0.0
+
+    def test_none_market_values_use_defaults(self, mock_property):
+        market = {'price_to_rent_ratio': None, 'property_tax_rate': None, 'vacancy_rate': None}
+        batch = FinancialMetricsBatch.from_records([mock_property], market)
+        rows = batch.to_records(batch.analyze())
+        expected = FinancialMetrics(mock_property, {}).analyze_property()
+        _assert_rows_match(rows, [expected])
+
+    def test_scalar_market_inputs_broadcast(self):
+        batch = FinancialMetricsBatch([100_000, 200_000], price_to_rent_ratio=10)
+        assert batch.price_to_rent_ratio.tolist() == [10.0, 10.0]
+
+    def test_mismatched_column_length_raises(self):
+        with pytest.raises(ValueError):
+            FinancialMetricsBatch([100_000, 200_000], vacancy_rate=[0.05, 0.06, 0.07])
+
+    def test_misaligned_market_list_raises(self, mock_property):
+        with pytest.raises(ValueError):
+            FinancialMetricsBatch.from_records([mock_property], [{}, {}])
+
+    def test_empty_batch(self):
+        batch = FinancialMetricsBatch([])
+        assert batch.to_records(batch.analyze()) == []
@@ -52,6 +52,7 @@ class TestGetConventionalLoan:
             "term_years",
             "monthly_payment",
             "monthly_pmi",
+            "pmi_months",
             "total_monthly_payment",
             "total_cost",
             "total_interest",
@@ -93,6 +94,16 @@ class TestGetConventionalLoan:
         expected_pmi = round((loan * 0.005) / 12, 2)
         assert result["monthly_pmi"] == expected_pmi
 
+    def test_pmi_drops_off_at_78_percent_ltv(self, mock_property, default_market_data):
+        fo = _make_financing(mock_property, default_market_data)
+        result = fo.get_conventional_loan(down_payment_percentage=0.10)
+        assert 0 < result["pmi_months"] < 360
+        assert result["total_cost"] < result["total_monthly_payment"] * 360
+
+    def test_no_pmi_months_when_twenty_percent_down(self, mock_property, default_market_data):
+        fo = _make_financing(mock_property, default_market_data)
+        assert fo.get_conventional_loan(down_payment_percentage=0.20)["pmi_months"] == 0
+
     def test_total_monthly_payment_equals_payment_plus_pmi(self, mock_property, default_market_data):
         fo = _make_financing(mock_property, default_market_data)
         result = fo.get_conventional_loan(down_payment_percentage=0.10, credit_score=720)
@@ -190,6 +201,7 @@ class TestGetFhaLoan:
             "monthly_payment",
             "upfront_mip",
             "monthly_mip",
+            "mip_months",
             "total_monthly_payment",
             "total_cost",
             "total_interest",
@@ -228,6 +240,14 @@ class TestGetFhaLoan:
         expected_monthly_mip = round((result["loan_amount"] * 0.0055) / 12, 2)
         assert result["monthly_mip"] == expected_monthly_mip
 
+    def test_mip_lasts_life_of_loan_below_ten_percent_down(self, mock_property, default_market_data):
+        fo = _make_financing(mock_property, default_market_data)
+        assert fo.get_fha_loan()["mip_months"] == 360
+
+    def test_mip_lasts_eleven_years_with_ten_percent_down(self, mock_property, default_market_data):
+        fo = _make_financing(mock_property, default_market_data)
+        assert fo.get_fha_loan(down_payment_percentage=0.10)["mip_months"] == 132
+
     def test_total_monthly_payment_includes_mip(self, mock_property, default_market_data):
         fo = _make_financing(mock_property, default_market_data)
         result = fo.get_fha_loan()
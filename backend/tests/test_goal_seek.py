@@ -0,0 +1,138 @@
+# backend/tests/test_goal_seek.py
+"""
+Tests for the goal-seek solver (services/analysis/goal_seek.py).
+
+Covers agreement of the forward model with FinancialMetrics, the closed-form
+and Brent solves for each variable, unreachable targets and the margin used
+to rank offers.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.analysis.financial_metrics import FinancialMetrics
+from services.analysis.goal_seek import GOAL_SEEK_METRICS, GoalSeek, _brent
+
+TARGETS = {"monthly_cash_flow": 0.0, "cap_rate": 6.0, "cash_on_cash_return": 2.0, "total_roi": 40.0}
+
+
+def _seek(market_data, price=350_000, **kwargs):
+    return GoalSeek(SimpleNamespace(price=price), market_data, **kwargs)
+
+
+class TestForwardModel:
+
+    def test_matches_financial_metrics(self, default_market_data):
+        prop = SimpleNamespace(price=350_000)
+        expected = FinancialMetrics(prop, default_market_data).analyze_property(
+            down_payment_percentage=0.25, interest_rate=0.06, holding_period=7)
+        metrics = GoalSeek(prop, default_market_data).metrics(
+            down_payment_percentage=0.25, interest_rate=0.06, holding_period=7)
+
+        assert metrics["monthly_cash_flow"] == pytest.approx(expected["monthly_cash_flow"], abs=0.02)
+        assert metrics["cap_rate"] == pytest.approx(expected["cap_rate"], abs=0.01)
+        assert metrics["cash_on_cash_return"] == pytest.approx(expected["cash_on_cash_return"], abs=0.01)
+        assert metrics["total_roi"] == pytest.approx(expected["roi"]["total_roi"], abs=0.01)
+
+    def test_rent_defaults_to_market_estimate(self, default_market_data):
+        prop = SimpleNamespace(price=350_000)
+        seek = GoalSeek(prop, default_market_data)
+        assert seek.monthly_rent == FinancialMetrics(prop, default_market_data).estimate_rental_income()
+
+    def test_rejects_property_without_price(self, default_market_data):
+        with pytest.raises(ValueError):
+            _seek(default_market_data, price=0)
+
+
+class TestSolve:
+
+    @pytest.mark.parametrize("metric", GOAL_SEEK_METRICS)
+    @pytest.mark.parametrize("variable", ["price", "monthly_rent"])
+    def test_closed_form_hits_target(self, default_market_data, variable, metric):
+        seek = _seek(default_market_data)
+        result = seek.solve(variable, metric, TARGETS[metric], interest_rate=0.06)
+
+        assert result["method"] == "closed_form"
+        assert result["reachable"] is True
+        achieved = seek.metrics(**{variable: result["value"]}, interest_rate=0.06)[metric]
+        assert achieved == pytest.approx(TARGETS[metric], abs=1e-9)
+
+    def test_break_even_price_holds_rent(self, default_market_data):
+        seek = _seek(default_market_data, monthly_rent=2_500)
+        result = seek.solve("price", "monthly_cash_flow", 0.0)
+
+        assert result["inputs"]["monthly_rent"] == 2_500
+        assert seek.metrics(price=result["value"])["monthly_cash_flow"] == pytest.approx(0, abs=1e-9)
+        # Below the break-even price the property cash-flows.
+        assert seek.metrics(price=result["value"] - 1_000)["monthly_cash_flow"] > 0
+
+    def test_down_payment_matches_financial_metrics(self, default_market_data):
+        prop = SimpleNamespace(price=350_000)
+        result = GoalSeek(prop, default_market_data).solve("down_payment_percentage", "monthly_cash_flow", 0.0)
+
+        check = FinancialMetrics(prop, default_market_data).analyze_property(
+            down_payment_percentage=result["value"])
+        assert check["monthly_cash_flow"] == pytest.approx(0, abs=0.02)
+
+    def test_interest_rate_uses_brent(self, default_market_data):
+        prop = SimpleNamespace(price=350_000)
+        result = GoalSeek(prop, default_market_data).solve(
+            "interest_rate", "total_roi", 40.0, down_payment_percentage=0.3)
+
+        assert result["method"] == "brent"
+        assert 0 < result["iterations"] < 20
+        check = FinancialMetrics(prop, default_market_data).analyze_property(
+            down_payment_percentage=0.3, interest_rate=result["value"])
+        assert check["roi"]["total_roi"] == pytest.approx(40.0, abs=0.02)
+
+    def test_rate_unreachable_when_zero_rate_falls_short(self, default_market_data):
+        result = _seek(default_market_data).solve("interest_rate", "cash_on_cash_return", 50.0)
+
+        assert result["reachable"] is False
+        assert result["value"] is None and result["margin"] is None
+        assert "0%" in result["reason"]
+
+    def test_down_payment_out_of_range_is_unreachable(self, default_market_data):
+        result = _seek(default_market_data).solve("down_payment_percentage", "monthly_cash_flow", 5_000)
+        assert result["reachable"] is False
+
+    def test_cap_rate_does_not_depend_on_financing(self, default_market_data):
+        with pytest.raises(ValueError):
+            _seek(default_market_data).solve("interest_rate", "cap_rate", 6.0)
+
+    def test_margin_is_positive_when_target_is_met(self, default_market_data):
+        seek = _seek(default_market_data, monthly_rent=4_000)
+        assert seek.metrics()["monthly_cash_flow"] > 0
+
+        assert seek.solve("price", "monthly_cash_flow", 0.0)["margin"] > 0
+        assert seek.solve("monthly_rent", "monthly_cash_flow", 0.0)["margin"] > 0
+        assert seek.solve("interest_rate", "monthly_cash_flow", 0.0)["margin"] > 0
+
+    def test_margin_follows_metric_direction_under_leverage(self):
+        # With positive leverage a larger down payment lowers cash-on-cash
+        # return, so the sign cannot be fixed per variable.
+        seek = _seek({"price_to_rent_ratio": 8}, price=200_000)
+        current = seek.metrics(interest_rate=0.04)["cash_on_cash_return"]
+
+        met = seek.solve("down_payment_percentage", "cash_on_cash_return", current - 5, interest_rate=0.04)
+        missed = seek.solve("down_payment_percentage", "cash_on_cash_return", current + 5, interest_rate=0.04)
+
+        assert met["value"] > 0.20 and met["margin"] > 0
+        assert missed["value"] < 0.20 and missed["margin"] < 0
+
+
+class TestBrent:
+
+    def test_finds_root(self):
+        root, iterations = _brent(lambda x: x ** 3 - 2 * x - 5, 2.0, 3.0)
+        assert root == pytest.approx(2.0945514815423265, abs=1e-12)
+        assert iterations < 15
+
+    def test_requires_sign_change(self):
+        with pytest.raises(ValueError):
+            _brent(lambda x: x * x + 1, -1.0, 1.0)
@@ -0,0 +1,159 @@
+"""Tests for index declarations and plan checks (backend/utils/indexes.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+from pymongo.errors import OperationFailure
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import utils.indexes as indexes  # noqa: E402
+from utils.indexes import (  # noqa: E402
+    INDEXES,
+    LIST_QUERY_SHAPES,
+    check_list_queries,
+    ensure_indexes,
+    esr_index,
+    explain_list_query,
+)
+
+IXSCAN_PLAN = {
+    "queryPlanner": {"winningPlan": {
+        "stage": "LIMIT",
+        "inputStage": {"stage": "FETCH", "inputStage": {
+            "stage": "IXSCAN", "indexName": "state_1_price_1__id_1",
+        }},
+    }},
+}
+
+SORT_PLAN = {
+    "queryPlanner": {"winningPlan": {
+        "queryPlan": {
+            "stage": "SORT",
+            "inputStage": {"stage": "COLLSCAN"},
+        },
+    }},
+}
+
+
+def _explaining_db(plan):
+    db = MagicMock()
+    cursor = db.__getitem__.return_value.find.return_value
+    cursor.sort.return_value.limit.return_value.explain.return_value = plan
+    return db
+
+
+class TestEsrIndex:
+
+    def test_orders_equality_sort_range(self):
+        assert esr_index(("state", "property_type"), "price", ("bedrooms",)) == [
+            ("state", 1), ("property_type", 1), ("price", 1), ("_id", 1), ("bedrooms", 1),
+        ]
+
+    def test_range_on_sort_field_is_not_repeated(self):
+        assert esr_index((), "price", ("price",)) == [("price", 1), ("_id", 1)]
+
+    def test_every_shape_is_declared(self):
+        declared = [keys for keys, _ in INDEXES["properties"]]
+        for shape in LIST_QUERY_SHAPES:
+            assert esr_index(*shape) in declared
+
+
+class TestEnsureIndexes:
+
+    def test_creates_every_declared_index(self):
+        db = MagicMock()
+        db.__getitem__.return_value.create_index.side_effect = lambda keys, **kw: str(keys)
+
+        summary = ensure_indexes(db)
+
+        total = sum(len(specs) for specs in INDEXES.values())
+        assert len(summary["created"]) == total
+        assert summary["failed"] == {}
+
+    def test_passes_index_options(self):
+        db = MagicMock()
+        ensure_indexes(db)
+
+        collection = db.__getitem__.return_value
+        collection.create_index.assert_any_call("listing_url", unique=True)
+        collection.create_index.assert_any_call("username", unique=True)
+
+    def test_failure_is_reported_and_others_still_created(self):
+        db = MagicMock()
+
+        def create(keys, **options):
+            if keys == "listing_url":
+                raise OperationFailure("E11000 duplicate key")
+            return "ok"
+
+        db.__getitem__.return_value.create_index.side_effect = create
+        summary = ensure_indexes(db)
+
+        assert list(summary["failed"]) == ["properties.listing_url"]
+        assert len(summary["created"]) == sum(len(s) for s in INDEXES.values()) - 1
+
+
+class TestExplainListQuery:
+
+    def test_indexed_plan(self):
+        db = _explaining_db(IXSCAN_PLAN)
+
+        result = explain_list_query(db, {"state": "WA"}, "price", -1)
+
+        db.__getitem__.return_value.find.return_value.sort.assert_called_once_with(
+            [("price", -1), ("_id", -1)]
+        )
+        assert result["stages"] == ["LIMIT", "FETCH", "IXSCAN"]
+        assert result["indexes"] == ["state_1_price_1__id_1"]
+        assert result["collscan"] is False
+        assert result["in_memory_sort"] is False
+
+    def test_flags_collscan_and_sort_in_sbe_plan(self):
+        result = explain_list_query(_explaining_db(SORT_PLAN), {}, "sqft")
+
+        assert result["collscan"] is True
+        assert result["in_memory_sort"] is True
+
+
+class TestCheckListQueries:
+
+    def test_checks_each_shape_in_both_directions(self):
+        results = check_list_queries(_explaining_db(IXSCAN_PLAN))
+
+        assert len(results) == 2 * len(LIST_QUERY_SHAPES)
+        assert all(r["ok"] for r in results)
+
+    def test_sample_filters_follow_shape(self):
+        results = check_list_queries(_explaining_db(SORT_PLAN))
+
+        by_shape = {(tuple(sorted(r["filters"])), r["sort_by"]) for r in results}
+        assert (("bedrooms", "price", "property_type", "state"), "price") in by_shape
+        assert not any(r["ok"] for r in results)
+
+
+class TestMain:
+
+    def test_check_exit_status_reflects_plans(self):
+        client = MagicMock()
+        with (
+            patch("pymongo.MongoClient", return_value=client),
+            patch.object(indexes, "check_list_queries", return_value=[
+                {"ok": False, "sort_by": "price", "sort_order": 1,
+                 "filters": {}, "stages": ["COLLSCAN"]},
+            ]),
+        ):
+            assert indexes.main(["--uri", "mongodb://localhost/realestate", "--check"]) == 1
+        client.close.assert_called_once()
+
+    def test_create_exit_status(self):
+        with (
+            patch("pymongo.MongoClient", return_value=MagicMock()),
+            patch.object(indexes, "ensure_indexes",
+                         return_value={"created": ["state_1"], "failed": {}}) as ensure,
+        ):
+            assert indexes.main(["--uri", "mongodb://localhost/realestate"]) == 0
+        ensure.assert_called_once()
@@ -729,7 +729,7 @@ class TestAnalysisPipelineFlow:
         mock_prop = self._setup_property_mock()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.get(f"/api/v1/analysis/property/{VALID_OBJECT_ID}")
         assert resp.status_code == 200
@@ -741,7 +741,7 @@ class TestAnalysisPipelineFlow:
         mock_prop = self._setup_property_mock()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.get(f"/api/v1/analysis/property/{VALID_OBJECT_ID}")
         body = resp.get_json()
@@ -755,7 +755,7 @@ class TestAnalysisPipelineFlow:
         mock_prop = self._setup_property_mock()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.get(f"/api/v1/analysis/property/{VALID_OBJECT_ID}")
         body = resp.get_json()
@@ -775,7 +775,7 @@ class TestAnalysisPipelineFlow:
         }
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.post(
                 f"/api/v1/analysis/property/{VALID_OBJECT_ID}",
@@ -790,7 +790,7 @@ class TestAnalysisPipelineFlow:
         custom_params = {"down_payment_percentage": 0.30, "interest_rate": 0.05}
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.post(
                 f"/api/v1/analysis/property/{VALID_OBJECT_ID}",
@@ -808,7 +808,7 @@ class TestAnalysisPipelineFlow:
         mock_prop = self._setup_property_mock()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.get(f"/api/v1/analysis/score/{VALID_OBJECT_ID}")
         assert resp.status_code == 200
@@ -1031,7 +1031,7 @@ class TestAPIVersioningParityFlow:
         mock_prop = _make_mock_property()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             v1_resp = client.get(f"/api/v1/analysis/property/{VALID_OBJECT_ID}")
             legacy_resp = client.get(f"/api/analysis/property/{VALID_OBJECT_ID}")
@@ -1123,7 +1123,7 @@ class TestRateLimitHeadersFlow:
         mock_prop = _make_mock_property()
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             resp = client.get(f"/api/v1/analysis/property/{VALID_OBJECT_ID}")
         assert resp.headers.get("X-Content-Type-Options") == "nosniff"
@@ -0,0 +1,237 @@
+"""Tests for the background job queue (backend/services/job_queue.py) and
+the worker that runs it (backend/worker.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.job_queue import (  # noqa: E402
+    COLLECTION, DONE, FAILED, QUEUED, RUNNING, JobQueue, job_to_dict,
+)
+
+
+def _queue(**kwargs):
+    db = MagicMock()
+    return JobQueue(db=db, visibility_timeout=600, retry_delay=60, **kwargs), db[COLLECTION]
+
+
+def _claimed(attempts=1, max_attempts=3):
+    return {
+        "_id": ObjectId(), "type": "crawl_city", "payload": {"city": "Austin", "state": "TX"},
+        "status": RUNNING, "worker": "w-1:1", "attempts": attempts, "max_attempts": max_attempts,
+    }
+
+
+class TestJobQueue:
+
+    def test_enqueue_without_dedupe_inserts(self):
+        queue, collection = _queue()
+        collection.insert_one.return_value.inserted_id = "abc"
+
+        job = queue.enqueue("crawl_city", {"city": "Austin"}, priority=7)
+
+        inserted = collection.insert_one.call_args.args[0]
+        assert inserted["status"] == QUEUED
+        assert inserted["priority"] == 7
+        assert inserted["attempts"] == 0
+        assert job["_id"] == "abc"
+
+    def test_enqueue_with_dedupe_upserts_only_over_live_jobs(self):
+        queue, collection = _queue()
+
+        queue.enqueue("rescore_market", dedupe_key="rescore_market:1")
+
+        query, update = collection.find_one_and_update.call_args.args
+        assert query == {"dedupe_key": "rescore_market:1", "live": True}
+        assert update["$setOnInsert"]["type"] == "rescore_market"
+        assert "dedupe_key" not in update["$setOnInsert"]
+        assert "live" not in update["$setOnInsert"]
+        assert collection.find_one_and_update.call_args.kwargs["upsert"] is True
+
+    def test_enqueue_race_returns_the_winning_job(self):
+        queue, collection = _queue()
+        winner = {"_id": ObjectId(), "dedupe_key": "rescore_market:1", "live": True}
+        collection.find_one_and_update.side_effect = DuplicateKeyError("E11000")
+        collection.find_one.return_value = winner
+
+        assert queue.enqueue("rescore_market", dedupe_key="rescore_market:1") is winner
+        collection.find_one.assert_called_once_with({"dedupe_key": "rescore_market:1", "live": True})
+
+    def test_enqueue_retries_when_the_winner_already_finished(self):
+        queue, collection = _queue()
+        inserted = {"_id": ObjectId(), "dedupe_key": "rescore_market:1", "live": True}
+        collection.find_one_and_update.side_effect = [DuplicateKeyError("E11000"), inserted]
+        collection.find_one.return_value = None
+
+        assert queue.enqueue("rescore_market", dedupe_key="rescore_market:1") is inserted
+        assert collection.find_one_and_update.call_count == 2
+
+    def test_claim_takes_highest_priority_and_leases(self):
+        queue, collection = _queue()
+        collection.find_one_and_update.return_value = _claimed()
+
+        job = queue.claim("w-1:1")
+
+        assert job["attempts"] == 1
+        query, update = collection.find_one_and_update.call_args.args
+        assert {"status": RUNNING, "lease_until": {"$lt": update["$set"]["started_at"]}} in query["$or"]
+        assert update["$set"]["worker"] == "w-1:1"
+        assert update["$set"]["lease_until"] - update["$set"]["started_at"] == timedelta(seconds=600)
+        assert update["$inc"] == {"attempts": 1}
+        assert collection.find_one_and_update.call_args.kwargs["sort"][0] == ("priority", -1)
+
+    def test_claim_fails_job_whose_last_attempt_timed_out(self):
+        queue, collection = _queue()
+        exhausted = _claimed(attempts=4)
+        collection.find_one_and_update.side_effect = [exhausted, None]
+        collection.update_one.return_value.modified_count = 1
+
+        assert queue.claim("w-1:1") is None
+
+        update = collection.update_one.call_args.args[1]["$set"]
+        assert update["status"] == FAILED
+        assert "Visibility timeout" in update["error"]
+
+    def test_fail_requeues_with_exponential_backoff(self):
+        queue, collection = _queue()
+        collection.update_one.return_value.modified_count = 1
+
+        assert queue.fail(_claimed(attempts=2), "timeout") is True
+
+        query, update = collection.update_one.call_args.args
+        assert query["status"] == RUNNING and query["worker"] == "w-1:1"
+        assert update["$set"]["status"] == QUEUED
+        assert "$unset" not in update
+        delay = update["$set"]["run_after"] - update["$set"]["updated_at"]
+        assert delay == timedelta(seconds=120)
+
+    def test_fail_on_last_attempt_or_without_retry_is_final(self):
+        queue, collection = _queue()
+        collection.update_one.return_value.modified_count = 1
+
+        queue.fail(_claimed(attempts=3), "boom")
+        assert collection.update_one.call_args.args[1]["$set"]["status"] == FAILED
+        assert collection.update_one.call_args.args[1]["$unset"] == {"live": ""}
+
+        queue.fail(_claimed(attempts=1), "bad type", retry=False)
+        assert collection.update_one.call_args.args[1]["$set"]["status"] == FAILED
+
+    def test_settling_a_lost_job_returns_false(self):
+        queue, collection = _queue()
+        collection.update_one.return_value.modified_count = 0
+
+        assert queue.complete(_claimed(), {"saved": 3}) is False
+        assert queue.extend(_claimed()) is False
+
+    def test_job_to_dict_is_json_safe(self):
+        job = _claimed()
+        job["status"] = DONE
+        job["created_at"] = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        result = job_to_dict(job)
+
+        assert result["id"] == str(job["_id"])
+        assert result["created_at"] == "2026-01-01T00:00:00+00:00"
+        assert result["finished_at"] is None
+
+
+class TestOnDemandValidation:
+
+    def test_crawl_city_normalizes_and_dedupes(self):
+        from services.jobs import ON_DEMAND_JOBS
+
+        payload, key = ON_DEMAND_JOBS["crawl_city"]({"city": " Austin ", "state": "tx", "max_pages": 50})
+
+        assert payload == {"city": "Austin", "state": "TX", "max_pages": 10}
+        assert key == "crawl_city:austin:TX"
+
+    @pytest.mark.parametrize("payload", [{"city": "Austin"}, {"state": "TX"}, {"city": "Austin", "state": "Texas"}])
+    def test_crawl_city_rejects_incomplete_location(self, payload):
+        from services.jobs import ON_DEMAND_JOBS
+
+        with pytest.raises(ValueError):
+            ON_DEMAND_JOBS["crawl_city"](payload)
+
+    @pytest.mark.parametrize("market_id", [None, "nope", 123])
+    def test_rescore_market_requires_object_id(self, market_id):
+        from services.jobs import ON_DEMAND_JOBS
+
+        with pytest.raises(ValueError):
+            ON_DEMAND_JOBS["rescore_market"]({"market_id": market_id})
+
+    def test_market_query_by_market_type(self):
+        from services.jobs import market_query
+
+        zip_market = MagicMock(market_type="zip_code", zip_code="78701")
+        city_market = MagicMock(market_type="city", city="Austin", state="TX")
+
+        assert market_query(zip_market) == {"zip_code": "78701"}
+        assert market_query(city_market) == {"city": "Austin", "state": "TX"}
+
+
+class TestWorker:
+
+    def _worker(self, handlers):
+        from worker import Worker
+
+        queue = MagicMock()
+        queue.visibility_timeout = 600
+        return Worker(queue, handlers=handlers, name="w-1:1", poll_interval=0), queue
+
+    def test_run_once_completes_successful_job(self):
+        handler = MagicMock(return_value={"saved": 12})
+        worker, queue = self._worker({"crawl_city": handler})
+        job = _claimed()
+        queue.claim.return_value = job
+
+        assert worker.run_once() is True
+
+        handler.assert_called_once_with(city="Austin", state="TX")
+        queue.complete.assert_called_once_with(job, {"saved": 12})
+        queue.fail.assert_not_called()
+
+    def test_run_once_records_handler_failure(self):
+        worker, queue = self._worker({"crawl_city": MagicMock(side_effect=RuntimeError("blocked"))})
+        job = _claimed()
+        queue.claim.return_value = job
+
+        worker.run_once()
+
+        queue.fail.assert_called_once_with(job, "blocked")
+        queue.complete.assert_not_called()
+
+    def test_unknown_job_type_fails_without_retry(self):
+        worker, queue = self._worker({})
+        job = _claimed()
+        queue.claim.return_value = job
+
+        worker.run_once()
+
+        queue.fail.assert_called_once_with(job, "Unknown job type: crawl_city", retry=False)
+
+    def test_empty_queue(self):
+        worker, queue = self._worker({})
+        queue.claim.return_value = None
+
+        assert worker.run_once() is False
+
+    def test_scheduled_jobs_are_enqueued_only_by_leader(self):
+        worker, queue = self._worker({})
+        lease = MagicMock(is_leader=False)
+        worker.enable_schedule(lease)
+
+        worker._enqueue_if_leader("update_property_data")
+        queue.enqueue.assert_not_called()
+
+        lease.is_leader = True
+        worker._enqueue_if_leader("update_property_data")
+        queue.enqueue.assert_called_once_with("update_property_data", dedupe_key="update_property_data")
@@ -0,0 +1,77 @@
+"""Tests for scheduler leader election (backend/utils/leader_lock.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.leader_lock import COLLECTION, LeaderLease  # noqa: E402
+
+
+def _lease(**kwargs):
+    db = MagicMock()
+    return LeaderLease(owner="web-1:100", ttl=600, db=db, **kwargs), db[COLLECTION]
+
+
+class TestLeaderLease:
+
+    def test_acquire_claims_own_or_expired_lease(self):
+        lease, collection = _lease()
+
+        assert lease.acquire() is True
+        assert lease.is_leader is True
+
+        query, update = collection.find_one_and_update.call_args.args
+        assert query["_id"] == "scheduler"
+        assert {"owner": "web-1:100"} in query["$or"]
+        assert update["$set"]["owner"] == "web-1:100"
+        expires_in = update["$set"]["expires_at"] - update["$set"]["renewed_at"]
+        assert expires_in == timedelta(seconds=600)
+        assert collection.find_one_and_update.call_args.kwargs["upsert"] is True
+
+    def test_live_lease_held_elsewhere_makes_follower(self):
+        lease, collection = _lease()
+        collection.find_one_and_update.side_effect = DuplicateKeyError("E11000")
+
+        assert lease.acquire() is False
+        assert lease.is_leader is False
+
+    def test_database_error_steps_down(self):
+        lease, collection = _lease()
+        lease.acquire()
+        collection.find_one_and_update.side_effect = ServerSelectionTimeoutError("down")
+
+        assert lease.acquire() is False
+        assert lease.is_leader is False
+
+    def test_release_only_deletes_own_lease(self):
+        lease, collection = _lease()
+        lease.release()
+        collection.delete_one.assert_not_called()
+
+        lease.acquire()
+        lease.release()
+
+        collection.delete_one.assert_called_once_with({"_id": "scheduler", "owner": "web-1:100"})
+        assert lease.is_leader is False
+
+    def test_current_leader(self):
+        lease, collection = _lease()
+        expires = datetime.now(timezone.utc) + timedelta(minutes=5)
+        collection.find_one.return_value = {
+            "_id": "scheduler", "owner": "web-2:200", "expires_at": expires.replace(tzinfo=None),
+        }
+
+        assert lease.current_leader() == {"owner": "web-2:200", "expires_at": expires.isoformat()}
+
+        collection.find_one.return_value["expires_at"] = datetime(2000, 1, 1)
+        assert lease.current_leader() is None
+        collection.find_one.return_value = None
+        assert lease.current_leader() is None
+
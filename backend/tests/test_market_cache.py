@@ -0,0 +1,204 @@
+"""Tests for market resolution: Market.find_for_location and the
+process-level cache in services/geographic/market_cache.py.
+
+Patches target imported module objects (``patch.object``) because other test
+modules purge ``models.*``/``services.*`` from ``sys.modules``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import models.market as market_module  # noqa: E402
+import services.geographic.market_cache as market_cache  # noqa: E402
+from models.market import DEFAULT_MARKET_DATA, Market  # noqa: E402
+
+
+def _market_doc(**overrides):
+    doc = {
+        "name": "Seattle 98101",
+        "market_type": "zip_code",
+        "state": "WA",
+        "city": "Seattle",
+        "zip_code": "98101",
+        "vacancy_rate": 0.05,
+    }
+    doc.update(overrides)
+    return doc
+
+
+@pytest.fixture()
+def collection():
+    coll = MagicMock()
+    db = MagicMock()
+    db.__getitem__.return_value = coll
+    with patch.object(market_module, "get_db", return_value=db):
+        yield coll
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    market_cache.invalidate_market_cache()
+    yield
+
+
+# ---------------------------------------------------------------------------
+# Market.find_for_location
+# ---------------------------------------------------------------------------
+
+class TestFindForLocation:
+
+    @staticmethod
+    def _answer(collection, by_field):
+        """Answer ``find_one({field: value})`` from ``{(field, value): doc}``."""
+        collection.find_one.side_effect = lambda query: by_field.get(next(iter(query.items())))
+
+    def test_stops_at_the_first_matching_level(self, collection):
+        self._answer(collection, {
+            ("zip_code", "98101"): _market_doc(name="Zip"),
+            ("city", "Seattle"): _market_doc(name="Seattle", market_type="city", zip_code=None),
+            ("state", "WA"): _market_doc(name="WA", market_type="state", zip_code=None, city=None),
+        })
+
+        assert Market.find_for_location("98101", "Seattle", "WA").name == "Zip"
+        collection.find_one.assert_called_once_with({"zip_code": "98101"})
+        collection.find.assert_not_called()
+
+    def test_falls_back_to_city_then_state(self, collection):
+        self._answer(collection, {
+            ("city", "Seattle"): _market_doc(name="Seattle", market_type="city", zip_code=None),
+            ("state", "WA"): _market_doc(name="WA", market_type="state", zip_code=None, city=None),
+        })
+
+        assert Market.find_for_location("00000", "Seattle", "WA").name == "Seattle"
+        assert Market.find_for_location("00000", "Tacoma", "WA").name == "WA"
+        assert [c.args[0] for c in collection.find_one.call_args_list[-3:]] == [
+            {"zip_code": "00000"}, {"city": "Tacoma"}, {"state": "WA"},
+        ]
+
+    def test_city_requires_state(self, collection):
+        Market.find_for_location(None, "Seattle", None)
+
+        collection.find_one.assert_not_called()
+
+    def test_returns_none_when_nothing_matches(self, collection):
+        collection.find_one.return_value = None
+
+        assert Market.find_for_location("98101", "Seattle", "WA") is None
+        assert collection.find_one.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# resolve_market_data
+# ---------------------------------------------------------------------------
+
+class TestResolveMarketData:
+
+    def test_caches_resolution_per_location(self):
+        market = Market.from_dict(_market_doc())
+        with patch.object(market_cache.Market, "find_for_location", return_value=market) as find:
+            first = market_cache.resolve_market_data("98101", "Seattle", "WA")
+            second = market_cache.resolve_market_data("98101", "Seattle", "WA")
+
+        find.assert_called_once_with("98101", "Seattle", "WA")
+        assert first == second == market.to_dict()
+
+    def test_distinct_locations_are_resolved_separately(self):
+        with patch.object(market_cache.Market, "find_for_location", return_value=None) as find:
+            market_cache.resolve_market_data("98101", "Seattle", "WA")
+            market_cache.resolve_market_data("98102", "Seattle", "WA")
+
+        assert find.call_count == 2
+
+    def test_missing_market_returns_defaults_and_is_cached(self):
+        with patch.object(market_cache.Market, "find_for_location", return_value=None) as find:
+            first = market_cache.resolve_market_data("98101", "Seattle", "WA")
+            second = market_cache.resolve_market_data("98101", "Seattle", "WA")
+
+        assert first == second == DEFAULT_MARKET_DATA
+        find.assert_called_once()
+
+    def test_returns_independent_copies(self):
+        market = Market.from_dict(_market_doc())
+        with patch.object(market_cache.Market, "find_for_location", return_value=market):
+            first = market_cache.resolve_market_data("98101", "Seattle", "WA")
+            first["vacancy_rate"] = 0.99
+            first["metrics"]["mutated"] = True
+            second = market_cache.resolve_market_data("98101", "Seattle", "WA")
+
+        assert second["vacancy_rate"] == 0.05
+        assert "mutated" not in second["metrics"]
+
+    def test_invalidate_forces_new_lookup(self):
+        with patch.object(market_cache.Market, "find_for_location", return_value=None) as find:
+            market_cache.resolve_market_data("98101", "Seattle", "WA")
+            market_cache.invalidate_market_cache()
+            market_cache.resolve_market_data("98101", "Seattle", "WA")
+
+        assert find.call_count == 2
+
+    def test_stats_report_hits_and_misses(self):
+        with patch.object(market_cache.Market, "find_for_location", return_value=None):
+            market_cache.resolve_market_data("98101", "Seattle", "WA")
+            market_cache.resolve_market_data("98101", "Seattle", "WA")
+
+        stats = market_cache.market_cache_stats()
+        assert stats["size"] == 1
+        assert stats["hits"] >= 1
+
+
+# ---------------------------------------------------------------------------
+# resolve_market_data_async
+# ---------------------------------------------------------------------------
+
+def _async_db(by_field):
+    """Async db whose markets.find_one answers ``{field: value}`` from *by_field*."""
+    async def find_one(query):
+        (field, _value), = query.items()
+        return by_field.get(field)
+
+    coll = MagicMock()
+    coll.find_one = AsyncMock(side_effect=find_one)
+    db = MagicMock()
+    db.__getitem__.return_value = coll
+    return db, coll
+
+
+class TestResolveMarketDataAsync:
+
+    def test_queries_each_level_and_prefers_zip(self):
+        db, coll = _async_db({
+            "zip_code": _market_doc(name="Zip"),
+            "state": _market_doc(name="WA", market_type="state"),
+        })
+
+        result = asyncio.run(market_cache.resolve_market_data_async(db, "98101", "Seattle", "WA"))
+
+        assert result["name"] == "Zip"
+        assert [c.args[0] for c in coll.find_one.await_args_list] == [
+            {"zip_code": "98101"}, {"city": "Seattle"}, {"state": "WA"},
+        ]
+
+    def test_falls_back_to_state(self):
+        db, _ = _async_db({"state": _market_doc(name="WA", market_type="state")})
+
+        result = asyncio.run(market_cache.resolve_market_data_async(db, "00000", "Tacoma", "WA"))
+
+        assert result["name"] == "WA"
+
+    def test_shares_cache_with_sync_resolution(self):
+        db, coll = _async_db({})
+        asyncio.run(market_cache.resolve_market_data_async(db, "98101", "Seattle", "WA"))
+
+        with patch.object(market_cache.Market, "find_for_location") as find:
+            assert market_cache.resolve_market_data("98101", "Seattle", "WA") == DEFAULT_MARKET_DATA
+
+        find.assert_not_called()
+        assert coll.find_one.await_count == 3
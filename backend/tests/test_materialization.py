@@ -0,0 +1,273 @@
+"""Tests for the metrics/score materialization job (services/materialization.py).
+
+The pymongo Database is replaced with a MagicMock; collection reads return
+plain lists of documents and bulk_write calls are captured for inspection.
+Patches target the imported module object (``patch.object``) because other
+test modules purge ``services.*`` from ``sys.modules`` between files.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import services.materialization as materialization  # noqa: E402
+from services.analysis.financial_metrics import FinancialMetrics  # noqa: E402
+from services.materialization import (  # noqa: E402
+    MarketIndex,
+    MetricsMaterializer,
+    compute_fingerprint,
+    update_property_metrics,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _property_doc(**overrides):
+    doc = {
+        "_id": ObjectId(),
+        "price": 300000,
+        "year_built": 2001,
+        "zip_code": "98101",
+        "city": "Seattle",
+        "state": "WA",
+        "property_type": "single_family",
+        "bedrooms": 3,
+        "bathrooms": 2,
+        "sqft": 1600,
+        "lot_size": 4000,
+        "score": None,
+    }
+    doc.update(overrides)
+    return doc
+
+
+def _market_doc(**overrides):
+    doc = {
+        "_id": ObjectId(),
+        "name": "Seattle 98101",
+        "market_type": "zip_code",
+        "state": "WA",
+        "city": "Seattle",
+        "zip_code": "98101",
+        "price_to_rent_ratio": 18,
+        "property_tax_rate": 0.011,
+        "vacancy_rate": 0.05,
+        "appreciation_rate": 0.04,
+        "avg_hoa_fee": 0,
+    }
+    doc.update(overrides)
+    return doc
+
+
+def _make_db(property_docs, market_docs=()):
+    db = MagicMock()
+    properties = MagicMock()
+    markets = MagicMock()
+    properties.find.return_value.batch_size.return_value = list(property_docs)
+    properties.bulk_write.side_effect = lambda ops, ordered: MagicMock(matched_count=len(ops))
+    markets.find.return_value = list(market_docs)
+    db.__getitem__.side_effect = lambda name: {"properties": properties, "markets": markets}[name]
+    return db, properties
+
+
+def _written_ops(properties_collection):
+    ops = []
+    for call in properties_collection.bulk_write.call_args_list:
+        ops.extend(call.args[0])
+    return ops
+
+
+# ---------------------------------------------------------------------------
+# MarketIndex
+# ---------------------------------------------------------------------------
+
+class TestMarketIndex:
+
+    def test_zip_match_wins(self):
+        index = MarketIndex([
+            _market_doc(market_type="state", zip_code=None, city=None, name="WA"),
+            _market_doc(name="Zip"),
+        ])
+        assert index.resolve("98101", "Seattle", "WA")["name"] == "Zip"
+
+    def test_falls_back_to_city_then_state(self):
+        index = MarketIndex([
+            _market_doc(market_type="state", zip_code=None, city=None, state="OR", name="Oregon"),
+            _market_doc(market_type="city", zip_code=None, city="Seattle", name="Seattle"),
+        ])
+        assert index.resolve("00000", "Seattle", "WA")["name"] == "Seattle"
+        assert index.resolve("00000", "Portland", "OR")["name"] == "Oregon"
+
+    def test_city_requires_state(self):
+        index = MarketIndex([_market_doc(market_type="city", zip_code=None, name="Seattle")])
+        assert "name" not in index.resolve(None, "Seattle", "")
+
+    def test_defaults_when_no_market(self):
+        market = MarketIndex([]).resolve("98101", "Seattle", "WA")
+        assert market["price_to_rent_ratio"] == 15
+        assert market["property_tax_rate"] == 0.01
+
+    def test_first_document_wins_for_duplicate_keys(self):
+        index = MarketIndex([_market_doc(name="first"), _market_doc(name="second")])
+        assert index.resolve("98101", None, None)["name"] == "first"
+
+
+# ---------------------------------------------------------------------------
+# compute_fingerprint
+# ---------------------------------------------------------------------------
+
+class TestComputeFingerprint:
+
+    def test_stable_for_same_inputs(self):
+        doc, market = _property_doc(), {"vacancy_rate": 0.05}
+        assert compute_fingerprint(doc, market, year=2026) == compute_fingerprint(doc, market, year=2026)
+
+    def test_changes_with_price(self):
+        market = {"vacancy_rate": 0.05}
+        assert (compute_fingerprint(_property_doc(price=1), market, year=2026)
+                != compute_fingerprint(_property_doc(price=2), market, year=2026))
+
+    def test_changes_with_market_input(self):
+        doc = _property_doc()
+        assert (compute_fingerprint(doc, {"vacancy_rate": 0.05}, year=2026)
+                != compute_fingerprint(doc, {"vacancy_rate": 0.06}, year=2026))
+
+    def test_ignores_unrelated_market_fields(self):
+        doc = _property_doc()
+        assert (compute_fingerprint(doc, {"name": "a", "updated_at": "x"}, year=2026)
+                == compute_fingerprint(doc, {"name": "b", "updated_at": "y"}, year=2026))
+
+    def test_changes_with_year(self):
+        doc, market = _property_doc(), {}
+        assert compute_fingerprint(doc, market, year=2026) != compute_fingerprint(doc, market, year=2027)
+
+
+# ---------------------------------------------------------------------------
+# MetricsMaterializer
+# ---------------------------------------------------------------------------
+
+class TestMetricsMaterializer:
+
+    def test_writes_metrics_and_score(self):
+        doc = _property_doc()
+        db, properties = _make_db([doc], [_market_doc()])
+
+        stats = MetricsMaterializer(db=db).run()
+
+        assert stats == {"scanned": 1, "skipped": 0, "updated": 1, "failed": 0}
+        (op,) = _written_ops(properties)
+        assert isinstance(op, UpdateOne)
+        update = op._doc["$set"]
+        assert op._filter == {"_id": doc["_id"]}
+        assert 0.0 <= update["score"] <= 100.0
+        assert update["metrics"]["cap_rate"] is not None
+        assert update["metrics_fingerprint"]
+
+    def test_metrics_match_scalar_analysis(self):
+        doc = _property_doc()
+        market_doc = _market_doc()
+        db, properties = _make_db([doc], [market_doc])
+
+        MetricsMaterializer(db=db).run()
+
+        market = MarketIndex([market_doc]).resolve("98101", "Seattle", "WA")
+        prop = MagicMock(price=doc["price"])
+        expected = FinancialMetrics(prop, market).analyze_property()
+        assert _written_ops(properties)[0]._doc["$set"]["metrics"] == expected
+
+    def test_skips_unchanged_properties(self):
+        market_doc = _market_doc()
+        market = MarketIndex([market_doc]).resolve("98101", "Seattle", "WA")
+        doc = _property_doc(score=72.5)
+        doc["metrics_fingerprint"] = compute_fingerprint(doc, market)
+        db, properties = _make_db([doc], [market_doc])
+
+        stats = MetricsMaterializer(db=db).run()
+
+        assert stats["skipped"] == 1
+        properties.bulk_write.assert_not_called()
+
+    def test_reprocesses_when_score_missing(self):
+        market_doc = _market_doc()
+        market = MarketIndex([market_doc]).resolve("98101", "Seattle", "WA")
+        doc = _property_doc(score=None)
+        doc["metrics_fingerprint"] = compute_fingerprint(doc, market)
+        db, _ = _make_db([doc], [market_doc])
+
+        assert MetricsMaterializer(db=db).run()["updated"] == 1
+
+    def test_force_reprocesses_everything(self):
+        market_doc = _market_doc()
+        market = MarketIndex([market_doc]).resolve("98101", "Seattle", "WA")
+        doc = _property_doc(score=72.5)
+        doc["metrics_fingerprint"] = compute_fingerprint(doc, market)
+        db, _ = _make_db([doc], [market_doc])
+
+        assert MetricsMaterializer(db=db).run(force=True)["updated"] == 1
+
+    def test_flushes_in_batches(self):
+        docs = [_property_doc() for _ in range(5)]
+        db, properties = _make_db(docs)
+
+        stats = MetricsMaterializer(db=db, batch_size=2).run()
+
+        assert stats["updated"] == 5
+        assert [len(c.args[0]) for c in properties.bulk_write.call_args_list] == [2, 2, 1]
+        for call in properties.bulk_write.call_args_list:
+            assert call.kwargs["ordered"] is False
+
+    def test_bulk_write_error_counts_failures(self):
+        db, properties = _make_db([_property_doc(), _property_doc()])
+        properties.bulk_write.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1, "errmsg": "boom"}], "nMatched": 1}
+        )
+
+        stats = MetricsMaterializer(db=db).run()
+
+        assert stats["updated"] == 1
+        assert stats["failed"] == 1
+
+    def test_scoring_failure_skips_only_that_property(self):
+        db, properties = _make_db([_property_doc(), _property_doc()])
+        with patch.object(materialization, "OpportunityScoring") as scorer_cls:
+            scorer_cls.return_value.calculate_score.side_effect = [
+                RuntimeError("bad"), {"overall_score": 55.0},
+            ]
+            stats = MetricsMaterializer(db=db).run()
+
+        assert stats["failed"] == 1
+        assert stats["updated"] == 1
+        assert len(_written_ops(properties)) == 1
+
+
+# ---------------------------------------------------------------------------
+# update_property_metrics (scheduler entry point)
+# ---------------------------------------------------------------------------
+
+class TestUpdatePropertyMetrics:
+
+    def test_returns_true_on_success(self):
+        db, _ = _make_db([])
+        with patch.object(materialization, "get_db", return_value=db):
+            assert update_property_metrics() is True
+
+    def test_returns_false_when_db_unavailable(self):
+        with patch.object(materialization, "get_db", side_effect=ConnectionError("down")):
+            assert update_property_metrics() is False
+
+    @pytest.mark.parametrize("force", [True, False])
+    def test_forwards_force_flag(self, force):
+        with patch.object(materialization, "MetricsMaterializer") as cls:
+            update_property_metrics(force=force)
+        cls.return_value.run.assert_called_once_with(force=force)
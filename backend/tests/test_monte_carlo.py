@@ -0,0 +1,130 @@
+# backend/tests/test_monte_carlo.py
+"""
+Tests for the Monte Carlo return simulation (services/analysis/monte_carlo.py).
+
+Covers market-derived assumptions, reproducibility with a seed, the shape
+of the summary, the vectorized IRR solver and the time budget.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.analysis import monte_carlo
+from services.analysis.monte_carlo import MonteCarloSimulation, _irr
+
+
+def _simulation(market_data, price=350_000):
+    return MonteCarloSimulation(SimpleNamespace(price=price), market_data)
+
+
+class TestAssumptions:
+
+    def test_volatility_from_price_history(self, default_market_data):
+        market = {**default_market_data, "price_history": [300_000, 330_000, 300_000, 330_000]}
+        appreciation = _simulation(market).assumptions()["appreciation"]
+
+        assert appreciation["source"] == "price_history"
+        assert appreciation["stdev"] == pytest.approx(np.std(np.diff(np.log([300, 330, 300, 330])), ddof=1))
+        assert appreciation["mean"] == default_market_data["appreciation_rate"]
+
+    def test_default_volatility_without_history(self, default_market_data):
+        appreciation = _simulation(default_market_data).assumptions()["appreciation"]
+        assert appreciation["source"] == "default"
+        assert appreciation["stdev"] == monte_carlo.DEFAULT_APPRECIATION_STDEV
+
+    def test_mean_from_history_when_market_has_no_rate(self):
+        appreciation = _simulation({"price_history": [100, 110, 121]}).assumptions()["appreciation"]
+        assert appreciation["mean"] == pytest.approx(0.10)
+
+    def test_explicit_appreciation_overrides_market(self, default_market_data):
+        appreciation = _simulation(default_market_data).assumptions(appreciation_rate=0.07)["appreciation"]
+        assert appreciation["mean"] == 0.07
+
+
+class TestRun:
+
+    def test_summary_shape(self, default_market_data):
+        result = _simulation(default_market_data).run(paths=2_000, seed=7)
+
+        assert result["paths"] == 2_000
+        assert result["truncated"] is False
+        assert result["seed"] == 7
+        for key in ("irr", "total_roi", "annual_cash_flow"):
+            summary = result[key]
+            assert summary["p5"] <= summary["p25"] <= summary["p50"] <= summary["p75"] <= summary["p95"]
+        for key in ("probability_negative_cash_flow", "probability_negative_first_year", "probability_loss"):
+            assert 0.0 <= result[key] <= 1.0
+
+    def test_seed_is_reproducible(self, default_market_data):
+        sim = _simulation(default_market_data)
+        first = sim.run(paths=3_000, seed=42)
+        second = sim.run(paths=3_000, seed=42)
+        other = sim.run(paths=3_000, seed=43)
+
+        assert first["irr"] == second["irr"]
+        assert first["total_roi"] == second["total_roi"]
+        assert first["irr"] != other["irr"]
+
+    def test_random_seed_is_reported(self, default_market_data):
+        result = _simulation(default_market_data).run(paths=500)
+        assert isinstance(result["seed"], int)
+
+    def test_paths_are_clamped(self, default_market_data):
+        result = _simulation(default_market_data).run(paths=1, seed=1)
+        assert result["paths"] == monte_carlo.MIN_SIMULATION_PATHS
+
+    def test_median_roi_tracks_point_estimate(self, default_market_data):
+        from services.analysis.financial_metrics import FinancialMetrics
+
+        prop = SimpleNamespace(price=350_000)
+        point = FinancialMetrics(prop, default_market_data).analyze_property()["roi"]["total_roi"]
+        result = MonteCarloSimulation(prop, default_market_data).run(paths=20_000, seed=3)
+
+        # Simulated rent grows while the point estimate holds it flat, so
+        # the median sits near but not exactly on the point estimate.
+        assert result["total_roi"]["p5"] < point < result["total_roi"]["p95"]
+        assert result["total_roi"]["p50"] == pytest.approx(point, abs=10)
+
+    def test_higher_volatility_widens_distribution(self, default_market_data):
+        calm = {**default_market_data, "price_history": [100, 101, 102, 103, 104]}
+        wild = {**default_market_data, "price_history": [100, 130, 95, 140, 100]}
+
+        calm_roi = _simulation(calm).run(paths=5_000, seed=1)["total_roi"]
+        wild_roi = _simulation(wild).run(paths=5_000, seed=1)["total_roi"]
+
+        assert wild_roi["p95"] - wild_roi["p5"] > calm_roi["p95"] - calm_roi["p5"]
+
+    def test_time_budget_truncates_after_a_chunk(self, default_market_data, monkeypatch):
+        monkeypatch.setattr(monte_carlo, "SIMULATION_CHUNK_PATHS", 1_000)
+        result = _simulation(default_market_data).run(paths=50_000, seed=1, max_ms=0)
+
+        assert result["truncated"] is True
+        assert result["paths"] == 1_000
+        assert result["requested_paths"] == 50_000
+
+    def test_rejects_property_without_price(self, default_market_data):
+        with pytest.raises(ValueError):
+            _simulation(default_market_data, price=0).run(paths=500)
+
+
+class TestIrr:
+
+    def test_matches_known_rate(self):
+        # -1000 now, 1100 in a year -> 10 %
+        flows = np.array([[-1000.0, 1100.0], [-1000.0, 1050.0]])
+        assert _irr(flows) == pytest.approx([0.10, 0.05])
+
+    def test_multi_year_flows(self):
+        rate = 0.08
+        flows = np.array([[-1000.0, rate * 1000, rate * 1000, 1000 + rate * 1000]])
+        assert _irr(flows)[0] == pytest.approx(rate)
+
+    def test_no_sign_change_is_nan(self):
+        flows = np.array([[-1000.0, -10.0, -10.0]])
+        assert np.isnan(_irr(flows)[0])
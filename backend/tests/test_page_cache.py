@@ -0,0 +1,265 @@
+"""Tests for the scraper's on-disk page cache (services/data_collection/page_cache.py)
+and the conditional fetches ZillowScraper makes with it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.data_collection.page_cache import PageCache, body_hash  # noqa: E402
+
+SEARCH_URL = "https://www.zillow.com/homes/seattle-wa/for_sale/"
+DETAIL_URL = "https://www.zillow.com/homedetails/1/"
+SEARCH_HTML = (
+    '<html><body><article class="list-card">'
+    f'<a class="list-card-link" href="{DETAIL_URL}">1</a></article></body></html>'
+)
+DETAIL_HTML = (
+    '<html><body><div class="ds-address-container">1 Main St</div>'
+    '<span data-testid="price">$350,000</span></body></html>'
+)
+
+
+class TestPageCache:
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        cache = PageCache(str(tmp_path))
+        cache.put(SEARCH_URL, '"abc"', "Tue, 01 Oct 2024 00:00:00 GMT", "h1", payload=["u"])
+        cache.close()
+
+        reopened = PageCache(str(tmp_path))
+        assert reopened.get(SEARCH_URL) == {
+            "etag": '"abc"',
+            "last_modified": "Tue, 01 Oct 2024 00:00:00 GMT",
+            "body_hash": "h1",
+            "payload": ["u"],
+        }
+        assert reopened.size > 0
+        assert reopened.get("https://example.com/missing") is None
+
+    def test_conditional_headers(self):
+        assert PageCache.conditional_headers(None) == {}
+        assert PageCache.conditional_headers(
+            {"etag": '"e"', "last_modified": None, "body_hash": "h", "payload": None}
+        ) == {"If-None-Match": '"e"'}
+        assert PageCache.conditional_headers(
+            {"etag": None, "last_modified": "Mon", "body_hash": "h", "payload": None}
+        ) == {"If-Modified-Since": "Mon"}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = PageCache(str(tmp_path), max_bytes=250)
+        urls = [f"https://www.zillow.com/homedetails/{i}/" for i in range(3)]
+        with patch("services.data_collection.page_cache.time.time", side_effect=[1, 2, 3, 4, 5]):
+            cache.put(urls[0], None, None, "a" * 64)
+            cache.put(urls[1], None, None, "b" * 64)
+            cache.get(urls[0])  # urls[1] is now least recently used
+            cache.put(urls[2], None, None, "c" * 64)
+
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[0]) is not None
+        assert cache.get(urls[2]) is not None
+        assert cache.size <= 250
+
+    def test_replacing_an_entry_keeps_size_accurate(self, tmp_path):
+        cache = PageCache(str(tmp_path))
+        cache.put(SEARCH_URL, None, None, "h", payload=list(range(100)))
+        cache.put(SEARCH_URL, None, None, "h")
+
+        assert cache.size == len(SEARCH_URL) + 1
+
+    def test_discard(self, tmp_path):
+        cache = PageCache(str(tmp_path))
+        cache.put(DETAIL_URL, '"e"', None, "h")
+
+        cache.discard([DETAIL_URL, "https://example.com/never-cached"])
+
+        assert cache.get(DETAIL_URL) is None
+        assert cache.size == 0
+
+
+# ---------------------------------------------------------------------------
+# ZillowScraper with a page cache
+# ---------------------------------------------------------------------------
+
+def _session(responses, requests):
+    """Session double answering each URL with ``(status, body, headers)``."""
+    def get(url, headers=None, **kwargs):
+        requests.append((url, headers))
+        status, body, response_headers = responses[url]
+        response = MagicMock()
+        response.status = status
+        response.headers = response_headers
+        response.text = AsyncMock(return_value=body)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        return response
+
+    session = MagicMock()
+    session.get = MagicMock(side_effect=get)
+    return session
+
+
+def _search(scraper, responses):
+    requests = []
+    properties = asyncio.run(scraper.search_properties(
+        "Seattle", "WA", max_pages=1, session=_session(responses, requests),
+    ))
+    return properties, requests
+
+
+class TestConditionalScrape:
+
+    def _scraper(self, tmp_path):
+        from services.data_collection.zillow_scraper import ZillowScraper
+
+        return ZillowScraper(
+            parse_workers=0, requests_per_second=0, page_cache=PageCache(str(tmp_path)),
+        )
+
+    def test_first_run_stores_validators(self, tmp_path):
+        scraper = self._scraper(tmp_path)
+
+        properties, requests = _search(scraper, {
+            SEARCH_URL: (200, SEARCH_HTML, {"ETag": '"s1"'}),
+            DETAIL_URL: (200, DETAIL_HTML, {"Last-Modified": "Mon"}),
+        })
+
+        assert [p.price for p in properties] == [350000]
+        assert "If-None-Match" not in requests[0][1]
+        assert scraper.page_cache.get(SEARCH_URL)["payload"] == [DETAIL_URL]
+        assert scraper.page_cache.get(DETAIL_URL)["body_hash"] == body_hash(DETAIL_HTML)
+
+    def test_not_modified_pages_are_skipped(self, tmp_path):
+        scraper = self._scraper(tmp_path)
+        _search(scraper, {
+            SEARCH_URL: (200, SEARCH_HTML, {"ETag": '"s1"'}),
+            DETAIL_URL: (200, DETAIL_HTML, {"Last-Modified": "Mon"}),
+        })
+
+        with patch("services.data_collection.zillow_scraper.parse_detail") as parse:
+            properties, requests = _search(scraper, {
+                SEARCH_URL: (304, None, {}),
+                DETAIL_URL: (304, None, {}),
+            })
+
+        assert properties == []
+        parse.assert_not_called()
+        # The cached listing URLs still drive the detail request.
+        assert requests[0][1]["If-None-Match"] == '"s1"'
+        assert requests[1][0] == DETAIL_URL
+        assert requests[1][1]["If-Modified-Since"] == "Mon"
+
+    def test_unchanged_body_hash_is_skipped(self, tmp_path):
+        scraper = self._scraper(tmp_path)
+        responses = {
+            SEARCH_URL: (200, SEARCH_HTML, {}),
+            DETAIL_URL: (200, DETAIL_HTML, {}),
+        }
+        _search(scraper, responses)
+
+        properties, _ = _search(scraper, responses)
+
+        assert properties == []
+
+    def test_changed_detail_is_returned(self, tmp_path):
+        scraper = self._scraper(tmp_path)
+        _search(scraper, {
+            SEARCH_URL: (200, SEARCH_HTML, {}),
+            DETAIL_URL: (200, DETAIL_HTML, {}),
+        })
+
+        properties, _ = _search(scraper, {
+            SEARCH_URL: (200, SEARCH_HTML, {}),
+            DETAIL_URL: (200, DETAIL_HTML.replace("350,000", "340,000"), {}),
+        })
+
+        assert [p.price for p in properties] == [340000]
+
+    def test_forget_pages_forces_refetch(self, tmp_path):
+        scraper = self._scraper(tmp_path)
+        responses = {
+            SEARCH_URL: (200, SEARCH_HTML, {}),
+            DETAIL_URL: (200, DETAIL_HTML, {}),
+        }
+        _search(scraper, responses)
+
+        scraper.forget_pages([DETAIL_URL])
+        properties, _ = _search(scraper, responses)
+
+        assert len(properties) == 1
+
+
+class _BreakingPool:
+    """Process pool double: runs the first task inline, then reports broken."""
+
+    def __init__(self, *args, **kwargs):
+        self.tasks = 0
+
+    def submit(self, fn, *args):
+        self.tasks += 1
+        if self.tasks > 1:
+            raise BrokenProcessPool("worker died")
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class TestBrokenParsePool:
+
+    def test_pool_break_keeps_owned_cache_for_fetches_in_flight(self, tmp_path):
+        import services.data_collection.zillow_scraper as zillow_scraper
+
+        new_url = "https://www.zillow.com/homedetails/2/"
+        search_html = SEARCH_HTML.replace(
+            "</body>",
+            f'<article class="list-card"><a class="list-card-link" href="{new_url}">2</a>'
+            "</article></body>",
+        )
+        with patch.object(zillow_scraper, "ZILLOW_PAGE_CACHE_DIR", str(tmp_path)):
+            scraper = zillow_scraper.ZillowScraper(parse_workers=1, requests_per_second=0)
+        assert scraper._owns_page_cache
+        scraper.page_cache.put(DETAIL_URL, None, None, body_hash(DETAIL_HTML))
+
+        requests = []
+        session = _session({
+            SEARCH_URL: (200, search_html, {}),
+            DETAIL_URL: (200, DETAIL_HTML, {}),
+            new_url: (200, DETAIL_HTML.replace("1 Main St", "2 Main St"), {}),
+        }, requests)
+        get = session.get.side_effect
+
+        def slow_cached_detail(url, **kwargs):
+            response = get(url, **kwargs)
+            if url == DETAIL_URL:
+                # Still in flight when the new listing's parse breaks the pool.
+                async def text():
+                    await asyncio.sleep(0.05)
+                    return DETAIL_HTML
+                response.text = text
+            return response
+
+        session.get.side_effect = slow_cached_detail
+
+        with patch.object(zillow_scraper, "ProcessPoolExecutor", _BreakingPool):
+            properties = asyncio.run(scraper.search_properties(
+                "Seattle", "WA", max_pages=1, session=session,
+            ))
+
+        # The unchanged listing is skipped and the new one parsed inline.
+        assert [p.address for p in properties] == ["2 Main St"]
+        assert scraper.parse_workers == 0 and scraper._parse_pool is None
+        assert scraper.page_cache is not None
+        assert scraper.page_cache.get(new_url) is not None
+
+        scraper.close()
+        assert scraper.page_cache is None
@@ -0,0 +1,129 @@
+"""Tests for the streaming property export (backend/services/property_export.py)."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+from bson import ObjectId
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import services.property_export as property_export  # noqa: E402
+from services.analysis.financial_metrics import FinancialMetrics  # noqa: E402
+from services.property_export import (  # noqa: E402
+    EXPORT_FIELDS,
+    csv_lines,
+    iter_property_rows,
+    ndjson_lines,
+)
+
+
+def _doc(price=300000, zip_code="98101", **overrides):
+    doc = {
+        "_id": ObjectId(),
+        "address": "1 Main St",
+        "city": "Seattle",
+        "state": "WA",
+        "zip_code": zip_code,
+        "price": price,
+        "bedrooms": 3,
+        "bathrooms": 2,
+        "sqft": 1500,
+    }
+    doc.update(overrides)
+    return doc
+
+
+def _make_db(docs):
+    collection = MagicMock()
+    collection.find.return_value.sort.return_value.batch_size.return_value = iter(docs)
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    return db, collection
+
+
+class TestIterPropertyRows:
+
+    def test_queries_with_filters_projection_and_batch_size(self):
+        db, collection = _make_db([])
+
+        list(iter_property_rows(db, {"state": "WA"}, batch_size=25))
+
+        filters, projection = collection.find.call_args.args
+        assert filters == {"state": "WA"}
+        assert set(projection) == set(EXPORT_FIELDS)
+        collection.find.return_value.sort.assert_called_once_with("_id", 1)
+        collection.find.return_value.sort.return_value.batch_size.assert_called_once_with(25)
+
+    def test_rows_have_export_fields_and_string_ids(self):
+        doc = _doc(description="long text", images=["a.jpg"])
+        db, _ = _make_db([doc])
+
+        (row,) = list(iter_property_rows(db, {}))
+
+        assert list(row) == list(EXPORT_FIELDS)
+        assert row["_id"] == str(doc["_id"])
+        assert "metrics" not in row
+
+    def test_is_lazy(self):
+        docs = (_doc() for _ in range(3))
+        db, collection = _make_db([])
+        collection.find.return_value.sort.return_value.batch_size.return_value = docs
+
+        rows = iter_property_rows(db, {}, batch_size=1)
+        next(rows)
+
+        assert len(list(docs)) == 2
+
+    def test_inline_metrics_match_scalar_analysis(self):
+        docs = [_doc(price=250000), _doc(price=410000, zip_code="98102"), _doc(price=0)]
+        db, _ = _make_db(docs)
+        market = {"price_to_rent_ratio": 18, "vacancy_rate": 0.05}
+
+        with patch.object(property_export, "resolve_market_data", return_value=market):
+            rows = list(iter_property_rows(db, {}, batch_size=2, include_metrics=True))
+
+        for doc, row in zip(docs, rows):
+            expected = FinancialMetrics(MagicMock(price=doc["price"]), market).analyze_property()
+            assert row["metrics"] == expected
+
+    def test_resolves_each_location_once_per_chunk(self):
+        docs = [_doc(), _doc(), _doc(zip_code="98102")]
+        db, _ = _make_db(docs)
+
+        with patch.object(property_export, "resolve_market_data", return_value={}) as resolve:
+            list(iter_property_rows(db, {}, include_metrics=True))
+
+        assert resolve.call_count == 2
+
+
+class TestEncoders:
+
+    def test_ndjson_one_document_per_line(self):
+        rows = [{"_id": "a", "price": 1}, {"_id": "b", "price": 2}]
+
+        lines = list(ndjson_lines(rows))
+
+        assert [json.loads(line) for line in lines] == rows
+        assert all(line.endswith("\n") for line in lines)
+
+    def test_csv_header_and_flattened_metrics(self):
+        row = {field: None for field in EXPORT_FIELDS}
+        row.update(_id="a", price=100, metrics={"cap_rate": 5.0, "roi": {"total_roi": 12.0}})
+
+        parsed = list(csv.reader(io.StringIO("".join(csv_lines([row])))))
+
+        header, values = parsed
+        assert header[: len(EXPORT_FIELDS)] == list(EXPORT_FIELDS)
+        assert header[len(EXPORT_FIELDS):] == ["metrics.cap_rate", "metrics.roi.total_roi"]
+        assert values[header.index("metrics.roi.total_roi")] == "12.0"
+
+    def test_csv_empty_export_has_header_only(self):
+        parsed = list(csv.reader(io.StringIO("".join(csv_lines([])))))
+
+        assert parsed == [list(EXPORT_FIELDS)]
@@ -0,0 +1,216 @@
+"""Tests for the Property model's database helpers (backend/models/property.py).
+
+``get_db`` is patched on the imported module object so no MongoDB instance is
+required; collection calls are recorded on MagicMocks.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import models.property as property_module  # noqa: E402
+from models.property import Property  # noqa: E402
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _make_property(listing_url="http://example.com/1", **overrides):
+    fields = dict(
+        address="1 Main St", price=250000, bedrooms=3, bathrooms=2, sqft=1500,
+        year_built=1999, property_type="single_family", lot_size=4000,
+        listing_url=listing_url, source="Zillow", city="Seattle", state="WA",
+        zip_code="98101",
+    )
+    fields.update(overrides)
+    return Property(**fields)
+
+
+def _bulk_result(inserted=0, modified=0, matched=0, upserted_ids=None):
+    return MagicMock(
+        upserted_count=inserted,
+        modified_count=modified,
+        matched_count=matched,
+        upserted_ids=upserted_ids or {},
+    )
+
+
+@pytest.fixture()
+def collection():
+    coll = MagicMock()
+    db = MagicMock()
+    db.__getitem__.return_value = coll
+    with patch.object(property_module, "get_db", return_value=db):
+        yield coll
+
+
+# ---------------------------------------------------------------------------
+# bulk_upsert
+# ---------------------------------------------------------------------------
+
+class TestBulkUpsert:
+
+    def test_sends_unordered_upserts_keyed_on_listing_url(self, collection):
+        collection.bulk_write.return_value = _bulk_result(inserted=2)
+        props = [_make_property("http://a"), _make_property("http://b")]
+
+        Property.bulk_upsert(props)
+
+        ops = collection.bulk_write.call_args.args[0]
+        assert collection.bulk_write.call_args.kwargs == {"ordered": False}
+        assert all(isinstance(op, UpdateOne) for op in ops)
+        assert [op._filter for op in ops] == [{"listing_url": "http://a"}, {"listing_url": "http://b"}]
+        assert all(op._upsert for op in ops)
+
+    def test_insert_only_fields_use_set_on_insert(self, collection):
+        collection.bulk_write.return_value = _bulk_result(inserted=1)
+
+        Property.bulk_upsert([_make_property()])
+
+        (op,) = collection.bulk_write.call_args.args[0]
+        assert set(op._doc["$setOnInsert"]) == {"created_at", "user_id", "metrics", "score"}
+        for field in ("created_at", "user_id", "metrics", "score"):
+            assert field not in op._doc["$set"]
+        assert op._doc["$set"]["price"] == 250000
+        assert "updated_at" in op._doc["$set"]
+
+    def test_batches_by_batch_size(self, collection):
+        collection.bulk_write.return_value = _bulk_result(inserted=2)
+        props = [_make_property(f"http://{i}") for i in range(5)]
+
+        Property.bulk_upsert(props, batch_size=2)
+
+        assert [len(c.args[0]) for c in collection.bulk_write.call_args_list] == [2, 2, 1]
+
+    def test_reports_per_batch_and_total_counts(self, collection):
+        collection.bulk_write.side_effect = [
+            _bulk_result(inserted=1, modified=1, matched=1),
+            _bulk_result(inserted=0, modified=0, matched=1),
+        ]
+        props = [_make_property(f"http://{i}") for i in range(3)]
+
+        result = Property.bulk_upsert(props, batch_size=2)
+
+        assert result["batches"] == [
+            {"inserted": 1, "modified": 1, "matched": 1, "failed": 0},
+            {"inserted": 0, "modified": 0, "matched": 1, "failed": 0},
+        ]
+        assert (result["inserted"], result["modified"], result["matched"], result["failed"]) == (1, 1, 2, 0)
+
+    def test_assigns_ids_to_inserted_properties(self, collection):
+        new_id = ObjectId()
+        collection.bulk_write.return_value = _bulk_result(inserted=1, matched=1, upserted_ids={1: new_id})
+        existing, fresh = _make_property("http://old"), _make_property("http://new")
+
+        Property.bulk_upsert([existing, fresh])
+
+        assert fresh._id == new_id
+        assert not hasattr(existing, "_id")
+
+    def test_deduplicates_listing_urls_last_wins(self, collection):
+        collection.bulk_write.return_value = _bulk_result(inserted=1)
+        props = [_make_property("http://dup", price=1), _make_property("http://dup", price=2)]
+
+        Property.bulk_upsert(props)
+
+        (op,) = collection.bulk_write.call_args.args[0]
+        assert op._doc["$set"]["price"] == 2
+
+    def test_missing_listing_url_counts_as_failed(self, collection):
+        collection.bulk_write.return_value = _bulk_result(inserted=1)
+
+        result = Property.bulk_upsert([_make_property(""), _make_property("http://ok")])
+
+        assert result["failed"] == 1
+        assert len(collection.bulk_write.call_args.args[0]) == 1
+
+    def test_bulk_write_error_reports_partial_counts(self, collection):
+        new_id = ObjectId()
+        collection.bulk_write.side_effect = BulkWriteError({
+            "writeErrors": [{"index": 0, "errmsg": "E11000 duplicate key"}],
+            "nUpserted": 1, "nModified": 0, "nMatched": 0,
+            "upserted": [{"index": 1, "_id": new_id}],
+        })
+        props = [_make_property("http://a"), _make_property("http://b")]
+
+        result = Property.bulk_upsert(props)
+
+        assert result["batches"] == [{"inserted": 1, "modified": 0, "matched": 0, "failed": 1}]
+        assert props[1]._id == new_id
+
+    def test_empty_input_skips_database(self, collection):
+        result = Property.bulk_upsert([])
+
+        collection.bulk_write.assert_not_called()
+        assert result == {"inserted": 0, "modified": 0, "matched": 0, "failed": 0, "batches": []}
+
+
+# ---------------------------------------------------------------------------
+# find_by_ids
+# ---------------------------------------------------------------------------
+
+class TestFindByIds:
+
+    def test_issues_single_in_query(self, collection):
+        ids = [ObjectId(), ObjectId()]
+        collection.find.return_value = []
+
+        Property.find_by_ids([str(ids[0]), ids[1]])
+
+        collection.find.assert_called_once_with({"_id": {"$in": ids}})
+
+    def test_maps_found_documents_by_string_id(self, collection):
+        found_id, missing_id = ObjectId(), ObjectId()
+        doc = _make_property().to_dict()
+        doc["_id"] = found_id
+        collection.find.return_value = [doc]
+
+        result = Property.find_by_ids([str(found_id), str(missing_id)])
+
+        assert list(result) == [str(found_id)]
+        assert result[str(found_id)]._id == found_id
+        assert result[str(found_id)].price == 250000
+
+
+# ---------------------------------------------------------------------------
+# find_all projections
+# ---------------------------------------------------------------------------
+
+class TestFindAllFields:
+
+    def test_projects_fields_and_returns_raw_documents(self, collection):
+        doc = {"_id": ObjectId(), "price": 250000, "city": "Seattle"}
+        collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [doc]
+
+        result = Property.find_all(filters={"state": "WA"}, fields=("price", "city"))
+
+        collection.find.assert_called_once_with({"state": "WA"}, {"price": 1, "city": 1})
+        assert result == [doc]
+
+    def test_cursor_mode_projects_fields(self, collection):
+        cursor = ObjectId()
+        collection.find.return_value.sort.return_value.limit.return_value = []
+
+        Property.find_all(cursor=cursor, fields=("price",))
+
+        collection.find.assert_called_once_with({"_id": {"$gt": cursor}}, {"price": 1})
+
+    def test_without_fields_builds_properties(self, collection):
+        doc = _make_property().to_dict()
+        doc["_id"] = ObjectId()
+        collection.find.return_value.sort.return_value.skip.return_value.limit.return_value = [doc]
+
+        result = Property.find_all()
+
+        collection.find.assert_called_once_with({}, None)
+        assert isinstance(result[0], Property)
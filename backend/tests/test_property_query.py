@@ -0,0 +1,264 @@
+"""Tests for listing totals and deep-page seeking (backend/services/property_query.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import services.property_query as property_query  # noqa: E402
+from services.property_query import (  # noqa: E402
+    count_properties,
+    count_properties_async,
+    find_offset_page,
+    find_offset_page_async,
+    invalidate_property_counts,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    # Other test modules re-import ``services``; clear this module's copy.
+    invalidate_property_counts()
+    yield
+    invalidate_property_counts()
+
+
+def _make_db():
+    collection = MagicMock()
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    return db, collection
+
+
+# ---------------------------------------------------------------------------
+# A minimal evaluator for the filters _seek_filter builds, so the seek path
+# can be checked against plain skip/limit over the same rows.
+# ---------------------------------------------------------------------------
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        if key == "$and":
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = doc.get(key)
+        if isinstance(cond, dict):
+            for op, operand in cond.items():
+                if op == "$ne" and value == operand:
+                    return False
+                if op == "$gt" and (value is None or not value > operand):
+                    return False
+                if op == "$lt" and (value is None or not value < operand):
+                    return False
+        elif value != cond:
+            return False
+    return True
+
+
+def _sorted(docs, sort_by, sort_order):
+    # Missing/None sort lowest, as in MongoDB.
+    def key(doc):
+        value = doc.get(sort_by)
+        return (value is not None, value if value is not None else 0, doc["_id"])
+    return sorted(docs, key=key, reverse=sort_order == -1)
+
+
+class _Rows(list):
+    """A limited cursor: iterable like pymongo's, awaitable like motor's."""
+
+    async def to_list(self, length=None):
+        return list(self)
+
+
+def _seek_db(docs):
+    def find(query, projection=None):
+        matched = [d for d in docs if _matches(d, query)]
+        cursor = MagicMock()
+
+        def sort(spec):
+            (field, order), _ = spec
+            rows = _sorted(matched, field, order)
+            sorted_cursor = MagicMock()
+            sorted_cursor.skip.side_effect = lambda n: MagicMock(
+                limit=lambda k: _Rows(rows[n:n + k]))
+            sorted_cursor.limit.side_effect = lambda k: _Rows(rows[:k])
+            return sorted_cursor
+
+        cursor.sort.side_effect = sort
+        return cursor
+
+    db, collection = _make_db()
+    collection.find.side_effect = find
+    return db
+
+
+class TestCountProperties:
+
+    def test_exact_counts_every_call(self):
+        db, collection = _make_db()
+        collection.count_documents.return_value = 7
+
+        first = count_properties(db, {"state": "WA"}, "exact")
+        count_properties(db, {"state": "WA"}, "exact")
+
+        assert first == {"total": 7, "count_strategy": "exact", "total_is_lower_bound": False}
+        assert collection.count_documents.call_count == 2
+
+    def test_cached_reuses_total_until_invalidated(self):
+        db, collection = _make_db()
+        collection.count_documents.return_value = 3
+
+        count_properties(db, {"state": "WA"}, "cached")
+        assert count_properties(db, {"state": "WA"}, "cached")["total"] == 3
+        assert collection.count_documents.call_count == 1
+
+        invalidate_property_counts()
+        count_properties(db, {"state": "WA"}, "cached")
+        assert collection.count_documents.call_count == 2
+
+    def test_cached_is_keyed_by_filter(self):
+        db, collection = _make_db()
+        collection.count_documents.side_effect = [1, 2]
+
+        assert count_properties(db, {"state": "WA"}, "cached")["total"] == 1
+        assert count_properties(db, {"state": "OR"}, "cached")["total"] == 2
+
+    def test_estimated_without_filter_uses_collection_metadata(self):
+        db, collection = _make_db()
+        collection.estimated_document_count.return_value = 50000
+
+        result = count_properties(db, {}, "estimated")
+
+        assert result["total"] == 50000
+        assert result["total_is_lower_bound"] is False
+        collection.count_documents.assert_not_called()
+
+    def test_estimated_with_filter_caps_the_scan(self):
+        db, collection = _make_db()
+        collection.count_documents.return_value = 10
+        with patch.object(property_query, "ESTIMATED_COUNT_CAP", 10):
+            result = count_properties(db, {"state": "WA"}, "estimated")
+
+        collection.count_documents.assert_called_once_with({"state": "WA"}, limit=10)
+        assert result["total_is_lower_bound"] is True
+
+    def test_unknown_strategy_raises(self):
+        db, _ = _make_db()
+        with pytest.raises(ValueError):
+            count_properties(db, {}, "guess")
+
+    def test_async_count_shares_the_cache(self):
+        db, collection = _make_db()
+        collection.count_documents = AsyncMock(return_value=4)
+
+        first = asyncio.run(count_properties_async(db, {"state": "WA"}, "cached"))
+        # The sync path is served from the total the async path cached.
+        second = count_properties(db, {"state": "WA"}, "cached")
+
+        assert first == second == {"total": 4, "count_strategy": "cached", "total_is_lower_bound": False}
+        collection.count_documents.assert_awaited_once_with({"state": "WA"})
+
+
+class TestFindOffsetPage:
+
+    def test_shallow_page_uses_skip(self):
+        db, collection = _make_db()
+        with patch.object(property_query.Property, "find_all", return_value=[]) as find_all:
+            find_offset_page(db, {"state": "WA"}, page=3, limit=20)
+
+        find_all.assert_called_once_with(
+            filters={"state": "WA"}, limit=20, skip=40, sort_by="price", sort_order=1, fields=None,
+        )
+        collection.find.assert_not_called()
+
+    def test_unseekable_sort_field_uses_skip(self):
+        db, _ = _make_db()
+        with (
+            patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0),
+            patch.object(property_query.Property, "find_all", return_value=[]) as find_all,
+        ):
+            find_offset_page(db, {}, page=5, limit=10, sort_by="city")
+
+        assert find_all.call_args.kwargs["skip"] == 40
+
+    def test_page_past_end_returns_empty(self):
+        db = _seek_db([{"_id": ObjectId(), "price": 1}])
+        with patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0):
+            assert find_offset_page(db, {}, page=5, limit=10) == []
+
+    @pytest.mark.parametrize("sort_order", [1, -1])
+    def test_seek_pages_match_skip_pages(self, sort_order):
+        # Duplicate and missing prices exercise the _id tie-break and the
+        # null ordering.
+        docs = []
+        for i in range(23):
+            doc = {"_id": ObjectId(), "address": f"{i} Main St", "city": "Seattle",
+                   "state": "WA", "zip_code": "98101"}
+            if i % 5:
+                doc["price"] = 100000 + (i % 4) * 1000
+            docs.append(doc)
+        expected = _sorted(docs, "price", sort_order)
+        db = _seek_db(docs)
+
+        with patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0):
+            for page in range(2, 6):
+                rows = find_offset_page(db, {}, page=page, limit=5, sort_order=sort_order)
+                assert [p._id for p in rows] == [
+                    d["_id"] for d in expected[(page - 1) * 5:page * 5]
+                ]
+
+    def test_sequential_pages_reuse_cached_boundary(self):
+        docs = [{"_id": ObjectId(), "price": i, "address": "a", "city": "c",
+                 "state": "WA", "zip_code": "98101"} for i in range(30)]
+        db = _seek_db(docs)
+
+        collection = db.__getitem__.return_value
+
+        with patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0):
+            find_offset_page(db, {}, page=2, limit=10)
+            collection.find.reset_mock()
+            rows = find_offset_page(db, {}, page=3, limit=10)
+
+        # Only the seek itself; the boundary came from the cache.
+        assert collection.find.call_count == 1
+        assert [p.price for p in rows] == list(range(20, 30))
+
+    def test_seek_page_with_fields_returns_projected_documents(self):
+        docs = [{"_id": ObjectId(), "price": i, "city": "Seattle"} for i in range(30)]
+        db = _seek_db(docs)
+
+        with patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0):
+            rows = find_offset_page(db, {}, page=2, limit=10, fields=("city",))
+
+        _, projection = db.__getitem__.return_value.find.call_args.args
+        assert projection == {"city": 1, "price": 1}
+        assert [set(row) for row in rows] == [{"_id", "city"}] * 10
+
+    @pytest.mark.parametrize("fields", [None, ("price",)])
+    def test_async_pages_match_sync_pages(self, fields):
+        docs = [{"_id": ObjectId(), "price": i % 7, "address": "a", "city": "c",
+                 "state": "WA", "zip_code": "98101"} for i in range(30)]
+
+        def ids(rows):
+            return [row["_id"] if isinstance(row, dict) else row._id for row in rows]
+
+        with patch.object(property_query, "DEEP_PAGE_SKIP_THRESHOLD", 0):
+            for page in range(2, 5):
+                invalidate_property_counts()
+                sync_rows = find_offset_page(_seek_db(docs), {}, page=page, limit=10, fields=fields)
+                invalidate_property_counts()
+                async_rows = asyncio.run(
+                    find_offset_page_async(_seek_db(docs), {}, page=page, limit=10, fields=fields)
+                )
+                assert ids(async_rows) == ids(sync_rows)
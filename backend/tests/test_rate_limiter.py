@@ -0,0 +1,74 @@
+"""Tests for the asyncio token-bucket rate limiter (backend/utils/rate_limiter.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import utils.rate_limiter as rate_limiter  # noqa: E402
+from utils.rate_limiter import HostRateLimiter, TokenBucket  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _bucket(rate, burst=1):
+    clock = _Clock()
+    with patch.object(rate_limiter.time, "monotonic", clock):
+        bucket = TokenBucket(rate, burst)
+    return bucket, clock
+
+
+class TestTokenBucket:
+
+    def test_burst_is_free_then_reservations_are_spaced(self):
+        bucket, clock = _bucket(rate=4, burst=2)
+        with patch.object(rate_limiter.time, "monotonic", clock):
+            waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 0.25, 0.5, 0.75]
+
+    def test_tokens_refill_over_time_up_to_burst(self):
+        bucket, clock = _bucket(rate=2, burst=2)
+        with patch.object(rate_limiter.time, "monotonic", clock):
+            bucket.reserve()
+            bucket.reserve()
+            clock.now += 60
+            waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.5]
+
+    def test_zero_rate_disables_limiting(self):
+        bucket, _ = _bucket(rate=0)
+        assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+
+    def test_acquire_sleeps_for_reserved_delay(self):
+        bucket, clock = _bucket(rate=10)
+        with (
+            patch.object(rate_limiter.time, "monotonic", clock),
+            patch.object(rate_limiter.asyncio, "sleep", new_callable=AsyncMock) as sleep,
+        ):
+            asyncio.run(bucket.acquire())
+            asyncio.run(bucket.acquire())
+
+        sleep.assert_awaited_once()
+        assert abs(sleep.await_args.args[0] - 0.1) < 1e-9
+
+
+class TestHostRateLimiter:
+
+    def test_one_bucket_per_host(self):
+        limiter = HostRateLimiter(rate=1)
+
+        zillow = limiter.bucket("https://www.zillow.com/homes/a/")
+        assert limiter.bucket("https://WWW.ZILLOW.COM/homedetails/1/") is zillow
+        assert limiter.bucket("https://example.com/") is not zillow
@@ -0,0 +1,251 @@
+"""Tests for the response cache decorator in backend/utils/response_cache.py.
+
+A minimal Flask-RESTful app with stub resources is used so the tests exercise
+keying, ETag handling and invalidation without the full application factory.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from flask_restful import Api, Resource
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import utils.response_cache as response_cache  # noqa: E402
+from utils.response_cache import (  # noqa: E402
+    cached_response,
+    entity_key,
+    invalidate_listings,
+    invalidate_property,
+    query_key,
+    response_cache_stats,
+)
+
+UPDATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _build_app(calls, entities, config=None):
+    """Return a Flask app exposing a cached entity and a cached listing route."""
+
+    def load_entity(fn):
+        def wrapper(*args, **kwargs):
+            kwargs["item"] = entities[kwargs["item_id"]]
+            return fn(*args, **kwargs)
+        return wrapper
+
+    class ItemResource(Resource):
+        @load_entity
+        @cached_response("property_analysis", entity_key("item_id", "item"))
+        def get(self, item_id, item):
+            calls.append(item_id)
+            if item.value is None:
+                return {"error": "boom"}, 500
+            return {"id": item_id, "value": item.value}, 200
+
+    class ListResource(Resource):
+        @cached_response("item_list", query_key(("page", "city", "cursor"), listings=True,
+                                                 presence=("cursor",)),
+                         timeout_config="LISTING_CACHE_TIMEOUT")
+        def get(self):
+            calls.append("list")
+            return {"items": len(calls)}, 200
+
+    app = Flask(__name__)
+    app.config.update({"TESTING": True, "RESPONSE_CACHE_ENABLED": True})
+    app.config.update(config or {})
+    response_cache.cache.init_app(app, config={"CACHE_TYPE": "SimpleCache"})
+    api = Api(app)
+    api.add_resource(ItemResource, "/items/<item_id>")
+    api.add_resource(ListResource, "/items")
+
+    @app.route("/invalidate/<item_id>", methods=["POST"])
+    def invalidate(item_id):
+        invalidate_property(item_id, UPDATED_AT)
+        return "", 204
+
+    @app.route("/invalidate-listings", methods=["POST"])
+    def invalidate_all_listings():
+        invalidate_listings()
+        return "", 204
+
+    return app
+
+
+@pytest.fixture()
+def calls():
+    return []
+
+
+@pytest.fixture()
+def entities():
+    return {"a": SimpleNamespace(value=1, updated_at=UPDATED_AT)}
+
+
+@pytest.fixture()
+def client(calls, entities):
+    return _build_app(calls, entities).test_client()
+
+
+class TestEntityCaching:
+
+    def test_second_request_is_served_from_cache(self, client, calls):
+        first = client.get("/items/a")
+        second = client.get("/items/a")
+
+        assert calls == ["a"]
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.get_json() == {"id": "a", "value": 1}
+
+    def test_new_updated_at_changes_the_key(self, client, calls, entities):
+        client.get("/items/a")
+        entities["a"] = SimpleNamespace(value=2, updated_at=datetime(2026, 2, 1, tzinfo=timezone.utc))
+
+        response = client.get("/items/a")
+
+        assert calls == ["a", "a"]
+        assert response.get_json()["value"] == 2
+
+    def test_entities_without_updated_at_are_not_cached(self, client, calls, entities):
+        entities["a"] = SimpleNamespace(value=1)
+
+        response = client.get("/items/a")
+        client.get("/items/a")
+
+        assert calls == ["a", "a"]
+        assert "X-Cache" not in response.headers
+
+    def test_errors_are_not_cached(self, client, calls, entities):
+        entities["a"] = SimpleNamespace(value=None, updated_at=UPDATED_AT)
+
+        assert client.get("/items/a").status_code == 500
+        client.get("/items/a")
+
+        assert calls == ["a", "a"]
+
+    def test_invalidate_property_drops_entry(self, client, calls):
+        client.get("/items/a")
+        client.post("/invalidate/a")
+        client.get("/items/a")
+
+        assert calls == ["a", "a"]
+
+    def test_disabled_when_config_off(self, calls, entities):
+        client = _build_app(calls, entities, {"RESPONSE_CACHE_ENABLED": False}).test_client()
+
+        client.get("/items/a")
+        client.get("/items/a")
+
+        assert calls == ["a", "a"]
+
+    def test_disabled_by_default_under_testing(self, calls, entities):
+        app = _build_app(calls, entities)
+        app.config.pop("RESPONSE_CACHE_ENABLED")
+        client = app.test_client()
+
+        client.get("/items/a")
+        client.get("/items/a")
+
+        assert calls == ["a", "a"]
+
+    def test_cache_backend_errors_fall_through(self, client, calls):
+        with (
+            patch.object(response_cache.cache, "get", side_effect=ConnectionError("redis down")),
+            patch.object(response_cache.cache, "set", side_effect=ConnectionError("redis down")),
+        ):
+            response = client.get("/items/a")
+
+        assert response.status_code == 200
+        assert calls == ["a"]
+
+
+class TestETags:
+
+    def test_matching_if_none_match_returns_304(self, client):
+        etag = client.get("/items/a").headers["ETag"]
+
+        response = client.get("/items/a", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+
+    def test_mismatched_etag_returns_body(self, client):
+        client.get("/items/a")
+
+        response = client.get("/items/a", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.get_json()["value"] == 1
+
+    def test_etag_is_stable_across_hits_and_misses(self, client):
+        miss = client.get("/items/a").headers["ETag"]
+        hit = client.get("/items/a").headers["ETag"]
+
+        assert miss == hit
+
+    def test_first_request_honours_if_none_match(self, calls, entities):
+        etag = _build_app([], entities).test_client().get("/items/a").headers["ETag"]
+        client = _build_app(calls, entities).test_client()
+
+        assert client.get("/items/a", headers={"If-None-Match": etag}).status_code == 304
+
+
+class TestListingCaching:
+
+    def test_normalizes_query_args(self, client, calls):
+        client.get("/items?city=Seattle&page=2")
+        response = client.get("/items?page=2&city=Seattle&ignored=x&state=")
+
+        assert calls == ["list"]
+        assert response.headers["X-Cache"] == "HIT"
+
+    def test_different_args_miss(self, client, calls):
+        client.get("/items?page=1")
+        client.get("/items?page=2")
+
+        assert calls == ["list", "list"]
+
+    def test_blank_mode_param_is_kept_in_key(self, client, calls):
+        client.get("/items")
+        first = client.get("/items?cursor=")
+        second = client.get("/items?cursor=")
+
+        assert calls == ["list", "list"]
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+
+    def test_invalidate_listings_retires_entries(self, client, calls):
+        client.get("/items?page=1")
+        client.post("/invalidate-listings")
+        client.get("/items?page=1")
+
+        assert calls == ["list", "list"]
+
+    def test_invalidate_property_also_retires_listings(self, client, calls):
+        client.get("/items?page=1")
+        client.post("/invalidate/a")
+        client.get("/items?page=1")
+
+        assert calls == ["list", "list"]
+
+
+class TestStats:
+
+    def test_counts_hits_and_misses(self, client):
+        before = response_cache_stats()["namespaces"].get("item_list", {"hits": 0, "misses": 0})
+
+        client.get("/items?page=9")
+        client.get("/items?page=9")
+
+        after = response_cache_stats()["namespaces"]["item_list"]
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+        assert 0 <= response_cache_stats()["hit_ratio"] <= 1
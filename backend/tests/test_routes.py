@@ -16,6 +16,7 @@ Test coverage:
 
 from __future__ import annotations
 
+import json
 import sys
 import types
 from datetime import datetime
@@ -23,6 +24,7 @@ from typing import Any, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
+from bson import ObjectId
 
 
 # ---------------------------------------------------------------------------
@@ -182,24 +184,81 @@ class TestHealthEndpoints:
         assert data["status"] == "alive"
         assert "pid" in data
 
-    @patch("utils.database.get_db")
-    def test_readiness_healthy_when_db_connected(self, mock_get_db: Any, client: Any) -> None:
-        mock_db = MagicMock()
-        mock_db.command.return_value = {"ok": 1}
-        mock_get_db.return_value = mock_db
+    @patch("utils.database.get_connection_health")
+    def test_readiness_healthy_when_db_connected(self, mock_health: Any, client: Any) -> None:
+        mock_health.return_value = {"status": "ok", "latency_ms": 1.2, "servers": {}}
         response = client.get("/health/ready")
         assert response.status_code == 200
         data = response.get_json()
         assert data["status"] == "healthy"
+        assert data["checks"]["mongodb"]["latency_ms"] == 1.2
 
-    @patch("utils.database.get_db")
-    def test_readiness_degraded_when_db_down(self, mock_get_db: Any, client: Any) -> None:
-        mock_get_db.side_effect = ConnectionError("Cannot connect")
+    @patch("utils.database.get_connection_health")
+    def test_readiness_degraded_when_db_down(self, mock_health: Any, client: Any) -> None:
+        mock_health.return_value = {"status": "error", "detail": "connection refused"}
         response = client.get("/health/ready")
         assert response.status_code == 503
         data = response.get_json()
         assert data["status"] == "degraded"
 
+    @patch("utils.database.get_connection_health")
+    def test_readiness_reports_scheduler_leader(
+        self, mock_health: Any, client: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        mock_health.return_value = {"status": "ok", "servers": {}}
+        app_module = sys.modules["app"]
+        lease = MagicMock(owner="web-1:101", is_leader=False)
+        lease.current_leader.return_value = {"owner": "web-2:202", "expires_at": "2026-01-01T00:00:00+00:00"}
+        monkeypatch.setattr(app_module, "_scheduler_thread", MagicMock(**{"is_alive.return_value": True}))
+        monkeypatch.setattr(app_module, "_scheduler_lease", lease)
+
+        scheduler = client.get("/health/ready").get_json()["checks"]["scheduler"]
+
+        assert scheduler["worker"] == "web-1:101"
+        assert scheduler["is_leader"] is False
+        assert scheduler["leader"]["owner"] == "web-2:202"
+
+    def test_readiness_stays_ok_across_requests(
+        self, app: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import utils.database as db_module
+        from config import TestingConfig
+        from utils.database import ConnectionHealth
+
+        health = ConnectionHealth()
+        health.succeeded(MagicMock(connection_id=("localhost", 27017), duration=0.001))
+        monkeypatch.setattr(db_module, "_db_client", MagicMock())
+        monkeypatch.setattr(db_module, "_db", MagicMock())
+        monkeypatch.setattr(db_module, "_health", health)
+        close_db = MagicMock()
+        monkeypatch.setattr(db_module, "close_db", close_db)
+        fresh_app, _ = sys.modules["app"].create_app(TestingConfig)
+        fresh_client = fresh_app.test_client()
+
+        first = fresh_client.get("/health/ready")
+        second = fresh_client.get("/health/ready")
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.get_json()["checks"]["mongodb"]["status"] == "ok"
+        close_db.assert_not_called()
+
+    def test_scheduled_jobs_run_only_on_leader(
+        self, app: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        app_module = sys.modules["app"]
+        job = MagicMock(__name__="update_property_data", return_value=True)
+        wrapped = app_module._run_if_leader(job)
+        lease = MagicMock(is_leader=False)
+        monkeypatch.setattr(app_module, "_scheduler_lease", lease)
+
+        assert wrapped() is None
+        job.assert_not_called()
+
+        lease.is_leader = True
+        assert wrapped() is True
+        job.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Test: GET /api/properties
@@ -267,6 +326,82 @@ class TestPropertyListGet:
         data = response.get_json()
         assert len(data["data"]) == 2
 
+    def test_list_reports_count_strategy(self, client: Any) -> None:
+        """The response names the count strategy that produced 'total'."""
+        mock_db = self._make_mock_db(count=4)
+        with (
+            patch("models.property.Property.find_all", return_value=[]),
+            patch("routes.properties.get_db", return_value=mock_db),
+        ):
+            response = client.get("/api/properties?countStrategy=exact")
+        data = response.get_json()
+        assert data["count_strategy"] == "exact"
+        assert data["total"] == 4
+        assert data["total_is_lower_bound"] is False
+
+    def test_list_defaults_to_exact_count(self, client: Any) -> None:
+        """Without countStrategy, total is an exact count."""
+        mock_db = self._make_mock_db(count=4)
+        with (
+            patch("models.property.Property.find_all", return_value=[]),
+            patch("routes.properties.get_db", return_value=mock_db),
+        ):
+            response = client.get("/api/properties")
+        data = response.get_json()
+        assert data["count_strategy"] == "exact"
+        assert data["total"] == 4
+
+    def test_list_estimated_count_without_filters(self, client: Any) -> None:
+        """countStrategy=estimated uses the collection's estimated count."""
+        mock_db = self._make_mock_db(count=0)
+        mock_db.__getitem__.return_value.estimated_document_count.return_value = 9
+        with (
+            patch("models.property.Property.find_all", return_value=[]),
+            patch("routes.properties.get_db", return_value=mock_db),
+        ):
+            response = client.get("/api/properties?countStrategy=estimated")
+        data = response.get_json()
+        assert data["total"] == 9
+        assert data["count_strategy"] == "estimated"
+
+    def test_list_fields_returns_projected_documents(self, client: Any) -> None:
+        """fields=... passes a projection through and returns raw documents."""
+        oid = ObjectId()
+        doc = {"_id": oid, "price": 250000, "city": "Seattle"}
+        mock_db = self._make_mock_db(count=1)
+        with (
+            patch("models.property.Property.find_all", return_value=[doc]) as find_all,
+            patch("routes.properties.get_db", return_value=mock_db),
+        ):
+            response = client.get("/api/properties?fields=price, city,price")
+        assert response.status_code == 200
+        assert find_all.call_args.kwargs["fields"] == ("price", "city")
+        assert response.get_json()["data"] == [
+            {"_id": str(oid), "price": 250000, "city": "Seattle"}
+        ]
+
+    def test_list_fields_with_cursor_sets_next_cursor(self, client: Any) -> None:
+        """Projected cursor pages take next_cursor from the last raw document."""
+        oid = ObjectId()
+        with patch("models.property.Property.find_all",
+                   return_value=[{"_id": oid, "price": 1}]):
+            response = client.get("/api/properties?cursor=&limit=1&fields=price")
+        data = response.get_json()
+        assert data["data"] == [{"_id": str(oid), "price": 1}]
+        assert data["next_cursor"] == str(oid)
+
+    def test_list_unknown_field_returns_400(self, client: Any) -> None:
+        """fields naming a non-projectable field is rejected."""
+        response = client.get("/api/properties?fields=price,password")
+        assert response.status_code == 400
+        assert "password" in response.get_json()["error"]["message"]
+
+    def test_list_unknown_count_strategy_returns_400(self, client: Any) -> None:
+        """An unknown countStrategy is rejected."""
+        response = client.get("/api/properties?countStrategy=guess")
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
 
 # ---------------------------------------------------------------------------
 # Test: GET /api/properties/<id>
@@ -863,7 +998,7 @@ class TestAnalysisParameterValidation:
         mock_prop.property_type = "single_family"
         with (
             patch("models.property.Property.find_by_id", return_value=mock_prop),
-            patch("models.market.Market.find_by_location", return_value=None),
+            patch("models.market.Market.find_for_location", return_value=None),
         ):
             response = client.post(
                 "/api/analysis/property/64a1f2c3d4e5f6a7b8c9d0e1",
@@ -873,6 +1008,540 @@ class TestAnalysisParameterValidation:
         assert response.status_code == 200
 
 
+# ---------------------------------------------------------------------------
+# Test: POST /api/v1/analysis/batch
+# ---------------------------------------------------------------------------
+
+BATCH_ID_A = "64a1f2c3d4e5f6a7b8c9d0e1"
+BATCH_ID_B = "64a1f2c3d4e5f6a7b8c9d0e2"
+BATCH_ID_C = "64a1f2c3d4e5f6a7b8c9d0e3"
+
+
+def _make_analysable_property(property_id: str, zip_code: str = "98101") -> MagicMock:
+    mock_prop = _make_mock_property()
+    mock_prop._id = property_id
+    mock_prop.price = 350000
+    mock_prop.sqft = 1800
+    mock_prop.bedrooms = 3
+    mock_prop.bathrooms = 2
+    mock_prop.year_built = 2005
+    mock_prop.zip_code = zip_code
+    mock_prop.city = "Seattle"
+    mock_prop.state = "WA"
+    mock_prop.property_type = "single_family"
+    return mock_prop
+
+
+class TestBatchAnalysis:
+    """Tests for POST /api/v1/analysis/batch."""
+
+    def test_returns_results_keyed_by_id(self, client: Any) -> None:
+        found = {
+            BATCH_ID_A: _make_analysable_property(BATCH_ID_A),
+            BATCH_ID_B: _make_analysable_property(BATCH_ID_B),
+        }
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value=found) as mock_find,
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            response = client.post(
+                "/api/v1/analysis/batch",
+                json={"property_ids": [BATCH_ID_A, BATCH_ID_B], "term_years": 15},
+            )
+        assert response.status_code == 200
+        data = response.get_json()
+        assert set(data["results"]) == {BATCH_ID_A, BATCH_ID_B}
+        assert data["errors"] == {}
+        assert data["parameters"] == {"term_years": 15}
+        assert "financial_analysis" in data["results"][BATCH_ID_A]
+        mock_find.assert_called_once_with([BATCH_ID_A, BATCH_ID_B])
+
+    def test_matches_single_property_analysis(self, client: Any) -> None:
+        prop = _make_analysable_property(BATCH_ID_A)
+        params = {"down_payment_percentage": 0.25, "interest_rate": 0.06}
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value={BATCH_ID_A: prop}),
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            batch = client.post(
+                "/api/v1/analysis/batch", json={"property_ids": [BATCH_ID_A], **params}
+            ).get_json()
+            single = client.post(f"/api/v1/analysis/property/{BATCH_ID_A}", json=params).get_json()
+
+        single.pop("parameters")
+        assert batch["results"][BATCH_ID_A] == single
+
+    def test_reports_partial_failures_per_item(self, client: Any) -> None:
+        found = {BATCH_ID_A: _make_analysable_property(BATCH_ID_A)}
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value=found) as mock_find,
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            response = client.post(
+                "/api/v1/analysis/batch",
+                json={"property_ids": [BATCH_ID_A, BATCH_ID_B, "not-an-id"]},
+            )
+        data = response.get_json()
+        assert response.status_code == 200
+        assert list(data["results"]) == [BATCH_ID_A]
+        assert data["errors"][BATCH_ID_B]["code"] == "NOT_FOUND"
+        assert data["errors"]["not-an-id"]["code"] == "VALIDATION_ERROR"
+        assert (data["succeeded"], data["failed"]) == (1, 2)
+        mock_find.assert_called_once_with([BATCH_ID_A, BATCH_ID_B])
+
+    def test_resolves_each_location_once(self, client: Any) -> None:
+        found = {
+            BATCH_ID_A: _make_analysable_property(BATCH_ID_A, zip_code="98101"),
+            BATCH_ID_B: _make_analysable_property(BATCH_ID_B, zip_code="98101"),
+            BATCH_ID_C: _make_analysable_property(BATCH_ID_C, zip_code="98102"),
+        }
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value=found),
+            patch("routes.analysis.resolve_market_data", return_value={}) as mock_resolve,
+        ):
+            client.post(
+                "/api/v1/analysis/batch",
+                json={"property_ids": [BATCH_ID_A, BATCH_ID_B, BATCH_ID_C]},
+            )
+        assert mock_resolve.call_count == 2
+
+    def test_deduplicates_ids(self, client: Any) -> None:
+        with patch("routes.analysis.Property.find_by_ids", return_value={}) as mock_find:
+            client.post("/api/v1/analysis/batch", json={"property_ids": [BATCH_ID_A, BATCH_ID_A]})
+        mock_find.assert_called_once_with([BATCH_ID_A])
+
+    def test_analysis_error_is_reported_per_item(self, client: Any) -> None:
+        found = {
+            BATCH_ID_A: _make_analysable_property(BATCH_ID_A),
+            BATCH_ID_B: _make_analysable_property(BATCH_ID_B, zip_code="98102"),
+        }
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value=found),
+            patch("routes.analysis.resolve_market_data",
+                  side_effect=[{}, RuntimeError("market lookup failed")]),
+        ):
+            data = client.post(
+                "/api/v1/analysis/batch", json={"property_ids": [BATCH_ID_A, BATCH_ID_B]}
+            ).get_json()
+        assert BATCH_ID_A in data["results"]
+        assert data["errors"][BATCH_ID_B] == {"code": "INTERNAL_ERROR", "message": "market lookup failed"}
+
+    @pytest.mark.parametrize("body", [
+        {"property_ids": []},
+        {"property_ids": "64a1f2c3d4e5f6a7b8c9d0e1"},
+        {"term_years": 30},
+    ])
+    def test_requires_non_empty_id_list(self, client: Any, body: dict) -> None:
+        response = client.post("/api/v1/analysis/batch", json=body)
+        assert response.status_code == 400
+
+    def test_rejects_oversized_batch(self, client: Any) -> None:
+        from routes.analysis import MAX_BATCH_PROPERTIES
+        ids = [f"{i:024x}" for i in range(MAX_BATCH_PROPERTIES + 1)]
+        response = client.post("/api/v1/analysis/batch", json={"property_ids": ids})
+        assert response.status_code == 400
+
+    def test_invalid_parameter_returns_400(self, client: Any) -> None:
+        response = client.post(
+            "/api/v1/analysis/batch", json={"property_ids": [BATCH_ID_A], "term_years": "abc"}
+        )
+        assert response.status_code == 400
+
+    def test_legacy_path_is_registered(self, client: Any) -> None:
+        with patch("routes.analysis.Property.find_by_ids", return_value={}):
+            response = client.post("/api/analysis/batch", json={"property_ids": [BATCH_ID_A]})
+        assert response.status_code == 200
+
+
+class TestCustomAnalysisTaxProjection:
+    """POST /api/v1/analysis/property/<id> returns a multi-year tax table."""
+
+    def _post(self, client: Any, body: dict[str, Any]) -> Any:
+        prop = _make_analysable_property(BATCH_ID_A)
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            return client.post(f"/api/v1/analysis/property/{BATCH_ID_A}", json=body)
+
+    def test_defaults_to_thirty_years(self, client: Any) -> None:
+        body = self._post(client, {"tax_bracket": 0.24}).get_json()
+
+        projection = body["tax_projection"]
+        assert projection["years"] == 30
+        assert len(projection["schedule"]) == 30
+        first = projection["schedule"][0]
+        assert first["mortgage_interest"] == body["tax_benefits"]["mortgage_interest_deduction"]
+        assert first["tax_savings"] == body["tax_benefits"]["estimated_tax_savings"]
+
+    def test_projection_years_is_clamped(self, client: Any) -> None:
+        body = self._post(client, {"projection_years": 99}).get_json()
+        assert len(body["tax_projection"]["schedule"]) == 30
+
+        body = self._post(client, {"projection_years": 7}).get_json()
+        assert len(body["tax_projection"]["schedule"]) == 7
+
+    def test_non_numeric_projection_years_returns_400(self, client: Any) -> None:
+        assert self._post(client, {"projection_years": "forever"}).status_code == 400
+
+
+class TestPropertySimulation:
+    """Tests for POST /api/v1/analysis/property/<id>/simulate."""
+
+    def _post(self, client: Any, body: dict[str, Any], prop: Any = None,
+              path: str = "/api/v1/analysis/property/{}/simulate") -> Any:
+        prop = prop if prop is not None else _make_analysable_property(BATCH_ID_A)
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            return client.post(path.format(BATCH_ID_A), json=body)
+
+    def test_returns_distribution(self, client: Any) -> None:
+        response = self._post(client, {"paths": 1000, "seed": 5, "holding_period": 7})
+
+        assert response.status_code == 200
+        body = response.get_json()
+        simulation = body["simulation"]
+        assert body["property_id"] == BATCH_ID_A
+        assert simulation["paths"] == 1000
+        assert simulation["seed"] == 5
+        assert simulation["holding_period"] == 7
+        assert {"p5", "p50", "p95"} <= set(simulation["irr"])
+        assert 0 <= simulation["probability_negative_cash_flow"] <= 1
+
+    def test_seed_reproduces_result(self, client: Any) -> None:
+        first = self._post(client, {"paths": 500, "seed": 9}).get_json()["simulation"]
+        second = self._post(client, {"paths": 500, "seed": 9}).get_json()["simulation"]
+        assert first["irr"] == second["irr"]
+
+    def test_paths_are_capped(self, client: Any) -> None:
+        from services.analysis.monte_carlo import MAX_SIMULATION_PATHS
+
+        with patch("routes.analysis.MonteCarloSimulation") as mock_sim:
+            mock_sim.return_value.run.return_value = {}
+            self._post(client, {"paths": 10 ** 9})
+        assert mock_sim.return_value.run.call_args.kwargs["paths"] == MAX_SIMULATION_PATHS
+
+    @pytest.mark.parametrize("body", [{"paths": "many"}, {"seed": -1}, {"max_ms": "soon"}])
+    def test_invalid_parameters_return_400(self, client: Any, body: dict[str, Any]) -> None:
+        response = self._post(client, body)
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_property_without_price_returns_400(self, client: Any) -> None:
+        prop = _make_analysable_property(BATCH_ID_A)
+        prop.price = 0
+        assert self._post(client, {}, prop=prop).status_code == 400
+
+    def test_legacy_path_is_registered(self, client: Any) -> None:
+        response = self._post(client, {"paths": 200}, path="/api/analysis/property/{}/simulate")
+        assert response.status_code == 200
+
+
+class TestPropertySensitivity:
+    """Tests for POST /api/v1/analysis/property/<id>/sensitivity."""
+
+    def _post(self, client: Any, body: dict[str, Any], prop: Any = None,
+              path: str = "/api/v1/analysis/property/{}/sensitivity") -> Any:
+        prop = prop if prop is not None else _make_analysable_property(BATCH_ID_A)
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            return client.post(path.format(BATCH_ID_A), json=body)
+
+    def test_returns_rate_by_down_payment_table(self, client: Any) -> None:
+        response = self._post(client, {
+            "down_payment_percentage": {"min": 0.1, "max": 0.3, "steps": 3},
+            "interest_rate": [0.07, 0.05, 0.06],
+            "holding_period": [5, 10],
+        })
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["property_id"] == BATCH_ID_A
+        assert body["axes"]["down_payment_percentage"] == [0.1, 0.2, 0.3]
+        assert body["axes"]["interest_rate"] == [0.05, 0.06, 0.07]
+        assert body["fixed"] == {"term_years": 30, "appreciation_rate": 0.03}
+        assert body["points"] == 18
+
+        cash_flow = body["metrics"]["monthly_cash_flow"]
+        assert cash_flow["dimensions"] == ["down_payment_percentage", "interest_rate"]
+        assert len(cash_flow["values"]) == 3 and len(cash_flow["values"][0]) == 3
+        assert body["metrics"]["total_roi"]["dimensions"] == [
+            "down_payment_percentage", "interest_rate", "holding_period",
+        ]
+
+    def test_cells_match_custom_analysis(self, client: Any) -> None:
+        grid = self._post(client, {
+            "interest_rate": [0.05, 0.06], "metrics": ["monthly_cash_flow"],
+        }).get_json()
+        prop = _make_analysable_property(BATCH_ID_A)
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            custom = client.post(
+                f"/api/v1/analysis/property/{BATCH_ID_A}", json={"interest_rate": 0.06}
+            ).get_json()
+
+        assert grid["metrics"]["monthly_cash_flow"]["values"][1] == \
+            custom["financial_analysis"]["monthly_cash_flow"]
+
+    def test_values_are_clamped_to_analysis_bounds(self, client: Any) -> None:
+        body = self._post(client, {"interest_rate": [-1, 0.05, 5]}).get_json()
+        assert body["axes"]["interest_rate"] == [0.001, 0.05, 0.3]
+
+    @pytest.mark.parametrize("body", [
+        {"interest_rate": {"min": 0.03}},
+        {"interest_rate": {"min": 0.03, "max": 0.08, "steps": 1}},
+        {"term_years": ["thirty"]},
+        {"metrics": ["irr"]},
+        {"metrics": "monthly_cash_flow"},
+        {"down_payment_percentage": [0.05 + i / 100 for i in range(51)]},
+    ])
+    def test_invalid_parameters_return_400(self, client: Any, body: dict[str, Any]) -> None:
+        response = self._post(client, body)
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_oversized_grid_returns_400(self, client: Any) -> None:
+        body = {
+            "down_payment_percentage": {"min": 0.05, "max": 0.5, "steps": 30},
+            "interest_rate": {"min": 0.02, "max": 0.09, "steps": 30},
+            "appreciation_rate": {"min": -0.05, "max": 0.1, "steps": 30},
+        }
+        response = self._post(client, body)
+        assert response.status_code == 400
+        assert "at most" in response.get_json()["error"]["message"]
+
+    def test_property_without_price_returns_400(self, client: Any) -> None:
+        prop = _make_analysable_property(BATCH_ID_A)
+        prop.price = 0
+        assert self._post(client, {"interest_rate": [0.05, 0.06]}, prop=prop).status_code == 400
+
+    def test_legacy_path_is_registered(self, client: Any) -> None:
+        response = self._post(client, {"interest_rate": [0.05, 0.06]},
+                              path="/api/analysis/property/{}/sensitivity")
+        assert response.status_code == 200
+
+
+class TestPropertyGoalSeek:
+    """Tests for POST /api/v1/analysis/property/<id>/goal-seek."""
+
+    def _post(self, client: Any, body: dict[str, Any], prop: Any = None,
+              path: str = "/api/v1/analysis/property/{}/goal-seek") -> Any:
+        prop = prop if prop is not None else _make_analysable_property(BATCH_ID_A)
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            return client.post(path.format(BATCH_ID_A), json=body)
+
+    def test_solves_break_even_price(self, client: Any) -> None:
+        response = self._post(client, {"solve_for": "price", "target_value": 0, "interest_rate": 0.06})
+
+        assert response.status_code == 200
+        body = response.get_json()
+        goal_seek = body["goal_seek"]
+        assert body["property_id"] == BATCH_ID_A
+        assert goal_seek["method"] == "closed_form"
+        assert goal_seek["target_metric"] == "monthly_cash_flow"
+        assert goal_seek["current"] == 350000
+        assert 0 < goal_seek["value"] < 350000
+        assert goal_seek["margin"] < 0
+        assert goal_seek["inputs"]["interest_rate"] == 0.06
+
+    def test_known_rent_is_used(self, client: Any) -> None:
+        body = self._post(client, {"monthly_rent": 5000}).get_json()
+        assert body["goal_seek"]["inputs"]["monthly_rent"] == 5000
+        assert body["goal_seek"]["margin"] > 0
+
+    def test_rate_solve_uses_brent(self, client: Any) -> None:
+        body = self._post(client, {"solve_for": "interest_rate", "target_metric": "total_roi",
+                                   "target_value": 30}).get_json()
+        assert body["goal_seek"]["method"] == "brent"
+        assert body["goal_seek"]["reachable"] is True
+
+    @pytest.mark.parametrize("body", [
+        {"solve_for": "hoa"},
+        {"target_metric": "irr"},
+        {"target_value": "lots"},
+        {"monthly_rent": -100},
+        {"solve_for": "interest_rate", "target_metric": "cap_rate"},
+    ])
+    def test_invalid_parameters_return_400(self, client: Any, body: dict[str, Any]) -> None:
+        response = self._post(client, body)
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_property_without_price_returns_400(self, client: Any) -> None:
+        prop = _make_analysable_property(BATCH_ID_A)
+        prop.price = 0
+        assert self._post(client, {"target_value": 0}, prop=prop).status_code == 400
+
+    def test_legacy_path_is_registered(self, client: Any) -> None:
+        response = self._post(client, {"target_value": 0}, path="/api/analysis/property/{}/goal-seek")
+        assert response.status_code == 200
+
+
+class TestBatchGoalSeek:
+    """Tests for POST /api/v1/analysis/goal-seek."""
+
+    def _post(self, client: Any, body: dict[str, Any], found: dict[str, Any]) -> Any:
+        with (
+            patch("routes.analysis.Property.find_by_ids", return_value=found),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            return client.post("/api/v1/analysis/goal-seek", json=body)
+
+    def test_ranks_properties_by_margin(self, client: Any) -> None:
+        cheap = _make_analysable_property(BATCH_ID_A)
+        pricey = _make_analysable_property(BATCH_ID_B)
+        pricey.price = 900000
+        body = {"property_ids": [BATCH_ID_B, BATCH_ID_A], "solve_for": "down_payment_percentage",
+                "target_metric": "cash_on_cash_return", "target_value": 1}
+
+        response = self._post(client, body, {BATCH_ID_A: cheap, BATCH_ID_B: pricey})
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["succeeded"] == 2 and data["failed"] == 0
+        assert [r["rank"] for r in data["results"]] == [1, 2]
+        margins = [r["margin"] for r in data["results"] if r["margin"] is not None]
+        assert margins == sorted(margins, reverse=True)
+
+    def test_matches_single_property_solve(self, client: Any) -> None:
+        prop = _make_analysable_property(BATCH_ID_A)
+        params = {"target_metric": "cap_rate", "target_value": 5}
+        batch = self._post(client, {"property_ids": [BATCH_ID_A], **params}, {BATCH_ID_A: prop}).get_json()
+        with (
+            patch("models.property.Property.find_by_id", return_value=prop),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            single = client.post(f"/api/v1/analysis/property/{BATCH_ID_A}/goal-seek", json=params).get_json()
+
+        result = batch["results"][0]
+        assert result.pop("property_id") == BATCH_ID_A
+        assert result.pop("rank") == 1
+        assert result == single["goal_seek"]
+
+    def test_reports_missing_and_malformed_ids(self, client: Any) -> None:
+        data = self._post(client, {"property_ids": [BATCH_ID_A, "nope"]}, {}).get_json()
+
+        assert data["results"] == []
+        assert data["errors"][BATCH_ID_A]["code"] == "NOT_FOUND"
+        assert data["errors"]["nope"]["code"] == "VALIDATION_ERROR"
+
+    @pytest.mark.parametrize("body", [
+        {"property_ids": []},
+        {"property_ids": [BATCH_ID_A], "monthly_rent": 2000},
+        {"property_ids": [BATCH_ID_A], "solve_for": "down_payment_percentage", "target_metric": "cap_rate"},
+    ])
+    def test_invalid_body_returns_400(self, client: Any, body: dict[str, Any]) -> None:
+        assert self._post(client, body, {}).status_code == 400
+
+
+# ---------------------------------------------------------------------------
+# Test: GET /api/v1/properties/export
+# ---------------------------------------------------------------------------
+
+class TestPropertyExport:
+    """Tests for the streaming property export endpoint."""
+
+    def _mock_db(self, docs: list) -> tuple[MagicMock, MagicMock]:
+        collection = MagicMock()
+        collection.find.return_value.sort.return_value.batch_size.return_value = iter(docs)
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+        return db, collection
+
+    def _docs(self) -> list:
+        return [
+            {"_id": ObjectId(), "address": "1 Main St", "price": 250000, "city": "Seattle", "state": "WA"},
+            {"_id": ObjectId(), "address": "2 Main St", "price": 310000, "city": "Seattle", "state": "WA"},
+        ]
+
+    def test_streams_ndjson_by_default(self, client: Any) -> None:
+        docs = self._docs()
+        db, _ = self._mock_db(docs)
+        with patch("routes.properties.get_db", return_value=db):
+            response = client.get("/api/v1/properties/export")
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert response.is_streamed
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [r["_id"] for r in rows] == [str(d["_id"]) for d in docs]
+
+    def test_applies_list_filters(self, client: Any) -> None:
+        db, collection = self._mock_db([])
+        with patch("routes.properties.get_db", return_value=db):
+            client.get("/api/v1/properties/export?state=WA&minPrice=100000&batchSize=50").get_data()
+        filters = collection.find.call_args.args[0]
+        assert filters == {"state": "WA", "price": {"$gte": 100000}}
+        collection.find.return_value.sort.return_value.batch_size.assert_called_once_with(50)
+
+    def test_csv_format(self, client: Any) -> None:
+        db, _ = self._mock_db(self._docs())
+        with patch("routes.properties.get_db", return_value=db):
+            response = client.get("/api/v1/properties/export?format=csv")
+        assert response.mimetype == "text/csv"
+        assert "attachment; filename=properties.csv" in response.headers["Content-Disposition"]
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines[0].startswith("_id,address,")
+        assert len(lines) == 3
+
+    def test_include_metrics(self, client: Any) -> None:
+        db, _ = self._mock_db(self._docs())
+        with (
+            patch("routes.properties.get_db", return_value=db),
+            patch("models.market.Market.find_for_location", return_value=None),
+        ):
+            response = client.get("/api/v1/properties/export?includeMetrics=true")
+        rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert all("cap_rate" in row["metrics"] for row in rows)
+
+    def _failing_db(self, rows_before_failure: int) -> MagicMock:
+        def cursor():
+            for i in range(rows_before_failure):
+                yield {"_id": ObjectId(), "address": f"{i} Main St", "price": 250000}
+            raise RuntimeError("cursor killed")
+
+        db, collection = self._mock_db([])
+        collection.find.return_value.sort.return_value.batch_size.return_value = cursor()
+        return db
+
+    @pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+    def test_mid_stream_failure_aborts_the_response(self, client: Any, export_format: str) -> None:
+        chunks = []
+        with patch("routes.properties.get_db", return_value=self._failing_db(10)):
+            response = client.get(f"/api/v1/properties/export?format={export_format}&batchSize=10")
+            # The error propagates to the server, which drops the connection
+            # instead of ending the chunked body normally.
+            with pytest.raises(RuntimeError, match="cursor killed"):
+                for chunk in response.response:
+                    chunks.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+
+        body = "".join(chunks).splitlines()
+        if export_format == "ndjson":
+            assert len(body) == 11
+            assert json.loads(body[-1]) == {
+                "error": {"code": "EXPORT_FAILED", "message": "cursor killed"},
+            }
+        else:
+            assert len(body) == 11  # header and the rows sent before the failure
+
+    def test_invalid_format_returns_400(self, client: Any) -> None:
+        response = client.get("/api/v1/properties/export?format=xml")
+        assert response.status_code == 400
+
+    def test_invalid_filter_returns_400(self, client: Any) -> None:
+        response = client.get("/api/v1/properties/export?minPrice=abc")
+        assert response.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Test: TopMarkets limit validation
 # ---------------------------------------------------------------------------
@@ -1154,6 +1823,57 @@ class TestPropertyOwnership:
         assert "error" in data
         assert data["error"]["code"] == "FORBIDDEN"
 
+    # ------------------------------------------------------------------
+    # Response cache invalidation
+    # ------------------------------------------------------------------
+
+    def test_put_invalidates_cached_responses_for_old_version(self, client: Any, app: Any) -> None:
+        """PUT drops cached responses keyed on the pre-update updated_at."""
+        mock_prop = self._make_mock_property_with_owner("owner-user")
+        old_version = mock_prop.updated_at
+        mock_prop.save.side_effect = lambda: setattr(mock_prop, "updated_at", "new")
+
+        with (
+            patch("models.property.Property.find_by_id", return_value=mock_prop),
+            patch("routes.properties.invalidate_property") as mock_invalidate,
+        ):
+            client.put(
+                "/api/properties/64a1f2c3d4e5f6a7b8c9d0e1",
+                json={"price": 500000},
+                content_type="application/json",
+                headers=self._auth_headers(app, identity="owner-user"),
+            )
+        mock_invalidate.assert_called_once_with("64a1f2c3d4e5f6a7b8c9d0e1", old_version)
+
+    def test_delete_invalidates_cached_responses(self, client: Any, app: Any) -> None:
+        mock_prop = self._make_mock_property_with_owner("owner-user")
+
+        with (
+            patch("models.property.Property.find_by_id", return_value=mock_prop),
+            patch("routes.properties.get_db", return_value=self._make_mock_db()),
+            patch("routes.properties.invalidate_property") as mock_invalidate,
+        ):
+            client.delete(
+                "/api/properties/64a1f2c3d4e5f6a7b8c9d0e1",
+                headers=self._auth_headers(app, identity="owner-user"),
+            )
+        mock_invalidate.assert_called_once_with("64a1f2c3d4e5f6a7b8c9d0e1", mock_prop.updated_at)
+
+    def test_forbidden_put_does_not_invalidate(self, client: Any, app: Any) -> None:
+        mock_prop = self._make_mock_property_with_owner("owner-user")
+
+        with (
+            patch("models.property.Property.find_by_id", return_value=mock_prop),
+            patch("routes.properties.invalidate_property") as mock_invalidate,
+        ):
+            client.put(
+                "/api/properties/64a1f2c3d4e5f6a7b8c9d0e1",
+                json={"price": 500000},
+                content_type="application/json",
+                headers=self._auth_headers(app, identity="other-user"),
+            )
+        mock_invalidate.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Test: API versioning
@@ -1211,3 +1931,94 @@ class TestAPIVersioning:
         assert "v1" in data["api_versions"]
         assert "current_api" in data
         assert data["current_api"] == "/api/v1"
+
+
+# ---------------------------------------------------------------------------
+# Test: /api/v1/jobs (background job queue)
+# ---------------------------------------------------------------------------
+
+class TestJobEndpoints:
+    """Tests for enqueueing and polling worker jobs."""
+
+    def _auth_headers(self, app: Any) -> dict[str, str]:
+        from flask_jwt_extended import create_access_token
+        with app.app_context():
+            token = create_access_token(identity="testuser")
+        return {"Authorization": f"Bearer {token}"}
+
+    def _job(self, **overrides: Any) -> dict[str, Any]:
+        job = {
+            "_id": ObjectId(), "type": "crawl_city", "status": "queued",
+            "payload": {"city": "Austin", "state": "TX", "max_pages": 2},
+            "priority": 5, "attempts": 0, "max_attempts": 3,
+        }
+        job.update(overrides)
+        return job
+
+    def test_enqueue_requires_jwt(self, client: Any) -> None:
+        response = client.post("/api/v1/jobs", json={"type": "crawl_city"})
+        assert response.status_code == 401
+
+    def test_enqueue_crawl_city_returns_202(self, client: Any, app: Any) -> None:
+        job = self._job()
+        with patch("routes.jobs.JobQueue") as mock_queue, \
+                patch("routes.jobs.JOB_CRAWL_USERS", frozenset({"testuser"})):
+            mock_queue.return_value.enqueue.return_value = job
+            response = client.post(
+                "/api/v1/jobs",
+                json={"type": "crawl_city", "payload": {"city": "Austin", "state": "tx"}, "priority": 99},
+                headers=self._auth_headers(app),
+            )
+        assert response.status_code == 202
+        assert response.get_json()["job"]["id"] == str(job["_id"])
+        mock_queue.return_value.enqueue.assert_called_once_with(
+            "crawl_city", {"city": "Austin", "state": "TX", "max_pages": 2},
+            priority=10, dedupe_key="crawl_city:austin:TX",
+        )
+
+    def test_enqueue_crawl_city_requires_allowed_user(self, client: Any, app: Any) -> None:
+        with patch("routes.jobs.JobQueue") as mock_queue, \
+                patch("routes.jobs.JOB_CRAWL_USERS", frozenset({"ops"})):
+            response = client.post(
+                "/api/v1/jobs",
+                json={"type": "crawl_city", "payload": {"city": "Austin", "state": "TX"}},
+                headers=self._auth_headers(app),
+            )
+        assert response.status_code == 403
+        assert response.get_json()["error"]["code"] == "FORBIDDEN"
+        mock_queue.return_value.enqueue.assert_not_called()
+
+    def test_enqueue_rejects_unknown_type(self, client: Any, app: Any) -> None:
+        response = client.post(
+            "/api/v1/jobs", json={"type": "update_property_data"}, headers=self._auth_headers(app),
+        )
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_enqueue_rejects_invalid_payload(self, client: Any, app: Any) -> None:
+        response = client.post(
+            "/api/v1/jobs",
+            json={"type": "rescore_market", "payload": {"market_id": "nope"}},
+            headers=self._auth_headers(app),
+        )
+        assert response.status_code == 400
+
+    def test_get_job_status(self, client: Any, app: Any) -> None:
+        job = self._job(status="done", result={"saved": 40})
+        with patch("routes.jobs.JobQueue") as mock_queue:
+            mock_queue.return_value.get.return_value = job
+            response = client.get(f"/api/v1/jobs/{job['_id']}", headers=self._auth_headers(app))
+        assert response.status_code == 200
+        body = response.get_json()["job"]
+        assert body["status"] == "done"
+        assert body["result"] == {"saved": 40}
+
+    def test_get_missing_job_returns_404(self, client: Any, app: Any) -> None:
+        with patch("routes.jobs.JobQueue") as mock_queue:
+            mock_queue.return_value.get.return_value = None
+            response = client.get(f"/api/v1/jobs/{ObjectId()}", headers=self._auth_headers(app))
+        assert response.status_code == 404
+
+    def test_get_job_rejects_invalid_id(self, client: Any, app: Any) -> None:
+        response = client.get("/api/v1/jobs/not-an-id", headers=self._auth_headers(app))
+        assert response.status_code == 400
@@ -88,18 +88,37 @@ class TestUpdatePropertyData:
         # The scheduler hardcodes 3 cities (Seattle, Portland, San Francisco)
         assert mock_scraper_instance.search_properties.call_count == 3
 
-    def test_saves_each_returned_property(self):
-        """Every property returned by the scraper should have .save() called."""
-        props = [MagicMock(save=MagicMock()), MagicMock(save=MagicMock())]
+    def test_bulk_upserts_returned_properties(self):
+        """Properties returned by the scraper are saved with one bulk_upsert per city."""
+        props = [MagicMock(), MagicMock()]
         mock_scraper_instance = MagicMock()
         mock_scraper_instance.search_properties.return_value = props
 
-        with patch(self._SCRAPER_PATH, return_value=mock_scraper_instance):
+        with (
+            patch(self._SCRAPER_PATH, return_value=mock_scraper_instance),
+            patch("services.scheduler.Property") as mock_property_cls,
+        ):
+            mock_property_cls.bulk_upsert.return_value = {"inserted": 2, "modified": 0, "failed": 0}
             from services.scheduler import update_property_data
             update_property_data()
 
+        assert mock_property_cls.bulk_upsert.call_count == 3
+        mock_property_cls.bulk_upsert.assert_called_with(props)
         for prop in props:
-            prop.save.assert_called()
+            prop.save.assert_not_called()
+
+    def test_skips_bulk_upsert_for_empty_city(self):
+        mock_scraper_instance = MagicMock()
+        mock_scraper_instance.search_properties.return_value = []
+
+        with (
+            patch(self._SCRAPER_PATH, return_value=mock_scraper_instance),
+            patch("services.scheduler.Property") as mock_property_cls,
+        ):
+            from services.scheduler import update_property_data
+            update_property_data()
+
+        mock_property_cls.bulk_upsert.assert_not_called()
 
     def test_continues_on_single_city_exception(self):
         """An exception for one city must not abort the remaining cities."""
@@ -254,6 +273,19 @@ class TestUpdateMarketData:
         assert result is True
         good_market.save.assert_called_once()
 
+    def test_invalidates_market_cache(self):
+        """Updated markets must not be served from the resolution cache."""
+        with (
+            patch(self._GET_DB_PATH, return_value=MagicMock()),
+            patch(self._MARKET_PATH) as mock_market_cls,
+            patch("services.scheduler.invalidate_market_cache") as mock_invalidate,
+        ):
+            mock_market_cls.find_all.return_value = [_make_mock_market()]
+            from services.scheduler import update_market_data
+            update_market_data()
+
+        mock_invalidate.assert_called_once()
+
     def test_returns_false_when_get_db_raises(self):
         """If get_db() raises (no connection), function returns False."""
         with patch(self._GET_DB_PATH, side_effect=ConnectionError("no db")):
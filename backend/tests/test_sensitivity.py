@@ -0,0 +1,90 @@
+# backend/tests/test_sensitivity.py
+"""
+Tests for the sensitivity grid (services/analysis/sensitivity.py).
+
+Covers agreement with the scalar FinancialMetrics path at every grid point,
+the layout of swept and fixed axes, per-metric dimensions and the grid
+limits.
+"""
+
+import itertools
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.analysis import sensitivity
+from services.analysis.financial_metrics import FinancialMetrics
+from services.analysis.sensitivity import sensitivity_grid
+
+
+def _axes(**overrides):
+    axes = {
+        "down_payment_percentage": [0.2],
+        "interest_rate": [0.045],
+        "term_years": [30],
+        "holding_period": [5],
+        "appreciation_rate": [0.03],
+    }
+    axes.update(overrides)
+    return axes
+
+
+class TestSensitivityGrid:
+
+    def test_every_cell_matches_scalar_analysis(self, default_market_data):
+        prop = SimpleNamespace(price=350_000)
+        axes = _axes(
+            down_payment_percentage=[0.1, 0.25],
+            interest_rate=[0.0, 0.055, 0.07],
+            term_years=[15, 30],
+            holding_period=[3, 10],
+        )
+        grid = sensitivity_grid(prop, default_market_data, axes,
+                                ["monthly_cash_flow", "cash_on_cash_return", "annualized_roi"])
+        metrics = FinancialMetrics(prop, default_market_data)
+
+        for i, j, k, h in itertools.product(range(2), range(3), range(2), range(2)):
+            expected = metrics.analyze_property(
+                down_payment_percentage=axes["down_payment_percentage"][i],
+                interest_rate=axes["interest_rate"][j],
+                term_years=axes["term_years"][k],
+                holding_period=axes["holding_period"][h],
+                appreciation_rate=0.03,
+            )
+            assert grid["metrics"]["monthly_cash_flow"]["values"][i][j][k] == expected["monthly_cash_flow"]
+            assert grid["metrics"]["cash_on_cash_return"]["values"][i][j][k] == expected["cash_on_cash_return"]
+            assert grid["metrics"]["annualized_roi"]["values"][i][j][k][h] == expected["roi"]["annualized_roi"]
+
+    def test_fixed_axes_are_squeezed(self, default_market_data):
+        grid = sensitivity_grid(SimpleNamespace(price=300_000), default_market_data,
+                                _axes(interest_rate=[0.05, 0.06, 0.07]))
+
+        assert list(grid["axes"]) == ["interest_rate"]
+        assert grid["fixed"]["term_years"] == 30
+        assert grid["points"] == 3
+        assert grid["metrics"]["monthly_cash_flow"]["dimensions"] == ["interest_rate"]
+        assert len(grid["metrics"]["monthly_cash_flow"]["values"]) == 3
+
+    def test_metric_ignores_axes_it_does_not_depend_on(self, default_market_data):
+        grid = sensitivity_grid(SimpleNamespace(price=300_000), default_market_data,
+                                _axes(appreciation_rate=[0.0, 0.05]),
+                                ["mortgage_payment", "total_roi"])
+
+        assert grid["metrics"]["mortgage_payment"]["dimensions"] == []
+        assert isinstance(grid["metrics"]["mortgage_payment"]["values"], float)
+        roi = grid["metrics"]["total_roi"]["values"]
+        assert roi[1] > roi[0]
+
+    def test_unknown_metric_raises(self, default_market_data):
+        with pytest.raises(ValueError):
+            sensitivity_grid(SimpleNamespace(price=300_000), default_market_data, _axes(), ["irr"])
+
+    def test_point_limit(self, default_market_data, monkeypatch):
+        monkeypatch.setattr(sensitivity, "MAX_SENSITIVITY_POINTS", 5)
+        with pytest.raises(ValueError):
+            sensitivity_grid(SimpleNamespace(price=300_000), default_market_data,
+                             _axes(interest_rate=[0.05, 0.06, 0.07], term_years=[15, 30]))
@@ -10,6 +10,8 @@ analyze_tax_benefits orchestration method.
 import sys
 import os
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from services.analysis.tax_benefits import TaxBenefits
@@ -444,3 +446,80 @@ class TestAnalyzeTaxBenefits:
         result_30 = tb.analyze_tax_benefits(term_years=30)
         result_15 = tb.analyze_tax_benefits(term_years=15)
         assert result_30["mortgage_interest_deduction"] != result_15["mortgage_interest_deduction"]
+
+
+# ---------------------------------------------------------------------------
+# project_tax_benefits
+# ---------------------------------------------------------------------------
+
+
+class TestProjectTaxBenefits:
+    """Tests for TaxBenefits.project_tax_benefits (multi-year table)."""
+
+    def test_returns_one_row_per_year(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        result = tb.project_tax_benefits(years=10)
+        assert result["years"] == 10
+        assert [row["year"] for row in result["schedule"]] == list(range(1, 11))
+
+    def test_years_clamped_to_thirty(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        assert len(tb.project_tax_benefits(years=50)["schedule"]) == 30
+        assert len(tb.project_tax_benefits(years=0)["schedule"]) == 1
+
+    def test_first_year_matches_single_year_analysis(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        single = tb.analyze_tax_benefits(tax_bracket=0.24, interest_rate=0.06)
+        first = tb.project_tax_benefits(tax_bracket=0.24, interest_rate=0.06)["schedule"][0]
+        assert first["depreciation"] == single["depreciation"]["annual_depreciation"]
+        assert first["mortgage_interest"] == single["mortgage_interest_deduction"]
+        assert first["property_tax"] == single["property_tax_deduction"]
+        assert first["tax_savings"] == single["estimated_tax_savings"]
+
+    def test_interest_matches_loop_every_year(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        loan = mock_property.price * 0.80
+        monthly_rate = 0.045 / 12
+        payment = loan * (monthly_rate * (1 + monthly_rate) ** 360) / ((1 + monthly_rate) ** 360 - 1)
+        balance, expected = loan, []
+        for _ in range(30):
+            year_interest = 0.0
+            for _ in range(12):
+                year_interest += balance * monthly_rate
+                balance -= payment - balance * monthly_rate
+            expected.append(year_interest)
+
+        schedule = tb.project_tax_benefits()["schedule"]
+
+        for row, year_interest in zip(schedule, expected):
+            assert row["mortgage_interest"] == pytest.approx(year_interest, abs=0.01)
+
+    def test_interest_stops_after_loan_term(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        schedule = tb.project_tax_benefits(years=20, term_years=15)["schedule"]
+        assert schedule[14]["mortgage_interest"] > 0
+        assert all(row["mortgage_interest"] == 0 for row in schedule[15:])
+
+    def test_depreciation_ends_after_27_and_a_half_years(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        schedule = tb.project_tax_benefits()["schedule"]
+        annual = schedule[0]["depreciation"]
+        assert schedule[27]["depreciation"] == pytest.approx(annual / 2, abs=0.01)
+        assert schedule[28]["depreciation"] == 0
+        total = sum(row["depreciation"] for row in schedule)
+        assert total == pytest.approx(mock_property.price * 0.8, abs=0.1)
+
+    def test_property_tax_grows(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        schedule = tb.project_tax_benefits(years=3, property_tax_growth=0.10)["schedule"]
+        base = schedule[0]["property_tax"]
+        assert schedule[2]["property_tax"] == pytest.approx(base * 1.21, abs=0.01)
+
+    def test_cumulative_savings_is_running_total(self, mock_property, default_market_data):
+        tb = _make_tax_benefits(mock_property, default_market_data)
+        result = tb.project_tax_benefits(years=5)
+        running = 0.0
+        for row in result["schedule"]:
+            running += row["tax_savings"]
+            assert row["cumulative_tax_savings"] == pytest.approx(running, abs=0.05)
+        assert result["total_tax_savings"] == result["schedule"][-1]["cumulative_tax_savings"]
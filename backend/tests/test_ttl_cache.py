@@ -0,0 +1,87 @@
+"""Tests for the LRU + TTL cache in backend/utils/ttl_cache.py."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.ttl_cache import MISSING, TTLCache  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+
+    def test_get_returns_missing_for_absent_key(self):
+        assert TTLCache().get("nope") is MISSING
+
+    def test_get_returns_default_when_given(self):
+        assert TTLCache().get("nope", default=7) == 7
+
+    def test_round_trip_including_none(self):
+        cache = TTLCache()
+        cache.set("a", None)
+        assert cache.get("a") is None
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, timer=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is MISSING
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_set_refreshes_expiry(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, timer=clock)
+        cache.set("a", 1)
+        clock.now = 8
+        cache.set("a", 2)
+        clock.now = 15
+        assert cache.get("a") == 2
+
+    def test_pop_and_clear(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", default="gone") == "gone"
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_stats_count_hits_and_misses(self):
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_rejects_zero_maxsize(self):
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
@@ -0,0 +1,153 @@
+"""Tests for the Zillow HTML parsing backends (services/data_collection/zillow_parser.py)
+and the scraper's parse process pool.
+
+Backends that are not installed are skipped; ``html.parser`` always runs and
+is the reference the others must match.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.data_collection import zillow_parser  # noqa: E402
+from services.data_collection.zillow_parser import (  # noqa: E402
+    PARSER_BACKENDS,
+    available_backends,
+    extract_listing_urls,
+    parse_detail,
+    resolve_backend,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SEARCH_HTML = (FIXTURES / "zillow_search.html").read_text()
+DETAIL_HTML = (FIXTURES / "zillow_detail.html").read_text()
+DETAIL_URL = "https://www.zillow.com/homedetails/20480000_zpid/"
+
+
+def _backend(name):
+    if name not in available_backends():
+        pytest.skip(f"{name} is not installed")
+    return name
+
+
+class TestReferenceParse:
+
+    def test_listing_urls_skip_relative_and_missing_links(self):
+        urls = extract_listing_urls(SEARCH_HTML)
+
+        assert len(urls) == 38
+        assert all(url.startswith("https://www.zillow.com/homedetails/") for url in urls)
+
+    def test_detail_fields(self):
+        result = parse_detail(DETAIL_HTML, DETAIL_URL)
+
+        assert result["address"] == "4217 Wallingford Ave N, Seattle, WA 98103"
+        assert result["price"] == 689000
+        assert (result["bedrooms"], result["bathrooms"], result["sqft"]) == (3, 1.5, 1680)
+        assert result["listing_url"] == DETAIL_URL
+
+    def test_missing_elements_use_defaults(self):
+        result = parse_detail("<html><body><div data-testid='bed-bath-beyond'>"
+                              "<span></span></div></body></html>", DETAIL_URL)
+
+        assert result["address"] == "Unknown Address"
+        assert (result["price"], result["bedrooms"], result["sqft"]) == (0, 0, 0)
+
+    def test_bytes_input(self):
+        assert parse_detail(DETAIL_HTML.encode(), DETAIL_URL) == parse_detail(
+            DETAIL_HTML, DETAIL_URL
+        )
+
+
+@pytest.mark.parametrize("name", [b for b in PARSER_BACKENDS if b != "html.parser"])
+class TestBackendParity:
+
+    def test_listing_urls_match_reference(self, name):
+        assert extract_listing_urls(SEARCH_HTML, _backend(name)) == extract_listing_urls(
+            SEARCH_HTML
+        )
+
+    def test_detail_matches_reference(self, name):
+        assert parse_detail(DETAIL_HTML, DETAIL_URL, _backend(name)) == parse_detail(
+            DETAIL_HTML, DETAIL_URL
+        )
+
+
+class TestResolveBackend:
+
+    def test_auto_prefers_fastest_installed(self):
+        with patch.object(zillow_parser, "available_backends",
+                          return_value=["html.parser", "lxml"]):
+            assert resolve_backend("auto") == "lxml"
+        with patch.object(zillow_parser, "available_backends",
+                          return_value=["html.parser"]):
+            assert resolve_backend("auto") == "html.parser"
+
+    def test_missing_backend_falls_back(self):
+        with patch.object(zillow_parser, "available_backends",
+                          return_value=["html.parser"]):
+            assert resolve_backend("selectolax") == "html.parser"
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="Unknown HTML parser"):
+            resolve_backend("regex")
+
+
+class TestParsePool:
+    # Imported per test: other modules purge ``services`` from sys.modules,
+    # and the pool pickles parse functions by their current module path.
+
+    def test_search_parses_in_process_pool(self):
+        from services.data_collection.zillow_scraper import ZillowScraper
+
+        scraper = ZillowScraper(parse_workers=1, requests_per_second=0)
+
+        async def fetch_detail_html(session, url, slots=None):
+            return DETAIL_HTML
+
+        try:
+            with (
+                patch.object(scraper, "_fetch_page", new_callable=AsyncMock,
+                             return_value=SEARCH_HTML),
+                patch.object(scraper, "_get_text", side_effect=fetch_detail_html),
+                patch("aiohttp.ClientSession") as session_cls,
+            ):
+                session_cls.return_value.__aenter__ = AsyncMock()
+                session_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+                result = asyncio.run(scraper.search_properties("Seattle", "WA", max_pages=1))
+
+            assert scraper._parse_pool is not None
+        finally:
+            scraper.close()
+
+        assert len(result) == 38
+        assert {p.price for p in result} == {689000}
+        assert scraper._parse_pool is None
+
+    def test_spawned_workers_do_not_build_the_app(self):
+        # Spawn children of ``python app.py`` re-run it as ``__mp_main__``.
+        import runpy
+
+        app_path = Path(__file__).parent.parent / "app.py"
+        namespace = runpy.run_path(str(app_path), run_name="__mp_main__")
+
+        assert "create_app" in namespace
+        assert "app" not in namespace and "limiter" not in namespace
+
+    def test_zero_workers_parse_inline(self):
+        from services.data_collection.zillow_scraper import ZillowScraper
+
+        scraper = ZillowScraper(parse_workers=0)
+
+        result = asyncio.run(scraper._parse(parse_detail, DETAIL_HTML, DETAIL_URL))
+
+        assert result["price"] == 689000
+        assert scraper._parse_pool is None
@@ -0,0 +1,91 @@
+"""Async MongoDB handle for the ASGI entry point (``asgi.py``).
+
+The Flask app keeps using the blocking client in ``utils.database``.  The
+ASGI handlers use one async client per process instead.  Its connection pool
+(``ASYNC_MONGODB_MAX_POOL_SIZE``, default 100) is shared by every in-flight
+request, so concurrency grows with the pool, not with the worker count.
+
+Motor (``motor.motor_asyncio.AsyncIOMotorClient``) is used when installed.
+Otherwise PyMongo's own ``AsyncMongoClient`` (PyMongo 4.9+) is used.  Both
+support the calls made here: ``find_one``, ``count_documents``,
+``estimated_document_count`` and chained ``find(...)`` cursors with
+``to_list``.  ``aggregate`` differs between them and goes through
+:func:`aggregate_to_list`.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+from typing import Any
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient as AsyncClient
+except ImportError:
+    from pymongo import AsyncMongoClient as AsyncClient
+
+from utils.database import DEFAULT_HEARTBEAT_FREQUENCY_MS, _heartbeat_ms, _parse_db_name
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASYNC_MAX_POOL_SIZE = 100
+
+_client = None
+_db = None
+
+
+def init_async_db(config) -> Any:
+    """Create the process's async client from a Flask-style config mapping.
+
+    The client connects lazily on first use.  Returns the database handle,
+    or None when ``MONGODB_URI`` is not configured.
+    """
+    global _client, _db
+    uri = config.get('MONGODB_URI')
+    if not uri:
+        logger.warning("MONGODB_URI not configured. Async handlers have no database.")
+        return None
+    _client = AsyncClient(
+        uri,
+        serverSelectionTimeoutMS=5000,
+        connectTimeoutMS=5000,
+        socketTimeoutMS=10000,
+        maxPoolSize=int(config.get('ASYNC_MONGODB_MAX_POOL_SIZE', DEFAULT_ASYNC_MAX_POOL_SIZE)),
+        retryWrites=True,
+        retryReads=True,
+        appname='real-estate-analyzer-asgi',
+        heartbeatFrequencyMS=_heartbeat_ms(
+            config.get('MONGODB_HEARTBEAT_FREQUENCY_MS', DEFAULT_HEARTBEAT_FREQUENCY_MS)
+        ),
+    )
+    _db = _client[_parse_db_name(uri)]
+    logger.info("Async MongoDB client initialised (%s)", type(_client).__name__)
+    return _db
+
+
+def get_async_db():
+    """Return the async database handle, or None before ``init_async_db``."""
+    return _db
+
+
+async def close_async_db() -> None:
+    """Close the async client; Motor closes synchronously, PyMongo awaits."""
+    global _client, _db
+    if _client is not None:
+        result = _client.close()
+        if inspect.isawaitable(result):
+            await result
+    _client = None
+    _db = None
+
+
+async def aggregate_to_list(collection, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Run *pipeline* and return every result document.
+
+    Motor's ``aggregate`` returns a cursor directly while PyMongo's async API
+    returns a coroutine resolving to one.
+    """
+    cursor = collection.aggregate(pipeline)
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+    return await cursor.to_list(length=None)
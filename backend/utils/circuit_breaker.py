@@ -7,7 +7,8 @@ OPEN     - Circuit is tripped. Requests are immediately rejected to allow the
            downstream service time to recover.
 HALF_OPEN - A single probe request is allowed through to test recovery. If it
             succeeds, the circuit closes; if it fails, the circuit re-opens and
-            the recovery timeout resets.
+            the recovery timeout resets.  While the probe is in flight every
+            other caller - thread or coroutine - is rejected as if OPEN.
 
 Usage example::
 
@@ -20,11 +21,32 @@ Usage example::
     except CircuitOpenError:
         logger.warning("Circuit open; skipping request to Zillow")
         result = None
+
+Coroutines use :meth:`CircuitBreaker.call_async`, ``async with breaker:``
+around the protected block, or the breaker as a decorator::
+
+    @breaker
+    async def fetch(url):
+        ...
+
+:class:`CircuitBreakerRegistry` hands out one independent breaker per
+endpoint, so a failing endpoint does not block healthy ones.
+
+By default a breaker's state lives in the process.  Pass a shared *store*
+(see :mod:`utils.circuit_store`) to keep it in Redis, so every process
+using the same breaker name sees the same circuit.  If the store is
+unreachable the breaker falls back to its local state.  ``async with`` and
+:meth:`CircuitBreaker.call_async` run the store's blocking calls on a worker
+thread so they never stall the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import logging
+import threading
 import time
 from enum import Enum
 from typing import Any, Callable
@@ -42,6 +64,10 @@ class CircuitOpenError(Exception):
     """Raised when a call is attempted while the circuit breaker is OPEN."""
 
 
+class CircuitStoreUnavailable(Exception):
+    """Raised by a shared state store that cannot be reached."""
+
+
 class CircuitBreaker:
     """A simple, thread-safe circuit breaker.
 
@@ -58,6 +84,10 @@ class CircuitBreaker:
     expected_exception:
         The exception type (or tuple of types) that counts as a failure.
         Defaults to ``Exception`` (all exceptions).
+    store:
+        Optional shared state store, such as
+        :class:`~utils.circuit_store.RedisCircuitStore`, keyed by *name*.
+        The fields below are used while it is unavailable.
     """
 
     def __init__(
@@ -66,15 +96,21 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 300.0,
         expected_exception: type | tuple[type, ...] = Exception,
+        store: Any = None,
     ) -> None:
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
+        self.store = store
 
         self._state: CircuitState = CircuitState.CLOSED
         self._failure_count: int = 0
         self._opened_at: float | None = None
+        self._probing: bool = False
+        # Guards the fields above.  Never held across an await, so it is
+        # safe to take from coroutines as well as threads.
+        self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public interface
@@ -84,17 +120,13 @@ class CircuitBreaker:
     def state(self) -> CircuitState:
         """Return the current state, transitioning OPEN -> HALF_OPEN when
         the recovery timeout has elapsed."""
-        if (
-            self._state is CircuitState.OPEN
-            and self._opened_at is not None
-            and (time.monotonic() - self._opened_at) >= self.recovery_timeout
-        ):
-            logger.info(
-                "CircuitBreaker[%s]: recovery timeout elapsed; transitioning OPEN -> HALF_OPEN",
-                self.name,
-            )
-            self._state = CircuitState.HALF_OPEN
-        return self._state
+        if self.store is not None:
+            try:
+                return self.store.state(self.name, self.recovery_timeout)
+            except CircuitStoreUnavailable:
+                pass
+        with self._lock:
+            return self._current_state()
 
     def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """Invoke *func* with *args*/*kwargs*, applying circuit breaker logic.
@@ -115,71 +147,216 @@ class CircuitBreaker:
         ------
         CircuitOpenError
             When the circuit is OPEN and the recovery timeout has not yet
-            elapsed.
+            elapsed, or HALF_OPEN with a probe already in flight.
         Exception
             Any exception raised by *func* that matches ``expected_exception``
             is re-raised after recording the failure.  Other exceptions are
             re-raised immediately without incrementing the failure counter.
         """
-        current_state = self.state  # Triggers OPEN -> HALF_OPEN transition check.
+        with self:
+            return func(*args, **kwargs)
 
-        if current_state is CircuitState.OPEN:
-            raise CircuitOpenError(
-                f"CircuitBreaker[{self.name}] is OPEN; call rejected. "
-                f"Recovery in {self._seconds_until_recovery():.0f}s."
-            )
+    async def call_async(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Await ``func(*args, **kwargs)``, applying circuit breaker logic.
 
-        try:
-            result = func(*args, **kwargs)
-            self._on_success()
-            return result
-        except self.expected_exception as exc:
-            self._on_failure()
-            raise exc
+        The coroutine counterpart of :meth:`call`, with the same return
+        value and exceptions.  A cancelled call is not counted either way;
+        if it was the HALF_OPEN probe, the next caller probes instead.
+        """
+        async with self:
+            return await func(*args, **kwargs)
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate *func* (sync or ``async def``) so every call goes
+        through this breaker."""
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await self.call_async(func, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(func, *args, **kwargs)
+        return wrapper
+
+    # ``with breaker:`` / ``async with breaker:`` protect a block: entering
+    # raises CircuitOpenError when the call is rejected; leaving records a
+    # success, or a failure for an ``expected_exception``.
+
+    def __enter__(self) -> CircuitBreaker:
+        self._admit()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._record(exc)
+        return False
+
+    # The local state is only touched under a lock that is never held for
+    # long, but a store call is a network round trip, so with a store the
+    # coroutine forms hand it to a worker thread.  If the awaiting task is
+    # cancelled while admission runs, a probe it claimed is released by the
+    # store's probe lease.
+
+    async def __aenter__(self) -> CircuitBreaker:
+        if self.store is None:
+            self._admit()
+        else:
+            await asyncio.to_thread(self._admit)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self.store is None:
+            self._record(exc)
+        else:
+            await asyncio.to_thread(self._record, exc)
+        return False
 
     # ------------------------------------------------------------------
     # State transitions
     # ------------------------------------------------------------------
 
-    def _on_success(self) -> None:
-        if self._state is CircuitState.HALF_OPEN:
+    def _current_state(self) -> CircuitState:
+        # Caller holds the lock.
+        if (
+            self._state is CircuitState.OPEN
+            and self._opened_at is not None
+            and (time.monotonic() - self._opened_at) >= self.recovery_timeout
+        ):
             logger.info(
-                "CircuitBreaker[%s]: probe succeeded; transitioning HALF_OPEN -> CLOSED",
-                self.name,
-            )
-        elif self._failure_count > 0:
-            logger.debug(
-                "CircuitBreaker[%s]: success; resetting failure count from %d",
+                "CircuitBreaker[%s]: recovery timeout elapsed; transitioning OPEN -> HALF_OPEN",
                 self.name,
-                self._failure_count,
             )
-        self._failure_count = 0
-        self._opened_at = None
-        self._state = CircuitState.CLOSED
+            self._state = CircuitState.HALF_OPEN
+        return self._state
 
-    def _on_failure(self) -> None:
-        self._failure_count += 1
-        logger.warning(
-            "CircuitBreaker[%s]: failure recorded (%d/%d)",
-            self.name,
-            self._failure_count,
-            self.failure_threshold,
-        )
+    def _admit(self) -> None:
+        """Let one call through, or raise :class:`CircuitOpenError`."""
+        if self.store is not None:
+            try:
+                state, admitted, remaining = self.store.admit(self.name, self.recovery_timeout)
+            except CircuitStoreUnavailable:
+                pass
+            else:
+                if admitted:
+                    return
+                if state is CircuitState.OPEN:
+                    raise CircuitOpenError(
+                        f"CircuitBreaker[{self.name}] is OPEN; call rejected. "
+                        f"Recovery in {remaining:.0f}s."
+                    )
+                raise CircuitOpenError(
+                    f"CircuitBreaker[{self.name}] is HALF_OPEN with a probe "
+                    "in flight; call rejected."
+                )
+        with self._lock:
+            current_state = self._current_state()
+            if current_state is CircuitState.OPEN:
+                raise CircuitOpenError(
+                    f"CircuitBreaker[{self.name}] is OPEN; call rejected. "
+                    f"Recovery in {self._seconds_until_recovery():.0f}s."
+                )
+            if current_state is CircuitState.HALF_OPEN:
+                if self._probing:
+                    raise CircuitOpenError(
+                        f"CircuitBreaker[{self.name}] is HALF_OPEN with a probe "
+                        "in flight; call rejected."
+                    )
+                self._probing = True
+
+    def _record(self, exc: BaseException | None) -> None:
+        """Record the outcome of an admitted call that raised *exc* (or None)."""
+        if exc is None:
+            self._on_success()
+        elif isinstance(exc, self.expected_exception):
+            self._on_failure()
+        else:
+            # Neither outcome (including cancellation): free the probe slot.
+            if self.store is not None:
+                try:
+                    self.store.release_probe(self.name)
+                    return
+                except CircuitStoreUnavailable:
+                    pass
+            with self._lock:
+                self._probing = False
+
+    def _on_success(self) -> None:
+        if self.store is not None:
+            try:
+                previous = self.store.record_success(self.name)
+            except CircuitStoreUnavailable:
+                pass
+            else:
+                if previous is CircuitState.HALF_OPEN:
+                    logger.info(
+                        "CircuitBreaker[%s]: probe succeeded; transitioning HALF_OPEN -> CLOSED",
+                        self.name,
+                    )
+                return
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                logger.info(
+                    "CircuitBreaker[%s]: probe succeeded; transitioning HALF_OPEN -> CLOSED",
+                    self.name,
+                )
+            elif self._failure_count > 0:
+                logger.debug(
+                    "CircuitBreaker[%s]: success; resetting failure count from %d",
+                    self.name,
+                    self._failure_count,
+                )
+            self._failure_count = 0
+            self._opened_at = None
+            self._probing = False
+            self._state = CircuitState.CLOSED
 
-        if self._state is CircuitState.HALF_OPEN:
-            # Probe failed — re-open immediately and restart the timeout.
+    def _on_failure(self) -> None:
+        if self.store is not None:
+            try:
+                previous, state, failures = self.store.record_failure(
+                    self.name, self.failure_threshold
+                )
+            except CircuitStoreUnavailable:
+                pass
+            else:
+                logger.warning(
+                    "CircuitBreaker[%s]: failure recorded (%d/%d)",
+                    self.name,
+                    failures,
+                    self.failure_threshold,
+                )
+                if state is CircuitState.OPEN and previous is not CircuitState.OPEN:
+                    logger.error(
+                        "CircuitBreaker[%s]: transitioning %s -> OPEN",
+                        self.name,
+                        previous.value,
+                    )
+                return
+        with self._lock:
+            self._failure_count += 1
+            self._probing = False
             logger.warning(
-                "CircuitBreaker[%s]: probe failed; transitioning HALF_OPEN -> OPEN",
-                self.name,
-            )
-            self._trip()
-        elif self._failure_count >= self.failure_threshold:
-            logger.error(
-                "CircuitBreaker[%s]: failure threshold reached (%d); transitioning CLOSED -> OPEN",
+                "CircuitBreaker[%s]: failure recorded (%d/%d)",
                 self.name,
+                self._failure_count,
                 self.failure_threshold,
             )
-            self._trip()
+
+            if self._state is CircuitState.HALF_OPEN:
+                # Probe failed — re-open immediately and restart the timeout.
+                logger.warning(
+                    "CircuitBreaker[%s]: probe failed; transitioning HALF_OPEN -> OPEN",
+                    self.name,
+                )
+                self._trip()
+            elif self._failure_count >= self.failure_threshold:
+                logger.error(
+                    "CircuitBreaker[%s]: failure threshold reached (%d); transitioning CLOSED -> OPEN",
+                    self.name,
+                    self.failure_threshold,
+                )
+                self._trip()
 
     def _trip(self) -> None:
         self._state = CircuitState.OPEN
@@ -200,9 +377,16 @@ class CircuitBreaker:
 
         Useful in tests or after a confirmed recovery.
         """
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._opened_at = None
+        if self.store is not None:
+            try:
+                self.store.reset(self.name)
+            except CircuitStoreUnavailable:
+                pass
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failure_count = 0
+            self._opened_at = None
+            self._probing = False
         logger.info("CircuitBreaker[%s]: manually reset to CLOSED", self.name)
 
     def __repr__(self) -> str:
@@ -210,3 +394,48 @@ class CircuitBreaker:
             f"CircuitBreaker(name={self.name!r}, state={self._state.value}, "
             f"failures={self._failure_count}/{self.failure_threshold})"
         )
+
+
+class CircuitBreakerRegistry:
+    """Independent circuit breakers, one per endpoint key.
+
+    Breakers are created on first use with the settings given here and
+    named ``"<name>:<key>"``.
+
+    Parameters
+    ----------
+    name:
+        Prefix for the breakers' names.
+    **settings:
+        Keyword arguments for each :class:`CircuitBreaker`
+        (``failure_threshold``, ``recovery_timeout``, ``expected_exception``,
+        ``store``).
+    """
+
+    def __init__(self, name: str = "circuit_breaker", **settings: Any) -> None:
+        self.name = name
+        self._settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Return the breaker for *key*, creating it if needed."""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(name=f"{self.name}:{key}", **self._settings)
+                self._breakers[key] = breaker
+            return breaker
+
+    def states(self) -> dict[str, CircuitState]:
+        """Current state of every breaker created so far, by key."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.state for key, breaker in breakers.items()}
+
+    def reset(self) -> None:
+        """Reset every breaker to CLOSED."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        for breaker in breakers:
+            breaker.reset()
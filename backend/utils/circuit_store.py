@@ -0,0 +1,216 @@
+"""Redis-backed circuit breaker state shared across processes.
+
+Every gunicorn worker and the scheduler build their own
+:class:`~utils.circuit_breaker.CircuitBreaker` objects.  With a
+:class:`RedisCircuitStore` they read and write one Redis hash per breaker
+name instead of their own in-memory fields.  A failure seen by any process
+then counts towards the same threshold, and an open circuit stops every
+process at once.
+
+Each breaker's hash (``circuit:<name>``) holds ``state``, ``failures``,
+``opened_at`` (wall-clock seconds) and ``probe_until``.  Admission and
+failure recording are Lua scripts, so the OPEN -> HALF_OPEN transition, the
+HALF_OPEN probe claim and the CLOSED -> OPEN trip are atomic across
+processes.  A success deletes the hash (no hash means CLOSED).  The probe
+claim is a lease of ``probe_timeout`` seconds.  If the process holding the
+probe dies, another process may probe once the lease runs out.
+
+When Redis cannot be reached, the store raises
+:class:`~utils.circuit_breaker.CircuitStoreUnavailable` and the breaker
+uses its local state instead.  Redis is then skipped for ``retry_interval``
+seconds before the next attempt.
+
+:func:`get_circuit_store` returns the process-wide store, or None when
+``CIRCUIT_BREAKER_REDIS_URL`` (default ``REDIS_URL``) is not set.
+
+The default test suite mocks the Redis client, so the Lua scripts are only
+executed by ``TestLuaScripts`` in ``tests/test_circuit_store.py``, which
+needs a Redis at ``CIRCUIT_STORE_TEST_REDIS_URL`` and is skipped otherwise.
+Run it against a throwaway Redis after changing a script.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+
+from utils.circuit_breaker import CircuitState, CircuitStoreUnavailable
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_REDIS_URL = os.getenv("CIRCUIT_BREAKER_REDIS_URL", os.getenv("REDIS_URL", ""))
+
+# Breakers sit on the request path, so a slow Redis must fail fast.
+_SOCKET_TIMEOUT_SECONDS = 0.5
+
+_ADMIT = """
+local now = tonumber(ARGV[1])
+local fields = redis.call('HMGET', KEYS[1], 'state', 'opened_at', 'probe_until')
+local state = fields[1] or 'CLOSED'
+if state == 'OPEN' then
+  local remaining = (tonumber(fields[2]) or 0) + tonumber(ARGV[2]) - now
+  if remaining > 0 then
+    return {state, '0', tostring(remaining)}
+  end
+  state = 'HALF_OPEN'
+  redis.call('HSET', KEYS[1], 'state', state)
+end
+if state == 'HALF_OPEN' then
+  if (tonumber(fields[3]) or 0) > now then
+    return {state, '0', '0'}
+  end
+  redis.call('HSET', KEYS[1], 'probe_until', tostring(now + tonumber(ARGV[3])))
+end
+return {state, '1', '0'}
+"""
+
+_FAILURE = """
+local failures = redis.call('HINCRBY', KEYS[1], 'failures', 1)
+local previous = redis.call('HGET', KEYS[1], 'state') or 'CLOSED'
+local state = previous
+if previous == 'HALF_OPEN' or failures >= tonumber(ARGV[2]) then
+  state = 'OPEN'
+  redis.call('HSET', KEYS[1], 'state', state, 'opened_at', ARGV[1], 'probe_until', '0')
+else
+  redis.call('HSET', KEYS[1], 'state', state)
+end
+return {previous, state, tostring(failures)}
+"""
+
+
+class RedisCircuitStore:
+    """Circuit breaker state kept in Redis.
+
+    Parameters
+    ----------
+    client:
+        A ``redis.Redis`` client created with ``decode_responses=True``.
+    prefix:
+        Key prefix; a breaker's hash is ``<prefix><name>``.
+    probe_timeout:
+        Seconds a HALF_OPEN probe claim lasts.  Defaults to 60.
+    retry_interval:
+        Seconds to use local state after a Redis error before trying Redis
+        again.  Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix: str = "circuit:",
+        probe_timeout: float = 60.0,
+        retry_interval: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.probe_timeout = probe_timeout
+        self.retry_interval = retry_interval
+        self._admit_script = client.register_script(_ADMIT)
+        self._failure_script = client.register_script(_FAILURE)
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Operations (called by CircuitBreaker)
+    # ------------------------------------------------------------------
+
+    def admit(self, name: str, recovery_timeout: float) -> tuple[CircuitState, bool, float]:
+        """Claim a call for *name*.
+
+        Returns ``(state, admitted, seconds until recovery)``.  In HALF_OPEN
+        only the caller that claims the probe is admitted.
+        """
+        state, admitted, remaining = self._run(
+            self._admit_script,
+            keys=[self.prefix + name],
+            args=[time.time(), recovery_timeout, self.probe_timeout],
+        )
+        return CircuitState(state), admitted == "1", float(remaining)
+
+    def record_success(self, name: str) -> CircuitState:
+        """Close *name*'s circuit; returns the state it was in."""
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hget(self.prefix + name, "state")
+        pipe.delete(self.prefix + name)
+        previous, _ = self._run(pipe.execute)
+        return CircuitState(previous or "CLOSED")
+
+    def record_failure(self, name: str, threshold: int) -> tuple[CircuitState, CircuitState, int]:
+        """Count a failure; returns ``(previous state, new state, failures)``."""
+        previous, state, failures = self._run(
+            self._failure_script,
+            keys=[self.prefix + name],
+            args=[time.time(), threshold],
+        )
+        return CircuitState(previous), CircuitState(state), int(failures)
+
+    def release_probe(self, name: str) -> None:
+        """Give up a HALF_OPEN probe claim without recording an outcome."""
+        self._run(self.client.hset, self.prefix + name, "probe_until", "0")
+
+    def state(self, name: str, recovery_timeout: float) -> CircuitState:
+        """*name*'s state, reporting HALF_OPEN once an OPEN circuit's
+        recovery timeout has passed."""
+        state, opened_at = self._run(self.client.hmget, self.prefix + name, "state", "opened_at")
+        state = CircuitState(state or "CLOSED")
+        if state is CircuitState.OPEN and time.time() - float(opened_at or 0) >= recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return state
+
+    def reset(self, name: str) -> None:
+        """Forget *name*'s state (CLOSED)."""
+        self._run(self.client.delete, self.prefix + name)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _run(self, func, *args, **kwargs):
+        if time.monotonic() < self._down_until:
+            raise CircuitStoreUnavailable("Redis circuit store is backing off")
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            with self._lock:
+                first = time.monotonic() >= self._down_until
+                self._down_until = time.monotonic() + self.retry_interval
+            if first:
+                logger.warning(
+                    "Redis unavailable for circuit breaker state, using local state "
+                    "for %.0fs: %s", self.retry_interval, exc,
+                )
+            raise CircuitStoreUnavailable(str(exc)) from exc
+
+
+# Sentinel values for the lazy store, as in utils/auth.py:
+#   None  -> not yet attempted
+#   False -> no URL configured or the client could not be created
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_circuit_store() -> RedisCircuitStore | None:
+    """Return the process-wide Redis store, or None when not configured."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = False
+            if CIRCUIT_BREAKER_REDIS_URL:
+                try:
+                    import redis  # imported lazily so redis is optional at startup
+
+                    client = redis.from_url(
+                        CIRCUIT_BREAKER_REDIS_URL,
+                        decode_responses=True,
+                        socket_timeout=_SOCKET_TIMEOUT_SECONDS,
+                        socket_connect_timeout=_SOCKET_TIMEOUT_SECONDS,
+                    )
+                    _store = RedisCircuitStore(client)
+                    logger.info("Circuit breaker state shared through Redis")
+                except Exception as exc:
+                    logger.warning(
+                        "Redis circuit store unavailable, using local state: %s", exc
+                    )
+    return _store if _store else None
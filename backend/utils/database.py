@@ -1,18 +1,131 @@
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
+from pymongo import MongoClient, monitoring
 from urllib.parse import urlparse
 import time
 import logging
 import threading
 
+from utils.indexes import ensure_indexes
+
+DEFAULT_HEARTBEAT_FREQUENCY_MS = 10000
+# pymongo rejects heartbeatFrequencyMS values below 500.
+MIN_HEARTBEAT_FREQUENCY_MS = 500
+# Missed heartbeats before the tracked state is considered stale.
+STALE_HEARTBEAT_MULTIPLIER = 3
+
 _db_client = None
 _db = None
 _db_lock = threading.Lock()
 _mongodb_uri = None
+_heartbeat_frequency_ms = DEFAULT_HEARTBEAT_FREQUENCY_MS
+_health = None
+_ensure_indexes = True
+# Set once ensure_indexes has run; reconnects in the same process skip it.
+_indexes_ensured = False
 
 logger = logging.getLogger(__name__)
 
 
+class ConnectionHealth(monitoring.ServerHeartbeatListener, monitoring.ServerListener):
+    """Track MongoDB reachability from pymongo's server monitoring events.
+
+    pymongo runs a monitor thread per server that sends a ``hello`` every
+    ``heartbeatFrequencyMS`` and immediately re-checks a server after an
+    operation fails against it.  Registering this listener on the client lets
+    the application read the latest outcome instead of pinging on every
+    request.
+
+    Parameters
+    ----------
+    heartbeat_frequency_ms:
+        The client's heartbeat interval.  The state is reported as stale when
+        no heartbeat has been seen for ``STALE_HEARTBEAT_MULTIPLIER`` intervals.
+    """
+
+    def __init__(self, heartbeat_frequency_ms=DEFAULT_HEARTBEAT_FREQUENCY_MS):
+        self.heartbeat_frequency_ms = heartbeat_frequency_ms
+        self._lock = threading.Lock()
+        self._servers = {}
+
+    # ------------------------------------------------------------ listeners
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event.connection_id, True, latency_ms=round(event.duration * 1000, 2))
+
+    def failed(self, event):
+        self._record(event.connection_id, False, detail=str(event.reply))
+
+    def opened(self, event):
+        pass
+
+    def description_changed(self, event):
+        # An operation failure marks the server Unknown before the monitor's
+        # next heartbeat; record it straight away.
+        # A failed heartbeat also produces this event, so only the transition
+        # from healthy is recorded to avoid counting the failure twice.
+        new = event.new_description
+        if not new.is_server_type_known and new.error is not None:
+            with self._lock:
+                was_ok = self._servers.get(event.server_address, {}).get('ok', True)
+            if was_ok:
+                self._record(event.server_address, False, detail=str(new.error))
+
+    def closed(self, event):
+        with self._lock:
+            self._servers.pop(event.server_address, None)
+
+    # -------------------------------------------------------------- state
+
+    def _record(self, address, ok, latency_ms=None, detail=None):
+        now = time.time()
+        with self._lock:
+            server = self._servers.setdefault(address, {'consecutive_failures': 0})
+            server['ok'] = ok
+            server['checked_at'] = now
+            if ok:
+                server['consecutive_failures'] = 0
+                server['last_success_at'] = now
+                server['latency_ms'] = latency_ms
+                server.pop('detail', None)
+            else:
+                server['consecutive_failures'] += 1
+                server['detail'] = detail
+
+    def snapshot(self):
+        """Return the tracked health state as a JSON-serialisable dict.
+
+        ``status`` is ``'ok'`` when at least one server answered its latest
+        heartbeat within the staleness window, ``'unknown'`` before the first
+        heartbeat and ``'error'`` otherwise.
+        """
+        now = time.time()
+        stale_after = self.heartbeat_frequency_ms * STALE_HEARTBEAT_MULTIPLIER / 1000
+        with self._lock:
+            servers = {
+                f'{host}:{port}': dict(state)
+                for (host, port), state in self._servers.items()
+            }
+
+        if not servers:
+            return {'status': 'unknown', 'detail': 'No heartbeat received yet', 'servers': {}}
+
+        for state in servers.values():
+            state['stale'] = now - state['checked_at'] > stale_after
+
+        healthy = [s for s in servers.values() if s['ok'] and not s['stale']]
+        result = {'status': 'ok' if healthy else 'error', 'servers': servers}
+        if healthy:
+            result['latency_ms'] = min(s['latency_ms'] for s in healthy)
+        else:
+            details = [s.get('detail') for s in servers.values() if s.get('detail')]
+            result['detail'] = details[0] if details else (
+                f'No heartbeat for over {int(stale_after)}s'
+            )
+        return result
+
+
 def _parse_db_name(uri):
     """Parse database name from MongoDB URI, handling query params."""
     parsed = urlparse(uri)
@@ -24,10 +137,11 @@ def _parse_db_name(uri):
 
 def _connect():
     """Establish MongoDB connection with retries and exponential backoff."""
-    global _db_client, _db
+    global _db_client, _db, _health, _indexes_ensured
     max_retries = 3
     for attempt in range(1, max_retries + 1):
         try:
+            health = ConnectionHealth(_heartbeat_frequency_ms)
             _db_client = MongoClient(
                 _mongodb_uri,
                 serverSelectionTimeoutMS=5000,
@@ -38,20 +152,17 @@ def _connect():
                 retryWrites=True,
                 retryReads=True,
                 appname='real-estate-analyzer',
+                heartbeatFrequencyMS=_heartbeat_frequency_ms,
+                event_listeners=[health],
             )
             _db_client.admin.command('ping')
             db_name = _parse_db_name(_mongodb_uri)
             _db = _db_client[db_name]
+            _health = health
 
-            # Create indexes
-            _db['properties'].create_index('listing_url', unique=True)
-            _db['properties'].create_index('state')
-            _db['properties'].create_index([('state', 1), ('city', 1)])
-            _db['properties'].create_index('zip_code')
-            _db['markets'].create_index('market_type')
-            _db['markets'].create_index('zip_code')
-            _db['markets'].create_index([('state', 1), ('city', 1)])
-            _db['users'].create_index('username', unique=True)
+            if _ensure_indexes and not _indexes_ensured:
+                ensure_indexes(_db)
+                _indexes_ensured = True
 
             logger.info("Successfully connected to MongoDB")
             return _db
@@ -63,9 +174,22 @@ def _connect():
             time.sleep(2 ** attempt)
 
 
+def _heartbeat_ms(value):
+    """Coerce a configured heartbeat interval, falling back to the default."""
+    try:
+        ms = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_HEARTBEAT_FREQUENCY_MS
+    return max(ms, MIN_HEARTBEAT_FREQUENCY_MS)
+
+
 def init_db(app):
-    global _mongodb_uri
+    global _mongodb_uri, _heartbeat_frequency_ms, _ensure_indexes
     _mongodb_uri = app.config.get('MONGODB_URI')
+    _ensure_indexes = bool(app.config.get('MONGODB_ENSURE_INDEXES', True))
+    _heartbeat_frequency_ms = _heartbeat_ms(
+        app.config.get('MONGODB_HEARTBEAT_FREQUENCY_MS', DEFAULT_HEARTBEAT_FREQUENCY_MS)
+    )
     if not _mongodb_uri:
         logger.warning("MONGODB_URI not configured. Starting without database.")
         return None
@@ -73,7 +197,12 @@ def init_db(app):
 
 
 def get_db():
-    global _db, _db_client
+    """Return the shared database handle, connecting on first use.
+
+    No liveness check is made here: pymongo's monitor threads track server
+    state in the background and retryable reads/writes cover a single
+    failover.  See :func:`get_connection_health` for the tracked state.
+    """
     if _db is None:
         with _db_lock:
             if _db is None:
@@ -83,23 +212,21 @@ def get_db():
                 if result is None:
                     raise ConnectionError("Cannot connect to MongoDB")
                 return result
-    # Verify connection is still alive
-    try:
-        _db_client.admin.command('ping')
-    except (ConnectionFailure, ServerSelectionTimeoutError, Exception):
-        logger.warning("Lost MongoDB connection. Attempting reconnect...")
-        with _db_lock:
-            result = _connect()
-            if result is None:
-                raise ConnectionError("Cannot reconnect to MongoDB")
-            return result
     return _db
 
 
+def get_connection_health():
+    """Return the MongoDB health state tracked by :class:`ConnectionHealth`."""
+    if _db is None or _health is None:
+        return {'status': 'error', 'detail': 'Database not initialized'}
+    return _health.snapshot()
+
+
 def close_db():
-    global _db_client, _db
+    global _db_client, _db, _health
     if _db_client:
         _db_client.close()
         _db_client = None
         _db = None
+        _health = None
         logger.info("Database connection closed")
@@ -0,0 +1,258 @@
+"""MongoDB index declarations, creation and query-plan checks.
+
+Every index the application relies on is declared in ``INDEXES`` and created
+by :func:`ensure_indexes`, which ``utils.database`` runs after connecting
+(unless ``MONGODB_ENSURE_INDEXES`` is off) and which can be run on its own::
+
+    python -m utils.indexes            # create missing indexes
+    python -m utils.indexes --check    # explain() the list query shapes
+
+``create_index`` is a no-op for an index that already exists with the same
+keys and options, so both are safe to repeat.
+
+Property list indexes
+---------------------
+``PropertyListResource`` combines equality filters (``state``, ``city``,
+``zip_code``, ``property_type``) with range filters (``price``,
+``bedrooms``, ``bathrooms``, ``score``) and sorts on ``(sortBy, _id)``.
+``LIST_QUERY_SHAPES`` lists the combinations the API is expected to serve
+from an index, and each becomes a compound index in ESR order: equality
+fields first, then the sort keys, then any remaining range fields.  With the
+equality fields pinned, the index is already in sort order, so there is no
+in-memory SORT; a range on the sort field becomes bounds on that key, and
+later range fields are filtered from index keys before documents are
+fetched.  The same indexes serve descending sorts by walking them backwards.
+
+:func:`explain_list_query` runs a list query through ``explain()`` and
+reports whether the winning plan contains a ``COLLSCAN`` or an in-memory
+``SORT``; :func:`check_list_queries` does that for every declared shape.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from typing import Any
+
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# (equality fields, sort field, extra range fields), in ESR order.
+LIST_QUERY_SHAPES = (
+    ((), 'price', ()),
+    (('state',), 'price', ()),
+    (('state', 'city'), 'price', ()),
+    (('zip_code',), 'price', ()),
+    (('property_type',), 'price', ('bedrooms',)),
+    (('state', 'property_type'), 'price', ('bedrooms',)),
+    ((), 'score', ()),
+    (('state',), 'score', ('price',)),
+    ((), 'created_at', ()),
+)
+
+
+def esr_index(equality: tuple[str, ...], sort_by: str,
+              ranges: tuple[str, ...] = ()) -> list[tuple[str, int]]:
+    """Build index keys for one list query shape in ESR order.
+
+    ``_id`` follows the sort field because list queries break ties on it.
+    """
+    keys = [(field, 1) for field in equality]
+    keys += [(sort_by, 1), ('_id', 1)]
+    keys += [(field, 1) for field in ranges if field != sort_by]
+    return keys
+
+
+# collection -> list of (keys, create_index options)
+INDEXES: dict[str, list[tuple[Any, dict[str, Any]]]] = {
+    'properties': [
+        ('listing_url', {'unique': True}),
+        ('state', {}),
+        ([('state', 1), ('city', 1)], {}),
+        ('zip_code', {}),
+        *((esr_index(*shape), {}) for shape in LIST_QUERY_SHAPES),
+    ],
+    'markets': [
+        ('market_type', {}),
+        ('zip_code', {}),
+        ([('state', 1), ('city', 1)], {}),
+    ],
+    'users': [
+        ('username', {'unique': True}),
+    ],
+    # services/job_queue.py: claim order, lapsed leases, de-duplication, and
+    # removal of finished jobs after a week.
+    'jobs': [
+        ([('status', 1), ('priority', -1), ('run_after', 1)], {}),
+        ([('status', 1), ('lease_until', 1)], {}),
+        # At most one queued or running job per dedupe key; JobQueue.enqueue
+        # relies on this to make its upsert race-free.
+        ([('dedupe_key', 1), ('live', 1)], {
+            'unique': True,
+            'partialFilterExpression': {'live': True, 'dedupe_key': {'$type': 'string'}},
+        }),
+        ('finished_at', {'expireAfterSeconds': 7 * 24 * 3600}),
+    ],
+    # Drops scheduler leases whose owner stopped renewing (utils/leader_lock.py).
+    'scheduler_locks': [
+        ('expires_at', {'expireAfterSeconds': 0}),
+    ],
+}
+
+
+def ensure_indexes(db) -> dict[str, Any]:
+    """Create every declared index that does not exist yet.
+
+    An index that cannot be built (for instance a unique index over
+    duplicate data, or a conflicting index with the same keys) is logged and
+    skipped so the remaining indexes are still created.
+
+    Returns
+    -------
+    dict
+        ``created`` (index names now present) and ``failed``
+        (``{index keys: error}``).
+    """
+    created, failed = [], {}
+    for collection_name, specs in INDEXES.items():
+        collection = db[collection_name]
+        for keys, options in specs:
+            try:
+                created.append(collection.create_index(keys, **options))
+            except OperationFailure as e:
+                label = f"{collection_name}.{keys}"
+                failed[label] = str(e)
+                logger.warning(f"Could not create index {label}: {e}")
+    return {'created': created, 'failed': failed}
+
+
+# ---------------------------------------------------------------------------
+# Query plan checks
+# ---------------------------------------------------------------------------
+
+def _plan_stages(plan: dict[str, Any]):
+    """Yield every stage of an explain plan tree, outermost first."""
+    # MongoDB 7+ nests the classic tree under ``queryPlan`` for SBE plans.
+    plan = plan.get('queryPlan', plan)
+    yield plan
+    if 'inputStage' in plan:
+        yield from _plan_stages(plan['inputStage'])
+    for child in plan.get('inputStages', ()):
+        yield from _plan_stages(child)
+
+
+def explain_list_query(db, filters: dict[str, Any], sort_by: str = 'price',
+                       sort_order: int = 1, limit: int = 50) -> dict[str, Any]:
+    """Explain a property list query and flag unindexed work.
+
+    The query is issued exactly as ``Property.find_all`` issues an offset
+    page: *filters*, sorted on ``(sort_by, _id)``, limited to *limit*.
+
+    Returns
+    -------
+    dict
+        ``stages`` (stage names, outermost first), ``indexes`` (indexes
+        scanned), and the ``collscan`` and ``in_memory_sort`` flags.
+    """
+    explanation = (
+        db['properties']
+        .find(filters)
+        .sort([(sort_by, sort_order), ('_id', sort_order)])
+        .limit(limit)
+        .explain()
+    )
+    winning = explanation.get('queryPlanner', {}).get('winningPlan', {})
+    stages = list(_plan_stages(winning))
+    names = [stage.get('stage') for stage in stages]
+    return {
+        'stages': names,
+        'indexes': [stage['indexName'] for stage in stages if 'indexName' in stage],
+        'collscan': 'COLLSCAN' in names,
+        'in_memory_sort': 'SORT' in names,
+    }
+
+
+def sample_filters(equality: tuple[str, ...], ranges: tuple[str, ...] = (),
+                   sort_by: str | None = None) -> dict[str, Any]:
+    """Build a filter of the shape ``parse_property_filters`` produces."""
+    filters: dict[str, Any] = {field: f'<{field}>' for field in equality}
+    for field in ranges:
+        filters[field] = {'$gte': 0}
+    if sort_by == 'price':
+        filters['price'] = {'$gte': 0, '$lte': 10 ** 9}
+    return filters
+
+
+def check_list_queries(db) -> list[dict[str, Any]]:
+    """Explain every ``LIST_QUERY_SHAPES`` query in both sort directions.
+
+    Returns one explain result per query, each with its ``filters``,
+    ``sort_by``, ``sort_order`` and an ``ok`` flag that is False when the
+    plan has a COLLSCAN or an in-memory SORT.
+    """
+    results = []
+    for equality, sort_by, ranges in LIST_QUERY_SHAPES:
+        filters = sample_filters(equality, ranges, sort_by)
+        for sort_order in (1, -1):
+            result = explain_list_query(db, filters, sort_by, sort_order)
+            result.update(
+                filters=filters, sort_by=sort_by, sort_order=sort_order,
+                ok=not (result['collscan'] or result['in_memory_sort']),
+            )
+            if not result['ok']:
+                logger.warning(
+                    f"List query {filters} sorted on {sort_by} ({sort_order}) "
+                    f"uses {' > '.join(result['stages'])}"
+                )
+            results.append(result)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.indexes',
+        description='Create the declared MongoDB indexes, or check list query plans.',
+    )
+    parser.add_argument('--uri', default=os.getenv('DATABASE_URL'),
+                        help='MongoDB URI (default: $DATABASE_URL)')
+    parser.add_argument('--check', action='store_true',
+                        help='explain() each list query shape instead of creating indexes')
+    args = parser.parse_args(argv)
+
+    if not args.uri:
+        parser.error('no MongoDB URI; pass --uri or set DATABASE_URL')
+
+    from pymongo import MongoClient
+    from utils.database import _parse_db_name
+
+    client = MongoClient(args.uri, serverSelectionTimeoutMS=5000)
+    try:
+        db = client[_parse_db_name(args.uri)]
+        if args.check:
+            results = check_list_queries(db)
+            for result in results:
+                status = 'ok  ' if result['ok'] else 'FAIL'
+                print(f"{status} sort={result['sort_by']}:{result['sort_order']} "
+                      f"filters={sorted(result['filters'])} "
+                      f"plan={' > '.join(result['stages'])}")
+            return 0 if all(result['ok'] for result in results) else 1
+
+        summary = ensure_indexes(db)
+        for name in summary['created']:
+            print(f"ok   {name}")
+        for label, error in summary['failed'].items():
+            print(f"FAIL {label}: {error}")
+        return 1 if summary['failed'] else 0
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Leader election for the background scheduler.
+
+Every gunicorn worker runs ``create_app`` and so starts its own scheduler
+thread.  The threads elect a single leader with a lease document in the
+``scheduler_locks`` collection::
+
+    {'_id': 'scheduler', 'owner': '<host>:<pid>', 'expires_at': ..., 'renewed_at': ...}
+
+Each scheduler heartbeat calls :meth:`LeaderLease.acquire`.  It is one
+``find_one_and_update`` that matches the document only if this worker
+already owns it or the lease has expired.  When neither holds, the upsert
+collides with the live document's ``_id`` (``DuplicateKeyError``) and the
+worker stays a follower.  Only the leader runs jobs.  If the leader dies,
+its lease lapses after ``SCHEDULER_LEASE_SECONDS`` and the next worker to
+heartbeat takes over.  A TTL index on ``expires_at`` (declared in
+:mod:`utils.indexes`) removes abandoned documents.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LEASE_SECONDS = int(os.getenv("SCHEDULER_LEASE_SECONDS", 600))
+
+COLLECTION = "scheduler_locks"
+
+
+def worker_id() -> str:
+    """Identify this process as ``<hostname>:<pid>``."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderLease:
+    """A renewable, expiring lease held by at most one worker.
+
+    Parameters
+    ----------
+    name:
+        Lease document ``_id``.  Defaults to ``"scheduler"``.
+    owner:
+        This worker's id.  Defaults to :func:`worker_id`.
+    ttl:
+        Lease length in seconds.  It must outlast the gap between renewals,
+        including a long job.  Defaults to ``SCHEDULER_LEASE_SECONDS``.
+    db:
+        Database handle.  Defaults to ``utils.database.get_db()`` on each use.
+    """
+
+    def __init__(
+        self,
+        name: str = "scheduler",
+        owner: str | None = None,
+        ttl: float | None = None,
+        db=None,
+    ) -> None:
+        self.name = name
+        self.owner = owner or worker_id()
+        self.ttl = SCHEDULER_LEASE_SECONDS if ttl is None else ttl
+        self._db = db
+        self._lock = threading.Lock()
+        self.is_leader = False
+
+    def _collection(self):
+        if self._db is not None:
+            return self._db[COLLECTION]
+        from utils.database import get_db
+        return get_db()[COLLECTION]
+
+    def acquire(self) -> bool:
+        """Take or renew the lease; return True if this worker is leader.
+
+        A database error counts as not holding the lease, so a worker that
+        cannot confirm its lease stops running jobs.
+        """
+        now = datetime.now(timezone.utc)
+        try:
+            self._collection().find_one_and_update(
+                {
+                    '_id': self.name,
+                    '$or': [{'owner': self.owner}, {'expires_at': {'$lt': now}}],
+                },
+                {'$set': {
+                    'owner': self.owner,
+                    'expires_at': now + timedelta(seconds=self.ttl),
+                    'renewed_at': now,
+                }},
+                upsert=True,
+            )
+            leader = True
+        except DuplicateKeyError:
+            leader = False
+        except Exception as e:
+            logger.warning(f"Could not renew {self.name} lease: {e}")
+            leader = False
+
+        with self._lock:
+            if leader != self.is_leader:
+                logger.info(
+                    f"{self.owner} {'became' if leader else 'is no longer'} "
+                    f"{self.name} leader"
+                )
+            self.is_leader = leader
+        return leader
+
+    def release(self) -> None:
+        """Give up the lease if this worker holds it."""
+        with self._lock:
+            if not self.is_leader:
+                return
+            self.is_leader = False
+        try:
+            self._collection().delete_one({'_id': self.name, 'owner': self.owner})
+        except Exception as e:
+            # Harmless: the lease expires on its own.
+            logger.info(f"Could not release {self.name} lease: {e}")
+
+    def current_leader(self) -> dict[str, Any] | None:
+        """The live lease as ``{'owner', 'expires_at'}``, or None."""
+        doc = self._collection().find_one({'_id': self.name})
+        if doc is None:
+            return None
+        expires_at = doc['expires_at']
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        if expires_at < datetime.now(timezone.utc):
+            return None
+        return {'owner': doc['owner'], 'expires_at': expires_at.isoformat()}
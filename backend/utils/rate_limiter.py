@@ -0,0 +1,77 @@
+"""Token-bucket rate limiting for outbound asyncio HTTP calls.
+
+:class:`TokenBucket` hands out *rate* tokens per second with room for a
+*burst*.  Callers reserve a token and sleep until it is due instead of
+polling.  A reservation may push the bucket negative, so concurrent callers
+queue up at evenly spaced times.  Reservations never await between reading
+and updating the bucket, so no lock is needed within one event loop.
+
+:class:`HostRateLimiter` keeps one bucket per host so a crawl that touches
+several hosts spends each host's budget separately::
+
+    limiter = HostRateLimiter(rate=4.0, burst=2)
+    await limiter.acquire("https://www.zillow.com/homedetails/1/")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Reserve-then-sleep token bucket.
+
+    Parameters
+    ----------
+    rate:
+        Tokens added per second.  A rate of 0 or less disables limiting.
+    burst:
+        Bucket capacity: how many calls may start back to back after an
+        idle period.  Defaults to 1.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens: float = float(self.burst)
+        self._updated: float = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class HostRateLimiter:
+    """One :class:`TokenBucket` per URL host, created on first use."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Return the bucket for *url*'s host."""
+        host = urlsplit(url).netloc.lower()
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> None:
+        """Wait for a token from *url*'s host bucket."""
+        await self.bucket(url).acquire()
@@ -48,7 +48,7 @@ Notes
 import functools
 import logging
 
-from flask import request
+from flask import current_app, request
 
 from utils.errors import error_response
 from utils.validation import is_valid_objectid
@@ -187,3 +187,24 @@ def require_entity(model_class, param_name, inject_as):
             return fn(*args, **kwargs)
         return wrapper
     return decorator
+
+
+# ---------------------------------------------------------------------------
+# lazy_limit
+# ---------------------------------------------------------------------------
+
+def lazy_limit(limit_string):
+    """Lazy rate-limit decorator that imports limiter at call time to avoid circular imports.
+
+    Respects RATELIMIT_ENABLED=False in app config (used to disable rate
+    limiting during tests).
+    """
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            from app import limiter
+            if not current_app.config.get('RATELIMIT_ENABLED', True):
+                return f(*args, **kwargs)
+            return limiter.limit(limit_string)(f)(*args, **kwargs)
+        return wrapper
+    return decorator
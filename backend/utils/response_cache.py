@@ -0,0 +1,262 @@
+"""HTTP response caching for read-heavy Resource handlers.
+
+``cache`` is the application's Flask-Caching instance (Redis when
+``REDIS_URL`` is set, SimpleCache otherwise); ``create_app`` initialises it.
+:func:`cached_response` wraps a ``Resource`` method so that a successful
+``(body, 200)`` result is stored under a key built from the request and served
+from the cache on the next hit.  Every cached response carries a strong
+``ETag``; when the client's ``If-None-Match`` matches, a bodyless 304 is
+returned instead.
+
+Keys
+----
+Entity endpoints key on the entity id plus its ``updated_at``, so any write
+that goes through ``save()``/``bulk_upsert()`` produces a new key.  Listing
+endpoints key on their normalized query arguments plus a *listings
+generation* token that is replaced whenever a property is created, updated or
+deleted through the API.  Entries also expire after a timeout, which bounds
+staleness for changes the API does not see (scraper runs, market updates).
+
+Usage example::
+
+    class PropertyAnalysisResource(Resource):
+        @require_entity(Property, 'property_id', inject_as='property_obj')
+        @cached_response('property_analysis', entity_key('property_id', 'property_obj'))
+        def get(self, property_id, property_obj):
+            ...
+
+Configuration
+-------------
+``RESPONSE_CACHE_ENABLED``
+    Defaults to on, and to off when ``TESTING`` is set so module-scoped test
+    apps do not serve one test's mocked data to the next.
+``RESPONSE_CACHE_TIMEOUT``
+    Seconds an entity response stays cached (default 300).
+``LISTING_CACHE_TIMEOUT``
+    Seconds a listing response stays cached (default 60).
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+import uuid
+from typing import Any, Callable
+
+from flask import Response, current_app, request
+from flask_caching import Cache
+
+logger = logging.getLogger(__name__)
+
+cache = Cache()
+
+DEFAULT_RESPONSE_TIMEOUT = 300
+DEFAULT_LISTING_TIMEOUT = 60
+
+_KEY_PREFIX = 'resp'
+_LISTINGS_GENERATION_KEY = f'{_KEY_PREFIX}:listings:generation'
+
+# Namespaces whose keys embed a property's id and version; see
+# invalidate_property().
+PROPERTY_NAMESPACES = ('property_analysis', 'opportunity_score')
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, int]] = {}
+
+
+# ---------------------------------------------------------------------------
+# Key builders
+# ---------------------------------------------------------------------------
+
+def _format_version(updated_at: Any) -> str | None:
+    if updated_at is None:
+        return None
+    return updated_at.isoformat() if hasattr(updated_at, 'isoformat') else str(updated_at)
+
+
+def entity_key(id_param: str, entity_param: str) -> Callable[..., tuple | None]:
+    """Key on ``(id, updated_at)`` of an entity injected by ``require_entity``.
+
+    Entities without ``updated_at`` cannot be versioned and are not cached.
+    """
+    def build(**kwargs):
+        version = _format_version(getattr(kwargs.get(entity_param), 'updated_at', None))
+        if version is None:
+            return None
+        return (kwargs.get(id_param), version)
+    return build
+
+
+def query_key(params: tuple[str, ...], listings: bool = False,
+              presence: tuple[str, ...] = ()) -> Callable[..., tuple]:
+    """Key on the normalized values of *params* from the query string.
+
+    Only the listed parameters take part, blank values are dropped and the
+    first value wins for repeated parameters, matching ``request.args.get``.
+    Parameters in *presence* switch the handler's mode just by appearing
+    (``?cursor=`` selects cursor pagination), so they are kept even when
+    blank.  With ``listings=True`` the key also includes the listings
+    generation.
+    """
+    def build(**kwargs):
+        args = tuple(
+            (name, request.args.get(name))
+            for name in sorted(params)
+            if request.args.get(name) not in (None, '')
+            or (name in presence and name in request.args)
+        )
+        if listings:
+            return (_listings_generation(),) + args
+        return args
+    return build
+
+
+def _make_key(namespace: str, parts: tuple) -> str:
+    digest = hashlib.sha1(
+        json.dumps(parts, default=str, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+    return f'{_KEY_PREFIX}:{namespace}:{digest}'
+
+
+def _etag(body: Any) -> str:
+    encoded = json.dumps(body, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Backend access — cache errors degrade to a miss, never to a failed request
+# ---------------------------------------------------------------------------
+
+def _cache_get(key: str) -> Any:
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"Response cache read failed for {key}: {e}")
+        return None
+
+
+def _cache_set(key: str, value: Any, timeout: int) -> None:
+    try:
+        cache.set(key, value, timeout=timeout)
+    except Exception as e:
+        logger.warning(f"Response cache write failed for {key}: {e}")
+
+
+def _cache_delete(*keys: str) -> None:
+    try:
+        cache.delete_many(*keys)
+    except Exception as e:
+        logger.warning(f"Response cache delete failed: {e}")
+
+
+def _listings_generation() -> str:
+    return _cache_get(_LISTINGS_GENERATION_KEY) or '0'
+
+
+def _enabled() -> bool:
+    config = current_app.config
+    return bool(config.get('RESPONSE_CACHE_ENABLED', not config.get('TESTING')))
+
+
+def _record(namespace: str, hit: bool) -> None:
+    with _stats_lock:
+        counts = _stats.setdefault(namespace, {'hits': 0, 'misses': 0})
+        counts['hits' if hit else 'misses'] += 1
+
+
+# ---------------------------------------------------------------------------
+# Decorator
+# ---------------------------------------------------------------------------
+
+def cached_response(namespace: str, key_fn: Callable[..., tuple | None],
+                    timeout_config: str = 'RESPONSE_CACHE_TIMEOUT',
+                    default_timeout: int = DEFAULT_RESPONSE_TIMEOUT):
+    """Decorator factory caching a Resource method's successful responses.
+
+    Parameters
+    ----------
+    namespace:
+        Label used in cache keys and hit/miss statistics.
+    key_fn:
+        Called with the handler's keyword arguments; returns a tuple that
+        identifies the response, or ``None`` to bypass the cache.
+    timeout_config:
+        App config key holding the entry timeout in seconds.
+    default_timeout:
+        Timeout used when ``timeout_config`` is not set.
+
+    Responses carry ``ETag`` and ``X-Cache: HIT|MISS`` headers.  Only
+    ``200`` results are stored.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled():
+                return fn(*args, **kwargs)
+            parts = key_fn(**kwargs)
+            if parts is None:
+                return fn(*args, **kwargs)
+
+            key = _make_key(namespace, parts)
+            entry = _cache_get(key)
+            if entry is not None:
+                _record(namespace, hit=True)
+                cache_status = 'HIT'
+            else:
+                _record(namespace, hit=False)
+                cache_status = 'MISS'
+                result = fn(*args, **kwargs)
+                if not isinstance(result, tuple) or len(result) < 2 or result[1] != 200:
+                    return result
+                entry = {'body': result[0], 'etag': _etag(result[0])}
+                timeout = current_app.config.get(timeout_config, default_timeout)
+                _cache_set(key, entry, timeout)
+
+            headers = {'ETag': f'"{entry["etag"]}"', 'X-Cache': cache_status}
+            if request.if_none_match.contains(entry['etag']):
+                return Response(status=304, headers=headers)
+            return entry['body'], 200, headers
+        return wrapper
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Invalidation and statistics
+# ---------------------------------------------------------------------------
+
+def invalidate_listings() -> None:
+    """Retire every cached listing response by replacing the generation token."""
+    _cache_set(_LISTINGS_GENERATION_KEY, uuid.uuid4().hex, 0)
+
+
+def invalidate_property(property_id: str, updated_at: Any) -> None:
+    """Drop cached responses for one version of a property and all listings.
+
+    Pass the ``updated_at`` the property had *before* the write; the new
+    version gets fresh keys on its own.
+    """
+    version = _format_version(updated_at)
+    if version is not None:
+        _cache_delete(*(
+            _make_key(namespace, (property_id, version))
+            for namespace in PROPERTY_NAMESPACES
+        ))
+    invalidate_listings()
+
+
+def response_cache_stats() -> dict[str, Any]:
+    """Return per-namespace and total hit/miss counts for this process."""
+    with _stats_lock:
+        namespaces = {name: dict(counts) for name, counts in _stats.items()}
+    hits = sum(c['hits'] for c in namespaces.values())
+    misses = sum(c['misses'] for c in namespaces.values())
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+        'namespaces': namespaces,
+    }
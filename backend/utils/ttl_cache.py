@@ -0,0 +1,92 @@
+"""Thread-safe, size-bounded LRU cache with per-entry expiry.
+
+Usage example::
+
+    from utils.ttl_cache import MISSING, TTLCache
+
+    cache = TTLCache(maxsize=1024, ttl=3600)
+
+    value = cache.get(key)
+    if value is MISSING:
+        value = expensive_lookup(key)
+        cache.set(key, value)
+
+``None`` is a valid cached value, so lookups compare against the ``MISSING``
+sentinel rather than ``None``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+#: Returned by :meth:`TTLCache.get` when the key is absent or expired.
+MISSING = object()
+
+
+class TTLCache:
+    """An LRU mapping whose entries also expire ``ttl`` seconds after insertion.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of entries.  Inserting beyond it evicts the least
+        recently used entry.
+    ttl:
+        Seconds an entry stays valid after it was set.
+    timer:
+        Monotonic clock, injectable for tests.  Defaults to
+        ``time.monotonic``.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for *key*, or *default* if absent/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._timer():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
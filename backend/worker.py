@@ -0,0 +1,208 @@
+"""Background worker: runs queued jobs outside the API processes.
+
+    python -m worker                  # run jobs and the recurring schedule
+    python -m worker --no-schedule    # only run jobs
+
+Jobs come from the ``jobs`` collection (:mod:`services.job_queue`).  The API
+enqueues on-demand jobs there (``POST /api/v1/jobs``).  Any number of workers
+may run; each job is leased to one of them at a time.
+
+Unless ``--no-schedule`` is given, the worker also takes part in scheduler
+leader election (:mod:`utils.leader_lock`).  The leader enqueues the nightly
+crawl, the weekly market refresh and the metrics materialization at the
+times the embedded scheduler in ``app.py`` would run them.  Set
+``EMBEDDED_SCHEDULER=false`` on the API processes so that no API worker
+becomes leader and runs those jobs in-process.
+
+SIGTERM and SIGINT let the current job finish before exiting.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import threading
+import time
+import traceback
+from typing import Any, Callable
+
+import schedule
+
+from services.job_queue import JobQueue
+from utils.leader_lock import LeaderLease, worker_id
+
+logger = logging.getLogger(__name__)
+
+JOB_POLL_SECONDS = float(os.getenv('JOB_POLL_SECONDS', 2))
+
+# Seconds between scheduler lease renewals, matching app.run_scheduled_tasks.
+SCHEDULE_HEARTBEAT_SECONDS = 60
+
+
+class Worker:
+    """Claims jobs from a :class:`JobQueue` and runs their handlers.
+
+    Parameters
+    ----------
+    queue:
+        The job queue.
+    handlers:
+        Job type -> callable taking the payload as keyword arguments.
+        Defaults to ``services.jobs.JOB_HANDLERS``.
+    name:
+        Worker id recorded on claimed jobs.  Defaults to ``<host>:<pid>``.
+    poll_interval:
+        Seconds to sleep when the queue is empty.  Defaults to
+        ``JOB_POLL_SECONDS``.
+    """
+
+    def __init__(self, queue: JobQueue, handlers: dict[str, Callable[..., Any]] | None = None,
+                 name: str | None = None, poll_interval: float | None = None) -> None:
+        if handlers is None:
+            from services.jobs import JOB_HANDLERS
+            handlers = JOB_HANDLERS
+        self.queue = queue
+        self.handlers = handlers
+        self.name = name or worker_id()
+        self.poll_interval = JOB_POLL_SECONDS if poll_interval is None else poll_interval
+        self.scheduler: schedule.Scheduler | None = None
+        self.lease: LeaderLease | None = None
+        self._stopping = threading.Event()
+        self._last_heartbeat = 0.0
+
+    # ------------------------------------------------------------------
+    # Recurring schedule
+    # ------------------------------------------------------------------
+
+    def enable_schedule(self, lease: LeaderLease | None = None) -> None:
+        """Enqueue the recurring jobs while this worker is scheduler leader."""
+        self.lease = lease or LeaderLease('scheduler', owner=self.name)
+        self.scheduler = schedule.Scheduler()
+        self.scheduler.every().day.at("01:00").do(self._enqueue_if_leader, 'update_property_data')
+        self.scheduler.every().week.do(self._enqueue_if_leader, 'update_market_data')
+        # Runs after the nightly scrape so new and re-priced listings get metrics.
+        self.scheduler.every().day.at("02:00").do(self._enqueue_if_leader, 'update_property_metrics')
+
+    def _enqueue_if_leader(self, job_type: str) -> None:
+        if self.lease is not None and not self.lease.is_leader:
+            return
+        job = self.queue.enqueue(job_type, dedupe_key=job_type)
+        logger.info(f"Enqueued scheduled job {job_type} ({job['_id']})")
+
+    def _tick_schedule(self) -> None:
+        if self.scheduler is None:
+            return
+        now = time.monotonic()
+        if now - self._last_heartbeat >= SCHEDULE_HEARTBEAT_SECONDS:
+            self.lease.acquire()
+            self._last_heartbeat = now
+        self.scheduler.run_pending()
+
+    # ------------------------------------------------------------------
+    # Job execution
+    # ------------------------------------------------------------------
+
+    def run_once(self) -> bool:
+        """Claim and run one job; return False if none was runnable."""
+        job = self.queue.claim(self.name)
+        if job is None:
+            return False
+
+        handler = self.handlers.get(job['type'])
+        if handler is None:
+            logger.error(f"No handler for job type {job['type']} ({job['_id']})")
+            self.queue.fail(job, f"Unknown job type: {job['type']}", retry=False)
+            return True
+
+        logger.info(f"Running job {job['type']} ({job['_id']}), attempt {job['attempts']}")
+        done = threading.Event()
+        keepalive = threading.Thread(
+            target=self._keep_leased, args=(job, done), name=f"job-lease-{job['_id']}", daemon=True,
+        )
+        keepalive.start()
+        started = time.perf_counter()
+        try:
+            result = handler(**job.get('payload', {}))
+        except Exception as e:
+            logger.error(f"Job {job['type']} ({job['_id']}) failed: {e}")
+            logger.debug(traceback.format_exc())
+            self.queue.fail(job, str(e) or type(e).__name__)
+        else:
+            self.queue.complete(job, result)
+            logger.info(
+                f"Job {job['type']} ({job['_id']}) done in {time.perf_counter() - started:.1f}s"
+            )
+        finally:
+            done.set()
+            keepalive.join()
+        return True
+
+    def _keep_leased(self, job: dict[str, Any], done: threading.Event) -> None:
+        # Renew well inside the visibility timeout so a long crawl keeps its job.
+        interval = max(1.0, self.queue.visibility_timeout / 3)
+        while not done.wait(interval):
+            try:
+                if not self.queue.extend(job):
+                    logger.warning(f"Lost the lease on job {job['_id']}")
+                    return
+            except Exception as e:
+                logger.warning(f"Could not extend lease on job {job['_id']}: {e}")
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def run(self) -> None:
+        """Process jobs until :meth:`stop` is called."""
+        logger.info(f"Worker {self.name} started")
+        while not self._stopping.is_set():
+            try:
+                self._tick_schedule()
+                if self.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Error in worker loop: {e}")
+            self._stopping.wait(self.poll_interval)
+        if self.lease is not None:
+            self.lease.release()
+        logger.info(f"Worker {self.name} stopped")
+
+    def stop(self, *_args) -> None:
+        """Finish the current job, then leave :meth:`run`."""
+        self._stopping.set()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m worker',
+        description='Run queued background jobs (scraping, market refresh, re-scoring).',
+    )
+    parser.add_argument('--no-schedule', action='store_true',
+                        help='do not enqueue the recurring jobs; only run queued ones')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+    from flask import Flask
+    from config import BaseConfig
+    from utils.database import init_db
+
+    config_app = Flask('worker')
+    config_app.config.from_object(BaseConfig)
+    if init_db(config_app) is None:
+        logger.error("Cannot start worker: MongoDB is not available (check DATABASE_URL)")
+        return 1
+
+    worker = Worker(JobQueue())
+    if not args.no_schedule:
+        worker.enable_schedule()
+    signal.signal(signal.SIGTERM, worker.stop)
+    signal.signal(signal.SIGINT, worker.stop)
+    worker.run()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
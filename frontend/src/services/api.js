@@ -47,6 +47,9 @@ export default {
   // Analysis endpoints
   getPropertyAnalysis: (id) => apiClient.get(`/analysis/property/${id}`),
   customizeAnalysis: (id, params) => apiClient.post(`/analysis/property/${id}`, params),
+  getSensitivityGrid: (id, params) => apiClient.post(`/analysis/property/${id}/sensitivity`, params),
+  goalSeek: (id, params) => apiClient.post(`/analysis/property/${id}/goal-seek`, params),
+  batchGoalSeek: (params) => apiClient.post('/analysis/goal-seek', params),
   
   // Market endpoints
   getTopMarkets: (params = {}) => apiClient.get('/markets/top', { params }),